@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Skills embedding ANN benchmark for FedHR5.0
+
+Compares the IVF index in fedhr5.modules.skills against exact brute-force
+search on clustered synthetic skills embeddings (employees drawn around
+role/skill-family centroids). Reports recall@k and per-query latency for a
+sweep of ``nprobe`` values, plus build, incremental insert and
+save/memory-mapped load times.
+
+Usage:
+    python experiments/ann_benchmark.py
+    python experiments/ann_benchmark.py --size 100000 --dim 64 --nprobe 1 4 16
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from fedhr5.modules.skills import IVFIndex, exact_search  # noqa: E402
+
+RESULTS_DIR = ROOT / "experiments" / "results"
+
+
+def make_embeddings(size, dim, families, rng):
+    """Employee embeddings clustered around skill-family centroids."""
+    centers = rng.standard_normal((families, dim)).astype(np.float32)
+    labels = rng.integers(0, families, size)
+    return centers[labels] + 0.6 * rng.standard_normal((size, dim)).astype(np.float32)
+
+
+def recall_at_k(found, truth):
+    k = truth.shape[1]
+    return float(np.mean([len(np.intersect1d(a, b)) / k for a, b in zip(found, truth)]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--families", type=int, default=300)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--lists", type=int, default=0, help="IVF lists (default sqrt(size))")
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--metric", choices=["cosine", "l2"], default="cosine")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=str(RESULTS_DIR / "ann_benchmark.json"))
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    data = make_embeddings(args.size + args.queries, args.dim, args.families, rng)
+    data, queries = data[:args.size], data[args.size:]
+    num_lists = args.lists or int(np.sqrt(args.size))
+    print(f"⏱️  {args.size:,} x {args.dim} embeddings, {num_lists} lists, "
+          f"{args.queries} queries, k={args.k}")
+
+    start = time.perf_counter()
+    _, truth = exact_search(data, queries, args.k, args.metric)
+    exact_s = time.perf_counter() - start
+    print(f"   exact search: {exact_s / args.queries * 1e3:.3f} ms/query")
+
+    index = IVFIndex(args.dim, num_lists, args.metric, seed=args.seed)
+    start = time.perf_counter()
+    index.train(data[rng.choice(args.size, min(args.size, 50 * num_lists), replace=False)])
+    train_s = time.perf_counter() - start
+    half = args.size // 2
+    start = time.perf_counter()
+    index.add(data[:half])
+    bulk_add_s = time.perf_counter() - start
+    # The second half arrives as small incremental batches (new hires)
+    start = time.perf_counter()
+    for lo in range(half, args.size, 1000):
+        index.add(data[lo:lo + 1000], ids=np.arange(lo, min(lo + 1000, args.size)))
+    incremental_s = time.perf_counter() - start
+    print(f"   train {train_s:.2f}s, bulk add {half / bulk_add_s:,.0f} vec/s, "
+          f"incremental add {(args.size - half) / incremental_s:,.0f} vec/s")
+
+    sweep = []
+    print(f"{'nprobe':>7} {'recall@k':>9} {'ms/query':>9} {'speedup':>8}")
+    for nprobe in args.nprobe:
+        start = time.perf_counter()
+        _, found = index.search(queries, args.k, nprobe)
+        elapsed = time.perf_counter() - start
+        row = {"nprobe": nprobe, "recall": recall_at_k(found, truth),
+               "ms_per_query": elapsed / args.queries * 1e3, "speedup": exact_s / elapsed}
+        sweep.append(row)
+        print(f"{nprobe:>7} {row['recall']:>9.3f} {row['ms_per_query']:>9.3f} "
+              f"{row['speedup']:>7.1f}x")
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        index.save(directory)
+        save_s = time.perf_counter() - start
+        start = time.perf_counter()
+        loaded = IVFIndex.load(directory)
+        load_s = time.perf_counter() - start
+        nprobe = args.nprobe[len(args.nprobe) // 2]
+        start = time.perf_counter()
+        _, found = loaded.search(queries, args.k, nprobe)
+        cold_s = time.perf_counter() - start
+        if not np.array_equal(found, index.search(queries, args.k, nprobe)[1]):
+            print("⚠️  Loaded index returned different neighbours")
+        del loaded
+    print(f"   save {save_s:.2f}s, memory-mapped load {load_s * 1e3:.1f} ms, "
+          f"first search after load {cold_s / args.queries * 1e3:.3f} ms/query")
+
+    config = {k: v for k, v in vars(args).items() if k != "output"}
+    config.update(lists=num_lists, python=platform.python_version(),
+                  machine=platform.machine())
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({"config": config,
+                   "exact_ms_per_query": exact_s / args.queries * 1e3,
+                   "train_s": train_s, "bulk_add_s": bulk_add_s,
+                   "incremental_add_s": incremental_s,
+                   "save_s": save_s, "load_s": load_s, "sweep": sweep}, f, indent=2)
+    print(f"✅ Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
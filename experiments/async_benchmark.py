@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Synchronous vs asynchronous aggregation benchmark for FedHR5.0
+
+Simulates a consortium in which one plant is much slower than the others and
+compares synchronous FedAvg rounds with bounded-staleness asynchronous
+aggregation over the same wall-clock budget.
+
+Usage:
+    python experiments/async_benchmark.py
+    python experiments/async_benchmark.py --clients 20 --slow-delay 1.0 --staleness 2 5 10
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from fedhr5.core.asynchronous import AsyncSimulation  # noqa: E402
+
+RESULTS_DIR = ROOT / "experiments" / "results"
+
+
+def summarize(label, trace, target):
+    reached = trace.time_to_error(target)
+    final = trace.errors[-1] if trace.errors else float("nan")
+    print(f"  {label:<22} applied={trace.updates_applied:>5} "
+          f"rejected={trace.updates_rejected:>4} final error={final:.4f} "
+          f"time to {target:g}={'—' if reached is None else f'{reached:.2f}s'}")
+    return {"mode": trace.mode, "updates_applied": trace.updates_applied,
+            "updates_rejected": trace.updates_rejected, "final_error": final,
+            "time_to_target_s": reached}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--clients", type=int, default=10)
+    parser.add_argument("--delay", type=float, default=0.02,
+                        help="seconds per local round for a typical plant")
+    parser.add_argument("--slow-delay", type=float, default=0.3,
+                        help="seconds per local round for the slow plant")
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--mixing", type=float, default=0.3)
+    parser.add_argument("--staleness", type=int, nargs="+", default=[2, 5, 20],
+                        help="max staleness values to try")
+    parser.add_argument("--target", type=float, default=0.5,
+                        help="relative model error used for time-to-accuracy")
+    parser.add_argument("--model-size", type=int, default=200)
+    parser.add_argument("--output", type=Path,
+                        default=RESULTS_DIR / "async_benchmark.json")
+    args = parser.parse_args()
+
+    delays = [args.delay] * (args.clients - 1) + [args.slow_delay]
+    print(f"⏱️  {args.clients} clients, one slow plant ({args.slow_delay}s vs "
+          f"{args.delay}s), {args.duration}s budget")
+
+    results = []
+    sync = AsyncSimulation(delays, model_size=args.model_size).run_sync(args.duration)
+    results.append(summarize("sync FedAvg", sync, args.target))
+    for max_staleness in args.staleness:
+        trace = AsyncSimulation(delays, model_size=args.model_size).run_async(
+            args.duration, mixing=args.mixing, max_staleness=max_staleness)
+        row = summarize(f"async (max stale {max_staleness})", trace, args.target)
+        row["max_staleness"] = max_staleness
+        results.append(row)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump({"client_delays": delays, "duration_s": args.duration,
+                   "results": results}, f, indent=2)
+    print(f"✅ Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Client selection benchmark for FedHR5.0
+
+Simulates a consortium of organizations whose clients differ in device
+speed and link bandwidth (1-100 Mbps edge links), with per-round jitter and
+occasional stragglers. Every round a cohort is chosen, trained in the local
+FedAvgSimulator, and the round lasts as long as its slowest member
+(modelled compute plus model download and upload). Clients the scheduler
+selects only to re-measure them (``Selection.explored``) do not hold the
+round: an update that misses it is dropped, but its timings are observed.
+Random selection of the same cohort size is the baseline for
+fedhr5.core.ClientScheduler, which learns EWMA speed and bandwidth estimates
+from the measured rounds.
+
+Reports round-time percentiles, the fraction of rounds meeting the deadline,
+and coverage: the share of clients ever selected and the spread of
+per-organization participation.
+
+Usage:
+    python experiments/client_selection_benchmark.py
+    python experiments/client_selection_benchmark.py --clients 500 --cohort 50 --deadline 20
+"""
+
+import argparse
+import json
+import platform
+import sys
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from fedhr5.core import ClientScheduler, FedAvgSimulator  # noqa: E402
+
+RESULTS_DIR = ROOT / "experiments" / "results"
+BANDWIDTH_CHOICES_MBPS = np.array([1.0, 5.0, 10.0, 10.0, 25.0, 100.0])
+
+
+def make_population(num_clients, num_orgs, rng):
+    """Organization, mean compute seconds and bandwidth of every client."""
+    orgs = rng.integers(0, num_orgs, num_clients)
+    # Organizations differ in typical hardware, clients within them too
+    org_speed = rng.lognormal(0.0, 0.4, num_orgs)
+    compute = 2.0 * org_speed[orgs] * rng.lognormal(0.0, 0.5, num_clients)
+    bandwidth = rng.choice(BANDWIDTH_CHOICES_MBPS, num_clients)
+    return orgs, compute, bandwidth
+
+
+def round_times(cohort, compute, bandwidth, model_bytes, args, rng):
+    """Actual per-client compute and transfer seconds for one round."""
+    n = len(cohort)
+    compute_s = compute[cohort] * rng.lognormal(0.0, args.jitter, n)
+    straggling = rng.random(n) < args.straggler_prob
+    compute_s[straggling] *= args.straggler_factor
+    link = bandwidth[cohort] * rng.uniform(0.7, 1.0, n)
+    transfer_s = model_bytes * 8 / (link * 1e6)
+    return compute_s, transfer_s
+
+
+def run_policy(policy, population, args, seed):
+    orgs, compute, bandwidth = population
+    rng = np.random.default_rng(seed)
+    simulator = FedAvgSimulator(len(orgs), model_size=args.sim_model_size, seed=seed)
+    model_bytes = int(args.model_mb * 1e6)
+    scheduler = ClientScheduler(args.deadline, model_bytes, args.cohort,
+                                min_clients=args.min_clients, max_org_gap=args.max_org_gap)
+    for cid in range(len(orgs)):
+        scheduler.register(cid, f"org_{orgs[cid]}")
+
+    durations, selected = [], np.zeros(len(orgs), dtype=int)
+    probes = dropped = 0
+    org_rounds = np.zeros((args.rounds, orgs.max() + 1), dtype=bool)
+    for round_num in range(args.rounds):
+        probe = np.zeros(args.cohort, dtype=bool)
+        if policy == "random":
+            cohort = rng.choice(len(orgs), args.cohort, replace=False)
+        else:
+            selection = scheduler.select()
+            cohort = np.array(selection.clients)
+            probe = np.isin(cohort, selection.explored)
+        compute_s, transfer_s = round_times(cohort, compute, bandwidth, model_bytes, args, rng)
+        client_s = compute_s + 2 * transfer_s + 0.04
+        duration = float(client_s[~probe].max()) if (~probe).any() else float(client_s.max())
+        durations.append(duration)
+        arrived = ~probe | (client_s <= max(duration, args.deadline))
+        probes += int(probe.sum())
+        dropped += int((~arrived).sum())
+        simulator.run_round(participants=cohort[arrived])
+        for cid, c_s, t_s in zip(cohort.tolist(), compute_s, transfer_s):
+            scheduler.observe(cid, compute_s=c_s, transfer_bytes=model_bytes, transfer_s=t_s)
+        selected[cohort] += 1
+        org_rounds[round_num, orgs[cohort]] = True
+
+    durations = np.array(durations)
+    org_share = org_rounds.mean(axis=0)
+    return {
+        "policy": policy,
+        "median_round_s": float(np.median(durations)),
+        "p95_round_s": float(np.percentile(durations, 95)),
+        "total_time_s": float(durations.sum()),
+        "deadline_hit_rate": float((durations <= args.deadline).mean()),
+        "clients_covered": float((selected > 0).mean()),
+        "min_org_participation": float(org_share.min()),
+        "max_org_participation": float(org_share.max()),
+        "probes": probes,
+        "dropped_probe_updates": dropped,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--orgs", type=int, default=10)
+    parser.add_argument("--cohort", type=int, default=20)
+    parser.add_argument("--min-clients", type=int, default=3)
+    parser.add_argument("--deadline", type=float, default=15.0, help="round timeout in seconds")
+    parser.add_argument("--max-org-gap", type=int, default=5)
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--model-mb", type=float, default=4.0,
+                        help="modelled size of the model exchanged each way")
+    parser.add_argument("--sim-model-size", type=int, default=1_000,
+                        help="parameters actually trained in the local simulator")
+    parser.add_argument("--jitter", type=float, default=0.2)
+    parser.add_argument("--straggler-prob", type=float, default=0.03)
+    parser.add_argument("--straggler-factor", type=float, default=5.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=str(RESULTS_DIR / "client_selection.json"))
+    args = parser.parse_args()
+
+    population = make_population(args.clients, args.orgs, np.random.default_rng(args.seed))
+    print(f"⏱️  {args.clients} clients in {args.orgs} organizations, cohort {args.cohort}, "
+          f"deadline {args.deadline:.0f} s, {args.model_mb:.0f} MB model")
+    print(f"{'policy':>10} {'median':>8} {'p95':>8} {'total':>9} {'on time':>8} "
+          f"{'covered':>8} {'org min/max':>12}")
+    results = []
+    for policy in ("random", "scheduler"):
+        row = run_policy(policy, population, args, args.seed + 1)
+        results.append(row)
+        print(f"{policy:>10} {row['median_round_s']:>7.1f}s {row['p95_round_s']:>7.1f}s "
+              f"{row['total_time_s']:>8.0f}s {row['deadline_hit_rate']:>8.0%} "
+              f"{row['clients_covered']:>8.0%} "
+              f"{row['min_org_participation']:>5.0%}/{row['max_org_participation']:<5.0%}")
+    speedup = results[0]["total_time_s"] / results[1]["total_time_s"]
+    print(f"✅ Scheduler cuts straggler-bound training time {speedup:.1f}x")
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    config = {k: v for k, v in vars(args).items() if k != "output"}
+    config.update(python=platform.python_version(), machine=platform.machine())
+    with open(output, "w") as f:
+        json.dump({"config": config, "results": results, "speedup": speedup}, f, indent=2)
+    print(f"✅ Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
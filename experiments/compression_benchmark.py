@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Update compression benchmark for FedHR5.0
+
+Measures encode/decode throughput (MB/s of float32 input), compression ratio,
+reconstruction error and the resulting upload time over a 10 Mbps edge link
+for each codec configuration.
+
+A second check runs the DP + secure-aggregation composition end to end:
+clip and noise each client's update, fixed-point encode and mask it on the
+grid from secure_aggregation_params, aggregate and unmask, and compare with
+the plaintext sum of the noisy updates. The grid is sized once for the clip
+bound alone and once for the clip bound plus the noise tail; a third run
+pushes one coordinate of every update 100σ out and checks that it saturates
+at the grid bound instead of wrapping the sum.
+
+Usage:
+    python experiments/compression_benchmark.py
+    python experiments/compression_benchmark.py --params 10000000 --link-mbps 10
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from fedhr5.core.compression import (  # noqa: E402
+    UpdateCodec,
+    compression_ratio,
+    secure_aggregation_params,
+)
+from fedhr5.privacy import SecureAggregator, clip_and_noise_, mask_update  # noqa: E402
+
+RESULTS_DIR = ROOT / "experiments" / "results"
+
+CONFIGS = {
+    "float32": dict(quantize=False),
+    "int8": dict(quantize=True),
+    "top1%": dict(topk_ratio=0.01, quantize=False),
+    "top1%+int8": dict(topk_ratio=0.01, quantize=True),
+    "top10%+int8": dict(topk_ratio=0.1, quantize=True),
+}
+
+
+def timed(fn, repeat):
+    timings, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def secure_aggregation_check(args):
+    """Clip → noise → quantize → mask → unmask, against the plaintext noisy sum."""
+    rng = np.random.default_rng(1)
+    n, d = args.sa_clients, args.sa_params
+    updates = rng.standard_normal((n, d), dtype=np.float32)
+    clip, sigma = clip_and_noise_(updates, args.epsilon, args.delta,
+                                  clip_norm=args.clip, rng=rng)
+    seeds = {}
+    for i in range(n):
+        for j in range(i + 1, n):
+            seeds[i, j] = seeds[j, i] = int(rng.integers(0, 2**63))
+    outliers = updates.copy()
+    outliers[:, 0] = 100 * sigma
+    rows = []
+    for sizing, noise_std, values in (("clip only", 0.0, updates),
+                                      ("clip + 6σ", sigma, updates),
+                                      ("100σ outlier", sigma, outliers)):
+        scale, field_bits, levels = secure_aggregation_params(clip, n, noise_std=noise_std)
+        aggregator = SecureAggregator(d, round_num=1, clients=range(n), scale=scale,
+                                      field_bits=field_bits)
+        for cid in range(n):
+            peers = {p: seeds[cid, p] for p in range(n) if p != cid}
+            aggregator.add(cid, mask_update(values[cid], cid, peers, 1, scale=scale,
+                                            field_bits=field_bits, levels=levels))
+        if values is outliers:
+            # Outliers are expected to saturate at the grid bound
+            values = np.clip(values, -levels / scale, levels / scale)
+        expected = values.sum(axis=0, dtype=np.float64)
+        error = float(np.abs(aggregator.finalize() - expected).max())
+        # Rounding every client's value costs at most half a grid step
+        bound = n * 0.5 / scale
+        rows.append({"sizing": sizing, "sigma": sigma, "scale": scale,
+                     "field_bits": field_bits, "max_abs_error": error,
+                     "rounding_bound": bound, "ok": error <= bound * 1.01})
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--params", type=int, default=1_000_000)
+    parser.add_argument("--link-mbps", type=float, default=10.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--sa-clients", type=int, default=20)
+    parser.add_argument("--sa-params", type=int, default=1000)
+    parser.add_argument("--epsilon", type=float, default=0.1)
+    parser.add_argument("--delta", type=float, default=1e-5)
+    parser.add_argument("--clip", type=float, default=1.0)
+    parser.add_argument("--output", type=Path,
+                        default=RESULTS_DIR / "compression_benchmark.json")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    update = rng.standard_normal(args.params).astype(np.float32)
+    megabytes = update.nbytes / 1e6
+
+    print(f"⏱️  {args.params:,} parameters ({megabytes:.1f} MB float32), "
+          f"{args.link_mbps:g} Mbps link")
+    print(f"{'codec':<13} {'encode':>11} {'decode':>11} {'ratio':>8} "
+          f"{'rel. error':>11} {'upload':>9}")
+    results = []
+    for name, config in CONFIGS.items():
+        codec = UpdateCodec(error_feedback=False, **config)
+        t_enc, payload = timed(lambda: codec.encode(update), args.repeat)
+        t_dec, restored = timed(lambda: codec.decode(payload), args.repeat)
+        error = float(np.linalg.norm(restored - update) / np.linalg.norm(update))
+        upload_s = len(payload) * 8 / (args.link_mbps * 1e6)
+        row = {
+            "codec": name,
+            "encode_mb_s": megabytes / t_enc,
+            "decode_mb_s": megabytes / t_dec,
+            "ratio": compression_ratio(update, payload),
+            "relative_error": error,
+            "payload_bytes": len(payload),
+            "upload_s": upload_s,
+        }
+        results.append(row)
+        print(f"{name:<13} {row['encode_mb_s']:>7.0f}MB/s {row['decode_mb_s']:>7.0f}MB/s "
+              f"{row['ratio']:>7.1f}× {error:>11.4f} {upload_s:>8.2f}s")
+
+    secure = secure_aggregation_check(args)
+    print(f"⏱️  DP + secure aggregation: {args.sa_clients} clients, {args.sa_params:,} "
+          f"parameters, ε={args.epsilon:g}, clip={args.clip:g}, σ={secure[0]['sigma']:.1f}")
+    for row in secure:
+        print(f"{row['sizing']:<13} {row['field_bits']:>2}-bit ring, max abs error "
+              f"{row['max_abs_error']:>10.3f} (rounding bound {row['rounding_bound']:.3f}) "
+              f"{'✅' if row['ok'] else '⚠️  values out of range'}")
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump({"params": args.params, "link_mbps": args.link_mbps,
+                   "results": results, "secure_aggregation": secure}, f, indent=2)
+    print(f"✅ Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Fairness audit benchmark for FedHR5.0
+
+Audits synthetic recruitment decisions over four protected attributes and two
+intersections with the grouped NumPy engine and with a per-group Python loop
+(one boolean mask per group and metric), then runs the federated mode: each
+organization computes its per-group statistics, the vectors are summed with
+secure aggregation, and the server evaluates the metrics on the sum.
+
+Usage:
+    python experiments/fairness_benchmark.py
+    python experiments/fairness_benchmark.py --candidates 5000000 --orgs 50
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from fedhr5.modules.recruitment import FairnessSchema, fairness_report  # noqa: E402
+from fedhr5.privacy import SecureAggregator, key_agreement, mask_update  # noqa: E402
+from fedhr5.privacy.secure_aggregation import DiffieHellmanKeyPair  # noqa: E402
+
+ATTRIBUTES = {
+    "gender": ["female", "male", "non_binary"],
+    "age_group": ["18-25", "26-35", "36-45", "46-55", "56+"],
+    "ethnicity": ["a", "b", "c", "d", "e", "f"],
+    "disability": [0, 1],
+}
+INTERSECTIONS = [("gender", "age_group"), ("gender", "ethnicity")]
+
+
+def synthetic_decisions(n, rng):
+    attributes = {name: np.asarray(values)[rng.integers(0, len(values), n)]
+                  for name, values in ATTRIBUTES.items()}
+    qualified = rng.random(n) < 0.4
+    bias = np.where(attributes["gender"] == "female", -0.08, 0.0)
+    hired = rng.random(n) < np.clip(np.where(qualified, 0.6, 0.1) + bias, 0, 1)
+    return hired, qualified, attributes
+
+
+def loop_audit(hired, qualified, attributes):
+    """Per-group loops with boolean masks, the straightforward implementation."""
+    results = {}
+    for attribute_set in [(name,) for name in ATTRIBUTES] + INTERSECTIONS:
+        rates, tprs, fprs = [], [], []
+        groups = [()]
+        for name in attribute_set:
+            groups = [g + (v,) for g in groups for v in ATTRIBUTES[name]]
+        for group in groups:
+            mask = np.ones(len(hired), dtype=bool)
+            for name, value in zip(attribute_set, group):
+                mask &= attributes[name] == value
+            if mask.any():
+                rates.append(hired[mask].mean())
+                tprs.append(hired[mask & qualified].mean())
+                fprs.append(hired[mask & ~qualified].mean())
+        results[attribute_set] = {
+            "demographic_parity_difference": max(rates) - min(rates),
+            "equalized_odds_difference": max(max(tprs) - min(tprs), max(fprs) - min(fprs)),
+        }
+    return results
+
+
+def federated_audit(hired, qualified, attributes, num_orgs):
+    """Per-organization statistics, secure-aggregated, evaluated on the sum."""
+    schema = FairnessSchema(ATTRIBUTES, INTERSECTIONS)
+    splits = np.array_split(np.arange(len(hired)), num_orgs)
+    key_pairs = [DiffieHellmanKeyPair() for _ in range(num_orgs)]
+    public_keys = {org: kp.public_key for org, kp in enumerate(key_pairs)}
+    # Pairwise seeds are agreed once per session, outside the audit itself
+    pair_seeds = [key_agreement(public_keys, kp, org) for org, kp in enumerate(key_pairs)]
+
+    start = time.perf_counter()
+    aggregator = SecureAggregator(schema.size, round_num=0, clients=range(num_orgs),
+                                  scale=1.0, field_bits=64)
+    for org, rows in enumerate(splits):
+        stats = schema.statistics(hired[rows],
+                                  {name: values[rows] for name, values in attributes.items()},
+                                  qualified[rows])
+        aggregator.add(org, mask_update(stats, org, pair_seeds[org], 0, scale=1.0,
+                                        field_bits=64))
+    total = np.rint(aggregator.finalize()).astype(np.int64)
+    reports = schema.evaluate(total)
+    return time.perf_counter() - start, reports
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--candidates", type=int, default=1_000_000)
+    parser.add_argument("--orgs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=str(ROOT / "experiments" / "results"
+                                                / "fairness.json"))
+    args = parser.parse_args()
+
+    hired, qualified, attributes = synthetic_decisions(args.candidates,
+                                                       np.random.default_rng(args.seed))
+
+    start = time.perf_counter()
+    reports = fairness_report(hired, attributes, labels=qualified, intersections=INTERSECTIONS)
+    engine_s = time.perf_counter() - start
+    print(f"⏱️  Grouped engine:   {engine_s:7.2f}s for {args.candidates:,} decisions")
+
+    start = time.perf_counter()
+    reference = loop_audit(hired, qualified, attributes)
+    loop_s = time.perf_counter() - start
+    print(f"⏱️  Per-group loops:  {loop_s:7.2f}s ({loop_s / engine_s:.1f}x slower)")
+
+    federated_s, federated = federated_audit(hired, qualified, attributes, args.orgs)
+    print(f"⏱️  Federated ({args.orgs} orgs, secure aggregation): {federated_s:.2f}s")
+
+    for report, fed in zip(reports, federated):
+        expected = reference[report.attributes]
+        for name, value in expected.items():
+            if not (np.isclose(report.metrics[name], value)
+                    and np.isclose(fed.metrics[name], value)):
+                print(f"⚠️  {name} mismatch for {report.attributes}")
+        print(f"   {' x '.join(report.attributes):<22} "
+              f"DI={report.metrics['disparate_impact']:.3f} "
+              f"EOdds={report.metrics['equalized_odds_difference']:.3f}")
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({"config": {k: v for k, v in vars(args).items() if k != "output"},
+                   "engine_s": engine_s, "loop_s": loop_s, "federated_s": federated_s,
+                   "reports": [report.to_dict() for report in reports]}, f, indent=2)
+    print(f"✅ Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Hierarchical aggregation benchmark for FedHR5.0
+
+Runs the edge → fog → cloud simulator and reports per-tier latency, bytes
+moved and end-to-end round time. Either simulates a topology config, or
+sweeps the number of fog nodes for a fixed number of edge devices to size
+fog fan-out.
+
+Usage:
+    python experiments/hierarchy_benchmark.py --config experiments/configs/topology.json
+    python experiments/hierarchy_benchmark.py --edges 64 --fog 1 2 4 8 16
+"""
+
+import argparse
+import json
+import statistics
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from fedhr5.core import HierarchicalSimulator, balanced_topology, load_topology  # noqa: E402
+
+RESULTS_DIR = ROOT / "experiments" / "results"
+
+
+def simulate(topology, model_size, rounds):
+    simulator = HierarchicalSimulator(topology, model_size=model_size)
+    simulator.run_round()  # warm-up
+    stats = [simulator.run_round() for _ in range(rounds)]
+    best = min(stats, key=lambda s: s.round_time_s)
+    row = best.to_dict()
+    row["round_time_s"] = statistics.median(s.round_time_s for s in stats)
+    return row
+
+
+def print_row(label, row):
+    tiers = "  ".join(
+        f"{name}: {t['latency_s'] * 1000:6.1f}ms+nic {t['nic_s'] * 1000:6.1f}ms/"
+        f"{t['bytes_moved'] / 2**20:6.1f}MiB"
+        for name, t in row["tiers"].items()
+    )
+    print(f"  {label:<12} round={row['round_time_s'] * 1000:8.1f}ms  {tiers}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--config", type=Path,
+                        help="topology JSON; disables the fan-out sweep")
+    parser.add_argument("--edges", type=int, default=64,
+                        help="total edge devices for the fan-out sweep")
+    parser.add_argument("--fog", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--model-size", type=int, default=20_000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--output", type=Path,
+                        default=RESULTS_DIR / "hierarchy_benchmark.json")
+    args = parser.parse_args()
+
+    print("⏱️  Hierarchical round (tier latency + NIC time / bytes moved)")
+    results = []
+    if args.config:
+        row = simulate(load_topology(args.config), args.model_size, args.rounds)
+        row["topology"] = str(args.config)
+        print_row(args.config.stem, row)
+        results.append(row)
+    else:
+        for num_fog in args.fog:
+            if args.edges % num_fog:
+                continue
+            topology = balanced_topology(num_fog, args.edges // num_fog)
+            row = simulate(topology, args.model_size, args.rounds)
+            row["num_fog"] = num_fog
+            row["edges_per_fog"] = args.edges // num_fog
+            print_row(f"fog={num_fog}", row)
+            results.append(row)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump({"model_size": args.model_size, "results": results}, f, indent=2)
+    print(f"✅ Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Import-time regression benchmark for FedHR5.0
+
+Edge agents restart often, so the cost of importing fedhr5 is part of every
+cold start. Each case below is imported in a fresh interpreter, repeatedly,
+and checked against two budgets:
+
+- time: median import time beyond the third-party baseline the case cannot
+  avoid (numpy for anything that touches model tensors),
+- modules: heavy dependencies the case must not load (plotting stacks,
+  asyncio, the HTTP exporter, multiprocessing).
+
+The exit status is 1 when a budget is exceeded, so the script can gate CI.
+The ``eager`` row imports every public name of every package, which is what
+``import fedhr5.core`` used to cost before the namespaces became lazy.
+
+Usage:
+    python experiments/import_time_benchmark.py
+    python experiments/import_time_benchmark.py --repeats 15 --scale 2
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+RESULTS_DIR = ROOT / "experiments" / "results"
+
+HEAVY = ["matplotlib", "seaborn", "asyncio", "http.server", "multiprocessing"]
+
+# (name, statement, baseline statement, budget in ms beyond the baseline, forbidden modules)
+CASES = [
+    ("package", "import fedhr5", None, 25.0, ["numpy", "typing"] + HEAVY),
+    ("subpackages", "import fedhr5.core, fedhr5.privacy, fedhr5.utils, fedhr5.modules",
+     None, 25.0, ["numpy"] + HEAVY),
+    ("top-level name", "from fedhr5 import FedAvgSimulator", "import numpy", 200.0, HEAVY),
+    ("edge agent",
+     "from fedhr5.core.wire import ModelUpdate, encode_frame\n"
+     "from fedhr5.privacy import SecureAggregator, clip_and_noise_, mask_update",
+     "import numpy", 200.0, HEAVY),
+    ("eager", "import fedhr5.modules.benchmarking, fedhr5.modules.learning, "
+     "fedhr5.modules.recruitment, fedhr5.modules.skills, fedhr5.modules.wellbeing\n"
+     "for package in [m for n, m in list(sys.modules.items()) if n.startswith('fedhr5')]:\n"
+     "    [getattr(package, name) for name in getattr(package, '__all__', [])]",
+     None, None, []),
+]
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+exec(compile(sys.argv[1], "<import>", "exec"))
+elapsed = time.perf_counter() - start
+import json
+print(json.dumps({"ms": elapsed * 1e3, "modules": sorted(sys.modules)}))
+"""
+
+
+def probe(statement):
+    """Import time (ms), process wall time (ms) and loaded modules in a fresh interpreter."""
+    env = dict(os.environ, PYTHONPATH=str(ROOT), PYTHONDONTWRITEBYTECODE="1")
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", PROBE, statement], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True)
+    wall_ms = (time.perf_counter() - start) * 1e3
+    data = json.loads(result.stdout)
+    return data["ms"], wall_ms, set(data["modules"])
+
+
+def measure(statement, repeats):
+    probe(statement)  # warm the bytecode and filesystem caches
+    runs = [probe(statement) for _ in range(repeats)]
+    return (statistics.median(r[0] for r in runs),
+            statistics.median(r[1] for r in runs), runs[-1][2])
+
+
+def slowest_imports(statement, top=5):
+    """Modules with the largest self import time (``python -X importtime``)."""
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], cwd=ROOT,
+                            env=env, capture_output=True, text=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[0].split(":")[-1].strip().isdigit():
+            rows.append((int(parts[0].split(":")[-1]) / 1e3, parts[2].strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeats", type=int, default=9)
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="multiply every time budget (for slower hardware)")
+    parser.add_argument("--output", default=str(RESULTS_DIR / "import_time.json"))
+    args = parser.parse_args()
+
+    baselines = {}
+    print(f"{'case':>15} {'import':>9} {'baseline':>9} {'budget':>9} {'process':>9} "
+          f"{'modules':>8}")
+    results, failures = [], []
+    for name, statement, baseline, budget, forbidden in CASES:
+        try:
+            import_ms, wall_ms, modules = measure(statement, args.repeats)
+        except subprocess.CalledProcessError as exc:
+            error = exc.stderr.strip().splitlines()[-1]
+            print(f"{name:>15} ⚠️  {error}")
+            results.append({"case": name, "statement": statement, "error": error, "ok": False})
+            failures.append(name)
+            continue
+        if baseline and baseline not in baselines:
+            baselines[baseline] = measure(baseline, args.repeats)[0]
+        base_ms = baselines.get(baseline, 0.0)
+        limit = budget * args.scale + base_ms if budget is not None else None
+        loaded = sorted(m for m in forbidden if m in modules)
+        ok = (limit is None or import_ms <= limit) and not loaded
+        print(f"{name:>15} {import_ms:>7.1f}ms {base_ms:>7.1f}ms "
+              f"{f'{limit:.0f}ms' if limit is not None else '-':>9} {wall_ms:>7.1f}ms "
+              f"{len(modules):>8}  {'✅' if ok else '⚠️ '}"
+              + (f" loads {', '.join(loaded)}" if loaded else ""))
+        row = {"case": name, "statement": statement, "import_ms": import_ms,
+               "baseline": baseline, "baseline_ms": base_ms, "limit_ms": limit,
+               "process_ms": wall_ms, "modules": len(modules), "forbidden_loaded": loaded,
+               "ok": ok}
+        if not ok:
+            failures.append(name)
+            row["slowest"] = slowest_imports(statement)
+            for self_ms, module in row["slowest"]:
+                print(f"{'':>17}{self_ms:>7.1f}ms  {module}")
+        results.append(row)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    config = {k: v for k, v in vars(args).items() if k != "output"}
+    config.update(python=platform.python_version(), machine=platform.machine())
+    with open(output, "w") as f:
+        json.dump({"config": config, "results": results}, f, indent=2)
+
+    if failures:
+        print(f"⚠️  Import budget exceeded: {', '.join(failures)}")
+    else:
+        print("✅ Every case within its import budget")
+    print(f"✅ Results written to {output}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
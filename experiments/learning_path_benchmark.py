@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Learning path optimizer benchmark for FedHR5.0
+
+Builds a synthetic layered course catalogue (skills in tracks, courses with
+one to three prerequisites, alternative providers per skill) and a
+consortium of employees whose skill states follow their track. It then
+measures fedhr5.modules.learning.PathOptimizer:
+
+- recomputing every employee's path from scratch (a fresh solver per
+  request; timed on a sample and extrapolated),
+- batched requests sharing the memoized subproblems, with the full cache and
+  with a small LRU,
+- re-answering a batch after one course outcome changes, with incremental
+  invalidation versus clearing the whole cache.
+
+Usage:
+    python experiments/learning_path_benchmark.py
+    python experiments/learning_path_benchmark.py --employees 10000 --levels 6
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from fedhr5.modules.learning import Course, PathOptimizer  # noqa: E402
+
+RESULTS_DIR = ROOT / "experiments" / "results"
+
+
+def make_catalogue(levels, skills_per_level, tracks, rng):
+    """Layered catalogue; prerequisites come from lower levels, mostly the same track."""
+    skill = lambda level, i: f"L{level}_S{i:03d}"  # noqa: E731
+    track_of = lambda i: i % tracks  # noqa: E731
+    courses = []
+    for level in range(levels):
+        for i in range(skills_per_level):
+            for alt in range(rng.integers(1, 4)):
+                requires = set()
+                if level:
+                    for _ in range(rng.integers(1, 4)):
+                        lower = rng.integers(max(0, level - 2), level)
+                        same_track = [j for j in range(skills_per_level)
+                                      if track_of(j) == track_of(i)]
+                        pool = same_track if rng.random() < 0.8 else range(skills_per_level)
+                        requires.add(skill(lower, int(rng.choice(pool))))
+                provides = {skill(level, i)}
+                if rng.random() < 0.2:
+                    provides.add(skill(level, int(rng.integers(skills_per_level))))
+                courses.append(Course(
+                    course_id=f"C{level}_{i:03d}_{alt}",
+                    duration_h=float(rng.uniform(4, 40)),
+                    provides=frozenset(provides),
+                    requires=frozenset(requires),
+                    cost=float(rng.uniform(0, 800)),
+                    success_rate=float(rng.uniform(0.6, 0.98)),
+                ))
+    return courses
+
+
+def make_employees(count, levels, skills_per_level, tracks, rng):
+    """Current skills (a track-following prefix) and role targets per employee."""
+    roles = [[f"L{levels - 1 - rng.integers(0, 2)}_S{rng.integers(skills_per_level):03d}"
+              for _ in range(rng.integers(1, 4))] for _ in range(40)]
+    states, targets = [], []
+    for _ in range(count):
+        track = rng.integers(tracks)
+        depth = rng.integers(0, levels // 2 + 1)
+        skills = [f"L{level}_S{i:03d}" for level in range(depth)
+                  for i in range(track, skills_per_level, tracks) if rng.random() < 0.7]
+        states.append(skills)
+        targets.append(roles[rng.integers(len(roles))])
+    return states, targets
+
+
+def timed_batches(optimizer, states, targets, batch_size):
+    start = time.perf_counter()
+    paths = []
+    for lo in range(0, len(states), batch_size):
+        paths.extend(optimizer.recommend_batch(states[lo:lo + batch_size],
+                                               targets[lo:lo + batch_size]))
+    return paths, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--employees", type=int, default=50_000)
+    parser.add_argument("--levels", type=int, default=8)
+    parser.add_argument("--skills-per-level", type=int, default=40)
+    parser.add_argument("--tracks", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--small-cache", type=int, default=20_000)
+    parser.add_argument("--naive-sample", type=int, default=200)
+    parser.add_argument("--updates", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=str(RESULTS_DIR / "learning_paths.json"))
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    courses = make_catalogue(args.levels, args.skills_per_level, args.tracks, rng)
+    states, targets = make_employees(args.employees, args.levels, args.skills_per_level,
+                                     args.tracks, rng)
+    print(f"⏱️  {len(courses)} courses, {args.levels * args.skills_per_level} skills, "
+          f"{args.employees:,} employees in batches of {args.batch_size:,}")
+
+    # From scratch: a fresh solver per request
+    sample = rng.choice(args.employees, args.naive_sample, replace=False)
+    start = time.perf_counter()
+    reference = [PathOptimizer(courses).recommend(states[i], targets[i]) for i in sample]
+    naive_rate = args.naive_sample / (time.perf_counter() - start)
+
+    optimizer = PathOptimizer(courses)
+    paths, memo_s = timed_batches(optimizer, states, targets, args.batch_size)
+    mismatches = sum(paths[i].courses != ref.courses for i, ref in zip(sample, reference))
+    memo = {"employees_per_s": args.employees / memo_s, "hit_rate": optimizer.stats.hit_rate,
+            "cache_entries": len(optimizer._cache)}
+
+    small = PathOptimizer(courses, cache_size=args.small_cache)
+    _, small_s = timed_batches(small, states, targets, args.batch_size)
+    small_row = {"employees_per_s": args.employees / small_s, "hit_rate": small.stats.hit_rate,
+                 "evictions": small.stats.evictions}
+
+    # One course outcome changes, then a batch is answered again
+    batch_states, batch_targets = states[:args.batch_size], targets[:args.batch_size]
+    incremental_s, invalidated, full_s = 0.0, 0, 0.0
+    full = PathOptimizer(courses)
+    full.recommend_batch(batch_states, batch_targets)
+    for course_id in rng.choice([c.course_id for c in courses], args.updates):
+        completed = bool(rng.random() < 0.5)
+        start = time.perf_counter()
+        invalidated += optimizer.record_outcome(course_id, completed)
+        fresh = optimizer.recommend_batch(batch_states, batch_targets)
+        incremental_s += time.perf_counter() - start
+        start = time.perf_counter()
+        full.record_outcome(course_id, completed)
+        full.clear_cache()
+        rebuilt = full.recommend_batch(batch_states, batch_targets)
+        full_s += time.perf_counter() - start
+        mismatches += sum(a.courses != b.courses for a, b in zip(fresh, rebuilt))
+
+    print(f"{'mode':>22} {'employees/s':>12} {'hit rate':>9}")
+    print(f"{'from scratch':>22} {naive_rate:>12,.0f} {'-':>9}")
+    print(f"{'memoized batch':>22} {memo['employees_per_s']:>12,.0f} {memo['hit_rate']:>9.1%}")
+    print(f"{f'LRU {args.small_cache:,} entries':>22} {small_row['employees_per_s']:>12,.0f} "
+          f"{small_row['hit_rate']:>9.1%}")
+    print(f"   after one outcome change: incremental {incremental_s / args.updates * 1e3:.0f} ms "
+          f"({invalidated / args.updates:,.0f} entries invalidated) vs full recompute "
+          f"{full_s / args.updates * 1e3:.0f} ms per {args.batch_size:,}-employee batch")
+    if mismatches:
+        print(f"⚠️  {mismatches} paths differ from the reference")
+    print(f"✅ Memoized batches answer {memo['employees_per_s'] / naive_rate:,.0f}x more "
+          f"employees per second than recomputing")
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    config = {k: v for k, v in vars(args).items() if k != "output"}
+    config.update(courses=len(courses), python=platform.python_version(),
+                  machine=platform.machine())
+    with open(output, "w") as f:
+        json.dump({"config": config, "from_scratch_employees_per_s": naive_rate,
+                   "memoized": memo, "small_cache": small_row,
+                   "incremental_update_ms": incremental_s / args.updates * 1e3,
+                   "full_recompute_ms": full_s / args.updates * 1e3,
+                   "mean_invalidated": invalidated / args.updates,
+                   "mismatches": mismatches}, f, indent=2)
+    print(f"✅ Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Ledger commit benchmark for FedHR5.0
+
+Compares two ways of recording round metadata on the ledger
+(fedhr5.modules.benchmarking):
+
+- synchronous: every round appends its own block and waits for it, as in the
+  round lifecycle of docs/architecture.md;
+- batched: every round journals its records locally (one fsync) and a
+  background committer packs many rounds and modules into Merkle-rooted
+  blocks.
+
+The local ledger stand-in emulates consensus with a fixed per-block delay.
+Reports the latency added to each round and the sustained commits (records
+on the ledger) per second.
+
+Usage:
+    python experiments/ledger_benchmark.py
+    python experiments/ledger_benchmark.py --rounds 500 --consensus-ms 500
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from fedhr5.modules.benchmarking import BatchedCommitter, LocalLedger  # noqa: E402
+
+RESULTS_DIR = ROOT / "experiments" / "results"
+MODULES = ["core", "wellbeing", "skills", "recruitment", "benchmarking", "learning"]
+
+
+def round_records(round_num, modules):
+    """Metadata each module records at the end of a round."""
+    return [(module, {"round_id": f"round_{round_num:05d}", "privacy_spent": 0.01,
+                      "num_clients": 20, "metrics": {"loss": 1.0 / (round_num + 1)}})
+            for module in modules]
+
+
+def summarize(mode, latencies, records, elapsed, ledger):
+    latencies = np.array(latencies) * 1e3
+    return {
+        "mode": mode,
+        "round_latency_ms_p50": float(np.percentile(latencies, 50)),
+        "round_latency_ms_p99": float(np.percentile(latencies, 99)),
+        "records": records,
+        "blocks": ledger.height + 1,
+        "elapsed_s": elapsed,
+        "commits_per_s": records / elapsed,
+        "chain_valid": ledger.verify(),
+    }
+
+
+def run_synchronous(directory, args, modules):
+    ledger = LocalLedger(Path(directory) / "sync.jsonl", args.consensus_ms / 1e3)
+    latencies = []
+    start = time.perf_counter()
+    for round_num in range(args.rounds):
+        round_start = time.perf_counter()
+        ledger.append_block([{"sequence": round_num * len(modules) + i, "module": module,
+                              "payload": payload}
+                             for i, (module, payload) in enumerate(round_records(round_num,
+                                                                                 modules))])
+        latencies.append(time.perf_counter() - round_start)
+    elapsed = time.perf_counter() - start
+    row = summarize("synchronous", latencies, args.rounds * len(modules), elapsed, ledger)
+    ledger.close()
+    return row
+
+
+def run_batched(directory, args, modules):
+    ledger = LocalLedger(Path(directory) / "batched.jsonl", args.consensus_ms / 1e3)
+    committer = BatchedCommitter(ledger, Path(directory) / "journal.jsonl",
+                                 max_batch=args.max_batch, max_delay_s=args.max_delay_ms / 1e3)
+    latencies = []
+    start = time.perf_counter()
+    for round_num in range(args.rounds):
+        round_start = time.perf_counter()
+        committer.submit_many(round_records(round_num, modules))
+        latencies.append(time.perf_counter() - round_start)
+    committer.flush()
+    elapsed = time.perf_counter() - start
+    committer.close()
+    row = summarize("batched", latencies, args.rounds * len(modules), elapsed, ledger)
+    ledger.close()
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=100)
+    parser.add_argument("--modules", type=int, default=len(MODULES),
+                        help="modules recording metadata every round")
+    parser.add_argument("--consensus-ms", type=float, default=100.0,
+                        help="emulated ledger consensus delay per block")
+    parser.add_argument("--max-batch", type=int, default=512)
+    parser.add_argument("--max-delay-ms", type=float, default=200.0)
+    parser.add_argument("--output", default=str(RESULTS_DIR / "ledger_benchmark.json"))
+    args = parser.parse_args()
+
+    modules = MODULES[:args.modules]
+    print(f"⏱️  {args.rounds} rounds x {len(modules)} modules, "
+          f"{args.consensus_ms:.0f} ms consensus per block")
+    print(f"{'mode':>12} {'p50 ms':>8} {'p99 ms':>8} {'blocks':>7} {'commits/s':>10} {'valid':>6}")
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for run in (run_synchronous, run_batched):
+            row = run(directory, args, modules)
+            results.append(row)
+            print(f"{row['mode']:>12} {row['round_latency_ms_p50']:>8.2f} "
+                  f"{row['round_latency_ms_p99']:>8.2f} {row['blocks']:>7} "
+                  f"{row['commits_per_s']:>10,.0f} {str(row['chain_valid']):>6}")
+    sync, batched = results
+    print(f"✅ Batched commits cut added round latency "
+          f"{sync['round_latency_ms_p50'] / batched['round_latency_ms_p50']:,.0f}x "
+          f"and raise throughput {batched['commits_per_s'] / sync['commits_per_s']:,.0f}x")
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    config = {k: v for k, v in vars(args).items() if k != "output"}
+    config.update(python=platform.python_version(), machine=platform.machine())
+    with open(output, "w") as f:
+        json.dump({"config": config, "results": results}, f, indent=2)
+    print(f"✅ Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
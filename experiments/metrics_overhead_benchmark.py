@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Instrumentation overhead benchmark for FedHR5.0
+
+Measures the cost of the primitives in ``fedhr5.utils.metrics`` (counter
+increment, histogram observation, timer block) and the end-to-end overhead of
+the timed ``federated_average`` against its uninstrumented ``__wrapped__``
+function on the aggregation hot path. The target is under 1% overhead.
+
+Usage:
+    python experiments/metrics_overhead_benchmark.py
+    python experiments/metrics_overhead_benchmark.py --clients 50 --sizes 10000 1000000
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from fedhr5.core.aggregation import federated_average  # noqa: E402
+from fedhr5.utils.metrics import MetricsRegistry  # noqa: E402
+
+TARGET_OVERHEAD = 0.01
+
+
+def per_call_ns(fn, iterations):
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter_ns() - start) / iterations
+
+
+def bench_primitives(iterations):
+    registry = MetricsRegistry()
+    counter = registry.counter("bench_total")
+    histogram = registry.histogram("bench_seconds")
+
+    def timer_block():
+        with histogram.time():
+            pass
+
+    results = {
+        "baseline_call": per_call_ns(lambda: None, iterations),
+        "counter_inc": per_call_ns(counter.inc, iterations),
+        "histogram_observe": per_call_ns(lambda: histogram.observe(0.0123), iterations),
+        "timer_block": per_call_ns(timer_block, iterations),
+    }
+    start = time.perf_counter()
+    registry.render()
+    results["render_ns"] = (time.perf_counter() - start) * 1e9
+    return results
+
+
+def bench_hot_path(num_clients, size, repeat, seed):
+    """Interleave instrumented and plain calls; compare the best of each."""
+    rng = np.random.default_rng(seed)
+    updates = [rng.standard_normal(size, dtype=np.float32) for _ in range(num_clients)]
+    weights = rng.integers(10, 100, num_clients)
+    plain = federated_average.__wrapped__
+    calls = max(1, int(2e7 // (num_clients * size)))
+    best = {"plain": float("inf"), "instrumented": float("inf")}
+    for _ in range(repeat):
+        for name, fn in (("plain", plain), ("instrumented", federated_average)):
+            start = time.perf_counter()
+            for _ in range(calls):
+                fn(updates, weights)
+            best[name] = min(best[name], (time.perf_counter() - start) / calls)
+    return {"num_clients": num_clients, "size": size, "plain_s": best["plain"],
+            "instrumented_s": best["instrumented"],
+            "overhead": best["instrumented"] / best["plain"] - 1}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--iterations", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=str(ROOT / "experiments" / "results"
+                                                / "metrics_overhead.json"))
+    args = parser.parse_args()
+
+    primitives = bench_primitives(args.iterations)
+    for name, ns in primitives.items():
+        print(f"⏱️  {name:<18} {ns:>10.0f} ns")
+
+    hot_path = []
+    for size in args.sizes:
+        row = bench_hot_path(args.clients, size, args.repeat, args.seed)
+        hot_path.append(row)
+        marker = "✅" if row["overhead"] < TARGET_OVERHEAD else "⚠️ "
+        print(f"{marker} federated_average K={args.clients} d={size:>9,}: "
+              f"{row['plain_s'] * 1e3:8.3f}ms plain, {row['instrumented_s'] * 1e3:8.3f}ms "
+              f"instrumented ({row['overhead'] * 100:+.2f}%)")
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({"config": {k: v for k, v in vars(args).items() if k != "output"},
+                   "primitives_ns": primitives, "hot_path": hot_path}, f, indent=2)
+    print(f"✅ Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
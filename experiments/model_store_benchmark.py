@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Model store benchmark for FedHR5.0
+
+Commits a run of rounds in which only a fraction of the global model changes
+per round (frozen layers, sparse top-K updates) to the chunk-deduplicated
+``ModelStore`` and to a baseline that saves a full ``.npy`` copy per round.
+Reports commit time, disk usage, and the time to open a historical round and
+to touch one value in every stored round through the memory-mapped readers.
+
+Usage:
+    python experiments/model_store_benchmark.py
+    python experiments/model_store_benchmark.py --rounds 100 --model-mb 64 --changed 0.1
+"""
+
+import argparse
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from fedhr5.core.model_store import ModelStore  # noqa: E402
+
+
+def round_updates(num_params, num_rounds, chunk_params, changed, seed):
+    """Yield successive global models where ``changed`` of the chunks move."""
+    rng = np.random.default_rng(seed)
+    weights = rng.standard_normal(num_params, dtype=np.float32)
+    num_chunks = -(-num_params // chunk_params)
+    per_round = max(1, int(round(changed * num_chunks)))
+    for _ in range(num_rounds):
+        for chunk in rng.choice(num_chunks, size=per_round, replace=False):
+            start = chunk * chunk_params
+            weights[start:start + chunk_params] += 0.01
+        yield weights
+
+
+def bench_store(directory, args):
+    store = ModelStore(directory, chunk_size=args.chunk_kb * 1024)
+    chunk_params = store.chunk_size // 4
+    start = time.perf_counter()
+    written = 0
+    for round_num, weights in enumerate(
+            round_updates(args.num_params, args.rounds, chunk_params, args.changed,
+                          args.seed), start=1):
+        written += store.commit(round_num, weights).bytes_written
+    commit_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reader = ModelStore(directory, chunk_size=store.chunk_size)
+    snapshot = reader.open(args.rounds // 2)
+    open_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    checksum = sum(float(reader.open(r).chunks()[0][0]) for r in reader.rounds())
+    scan_s = time.perf_counter() - start
+    assert snapshot.tensor().shape == (args.num_params,)
+    return {"commit_s": commit_s, "bytes_written": written,
+            "disk_bytes": store.disk_usage(), "open_s": open_s, "scan_s": scan_s,
+            "checksum": checksum}
+
+
+def bench_full_copies(directory, args):
+    chunk_params = args.chunk_kb * 1024 // 4
+    start = time.perf_counter()
+    for round_num, weights in enumerate(
+            round_updates(args.num_params, args.rounds, chunk_params, args.changed,
+                          args.seed), start=1):
+        np.save(Path(directory) / f"round-{round_num:08d}.npy", weights)
+    commit_s = time.perf_counter() - start
+    disk = sum(p.stat().st_size for p in Path(directory).glob("*.npy"))
+
+    start = time.perf_counter()
+    np.load(Path(directory) / f"round-{args.rounds // 2:08d}.npy")
+    open_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    checksum = sum(float(np.load(Path(directory) / f"round-{r:08d}.npy")[0])
+                   for r in range(1, args.rounds + 1))
+    scan_s = time.perf_counter() - start
+    return {"commit_s": commit_s, "bytes_written": disk, "disk_bytes": disk,
+            "open_s": open_s, "scan_s": scan_s, "checksum": checksum}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=100)
+    parser.add_argument("--model-mb", type=int, default=32)
+    parser.add_argument("--chunk-kb", type=int, default=1024)
+    parser.add_argument("--changed", type=float, default=0.1,
+                        help="Fraction of chunks updated per round")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=str(ROOT / "experiments" / "results"
+                                                / "model_store.json"))
+    args = parser.parse_args()
+    args.num_params = args.model_mb * 2**20 // 4
+
+    results = {"config": {k: v for k, v in vars(args).items() if k != "output"}}
+    for name, bench in (("model_store", bench_store), ("full_copies", bench_full_copies)):
+        directory = tempfile.mkdtemp(prefix=f"fedhr5_{name}_")
+        try:
+            result = bench(directory, args)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        results[name] = result
+        print(f"⏱️  {name:<12} commit {result['commit_s']:6.2f}s  "
+              f"disk {result['disk_bytes'] / 2**20:8.1f}MB  "
+              f"open {result['open_s'] * 1000:7.2f}ms  "
+              f"scan {args.rounds} rounds {result['scan_s'] * 1000:8.1f}ms")
+
+    if results["model_store"]["checksum"] != results["full_copies"]["checksum"]:
+        print("⚠️  Stored models differ between the two backends")
+    saving = results["full_copies"]["disk_bytes"] / max(results["model_store"]["disk_bytes"], 1)
+    print(f"✅ History stored in {saving:.1f}x less disk space")
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"✅ Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
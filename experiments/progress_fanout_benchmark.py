@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Round progress fan-out load test for FedHR5.0
+
+Simulates the WebSocket ``round_updates`` channel in one process: reporting
+clients publish progress ticks for a set of concurrent rounds and every
+dashboard connection follows one round. A share of the connections is slow
+(each write blocks for a while); a few probe connections decode every frame
+they receive to measure staleness, from a client's tick to its delivery.
+
+Two brokers are compared on the same load:
+
+- naive: every tick is serialized and queued to every subscriber of its
+  round (unbounded per-connection queues),
+- coalescing: fedhr5.core.progress.ProgressBroker, one shared frame per round
+  and flush, at most one pending frame per connection and round.
+
+Usage:
+    python experiments/progress_fanout_benchmark.py
+    python experiments/progress_fanout_benchmark.py --subscribers 2000 --duration 5
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from fedhr5.core.progress import ProgressBroker  # noqa: E402
+
+RESULTS_DIR = ROOT / "experiments" / "results"
+
+
+class SimulatedConnection:
+    """Counts what a dashboard receives; slow ones block on every write."""
+
+    __slots__ = ("delay_s", "probe", "frames", "bytes", "lags")
+
+    def __init__(self, delay_s, probe):
+        self.delay_s = delay_s
+        self.probe = probe
+        self.frames = 0
+        self.bytes = 0
+        self.lags = []
+
+    async def send(self, payload):
+        self.frames += 1
+        self.bytes += len(payload)
+        if self.probe:
+            now, message = time.time(), json.loads(payload)
+            if "clients" not in message:
+                self.lags.append(now - message["sent_at"])
+            elif not message["snapshot"]:
+                self.lags.extend(now - c["sent_at"] for c in message["clients"].values())
+        if self.delay_s:
+            await asyncio.sleep(self.delay_s)
+
+
+class NaiveFanout:
+    """Baseline: serialize every tick and queue it to every subscriber."""
+
+    def __init__(self):
+        self.queues = defaultdict(list)
+        self.tasks = []
+        self.published = 0
+        self.frames = 0
+
+    def subscribe(self, send, round_id):
+        queue = asyncio.Queue()
+        self.queues[round_id].append(queue)
+
+        async def write():
+            while True:
+                await send(await queue.get())
+
+        self.tasks.append(asyncio.get_running_loop().create_task(write()))
+
+    def publish(self, round_id, client_id, **fields):
+        self.published += 1
+        self.frames += 1
+        payload = json.dumps({"type": "progress", "round_id": round_id,
+                              "client_id": client_id, "ts": time.time(), **fields},
+                             separators=(",", ":"))
+        for queue in self.queues[round_id]:
+            queue.put_nowait(payload)
+
+    def pending(self):
+        return sum(queue.qsize() for queues in self.queues.values() for queue in queues)
+
+    async def close(self):
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+
+
+async def run_load(mode, args, duration_s):
+    rng = np.random.default_rng(args.seed)
+    round_ids = [f"round_2024_12_{i:03d}" for i in range(args.rounds)]
+    connections = [SimulatedConnection(args.slow_delay if rng.random() < args.slow_fraction
+                                       else 0.0, i < args.probes)
+                   for i in range(args.subscribers)]
+
+    if mode == "naive":
+        broker = NaiveFanout()
+        for i, connection in enumerate(connections):
+            broker.subscribe(connection.send, round_ids[i % args.rounds])
+    else:
+        broker = ProgressBroker(rate_hz=args.rate_hz)
+        broker.start()
+        for i, connection in enumerate(connections):
+            broker.subscribe(connection.send, [round_ids[i % args.rounds]])
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + duration_s
+    interval = 1.0 / args.tick_hz
+
+    async def reporter(client_id, round_id, offset):
+        await asyncio.sleep(offset)
+        progress = 0.0
+        while loop.time() < deadline:
+            progress = min(1.0, progress + rng.uniform(0, 0.02))
+            now = time.time()
+            broker.publish(round_id, client_id, progress=progress,
+                           eta=now + 600 * (1 - progress), sent_at=now)
+            await asyncio.sleep(interval)
+
+    loop_lags, peak_pending = [], 0
+
+    def sample_pending():
+        nonlocal peak_pending
+        if mode == "naive":
+            pending = broker.pending()
+        else:
+            pending = sum(s.pending for s in broker._subscriptions)
+        peak_pending = max(peak_pending, pending)
+
+    async def monitor():
+        step, last_sample = 0.01, loop.time()
+        while loop.time() < deadline:
+            start = loop.time()
+            await asyncio.sleep(step)
+            loop_lags.append(loop.time() - start - step)
+            if loop.time() - last_sample >= 0.5:
+                sample_pending()
+                last_sample = loop.time()
+
+    await asyncio.gather(monitor(), *(
+        reporter(f"org_{c:04d}", round_ids[c % args.rounds], c * interval / args.reporters)
+        for c in range(args.reporters)))
+    sample_pending()
+
+    if mode == "naive":
+        published, frames, superseded = broker.published, broker.frames, 0
+        await broker.close()
+    else:
+        stats = broker.stats
+        published, frames, superseded = stats.published, stats.frames, stats.superseded
+        await broker.close()
+
+    lags = [lag for connection in connections for lag in connection.lags]
+    delivered = sum(connection.frames for connection in connections)
+    return {
+        "mode": mode,
+        "duration_s": duration_s,
+        "ticks_per_s": published / duration_s,
+        "frames_serialized_per_s": frames / duration_s,
+        "deliveries_per_s": delivered / duration_s,
+        "mb_written_per_s": sum(c.bytes for c in connections) / duration_s / 1e6,
+        "superseded": superseded,
+        "peak_pending_frames": peak_pending,
+        "loop_lag_p99_ms": float(np.percentile(loop_lags, 99) * 1e3) if loop_lags else None,
+        "staleness_p50_ms": float(np.percentile(lags, 50) * 1e3) if lags else None,
+        "staleness_p99_ms": float(np.percentile(lags, 99) * 1e3) if lags else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--subscribers", type=int, default=10_000)
+    parser.add_argument("--reporters", type=int, default=1_000)
+    parser.add_argument("--rounds", type=int, default=10,
+                        help="concurrent rounds; subscribers and reporters are spread evenly")
+    parser.add_argument("--tick-hz", type=float, default=2.0,
+                        help="progress ticks per second per reporting client")
+    parser.add_argument("--rate-hz", type=float, default=2.0,
+                        help="broker flushes per second")
+    parser.add_argument("--slow-fraction", type=float, default=0.05)
+    parser.add_argument("--slow-delay", type=float, default=1.0,
+                        help="seconds a slow connection blocks per write")
+    parser.add_argument("--probes", type=int, default=100,
+                        help="connections that decode every frame to measure staleness")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--naive-duration", type=float, default=3.0,
+                        help="the naive broker saturates quickly, so it runs shorter")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=str(RESULTS_DIR / "progress_fanout.json"))
+    args = parser.parse_args()
+
+    print(f"⏱️  {args.subscribers:,} subscribers, {args.reporters:,} reporters at "
+          f"{args.tick_hz:g} Hz over {args.rounds} rounds, "
+          f"{args.slow_fraction:.0%} slow connections")
+    print(f"{'mode':>11} {'ticks/s':>9} {'frames/s':>9} {'deliv/s':>10} {'MB/s':>7} "
+          f"{'pending':>9} {'loop p99':>9} {'stale p50':>10} {'stale p99':>10}")
+    results = []
+    for mode, duration in (("naive", args.naive_duration), ("coalescing", args.duration)):
+        row = asyncio.run(run_load(mode, args, duration))
+        results.append(row)
+        fmt = lambda v: f"{v:>8.0f}ms" if v is not None else f"{'-':>10}"  # noqa: E731
+        print(f"{mode:>11} {row['ticks_per_s']:>9,.0f} {row['frames_serialized_per_s']:>9,.0f} "
+              f"{row['deliveries_per_s']:>10,.0f} {row['mb_written_per_s']:>7.1f} "
+              f"{row['peak_pending_frames']:>9,} {row['loop_lag_p99_ms']:>7.0f}ms "
+              f"{fmt(row['staleness_p50_ms'])} {fmt(row['staleness_p99_ms'])}")
+
+    naive, coalescing = results
+    offered = args.reporters * args.tick_hz
+    if coalescing["ticks_per_s"] < 0.9 * offered:
+        print(f"⚠️  Coalescing broker kept up with only {coalescing['ticks_per_s']:,.0f} "
+              f"of {offered:,.0f} offered ticks/s")
+    else:
+        print(f"✅ Coalescing broker absorbed all {offered:,.0f} ticks/s with "
+              f"{coalescing['superseded']:,} stale frames dropped for slow connections "
+              f"(naive: {naive['ticks_per_s']:,.0f} ticks/s, "
+              f"{naive['peak_pending_frames']:,} frames queued)")
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    config = {k: v for k, v in vars(args).items() if k != "output"}
+    config.update(python=platform.python_version(), machine=platform.machine())
+    with open(output, "w") as f:
+        json.dump({"config": config, "results": results}, f, indent=2)
+    print(f"✅ Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Scalability benchmark for FedHR5.0
+
+Runs simulated FedAvg rounds for a sweep of organization counts and records
+round wall time, peak RSS and bytes exchanged per round. Each point runs in a
+fresh process so that peak RSS is not polluted by earlier, larger points.
+
+Results are written to experiments/results/scalability.json (read by
+scripts/create_placeholder_images.py) and a CSV with the same rows.
+
+Usage:
+    python experiments/scalability_benchmark.py
+    python experiments/scalability_benchmark.py --orgs 1 10 50 --model-size 50000
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing as mp
+import platform
+import resource
+import statistics
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from fedhr5.core.simulation import FedAvgSimulator  # noqa: E402
+
+DEFAULT_ORGS = [1, 5, 10, 20, 30, 40, 50, 75, 100, 150, 200]
+RESULTS_DIR = ROOT / "experiments" / "results"
+
+
+def _peak_rss_bytes():
+    """Peak resident set size of the current process in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def measure_point(num_orgs, model_size, samples_per_org, rounds, warmup, seed):
+    """Benchmark a single organization count (runs in a child process)."""
+    simulator = FedAvgSimulator(num_orgs, model_size=model_size,
+                                samples_per_org=samples_per_org, seed=seed)
+    stats = simulator.run(rounds, warmup=warmup)
+    wall_times = [s.wall_time_s for s in stats]
+    return {
+        "num_orgs": num_orgs,
+        "round_time_s": statistics.median(wall_times),
+        "round_time_min_s": min(wall_times),
+        "round_time_max_s": max(wall_times),
+        "train_time_s": statistics.median(s.train_time_s for s in stats),
+        "aggregation_time_s": statistics.median(s.aggregation_time_s for s in stats),
+        "bytes_up": stats[-1].bytes_up,
+        "bytes_down": stats[-1].bytes_down,
+        "bytes_exchanged": stats[-1].bytes_exchanged,
+        "peak_rss_bytes": _peak_rss_bytes(),
+    }
+
+
+def run_benchmark(orgs, model_size, samples_per_org, rounds, warmup, seed):
+    """Sweep organization counts, one fresh process per point."""
+    ctx = mp.get_context("spawn")
+    results = []
+    for num_orgs in orgs:
+        with ctx.Pool(1) as pool:
+            row = pool.apply(measure_point, (num_orgs, model_size, samples_per_org,
+                                             rounds, warmup, seed))
+        results.append(row)
+        print(f"  N={num_orgs:>4}  round={row['round_time_s'] * 1000:9.1f} ms  "
+              f"rss={row['peak_rss_bytes'] / 2**20:8.1f} MiB  "
+              f"exchanged={row['bytes_exchanged'] / 2**20:8.1f} MiB")
+    return results
+
+
+def write_results(results, config, output_dir):
+    """Write JSON (with run configuration) and CSV result files."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    json_path = output_dir / "scalability.json"
+    csv_path = output_dir / "scalability.csv"
+
+    with open(json_path, "w") as f:
+        json.dump({"config": config, "results": results}, f, indent=2)
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+        writer.writeheader()
+        writer.writerows(results)
+    return json_path, csv_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--orgs", type=int, nargs="+", default=DEFAULT_ORGS,
+                        help="organization counts to sweep")
+    parser.add_argument("--model-size", type=int, default=10_000,
+                        help="number of model parameters")
+    parser.add_argument("--samples-per-org", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=5,
+                        help="timed rounds per point")
+    parser.add_argument("--warmup", type=int, default=1,
+                        help="untimed warm-up rounds per point")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output-dir", type=Path, default=RESULTS_DIR)
+    args = parser.parse_args()
+
+    config = {
+        "model_size": args.model_size,
+        "samples_per_org": args.samples_per_org,
+        "rounds": args.rounds,
+        "warmup": args.warmup,
+        "seed": args.seed,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+    }
+    print("⏱️  Running scalability benchmark...")
+    results = run_benchmark(args.orgs, args.model_size, args.samples_per_org,
+                            args.rounds, args.warmup, args.seed)
+    json_path, csv_path = write_results(results, config, args.output_dir)
+    print(f"✅ Results written to {json_path} and {csv_path}")
+
+
+if __name__ == "__main__":
+    main()
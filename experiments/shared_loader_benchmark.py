@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Shared-memory data loader benchmark for FedHR5.0
+
+An organization trains all five modules at once, one process per module, on
+overlapping columns of the same employee table. Two ways of feeding them are
+compared on a synthetic CSV export:
+
+- per-module: every training process decodes the whole file itself (what
+  each module's loader does today),
+- shared: fedhr5.utils.data_loader.SharedDataLoader decodes it once into
+  shared memory and the training processes attach read-only.
+
+Each mode runs under its own coordinator process. Once every module has
+trained, the coordinator snapshots the proportional set size (PSS) of itself
+and its workers: shared pages are split between the processes mapping them,
+so the sum is the node's real footprint. Peak RSS counts shared pages in
+every process and is reported alongside.
+
+Linux only (reads /proc).
+
+Usage:
+    python experiments/shared_loader_benchmark.py
+    python experiments/shared_loader_benchmark.py --rows 1000000 --epochs 3
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing as mp
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from fedhr5.utils.data_loader import SharedDataLoader, read_table  # noqa: E402
+
+RESULTS_DIR = ROOT / "experiments" / "results"
+
+CATEGORICAL = {"department": 24, "role": 180, "location": 40, "contract": 4}
+NUMERIC = ["tenure", "age", "salary_band", "workload", "overtime", "absences",
+           "engagement", "stress", "sleep_score", "training_hours", "skills_count",
+           "certifications", "performance", "promotion_gap", "team_size"]
+TARGET = "attrition"
+
+# (numeric features, grouping column) per module; the subsets overlap
+MODULE_COLUMNS = {
+    "wellbeing": (["workload", "overtime", "absences", "engagement", "stress",
+                   "sleep_score"], "department"),
+    "skills": (["tenure", "training_hours", "skills_count", "certifications",
+                "performance"], "role"),
+    "recruitment": (["age", "tenure", "salary_band", "skills_count", "performance",
+                     "promotion_gap"], "role"),
+    "benchmarking": (["salary_band", "engagement", "performance", "absences",
+                      "team_size"], "location"),
+    "learning": (["training_hours", "skills_count", "certifications", "promotion_gap",
+                  "engagement"], "department"),
+}
+
+
+def write_table(path, rows, seed):
+    """Synthetic employee export: categorical, integer and float columns."""
+    rng = np.random.default_rng(seed)
+    columns = {"employee_id": np.arange(rows)}
+    for name, cardinality in CATEGORICAL.items():
+        codes = rng.integers(0, cardinality, rows)
+        columns[name] = np.array([f"{name}_{i:03d}" for i in range(cardinality)])[codes]
+    for i, name in enumerate(NUMERIC):
+        if i % 3 == 0:
+            columns[name] = rng.integers(0, 40, rows)
+        else:
+            columns[name] = np.round(rng.normal(0, 1, rows), 4)
+    logits = 0.8 * columns["stress"] - 0.6 * columns["engagement"] - 0.02 * columns["tenure"]
+    columns[TARGET] = (rng.random(rows) < 1 / (1 + np.exp(-logits))).astype(np.int64)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(list(columns))
+        writer.writerows(zip(*(values.tolist() for values in columns.values())))
+
+
+def memory_kb(pid="self"):
+    """Current RSS, peak RSS and PSS of a process in kB."""
+    status = {}
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in ("VmRSS", "VmHWM"):
+                status[key] = int(value.split()[0])
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            if line.startswith("Pss:"):
+                status["Pss"] = int(line.split()[1])
+    return status
+
+
+def train(columns, features, group, num_groups, epochs, batch_size):
+    """Logistic regression with mini-batch gradient steps, then mean risk per group."""
+    num_rows = len(columns[TARGET])
+
+    def batches():
+        for start in range(0, num_rows, batch_size):
+            rows = slice(start, start + batch_size)
+            x = np.column_stack([columns[name][rows] for name in features]).astype(np.float32)
+            yield rows, x
+
+    weights = np.zeros(len(features), dtype=np.float32)
+    for _ in range(epochs):
+        for rows, x in batches():
+            y = columns[TARGET][rows]
+            p = 1 / (1 + np.exp(-(x @ weights)))
+            weights -= 0.05 * x.T @ (p - y) / len(y)
+    risk, counts = np.zeros(num_groups), np.zeros(num_groups)
+    for rows, x in batches():
+        codes = columns[group][rows]
+        risk += np.bincount(codes, 1 / (1 + np.exp(-(x @ weights))), num_groups)
+        counts += np.bincount(codes, minlength=num_groups)
+    return weights, risk / np.maximum(counts, 1)
+
+
+def worker(module, mode, source, args, started, results, done):
+    baseline_kb = memory_kb()["VmRSS"]
+    start = time.perf_counter()
+    features, group = MODULE_COLUMNS[module]
+    names = features + [group, TARGET]
+    if mode == "shared":
+        table = source.attach()
+        columns = table.select(names)
+        num_groups = len(table.categories(group))
+    else:
+        decoded = read_table(source)
+        columns = {name: values for name, (values, _) in decoded.items()}
+        num_groups = len(decoded[group][1])
+    loaded = time.time()
+    load_s = time.perf_counter() - start
+    start = time.perf_counter()
+    weights, _ = train(columns, features, group, num_groups, args.epochs, args.batch_size)
+    train_s = time.perf_counter() - start
+    memory = memory_kb()
+    results.put({"module": module, "pid": os.getpid(), "load_s": load_s,
+                 "train_s": train_s, "ready_after_s": loaded - started,
+                 "baseline_rss_mb": baseline_kb / 1024, "peak_rss_mb": memory["VmHWM"] / 1024,
+                 "weights": weights.tolist()})
+    # Stay alive (and attached) until the coordinator has read every PSS
+    done.wait()
+
+
+def coordinator(mode, path, args, out):
+    ctx = mp.get_context("spawn")
+    results, done = ctx.Queue(), ctx.Event()
+    started = time.time()
+    start = time.perf_counter()
+    loader = SharedDataLoader()
+    if mode == "shared":
+        source = loader.load("employees", path)
+    else:
+        source = str(path)
+    decode_s = time.perf_counter() - start
+    processes = [ctx.Process(target=worker, args=(module, mode, source, args, started,
+                                                  results, done))
+                 for module in MODULE_COLUMNS]
+    for process in processes:
+        process.start()
+    workers = sorted((results.get() for _ in processes), key=lambda r: r["module"])
+    elapsed_s = time.perf_counter() - start
+    for row in workers:
+        row["pss_mb"] = memory_kb(row["pid"])["Pss"] / 1024
+    own = memory_kb()
+    done.set()
+    for process in processes:
+        process.join()
+    loader.close()
+    out.put({
+        "mode": mode,
+        "decode_s": decode_s,
+        "ready_s": max(row["ready_after_s"] for row in workers),
+        "elapsed_s": elapsed_s,
+        "coordinator_peak_rss_mb": own["VmHWM"] / 1024,
+        "total_pss_mb": (own["Pss"] + sum(row["pss_mb"] * 1024 for row in workers)) / 1024,
+        "sum_peak_rss_mb": (own["VmHWM"] + sum(row["peak_rss_mb"] * 1024
+                                               for row in workers)) / 1024,
+        "workers": workers,
+    })
+
+
+def run(mode, path, args):
+    ctx = mp.get_context("spawn")
+    out = ctx.Queue()
+    process = ctx.Process(target=coordinator, args=(mode, path, args, out))
+    process.start()
+    result = out.get()
+    process.join()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=400_000)
+    parser.add_argument("--epochs", type=int, default=2)
+    parser.add_argument("--batch-size", type=int, default=8192)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=str(RESULTS_DIR / "shared_loader.json"))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "employees.csv"
+        write_table(path, args.rows, args.seed)
+        size_mb = path.stat().st_size / 1e6
+        columns = read_table(path)
+        decoded_mb = sum(values.nbytes for values, _ in columns.values()) / 1e6
+        del columns
+        print(f"⏱️  {args.rows:,} employees x {len(NUMERIC) + len(CATEGORICAL) + 2} columns: "
+              f"{size_mb:.0f} MB CSV, {decoded_mb:.0f} MB decoded; "
+              f"{len(MODULE_COLUMNS)} modules training concurrently")
+        print(f"{'mode':>11} {'decode':>8} {'ready':>8} {'total':>8} {'PSS sum':>9} "
+              f"{'peak RSS sum':>13} {'coord peak':>11} {'worker peak':>12}")
+        results = []
+        for mode in ("per-module", "shared"):
+            row = run(mode, path, args)
+            results.append(row)
+            worker_peak = max(w["peak_rss_mb"] for w in row["workers"])
+            print(f"{mode:>11} {row['decode_s']:>7.2f}s {row['ready_s']:>7.2f}s "
+                  f"{row['elapsed_s']:>7.2f}s {row['total_pss_mb']:>6.0f} MB "
+                  f"{row['sum_peak_rss_mb']:>10.0f} MB {row['coordinator_peak_rss_mb']:>8.0f} MB "
+                  f"{worker_peak:>9.0f} MB")
+
+    per_module, shared = results
+    same = all(np.allclose(a["weights"], b["weights"])
+               for a, b in zip(per_module["workers"], shared["workers"]))
+    if not same:
+        print("⚠️  Modules trained on shared columns disagree with per-module loading")
+    else:
+        print(f"✅ Shared loading: {per_module['total_pss_mb'] / shared['total_pss_mb']:.1f}x "
+              f"less memory ({shared['total_pss_mb']:.0f} vs {per_module['total_pss_mb']:.0f} MB "
+              f"PSS), every module ready after {shared['ready_s']:.1f}s "
+              f"vs {per_module['ready_s']:.1f}s, identical models")
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    config = {k: v for k, v in vars(args).items() if k != "output"}
+    config.update(python=platform.python_version(), machine=platform.machine(),
+                  csv_mb=size_mb, decoded_mb=decoded_mb)
+    with open(output, "w") as f:
+        json.dump({"config": config, "results": results}, f, indent=2)
+    print(f"✅ Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Well-being streaming pipeline benchmark for FedHR5.0
+
+Pushes a synthetic wearable/environmental stream (default 10k events/s per
+device) through the edge pipeline of fedhr5.modules.wellbeing:
+
+    sensor stream -> sliding (30 s / 5 s hop) or tumbling (60 s) windows
+    -> FeatureBuffer
+
+and reports sustained throughput, the headroom over real time, and peak
+traced memory for increasing stream lengths. Peak memory should stay flat
+as the stream grows, since no raw history is retained; the first row shows
+what materializing the same readings would cost instead.
+
+Usage:
+    python experiments/wellbeing_stream_benchmark.py
+    python experiments/wellbeing_stream_benchmark.py --rate 10000 --durations 60 600
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections import deque
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from fedhr5.modules.wellbeing import (  # noqa: E402
+    FeatureBuffer, SlidingWindowFeatures, TumblingWindowFeatures, collect,
+    simulate_sensor_stream,
+)
+from fedhr5.modules.wellbeing.data_collectors import SENSOR_CHANNELS  # noqa: E402
+
+RESULTS_DIR = ROOT / "experiments" / "results"
+CHANNELS = list(SENSOR_CHANNELS)
+
+
+def run_pipeline(mode, rate, duration, seed):
+    """Run the stream end to end; returns (events, feature vectors, pipeline)."""
+    stream = simulate_sensor_stream(rate, duration, CHANNELS, seed=seed)
+    if mode == "sliding":
+        pipeline = SlidingWindowFeatures(CHANNELS, window=30.0, hop=5.0,
+                                         max_rate=rate / len(CHANNELS) * 1.5)
+    else:
+        pipeline = TumblingWindowFeatures(CHANNELS, duration=60.0)
+    # One hour of feature vectors at a 5 s hop
+    buffer = FeatureBuffer(capacity=720, width=pipeline.width)
+    deque(collect(pipeline.process(stream), buffer), maxlen=0)
+    return int(rate * duration), len(buffer), pipeline
+
+
+def measure(mode, rate, duration, seed):
+    start = time.perf_counter()
+    for _ in simulate_sensor_stream(rate, duration, CHANNELS, seed=seed):
+        pass
+    source_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    events, vectors, pipeline = run_pipeline(mode, rate, duration, seed)
+    total_s = time.perf_counter() - start
+
+    # Memory in a separate pass: tracemalloc slows allocation-heavy code down
+    tracemalloc.start()
+    run_pipeline(mode, rate, duration, seed)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    pipeline_s = max(total_s - source_s, 1e-9)
+    return {
+        "mode": mode,
+        "stream_seconds": duration,
+        "events": events,
+        "feature_vectors": vectors,
+        "source_s": source_s,
+        "total_s": total_s,
+        "events_per_s": events / total_s,
+        "pipeline_events_per_s": events / pipeline_s,
+        "realtime_factor": duration / total_s,
+        "peak_mb": peak / 1e6,
+        "dropped": getattr(pipeline, "dropped", 0),
+        "late": pipeline.late,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rate", type=float, default=10_000.0, help="events/s per device")
+    parser.add_argument("--durations", type=float, nargs="+", default=[60, 300, 600],
+                        help="simulated stream lengths in seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=str(RESULTS_DIR / "wellbeing_stream.json"))
+    args = parser.parse_args()
+
+    # What keeping the raw history would cost: one tuple per reading
+    duration = args.durations[0]
+    tracemalloc.start()
+    history = list(simulate_sensor_stream(args.rate, duration, CHANNELS, seed=args.seed))
+    _, history_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del history
+    print(f"⏱️  {args.rate:,.0f} events/s, {len(CHANNELS)} channels; "
+          f"materializing {duration:.0f} s of raw readings peaks at {history_peak / 1e6:.1f} MB")
+
+    print(f"{'mode':>8} {'stream':>8} {'events':>11} {'events/s':>11} "
+          f"{'pipeline/s':>11} {'x realtime':>11} {'peak MB':>8}")
+    results = []
+    for mode in ("sliding", "tumbling"):
+        for duration in args.durations:
+            row = measure(mode, args.rate, duration, args.seed)
+            results.append(row)
+            print(f"{mode:>8} {duration:>7.0f}s {row['events']:>11,} "
+                  f"{row['events_per_s']:>11,.0f} {row['pipeline_events_per_s']:>11,.0f} "
+                  f"{row['realtime_factor']:>10.1f}x {row['peak_mb']:>8.2f}")
+            if row["realtime_factor"] < 1:
+                print(f"⚠️  {mode} pipeline falls behind a {args.rate:,.0f} events/s stream")
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({"config": {"rate": args.rate, "durations": args.durations,
+                              "channels": CHANNELS, "seed": args.seed,
+                              "python": platform.python_version(),
+                              "machine": platform.machine()},
+                   "history_peak_mb": history_peak / 1e6,
+                   "results": results}, f, indent=2)
+    print(f"✅ Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
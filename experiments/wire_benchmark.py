@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Wire format round-trip benchmark for FedHR5.0
+
+Compares encode and decode time of the zero-copy frame format with pickle
+and with protobuf (weights packed in a ``bytes`` field, as in the current
+``ModelUpdate`` message) for models from 1 MB to 1 GB. Protobuf is skipped
+if the ``protobuf`` package is not installed. Results are written to
+experiments/results/wire.json.
+
+Usage:
+    python experiments/wire_benchmark.py
+    python experiments/wire_benchmark.py --sizes-mb 1 64 1024
+"""
+
+import argparse
+import json
+import pickle
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from fedhr5.core.wire import MESSAGE_MODEL_UPDATE, ModelUpdate, pack_frame  # noqa: E402
+
+try:
+    from google.protobuf import wrappers_pb2
+except ImportError:
+    wrappers_pb2 = None
+
+RESULTS_DIR = ROOT / "experiments" / "results"
+METADATA = {"round_id": "round_2024_12_001", "privacy_spent": 0.01, "metrics": {}}
+
+
+def timed(fn, repeat):
+    timings, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def bench_frame(weights, repeat):
+    tensors = {"weights": weights}
+    t_enc, frame = timed(lambda: pack_frame(MESSAGE_MODEL_UPDATE, METADATA, tensors),
+                         repeat)
+    t_dec, update = timed(lambda: ModelUpdate.from_frame(frame), repeat)
+    assert update.tensors["weights"][-1] == weights[-1]
+    return t_enc, t_dec, frame.nbytes
+
+
+def bench_pickle(weights, repeat):
+    message = dict(METADATA, weights=weights)
+    t_enc, blob = timed(lambda: pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL),
+                        repeat)
+    t_dec, _ = timed(lambda: pickle.loads(blob), repeat)
+    return t_enc, t_dec, len(blob)
+
+
+def bench_protobuf(weights, repeat):
+    def encode():
+        return wrappers_pb2.BytesValue(value=weights.tobytes()).SerializeToString()
+
+    def decode():
+        message = wrappers_pb2.BytesValue.FromString(blob)
+        return np.frombuffer(message.value, dtype=np.float32)
+
+    t_enc, blob = timed(encode, repeat)
+    t_dec, _ = timed(decode, repeat)
+    return t_enc, t_dec, len(blob)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes-mb", type=int, nargs="+", default=[1, 16, 256, 1024])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default=str(RESULTS_DIR / "wire.json"))
+    args = parser.parse_args()
+
+    formats = [("frame", bench_frame), ("pickle", bench_pickle)]
+    if wrappers_pb2 is not None:
+        formats.append(("protobuf", bench_protobuf))
+    else:
+        print("⚠️  protobuf not installed, skipping the protobuf baseline")
+
+    print(f"{'size':>8} {'format':<9} {'encode':>10} {'decode':>10} {'wire size':>12}")
+    results = []
+    for size_mb in args.sizes_mb:
+        weights = np.random.default_rng(0).standard_normal(
+            size_mb * 2**20 // 4, dtype=np.float32)
+        for name, bench in formats:
+            t_enc, t_dec, nbytes = bench(weights, args.repeat)
+            results.append({"size_mb": size_mb, "format": name, "encode_s": t_enc,
+                            "decode_s": t_dec, "wire_bytes": nbytes})
+            print(f"{size_mb:>6}MB {name:<9} {t_enc * 1000:>8.2f}ms "
+                  f"{t_dec * 1000:>8.3f}ms {nbytes / 2**20:>10.2f}MB")
+        del weights
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    config = {k: v for k, v in vars(args).items() if k != "output"}
+    config.update(python=platform.python_version(), machine=platform.machine(),
+                  protobuf=wrappers_pb2 is not None)
+    with open(output, "w") as f:
+        json.dump({"config": config, "results": results}, f, indent=2)
+    print(f"✅ Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
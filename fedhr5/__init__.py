@@ -0,0 +1,23 @@
+"""
+FedHR5.0 - Federated Learning for Industry 5.0 HR Management
+
+Privacy-preserving federated analytics for well-being, skills, recruitment,
+benchmarking and learning across manufacturing consortiums.
+
+Subpackages and the names below are imported on first use (PEP 562), so
+``import fedhr5`` does not load numpy or any submodule.
+"""
+
+from .utils.lazy import attach
+
+__version__ = "0.1.0"
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "core": ["FedAvgSimulator", "ClientScheduler", "ProgressBroker"],
+        "privacy": ["PrivacyAccountant", "PrivacyBudgetManager", "SecureAggregator"],
+        "utils": ["ResultsStore"],
+    },
+    submodules=["core", "modules", "privacy", "utils"],
+)
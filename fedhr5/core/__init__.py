@@ -0,0 +1,20 @@
+"""
+FedHR5.0 - Core federated learning components
+"""
+
+from ..utils.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "aggregation": ["federated_average", "AGGREGATORS", "aggregate", "coordinate_median",
+                    "trimmed_mean", "krum"],
+    "asynchronous": ["AsyncAggregator", "AsyncSimulation", "SimulationTrace",
+                     "staleness_weight"],
+    "compression": ["UpdateCodec", "compression_ratio", "secure_aggregation_params"],
+    "model_store": ["ModelStore", "ModelSnapshot", "CommitStats"],
+    "progress": ["ProgressBroker", "Subscription", "BrokerStats"],
+    "scheduling": ["ClientScheduler", "ClientProfile", "Selection"],
+    "simulation": ["FedAvgSimulator", "RoundStats"],
+    "hierarchy": ["HierarchicalSimulator", "HierarchicalRoundStats", "TierStats"],
+    "topology": ["TopologyNode", "balanced_topology", "build_topology", "load_topology"],
+    "wire": ["ModelUpdate", "AggregatedModel", "encode_frame", "decode_frame", "read_frame"],
+})
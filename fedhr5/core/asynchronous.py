@@ -0,0 +1,214 @@
+"""
+FedHR5.0 - Asynchronous bounded-staleness aggregation
+
+Applies client updates as soon as they arrive instead of waiting for the
+slowest participant (FedAsync, Xie et al., 2019). An update trained on global
+version τ and received at version v has staleness s = v − τ; it is mixed in
+with weight ``mixing · (1 + s)^−a`` and rejected when s exceeds
+``max_staleness``.
+
+Both the asynchronous mode and a synchronous FedAvg baseline are driven by
+the same asyncio simulator, with per-client delays modelling device speed,
+so the two can be benchmarked on equal footing.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .aggregation import federated_average
+from .simulation import local_update
+
+
+def staleness_weight(staleness: int, exponent: float = 0.5) -> float:
+    """Polynomial staleness discount (1 + s)^−a."""
+    return (1.0 + staleness) ** -exponent
+
+
+class AsyncAggregator:
+    """
+    Global model that accepts client updates asynchronously.
+
+    Args:
+        initial_weights: Initial global parameters.
+        mixing: Base mixing rate α for a fresh (staleness 0) update.
+        max_staleness: Updates staler than this are rejected.
+        staleness_exponent: Exponent a of the staleness discount.
+    """
+
+    def __init__(self,
+                 initial_weights: np.ndarray,
+                 mixing: float = 0.5,
+                 max_staleness: int = 10,
+                 staleness_exponent: float = 0.5):
+        if not 0 < mixing <= 1:
+            raise ValueError("mixing must lie in (0, 1]")
+        if max_staleness < 0:
+            raise ValueError("max_staleness must be non-negative")
+        self.weights = np.array(initial_weights, dtype=np.float32)
+        self.version = 0
+        self.mixing = mixing
+        self.max_staleness = max_staleness
+        self.staleness_exponent = staleness_exponent
+        self.accepted = 0
+        self.rejected = 0
+
+    def snapshot(self) -> Tuple[np.ndarray, int]:
+        """Current global weights (copy) and their version."""
+        return self.weights.copy(), self.version
+
+    def submit(self, weights: np.ndarray, base_version: int) -> bool:
+        """
+        Mix one client's locally trained weights into the global model.
+
+        Runs without awaiting, so within one event loop every update is
+        applied atomically.
+
+        Args:
+            weights: Client weights after local training.
+            base_version: Global version the client started from.
+
+        Returns:
+            True if the update was applied, False if it was too stale.
+        """
+        staleness = self.version - base_version
+        if staleness > self.max_staleness:
+            self.rejected += 1
+            return False
+        alpha = np.float32(self.mixing * staleness_weight(staleness,
+                                                          self.staleness_exponent))
+        self.weights *= 1 - alpha
+        self.weights += alpha * weights
+        self.version += 1
+        self.accepted += 1
+        return True
+
+
+@dataclass
+class SimulationTrace:
+    """Model error of the global model over (simulated) wall time."""
+
+    mode: str
+    times_s: List[float] = field(default_factory=list)
+    errors: List[float] = field(default_factory=list)
+    updates_applied: int = 0
+    updates_rejected: int = 0
+
+    def time_to_error(self, target: float) -> Optional[float]:
+        """First time the global model error fell to ``target``, if ever."""
+        for t, error in zip(self.times_s, self.errors):
+            if error <= target:
+                return t
+        return None
+
+
+class AsyncSimulation:
+    """
+    Asyncio simulator for synchronous and asynchronous aggregation.
+
+    Each client repeatedly fetches the global model, waits for its delay
+    (device speed and network), trains locally and reports back. Error is
+    the relative distance of the global model to the ground-truth weights.
+
+    Args:
+        client_delays: Per-client seconds per local training round.
+        model_size: Number of model parameters.
+        samples_per_client: Local samples per client.
+        jitter: Relative random variation of each delay.
+        seed: Seed for data, model and delays.
+    """
+
+    def __init__(self,
+                 client_delays: Sequence[float],
+                 model_size: int = 1_000,
+                 samples_per_client: int = 64,
+                 jitter: float = 0.1,
+                 seed: int = 0):
+        self.client_delays = list(client_delays)
+        self.model_size = model_size
+        self.samples_per_client = samples_per_client
+        self.jitter = jitter
+        self.seed = seed
+        rng = np.random.default_rng(seed)
+        self._true_weights = rng.standard_normal(model_size).astype(np.float32)
+        self._delay_rng = np.random.default_rng((seed, 1))
+
+    def _error(self, weights: np.ndarray) -> float:
+        return float(np.linalg.norm(weights - self._true_weights)
+                     / np.linalg.norm(self._true_weights))
+
+    def _delay(self, client_id: int) -> float:
+        spread = self._delay_rng.uniform(1 - self.jitter, 1 + self.jitter)
+        return self.client_delays[client_id] * spread
+
+    def _train(self, client_id: int, weights: np.ndarray, step: int) -> np.ndarray:
+        # A fresh local minibatch per step, as in a real client's data stream
+        return local_update(weights, self._true_weights,
+                            (self.seed, client_id, step),
+                            self.samples_per_client, local_steps=1,
+                            learning_rate=0.05)
+
+    async def _run_async(self, aggregator: AsyncAggregator,
+                         duration_s: float, trace: SimulationTrace):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        deadline = start + duration_s
+
+        async def client(client_id: int):
+            step = 0
+            while True:
+                weights, version = aggregator.snapshot()
+                await asyncio.sleep(self._delay(client_id))
+                if loop.time() >= deadline:
+                    return
+                step += 1
+                local = self._train(client_id, weights, step)
+                if aggregator.submit(local, version):
+                    trace.times_s.append(loop.time() - start)
+                    trace.errors.append(self._error(aggregator.weights))
+
+        await asyncio.gather(*(client(i) for i in range(len(self.client_delays))))
+
+    def run_async(self,
+                  duration_s: float,
+                  mixing: float = 0.5,
+                  max_staleness: int = 10,
+                  staleness_exponent: float = 0.5) -> SimulationTrace:
+        """Run asynchronous bounded-staleness aggregation for ``duration_s``."""
+        aggregator = AsyncAggregator(np.zeros(self.model_size, dtype=np.float32),
+                                     mixing, max_staleness, staleness_exponent)
+        trace = SimulationTrace(mode="async")
+        asyncio.run(self._run_async(aggregator, duration_s, trace))
+        trace.updates_applied = aggregator.accepted
+        trace.updates_rejected = aggregator.rejected
+        return trace
+
+    async def _run_sync(self, duration_s: float, trace: SimulationTrace):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        weights = np.zeros(self.model_size, dtype=np.float32)
+        round_num = 0
+
+        async def client(client_id: int, global_weights: np.ndarray, step: int):
+            await asyncio.sleep(self._delay(client_id))
+            return self._train(client_id, global_weights, step)
+
+        while True:
+            round_num += 1
+            updates = await asyncio.gather(*(
+                client(i, weights, round_num) for i in range(len(self.client_delays))
+            ))
+            if loop.time() - start >= duration_s:
+                return
+            weights = federated_average(updates)
+            trace.updates_applied += len(updates)
+            trace.times_s.append(loop.time() - start)
+            trace.errors.append(self._error(weights))
+
+    def run_sync(self, duration_s: float) -> SimulationTrace:
+        """Run synchronous FedAvg rounds (wait for every client) for ``duration_s``."""
+        trace = SimulationTrace(mode="sync")
+        asyncio.run(self._run_sync(duration_s, trace))
+        return trace
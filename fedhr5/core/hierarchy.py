@@ -0,0 +1,177 @@
+"""
+FedHR5.0 - Hierarchical aggregation simulator
+
+Executes edge → fog → cloud FedAvg rounds in-process over an arbitrary
+:class:`~fedhr5.core.topology.TopologyNode` tree. Every inner node performs a
+partial weighted average of its children and forwards it, with its total
+sample count, to its parent, which is exactly equivalent to flat FedAvg over
+the leaves.
+
+Compute (local training, aggregation) is measured; network transfers are
+modelled from each link's bandwidth and latency. Children of a node run in
+parallel in a real deployment, so the round time is the critical path
+through the tree rather than the sum of all work, except that every
+broadcast and upload of a node's children shares that node's interface
+(``nic_mbps``), which is what bounds fog fan-out.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+import numpy as np
+
+from .aggregation import federated_average
+from .simulation import local_update
+from .topology import TopologyNode
+
+
+@dataclass
+class TierStats:
+    """
+    Per-tier totals for one round.
+
+    ``latency_s`` is the slowest node of the tier's own contribution: its
+    training or aggregation time plus the transfers over its parent link.
+    ``nic_s`` is the longest time a node of the tier spends moving its
+    children's traffic through its own interface.
+    """
+
+    nodes: int = 0
+    bytes_up: int = 0
+    bytes_down: int = 0
+    compute_s: float = 0.0
+    transfer_s: float = 0.0
+    latency_s: float = 0.0
+    nic_s: float = 0.0
+
+    @property
+    def bytes_moved(self) -> int:
+        return self.bytes_up + self.bytes_down
+
+
+@dataclass
+class HierarchicalRoundStats:
+    """Measurements for one hierarchical round."""
+
+    round_num: int
+    round_time_s: float
+    wall_time_s: float
+    tiers: Dict[str, TierStats] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        return {
+            "round_num": self.round_num,
+            "round_time_s": self.round_time_s,
+            "wall_time_s": self.wall_time_s,
+            "tiers": {
+                name: dict(vars(stats), bytes_moved=stats.bytes_moved)
+                for name, stats in self.tiers.items()
+            },
+        }
+
+
+class HierarchicalSimulator:
+    """
+    Simulate FedAvg over a multi-tier aggregation tree.
+
+    Args:
+        topology: Root of the aggregation tree (e.g. the cloud node).
+        model_size: Number of model parameters.
+        local_steps: Gradient steps per leaf per round.
+        learning_rate: Local SGD learning rate.
+        seed: Seed for synthetic data and model initialisation.
+    """
+
+    def __init__(self,
+                 topology: TopologyNode,
+                 model_size: int = 10_000,
+                 local_steps: int = 1,
+                 learning_rate: float = 0.01,
+                 seed: int = 0):
+        self.topology = topology
+        self.model_size = model_size
+        self.local_steps = local_steps
+        self.learning_rate = learning_rate
+        self.seed = seed
+
+        rng = np.random.default_rng(seed)
+        self.global_weights = np.zeros(model_size, dtype=np.float32)
+        self._true_weights = rng.standard_normal(model_size).astype(np.float32)
+        self._leaf_ids = {leaf.name: i for i, leaf in enumerate(topology.leaves())}
+        self.round = 0
+
+    def _run_node(self,
+                  node: TopologyNode,
+                  weights: np.ndarray,
+                  tiers: Dict[str, TierStats]) -> Tuple[np.ndarray, int, float, float]:
+        """
+        Run the subtree rooted at ``node``.
+
+        Returns:
+            ``(weights, num_samples, elapsed, own_compute)`` where
+            ``elapsed`` is the modelled time from the moment ``node`` holds
+            the global model to the moment its (partial) aggregate is ready,
+            excluding transfers over its own parent link, and
+            ``own_compute`` is the node's training or aggregation time.
+        """
+        stats = tiers[node.tier]
+        stats.nodes += 1
+        payload = weights.nbytes
+
+        if node.is_leaf:
+            start = time.perf_counter()
+            local = local_update(weights, self._true_weights,
+                                 (self.seed, self._leaf_ids[node.name]),
+                                 node.num_samples, self.local_steps,
+                                 self.learning_rate)
+            compute = (time.perf_counter() - start) * node.compute_scale
+            stats.compute_s += compute
+            return local, node.num_samples, compute, compute
+
+        results = []
+        slowest = 0.0
+        slowest_subtree = 0.0
+        nic_bytes = 0
+        for child in node.children:
+            child_stats = tiers[child.tier]
+            child_weights, samples, elapsed, own = self._run_node(child, weights, tiers)
+            transfer = (child.transfer_time_s(payload)
+                        + child.transfer_time_s(child_weights.nbytes))
+            child_stats.bytes_down += payload
+            child_stats.bytes_up += child_weights.nbytes
+            child_stats.transfer_s += transfer
+            child_stats.latency_s = max(child_stats.latency_s, own + transfer)
+            slowest = max(slowest, elapsed + transfer)
+            slowest_subtree = max(slowest_subtree, elapsed)
+            nic_bytes += payload + child_weights.nbytes
+            results.append((child_weights, samples))
+
+        # Broadcasts and uploads are serialized through this node's interface
+        nic = node.nic_time_s(nic_bytes)
+        stats.nic_s = max(stats.nic_s, nic)
+        slowest = max(slowest, nic + slowest_subtree)
+
+        start = time.perf_counter()
+        aggregate = federated_average([w for w, _ in results],
+                                      [n for _, n in results])
+        aggregation = (time.perf_counter() - start) * node.compute_scale
+        stats.compute_s += aggregation
+        return (aggregate, sum(n for _, n in results), slowest + aggregation,
+                aggregation)
+
+    def run_round(self) -> HierarchicalRoundStats:
+        """Execute one hierarchical round and return its measurements."""
+        self.round += 1
+        tiers = {name: TierStats() for name in self.topology.tiers()}
+        start = time.perf_counter()
+        self.global_weights, _, round_time, aggregation = self._run_node(
+            self.topology, self.global_weights, tiers)
+        tiers[self.topology.tier].latency_s = aggregation
+        wall_time = time.perf_counter() - start
+        return HierarchicalRoundStats(
+            round_num=self.round,
+            round_time_s=round_time,
+            wall_time_s=wall_time,
+            tiers=tiers,
+        )
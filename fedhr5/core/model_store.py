@@ -0,0 +1,278 @@
+"""
+FedHR5.0 - Versioned, memory-mapped global model store
+
+Stores each round's global weights as a manifest of content-addressed
+chunks. Committing a round compares each chunk with the previous round,
+hashes the ones that differ, and writes only the chunks that no earlier
+round already stored, into one immutable segment file per round. Readers
+(fog nodes, evaluation jobs, plotting) open a round as a
+:class:`ModelSnapshot` whose tensors are ``np.memmap`` views into the
+segment files: nothing is read until it is touched, pages are shared through
+the OS page cache, and a long audit history costs disk space only for the
+chunks that actually changed.
+
+Layout::
+
+    <root>/manifests/round-00000042.json
+    <root>/segments/round-00000042.seg
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+ALIGNMENT = 64
+DEFAULT_TENSOR = "weights"
+
+Tensors = Union[np.ndarray, Mapping[str, np.ndarray]]
+
+
+@dataclass
+class CommitStats:
+    """What a commit wrote to disk."""
+
+    round_num: int
+    chunks_total: int
+    chunks_written: int
+    bytes_written: int
+    bytes_total: int
+
+    @property
+    def chunks_reused(self) -> int:
+        return self.chunks_total - self.chunks_written
+
+
+def _manifest_name(round_num: int) -> str:
+    return f"round-{round_num:08d}.json"
+
+
+def _segment_name(round_num: int) -> str:
+    return f"round-{round_num:08d}.seg"
+
+
+def _write_atomic(path: Path, write):
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class ModelSnapshot:
+    """
+    Read-only, lazily mapped view of one round's global model.
+
+    Tensors whose chunks are stored contiguously (always the case for a
+    tensor that fits in one chunk or was rewritten entirely) are returned as
+    zero-copy views; otherwise they are assembled from their chunk views.
+    """
+
+    def __init__(self, store: "ModelStore", manifest: Dict):
+        self._store = store
+        self._manifest = manifest
+        self.round_num = manifest["round"]
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._manifest["tensors"])
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._manifest["tensors"]
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.tensor(name)
+
+    def chunks(self, name: str = DEFAULT_TENSOR) -> List[np.ndarray]:
+        """Zero-copy views of every chunk of a tensor, in order."""
+        entry = self._manifest["tensors"][name]
+        dtype = np.dtype(entry["dtype"])
+        return [self._store._chunk_view(segment, offset, nbytes).view(dtype)
+                for _, segment, offset, nbytes in entry["chunks"]]
+
+    def tensor(self, name: str = DEFAULT_TENSOR) -> np.ndarray:
+        """Tensor ``name`` of this round (read-only)."""
+        entry = self._manifest["tensors"][name]
+        dtype = np.dtype(entry["dtype"])
+        shape = tuple(entry["shape"])
+        chunks = entry["chunks"]
+        if not chunks:
+            return np.empty(shape, dtype=dtype)
+
+        _, first_segment, first_offset, _ = chunks[0]
+        position = first_offset
+        contiguous = True
+        for _, segment, offset, nbytes in chunks:
+            if segment != first_segment or offset != position:
+                contiguous = False
+                break
+            position += nbytes
+        if contiguous:
+            view = self._store._chunk_view(first_segment, first_offset,
+                                           position - first_offset)
+            return view.view(dtype).reshape(shape)
+
+        out = np.concatenate([c.view(np.uint8) for c in self.chunks(name)])
+        out = out.view(dtype).reshape(shape)
+        out.flags.writeable = False
+        return out
+
+
+class ModelStore:
+    """
+    On-disk, content-addressed store of per-round global models.
+
+    Args:
+        root: Store directory (created if missing).
+        chunk_size: Chunk size in bytes; smaller chunks deduplicate sparse
+            changes better at the cost of larger manifests.
+
+    Example:
+        >>> store = ModelStore("model_store")
+        >>> stats = store.commit(round_num, {"weights": global_weights})
+        >>> weights = store.open().tensor("weights")        # latest, zero-copy
+        >>> audit = store.open(round_num - 50).tensor("weights")
+    """
+
+    def __init__(self, root: Union[str, Path], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if chunk_size <= 0 or chunk_size % ALIGNMENT:
+            raise ValueError(f"chunk_size must be a positive multiple of {ALIGNMENT}")
+        self.root = Path(root)
+        self.chunk_size = chunk_size
+        self._manifests_dir = self.root / "manifests"
+        self._segments_dir = self.root / "segments"
+        self._manifests_dir.mkdir(parents=True, exist_ok=True)
+        self._segments_dir.mkdir(parents=True, exist_ok=True)
+        self._maps: Dict[str, np.memmap] = {}
+        self._index: Dict[str, Tuple[str, int, int]] = {}
+        for round_num in self.rounds():
+            self._index_manifest(self._load_manifest(round_num))
+
+    def rounds(self) -> List[int]:
+        """Committed rounds in ascending order."""
+        return sorted(int(p.stem.split("-")[1])
+                      for p in self._manifests_dir.glob("round-*.json"))
+
+    def latest_round(self) -> Optional[int]:
+        rounds = self.rounds()
+        return rounds[-1] if rounds else None
+
+    def _load_manifest(self, round_num: int) -> Dict:
+        path = self._manifests_dir / _manifest_name(round_num)
+        if not path.exists():
+            raise KeyError(f"Round {round_num} is not in the model store")
+        with open(path) as f:
+            return json.load(f)
+
+    def _index_manifest(self, manifest: Dict):
+        for entry in manifest["tensors"].values():
+            for digest, segment, offset, nbytes in entry["chunks"]:
+                self._index.setdefault(digest, (segment, offset, nbytes))
+
+    def _chunk_view(self, segment: str, offset: int, nbytes: int) -> np.ndarray:
+        mapped = self._maps.get(segment)
+        if mapped is None:
+            mapped = np.memmap(self._segments_dir / segment, dtype=np.uint8, mode="r")
+            self._maps[segment] = mapped
+        return mapped[offset:offset + nbytes]
+
+    def commit(self, round_num: int, tensors: Tensors) -> CommitStats:
+        """
+        Store the global model of ``round_num``.
+
+        Args:
+            round_num: Round identifier; must be greater than every
+                committed round.
+            tensors: A flat weight vector or a mapping of named tensors.
+
+        Returns:
+            Statistics on how much was written versus reused.
+
+        Raises:
+            ValueError: If the round is not newer than the latest one.
+        """
+        latest = self.latest_round()
+        if latest is not None and round_num <= latest:
+            raise ValueError(f"Round {round_num} is not newer than round {latest}")
+        if isinstance(tensors, np.ndarray):
+            tensors = {DEFAULT_TENSOR: tensors}
+
+        previous = self._load_manifest(latest)["tensors"] if latest is not None else {}
+        segment = _segment_name(round_num)
+        pending: List[memoryview] = []
+        new_chunks: Dict[str, Tuple[str, int, int]] = {}
+        offset = 0
+        manifest = {"round": round_num, "chunk_size": self.chunk_size, "tensors": {}}
+        chunks_total = 0
+        bytes_total = 0
+
+        for name, array in tensors.items():
+            array = np.ascontiguousarray(array)
+            data = memoryview(array.reshape(-1).view(np.uint8))
+            before = previous.get(name, {}).get("chunks", [])
+            refs = []
+            for index, start in enumerate(range(0, data.nbytes, self.chunk_size)):
+                chunk = data[start:start + self.chunk_size]
+                chunks_total += 1
+                # Comparing against the previous round is cheaper than hashing
+                if index < len(before) and before[index][3] == chunk.nbytes:
+                    old = self._chunk_view(*before[index][1:])
+                    if np.array_equal(old, np.frombuffer(chunk, dtype=np.uint8)):
+                        refs.append(before[index])
+                        continue
+                digest = hashlib.blake2b(chunk, digest_size=16).hexdigest()
+                location = self._index.get(digest) or new_chunks.get(digest)
+                if location is None:
+                    location = (segment, offset, chunk.nbytes)
+                    new_chunks[digest] = location
+                    pending.append(chunk)
+                    pad = -chunk.nbytes % ALIGNMENT
+                    if pad:
+                        pending.append(memoryview(bytes(pad)))
+                    offset += chunk.nbytes + pad
+                refs.append([digest, *location])
+            bytes_total += data.nbytes
+            manifest["tensors"][name] = {"dtype": array.dtype.str,
+                                         "shape": list(array.shape),
+                                         "chunks": refs}
+
+        if pending:
+            def write_segment(f):
+                for part in pending:
+                    f.write(part)
+            _write_atomic(self._segments_dir / segment, write_segment)
+        # The manifest is written last: a round exists only once its data does
+        _write_atomic(self._manifests_dir / _manifest_name(round_num),
+                      lambda f: f.write(json.dumps(manifest).encode()))
+        self._index.update(new_chunks)
+
+        return CommitStats(
+            round_num=round_num,
+            chunks_total=chunks_total,
+            chunks_written=len(new_chunks),
+            bytes_written=offset,
+            bytes_total=bytes_total,
+        )
+
+    def open(self, round_num: Optional[int] = None) -> ModelSnapshot:
+        """
+        Open a round for reading (the latest round by default).
+
+        Raises:
+            KeyError: If the round does not exist or the store is empty.
+        """
+        if round_num is None:
+            round_num = self.latest_round()
+            if round_num is None:
+                raise KeyError("The model store is empty")
+        return ModelSnapshot(self, self._load_manifest(round_num))
+
+    def disk_usage(self) -> int:
+        """Bytes used by segment files."""
+        return sum(p.stat().st_size for p in self._segments_dir.glob("*.seg"))
@@ -0,0 +1,330 @@
+"""
+FedHR5.0 - Round progress fan-out
+
+Publish/subscribe broker behind the WebSocket ``round_updates`` channel
+(docs/api.md). Reporting clients publish progress ticks as often as they
+like; the broker merges them per round and, at a fixed rate, serializes one
+frame per changed round and hands the same string to every subscriber of
+that round, so the cost of a tick no longer grows with the audience.
+
+Each write runs in a task of its own, so a ``send`` that uses
+``asyncio.timeout()``, ``current_task()`` or context variables never touches
+the broker's flusher. On Python 3.12+ the task starts eagerly: a write that
+completes without blocking (the socket buffer has room) finishes before the
+flush moves on and costs no task switch. A blocked connection holds at most
+one unsent frame per round; when a new frame arrives before the previous one
+was written (a slow dashboard), both are replaced by a full snapshot of the
+round. A lagging connection skips to
+the current state instead of queueing stale ticks, and its memory stays
+bounded.
+
+Example:
+    >>> broker = ProgressBroker(rate_hz=2.0)
+    >>> async with broker:
+    ...     broker.subscribe(websocket.send, ["round_2024_12_001"])
+    ...     broker.publish("round_2024_12_001", "org_001", progress=0.45)
+"""
+
+import asyncio
+import json
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set
+
+Send = Callable[[str], Awaitable[Any]]
+
+
+def _compact_json(message: Dict[str, Any]) -> str:
+    return json.dumps(message, separators=(",", ":"))
+
+
+def _start_task(coro) -> asyncio.Task:
+    """Create a task that runs its first step immediately where supported."""
+    if sys.version_info >= (3, 12):
+        return asyncio.Task(coro, loop=asyncio.get_running_loop(), eager_start=True)
+    return asyncio.get_running_loop().create_task(coro)
+
+
+@dataclass
+class BrokerStats:
+    """Counters of one broker since it was created."""
+
+    published: int = 0      # progress ticks received from clients
+    frames: int = 0         # frames serialized (deltas and snapshots)
+    deliveries: int = 0     # frames written to connections
+    superseded: int = 0     # unsent frames replaced by a snapshot
+    disconnects: int = 0    # connections dropped after a failed send
+
+
+class _Round:
+    """Merged state of one round and what changed since the last flush."""
+
+    __slots__ = ("fields", "clients", "changed", "fields_changed", "progress_sum",
+                 "seq", "subscribers")
+
+    def __init__(self):
+        self.fields: Dict[str, Any] = {}
+        self.clients: Dict[str, Dict[str, Any]] = {}
+        self.changed: Set[str] = set()
+        self.fields_changed = False
+        self.progress_sum = 0.0
+        self.seq = 0
+        self.subscribers: Set["Subscription"] = set()
+
+
+class Subscription:
+    """
+    One connection's view of the broker.
+
+    While a write is blocked, holds at most one pending frame per round,
+    which the writer task drains through ``send`` one at a time.
+    """
+
+    __slots__ = ("round_ids", "sent", "superseded", "_send", "_pending", "_task")
+
+    def __init__(self, send: Send):
+        self.round_ids: Set[str] = set()
+        self.sent = 0
+        self.superseded = 0
+        self._send = send
+        self._pending: Dict[str, str] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        """Frames waiting to be written."""
+        return len(self._pending)
+
+
+class ProgressBroker:
+    """
+    Coalescing pub/sub broker for round progress.
+
+    Args:
+        rate_hz: Flushes per second, i.e. the highest frame rate a
+            subscriber sees for one round.
+        encoder: Serializes a frame dict to the string sent on the wire.
+    """
+
+    def __init__(self,
+                 rate_hz: float = 2.0,
+                 encoder: Callable[[Dict[str, Any]], str] = _compact_json):
+        if rate_hz <= 0:
+            raise ValueError("rate_hz must be positive")
+        self.interval_s = 1.0 / rate_hz
+        self.encoder = encoder
+        self.stats = BrokerStats()
+        self._rounds: Dict[str, _Round] = {}
+        self._subscriptions: Set[Subscription] = set()
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "ProgressBroker":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+        return False
+
+    def _round(self, round_id: str) -> _Round:
+        state = self._rounds.get(round_id)
+        if state is None:
+            state = self._rounds[round_id] = _Round()
+        return state
+
+    # Publishing ---------------------------------------------------------
+
+    def publish(self, round_id: str, client_id: str, **fields):
+        """
+        Record a client's progress tick (``progress``, ``eta``, ...).
+
+        Never awaits and never touches a connection: the tick is merged into
+        the round state and goes out with the next flush.
+        """
+        state = self._round(round_id)
+        client = state.clients.get(client_id)
+        if client is None:
+            client = state.clients[client_id] = {}
+        if "progress" in fields:
+            state.progress_sum += fields["progress"] - client.get("progress", 0.0)
+        client.update(fields)
+        state.changed.add(client_id)
+        self.stats.published += 1
+
+    def update_round(self, round_id: str, **fields):
+        """Set round-level fields such as ``status`` or ``privacy_spent``."""
+        state = self._round(round_id)
+        state.fields.update(fields)
+        state.fields_changed = True
+
+    def discard_round(self, round_id: str):
+        """Forget a finished round's state; its subscribers stay connected."""
+        state = self._rounds.get(round_id)
+        if state is not None:
+            state.fields.clear()
+            state.clients.clear()
+            state.changed.clear()
+            state.progress_sum = 0.0
+            if not state.subscribers:
+                del self._rounds[round_id]
+
+    # Subscribing --------------------------------------------------------
+
+    def subscribe(self, send: Send, round_ids: Iterable[str] = ()) -> Subscription:
+        """
+        Register a connection; must be called from the running event loop.
+
+        Args:
+            send: Coroutine function writing one text frame to the connection
+                (e.g. ``websocket.send``). An exception closes the subscription.
+            round_ids: Rounds to follow; more can be added with :meth:`follow`.
+        """
+        subscription = Subscription(send)
+        self._subscriptions.add(subscription)
+        for round_id in round_ids:
+            self.follow(subscription, round_id)
+        return subscription
+
+    def follow(self, subscription: Subscription, round_id: str):
+        """Add a round to a subscription, starting with a full snapshot."""
+        if round_id in subscription.round_ids:
+            return
+        state = self._round(round_id)
+        subscription.round_ids.add(round_id)
+        state.subscribers.add(subscription)
+        if state.clients or state.fields:
+            snapshot = self._snapshot(round_id, state)
+            if subscription._task is None:
+                self._start_writer(subscription, snapshot)
+            else:
+                subscription._pending[round_id] = snapshot
+
+    def unsubscribe(self, subscription: Subscription):
+        """Detach a connection and stop its writer."""
+        self._subscriptions.discard(subscription)
+        for round_id in subscription.round_ids:
+            state = self._rounds.get(round_id)
+            if state is not None:
+                state.subscribers.discard(subscription)
+        subscription.round_ids.clear()
+        subscription._pending.clear()
+        if subscription._task is not None:
+            subscription._task.cancel()
+            subscription._task = None
+
+    def _disconnect(self, subscription: Subscription):
+        self.stats.disconnects += 1
+        self.unsubscribe(subscription)
+
+    def _start_writer(self, subscription: Subscription, payload: str):
+        """Write ``payload`` in a task that then drains the frames queued behind it."""
+        task = _start_task(self._drain(subscription, payload))
+        # An eager task that never blocked has already finished
+        if not task.done():
+            subscription._task = task
+
+    async def _drain(self, subscription: Subscription, payload: str):
+        pending = subscription._pending
+        try:
+            while True:
+                await subscription._send(payload)
+                subscription.sent += 1
+                self.stats.deliveries += 1
+                if not pending:
+                    break
+                payload = pending.pop(next(iter(pending)))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            subscription._task = None
+            self._disconnect(subscription)
+        else:
+            subscription._task = None
+
+    # Flushing -----------------------------------------------------------
+
+    def _frame(self, round_id: str, state: _Round, snapshot: bool,
+               fields: Dict[str, Any], clients: Dict[str, Dict[str, Any]]) -> str:
+        self.stats.frames += 1
+        participants = len(state.clients)
+        return self.encoder({
+            "type": "round_progress",
+            "round_id": round_id,
+            "seq": state.seq,
+            "snapshot": snapshot,
+            "ts": time.time(),
+            "participants": participants,
+            "progress": state.progress_sum / participants if participants else 0.0,
+            "round": fields,
+            "clients": clients,
+        })
+
+    def _snapshot(self, round_id: str, state: _Round) -> str:
+        return self._frame(round_id, state, True, state.fields, state.clients)
+
+    def flush(self) -> int:
+        """
+        Send one frame per changed round to its subscribers.
+
+        Subscribers share the serialized delta; one still blocked on its
+        previous frame for the round gets a full snapshot in its place.
+
+        Returns:
+            Number of rounds flushed.
+        """
+        flushed = 0
+        for round_id, state in self._rounds.items():
+            if not (state.changed or state.fields_changed):
+                continue
+            state.seq += 1
+            flushed += 1
+            if state.subscribers:
+                delta = self._frame(
+                    round_id, state, False,
+                    state.fields if state.fields_changed else {},
+                    {client_id: state.clients[client_id] for client_id in state.changed
+                     if client_id in state.clients})
+                snapshot = None
+                # A failed send unsubscribes, so iterate over a copy
+                for subscription in list(state.subscribers):
+                    if subscription._task is None:
+                        self._start_writer(subscription, delta)
+                        continue
+                    pending = subscription._pending
+                    if round_id in pending:
+                        if snapshot is None:
+                            snapshot = self._snapshot(round_id, state)
+                        pending[round_id] = snapshot
+                        subscription.superseded += 1
+                        self.stats.superseded += 1
+                    else:
+                        pending[round_id] = delta
+            state.changed.clear()
+            state.fields_changed = False
+        return flushed
+
+    async def _flush_periodically(self):
+        loop = asyncio.get_running_loop()
+        next_flush = loop.time()
+        while True:
+            next_flush += self.interval_s
+            await asyncio.sleep(max(0.0, next_flush - loop.time()))
+            self.flush()
+
+    def start(self):
+        """Start flushing at ``rate_hz`` on the running event loop."""
+        if self._flusher is None:
+            self._flusher = asyncio.get_running_loop().create_task(
+                self._flush_periodically())
+
+    async def close(self):
+        """Stop flushing and detach every subscriber."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        subscriptions = list(self._subscriptions)
+        tasks = [s._task for s in subscriptions if s._task is not None]
+        for subscription in subscriptions:
+            self.unsubscribe(subscription)
+        await asyncio.gather(*tasks, return_exceptions=True)
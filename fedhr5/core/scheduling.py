@@ -0,0 +1,258 @@
+"""
+FedHR5.0 - Deadline-aware client selection
+
+Chooses which clients take part in a round. Each client's local training
+time and link bandwidth are tracked as exponentially weighted moving
+averages of what previous rounds measured, and its expected round time is
+
+    compute + risk * compute_std + latency + 2 * model_bytes / bandwidth
+
+(download and upload). A cohort is filled round-robin across organizations,
+least recently served organization first, from the clients expected to
+finish within the round deadline; within an organization clients rotate so
+that every local dataset is used. An organization that has sat out
+``max_org_gap`` rounds gets its fastest client included even if it is
+expected to be late, so slow organizations still contribute. Estimates of
+clients that are never selected are never refreshed, so a client written off
+after one straggling round is re-measured once it has sat out
+``explore_after`` rounds (``explore_slots`` such clients per round). These
+probes are listed in :attr:`Selection.explored`; the round should not wait
+for them past its deadline, only collect their timings. Each probe that
+confirms the client is late doubles its wait, so genuinely slow clients are
+probed rarely.
+
+Maps onto the round API: ``timeout`` is the deadline and ``min_clients`` the
+smallest acceptable cohort.
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from .topology import DEFAULT_BANDWIDTH_MBPS, DEFAULT_LATENCY_MS
+
+
+@dataclass
+class ClientProfile:
+    """Running estimates for one client."""
+
+    client_id: str
+    organization: str
+    compute_s: float
+    bandwidth_mbps: float
+    latency_ms: float
+    compute_var: float = 0.0
+    observations: int = 0
+    selections: int = 0
+    last_selected: int = 0
+    stale: bool = False
+    explore_backoff: int = 1
+
+    @property
+    def compute_std(self) -> float:
+        return math.sqrt(self.compute_var)
+
+
+@dataclass
+class Selection:
+    """
+    The cohort chosen for one round.
+
+    ``explored`` clients are probes expected to be late; ``expected_round_s``
+    and ``late`` cover the rest of the cohort.
+    """
+
+    round_num: int
+    clients: List[str]
+    expected_round_s: float
+    deadline_s: float
+    late: List[str] = field(default_factory=list)
+    explored: List[str] = field(default_factory=list)
+
+    @property
+    def meets_deadline(self) -> bool:
+        return self.expected_round_s <= self.deadline_s
+
+
+def _ewma(mean: float, var: float, value: float, alpha: float):
+    """Exponentially weighted mean and variance update."""
+    diff = value - mean
+    mean += alpha * diff
+    var = (1 - alpha) * (var + alpha * diff * diff)
+    return mean, var
+
+
+class ClientScheduler:
+    """
+    Select round cohorts from measured client speed and bandwidth.
+
+    Args:
+        deadline_s: Target round duration (the round ``timeout``).
+        model_bytes: Size of the model exchanged each way.
+        cohort_size: Clients selected per round when enough meet the deadline.
+        min_clients: Smallest cohort; filled with the fastest remaining
+            clients even if they are expected to be late.
+        decay: EWMA weight of the newest measurement.
+        risk: Standard deviations of compute time added as a safety margin.
+        max_org_gap: Rounds an organization may be left out before one of
+            its clients is selected regardless of the deadline.
+        explore_after: Rounds a client expected to be late may sit out
+            before it is selected again to refresh its estimates; ``None``
+            disables exploration.
+        explore_slots: Cohort places per round reserved for such clients.
+    """
+
+    def __init__(self,
+                 deadline_s: float,
+                 model_bytes: int,
+                 cohort_size: int,
+                 min_clients: int = 1,
+                 decay: float = 0.3,
+                 risk: float = 1.0,
+                 max_org_gap: int = 5,
+                 explore_after: Optional[int] = 20,
+                 explore_slots: int = 1):
+        if not 0 < decay <= 1:
+            raise ValueError("decay must lie in (0, 1]")
+        if min_clients > cohort_size:
+            raise ValueError("min_clients cannot exceed cohort_size")
+        self.deadline_s = deadline_s
+        self.model_bytes = model_bytes
+        self.cohort_size = cohort_size
+        self.min_clients = min_clients
+        self.decay = decay
+        self.risk = risk
+        self.max_org_gap = max_org_gap
+        self.explore_after = explore_after
+        self.explore_slots = explore_slots
+        self.clients: Dict[str, ClientProfile] = {}
+        self.round = 0
+        self._org_last_round: Dict[str, int] = {}
+
+    def register(self,
+                 client_id: str,
+                 organization: str,
+                 compute_s: float = 1.0,
+                 bandwidth_mbps: float = DEFAULT_BANDWIDTH_MBPS["edge"],
+                 latency_ms: float = DEFAULT_LATENCY_MS["edge"]):
+        """Add a client with prior estimates (replaced as measurements arrive)."""
+        self.clients[client_id] = ClientProfile(client_id, organization, compute_s,
+                                                bandwidth_mbps, latency_ms)
+        self._org_last_round.setdefault(organization, 0)
+
+    def observe(self,
+                client_id: str,
+                compute_s: Optional[float] = None,
+                transfer_bytes: Optional[int] = None,
+                transfer_s: Optional[float] = None):
+        """
+        Fold one round's measurements into a client's estimates.
+
+        Args:
+            client_id: Reporting client.
+            compute_s: Local training time.
+            transfer_bytes: Bytes moved in a timed transfer.
+            transfer_s: Duration of that transfer, latency excluded.
+        """
+        profile = self.clients[client_id]
+        # The first measurement replaces the prior outright, and one taken
+        # while exploring replaces estimates that are explore_after rounds old
+        alpha = 1.0 if profile.observations == 0 or profile.stale else self.decay
+        explored, profile.stale = profile.stale, False
+        if compute_s is not None:
+            profile.compute_s, profile.compute_var = _ewma(
+                profile.compute_s, profile.compute_var, compute_s, alpha)
+        if transfer_bytes and transfer_s and transfer_s > 0:
+            measured = transfer_bytes * 8 / transfer_s / 1e6
+            profile.bandwidth_mbps += alpha * (measured - profile.bandwidth_mbps)
+        profile.observations += 1
+        if self.expected_time(client_id) <= self.deadline_s:
+            profile.explore_backoff = 1
+        elif explored:
+            profile.explore_backoff *= 2
+
+    def expected_time(self, client_id: str) -> float:
+        """Pessimistic round time of one client under the current estimates."""
+        profile = self.clients[client_id]
+        transfer = 2 * self.model_bytes * 8 / (profile.bandwidth_mbps * 1e6)
+        return (profile.compute_s + self.risk * profile.compute_std
+                + 2 * profile.latency_ms / 1000 + transfer)
+
+    def select(self) -> Selection:
+        """Choose the cohort of the next round."""
+        self.round += 1
+        times = {cid: self.expected_time(cid) for cid in self.clients}
+
+        # Per organization: on-time clients first, least recently used first
+        queues: Dict[str, List[str]] = {}
+        for cid, profile in self.clients.items():
+            queues.setdefault(profile.organization, []).append(cid)
+        for org, members in queues.items():
+            members.sort(key=lambda cid: (times[cid] > self.deadline_s,
+                                          self.clients[cid].last_selected, times[cid]))
+        orgs = sorted(queues, key=lambda org: self._org_last_round[org])
+
+        cohort: List[str] = []
+        overdue = [org for org in orgs
+                   if self.round - self._org_last_round[org] > self.max_org_gap]
+        for org in overdue:
+            if len(cohort) < self.cohort_size:
+                cohort.append(min(queues[org], key=times.__getitem__))
+        chosen = set(cohort)
+
+        # Re-measure the stalest clients written off as late
+        explored: List[str] = []
+        if self.explore_after is not None:
+            stale = sorted((cid for cid, profile in self.clients.items()
+                            if cid not in chosen and times[cid] > self.deadline_s
+                            and self.round - profile.last_selected
+                            > self.explore_after * profile.explore_backoff),
+                           key=lambda cid: self.clients[cid].last_selected)
+            room = min(self.explore_slots, self.cohort_size - len(cohort))
+            explored = stale[:max(room, 0)]
+            for cid in explored:
+                self.clients[cid].stale = True
+            cohort.extend(explored)
+            chosen.update(explored)
+
+        # Round-robin over organizations among clients that meet the deadline
+        position = dict.fromkeys(orgs, 0)
+        progress = True
+        while len(cohort) < self.cohort_size and progress:
+            progress = False
+            for org in orgs:
+                members = queues[org]
+                while position[org] < len(members) and members[position[org]] in chosen:
+                    position[org] += 1
+                if position[org] == len(members):
+                    continue
+                cid = members[position[org]]
+                if times[cid] > self.deadline_s:
+                    continue
+                cohort.append(cid)
+                chosen.add(cid)
+                position[org] += 1
+                progress = True
+                if len(cohort) == self.cohort_size:
+                    break
+
+        if len(cohort) < self.min_clients:
+            remaining = sorted((cid for cid in self.clients if cid not in chosen),
+                               key=times.__getitem__)
+            cohort.extend(remaining[:self.min_clients - len(cohort)])
+
+        for cid in cohort:
+            profile = self.clients[cid]
+            profile.selections += 1
+            profile.last_selected = self.round
+            self._org_last_round[profile.organization] = self.round
+        probes = set(explored)
+        members = [cid for cid in cohort if cid not in probes]
+        return Selection(
+            round_num=self.round,
+            clients=cohort,
+            expected_round_s=max((times[cid] for cid in members), default=0.0),
+            deadline_s=self.deadline_s,
+            late=[cid for cid in members if times[cid] > self.deadline_s],
+            explored=explored,
+        )
@@ -0,0 +1,144 @@
+"""
+FedHR5.0 - Hierarchical deployment topology
+
+Describes edge → fog → cloud trees as plain configuration. The same
+configuration drives the hierarchical simulator and the architecture
+diagram, so the picture always matches what was simulated.
+
+Configuration format (JSON or dict)::
+
+    {
+      "name": "cloud", "tier": "cloud",
+      "children": [
+        {"name": "fog", "tier": "fog", "count": 2,
+         "bandwidth_mbps": 100, "latency_ms": 5,
+         "children": [
+           {"name": "edge", "tier": "edge", "count": 4,
+            "bandwidth_mbps": 10, "latency_ms": 20, "num_samples": 64}
+         ]}
+      ]
+    }
+
+``count`` replicates a node spec (names become ``fog-1``, ``fog-2``, ...),
+``bandwidth_mbps``/``latency_ms`` describe the link to the parent, and
+``nic_mbps`` is the node's own interface capacity, shared by all transfers
+to and from its children.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+DEFAULT_BANDWIDTH_MBPS = {"edge": 10.0, "fog": 100.0, "cloud": 1000.0}
+DEFAULT_LATENCY_MS = {"edge": 20.0, "fog": 5.0, "cloud": 1.0}
+# Network interface capacity shared by all children of an aggregator
+DEFAULT_NIC_MBPS = {"edge": 10.0, "fog": 100.0, "cloud": 1000.0}
+
+
+@dataclass
+class TopologyNode:
+    """A node of the aggregation tree and the link to its parent."""
+
+    name: str
+    tier: str
+    bandwidth_mbps: float
+    latency_ms: float
+    nic_mbps: float = 100.0
+    num_samples: int = 64
+    compute_scale: float = 1.0
+    children: List["TopologyNode"] = field(default_factory=list)
+
+    @property
+    def is_leaf(self) -> bool:
+        return not self.children
+
+    def walk(self) -> Iterator["TopologyNode"]:
+        """Pre-order traversal of the subtree."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def leaves(self) -> List["TopologyNode"]:
+        return [node for node in self.walk() if node.is_leaf]
+
+    def depth(self) -> int:
+        return 1 + max((child.depth() for child in self.children), default=0)
+
+    def tiers(self) -> List[str]:
+        """Tier names ordered from the root downwards."""
+        order: List[str] = []
+        for node in self.walk():
+            if node.tier not in order:
+                order.append(node.tier)
+        return order
+
+    def transfer_time_s(self, num_bytes: int) -> float:
+        """Modelled time to move ``num_bytes`` over the link to the parent."""
+        return self.latency_ms / 1000 + num_bytes * 8 / (self.bandwidth_mbps * 1e6)
+
+    def nic_time_s(self, num_bytes: int) -> float:
+        """Time for ``num_bytes`` to pass through this node's own interface."""
+        return num_bytes * 8 / (self.nic_mbps * 1e6)
+
+
+def _expand(spec: Dict, prefix: str = "") -> List[TopologyNode]:
+    """Expand one node spec (and its ``count`` replicas) recursively."""
+    tier = spec.get("tier", "edge")
+    count = int(spec.get("count", 1))
+    nodes = []
+    for i in range(count):
+        name = spec.get("name", tier)
+        if count > 1:
+            name = f"{name}-{i + 1}"
+        name = prefix + name
+        # Each replica gets its own subtree; names are qualified by the path
+        children = [node for child in spec.get("children", [])
+                    for node in _expand(child, prefix=name + "/")]
+        nodes.append(TopologyNode(
+            name=name,
+            tier=tier,
+            bandwidth_mbps=float(spec.get("bandwidth_mbps",
+                                          DEFAULT_BANDWIDTH_MBPS.get(tier, 100.0))),
+            latency_ms=float(spec.get("latency_ms", DEFAULT_LATENCY_MS.get(tier, 5.0))),
+            nic_mbps=float(spec.get("nic_mbps", DEFAULT_NIC_MBPS.get(tier, 100.0))),
+            num_samples=int(spec.get("num_samples", 64)),
+            compute_scale=float(spec.get("compute_scale", 1.0)),
+            children=children,
+        ))
+    return nodes
+
+
+def build_topology(config: Dict) -> TopologyNode:
+    """
+    Build a topology tree from a configuration dict.
+
+    Raises:
+        ValueError: If the root expands to more than one node.
+    """
+    roots = _expand(config)
+    if len(roots) != 1:
+        raise ValueError("Topology root must be a single node (count == 1)")
+    return roots[0]
+
+
+def load_topology(path: Union[str, Path]) -> TopologyNode:
+    """Load a topology from a JSON configuration file."""
+    with open(path) as f:
+        return build_topology(json.load(f))
+
+
+def balanced_topology(num_fog: int,
+                      edges_per_fog: int,
+                      edge_bandwidth_mbps: Optional[float] = None,
+                      fog_bandwidth_mbps: Optional[float] = None,
+                      num_samples: int = 64) -> TopologyNode:
+    """Convenience builder for a cloud with identical fog subtrees."""
+    edge = {"name": "edge", "tier": "edge", "count": edges_per_fog,
+            "num_samples": num_samples}
+    fog = {"name": "fog", "tier": "fog", "count": num_fog, "children": [edge]}
+    if edge_bandwidth_mbps is not None:
+        edge["bandwidth_mbps"] = edge_bandwidth_mbps
+    if fog_bandwidth_mbps is not None:
+        fog["bandwidth_mbps"] = fog_bandwidth_mbps
+    return build_topology({"name": "cloud", "tier": "cloud", "children": [fog]})
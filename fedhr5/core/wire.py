@@ -0,0 +1,245 @@
+"""
+FedHR5.0 - Zero-copy binary wire format
+
+Framed encoding for ``ModelUpdate`` and ``AggregatedModel`` messages in which
+tensors travel as raw, 64-byte aligned buffers. Metadata goes in a small JSON
+header; the receiver maps every tensor straight out of the received buffer
+with ``np.frombuffer`` without decoding or copying it.
+
+Frame layout (little-endian)::
+
+    +--------+---------+------+------------+-------------+--------+---------+
+    | "FHW1" | version | type | header_len | payload_len | header | payload |
+    |   4 B  |   2 B   | 2 B  |    4 B     |     8 B     |  JSON  | tensors |
+    +--------+---------+------+------------+-------------+--------+---------+
+
+The header is padded so that the payload starts on an ALIGNMENT boundary,
+and each tensor's offset within the payload is aligned as well.
+"""
+
+import json
+import struct
+from dataclasses import dataclass, field
+from typing import BinaryIO, Dict, List, Tuple, Union
+
+import numpy as np
+
+from ..utils.metrics import WIRE_BYTES_AGGREGATED, WIRE_BYTES_UPDATE
+
+MAGIC = b"FHW1"
+VERSION = 1
+ALIGNMENT = 64
+
+MESSAGE_MODEL_UPDATE = 1
+MESSAGE_AGGREGATED_MODEL = 2
+
+_PREFIX = struct.Struct("<4sHHIQ")
+PREFIX_SIZE = _PREFIX.size
+
+Buffer = Union[bytes, bytearray, memoryview, np.ndarray]
+
+_WIRE_BYTES = {MESSAGE_MODEL_UPDATE: WIRE_BYTES_UPDATE,
+               MESSAGE_AGGREGATED_MODEL: WIRE_BYTES_AGGREGATED}
+
+
+def _padding(length: int) -> int:
+    return -length % ALIGNMENT
+
+
+def aligned_buffer(size: int) -> np.ndarray:
+    """Writable uint8 buffer whose first byte is ALIGNMENT-aligned in memory."""
+    raw = np.empty(size + ALIGNMENT, dtype=np.uint8)
+    start = -raw.ctypes.data % ALIGNMENT
+    return raw[start:start + size]
+
+
+def encode_frame(message_type: int,
+                 metadata: Dict,
+                 tensors: Dict[str, np.ndarray]) -> List[memoryview]:
+    """
+    Encode a message as a list of buffers for scatter-gather I/O.
+
+    Tensor data is referenced, not copied: the returned list can be passed
+    to ``socket.sendmsg`` or written piecewise with :func:`write_frame`.
+
+    Args:
+        message_type: ``MESSAGE_MODEL_UPDATE`` or ``MESSAGE_AGGREGATED_MODEL``.
+        metadata: JSON-serializable message fields.
+        tensors: Named arrays; non-contiguous arrays are made contiguous.
+
+    Returns:
+        Buffers whose concatenation is the frame.
+    """
+    table = []
+    parts: List[memoryview] = []
+    offset = 0
+    for name, array in tensors.items():
+        array = np.asarray(array)
+        if not array.flags.c_contiguous:
+            array = np.ascontiguousarray(array)
+        if array.dtype.hasobject:
+            raise ValueError(f"Tensor {name!r} has an object dtype")
+        table.append({"name": name, "dtype": array.dtype.str,
+                      "shape": list(array.shape), "offset": offset})
+        data = memoryview(array.reshape(-1).view(np.uint8))
+        parts.append(data)
+        pad = _padding(data.nbytes)
+        if pad:
+            parts.append(memoryview(bytes(pad)))
+        offset += data.nbytes + pad
+
+    header = json.dumps({"meta": metadata, "tensors": table},
+                        separators=(",", ":")).encode()
+    header += b" " * _padding(_PREFIX.size + len(header))
+    prefix = _PREFIX.pack(MAGIC, VERSION, message_type, len(header), offset)
+    counter = _WIRE_BYTES.get(message_type)
+    if counter is not None:
+        counter.inc(len(prefix) + len(header) + offset)
+    return [memoryview(prefix), memoryview(header)] + parts
+
+
+def pack_frame(message_type: int,
+               metadata: Dict,
+               tensors: Dict[str, np.ndarray]) -> np.ndarray:
+    """Encode a message into one aligned buffer (copies the tensors once)."""
+    parts = encode_frame(message_type, metadata, tensors)
+    frame = aligned_buffer(sum(part.nbytes for part in parts))
+    position = 0
+    for part in parts:
+        frame[position:position + part.nbytes] = part
+        position += part.nbytes
+    return frame
+
+
+def write_frame(stream: BinaryIO,
+                message_type: int,
+                metadata: Dict,
+                tensors: Dict[str, np.ndarray]) -> int:
+    """Write a frame to a binary stream without joining it first."""
+    written = 0
+    for part in encode_frame(message_type, metadata, tensors):
+        written += stream.write(part)
+    return written
+
+
+def decode_frame(buffer: Buffer) -> Tuple[int, Dict, Dict[str, np.ndarray]]:
+    """
+    Decode a frame without copying tensor data.
+
+    The returned arrays are read-only views into ``buffer`` (writable if the
+    buffer is writable), so the buffer must stay alive while they are used.
+
+    Returns:
+        ``(message_type, metadata, tensors)``.
+
+    Raises:
+        ValueError: If the buffer is not a complete, supported frame, or a
+            tensor lies outside the frame's payload.
+    """
+    view = memoryview(buffer)
+    if view.format != "B" or view.ndim != 1:
+        view = view.cast("B")
+    if view.nbytes < _PREFIX.size:
+        raise ValueError("Truncated frame prefix")
+    magic, version, message_type, header_len, payload_len = _PREFIX.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("Not a FedHR5.0 wire frame")
+    if version != VERSION:
+        raise ValueError(f"Unsupported wire format version {version}")
+    payload_start = _PREFIX.size + header_len
+    if view.nbytes < payload_start + payload_len:
+        raise ValueError("Truncated frame payload")
+
+    header = json.loads(bytes(view[_PREFIX.size:payload_start]))
+    tensors = {}
+    for entry in header["tensors"]:
+        dtype = np.dtype(entry["dtype"])
+        shape = tuple(entry["shape"])
+        offset = entry["offset"]
+        if any(dim < 0 for dim in shape):
+            raise ValueError(f"Tensor {entry['name']!r} has a negative dimension")
+        count = int(np.prod(shape, dtype=np.int64))
+        # A bad header must not map bytes of the header or of a following frame
+        if not isinstance(offset, int) or not 0 <= offset <= payload_len - count * dtype.itemsize:
+            raise ValueError(f"Tensor {entry['name']!r} lies outside the frame payload")
+        tensors[entry["name"]] = np.frombuffer(
+            view, dtype=dtype, count=count,
+            offset=payload_start + offset).reshape(shape)
+    return message_type, header["meta"], tensors
+
+
+def frame_size(prefix: Buffer) -> int:
+    """Total frame length from its first ``PREFIX_SIZE`` bytes."""
+    _, _, _, header_len, payload_len = _PREFIX.unpack_from(prefix)
+    return _PREFIX.size + header_len + payload_len
+
+
+def read_frame(stream: BinaryIO) -> Tuple[int, Dict, Dict[str, np.ndarray]]:
+    """
+    Read one frame from a binary stream and decode it.
+
+    The frame is read with ``readinto`` into a single preallocated, aligned
+    buffer, which the decoded tensors then view directly.
+    """
+    prefix = bytearray(PREFIX_SIZE)
+    if stream.readinto(prefix) != PREFIX_SIZE:
+        raise ValueError("Truncated frame prefix")
+    frame = aligned_buffer(frame_size(prefix))
+    frame[:PREFIX_SIZE] = np.frombuffer(prefix, dtype=np.uint8)
+    view = memoryview(frame)
+    position = PREFIX_SIZE
+    while position < len(frame):
+        read = stream.readinto(view[position:])
+        if not read:
+            raise ValueError("Truncated frame payload")
+        position += read
+    return decode_frame(frame)
+
+
+@dataclass
+class ModelUpdate:
+    """Client → server update (mirrors the ``ModelUpdate`` protobuf message)."""
+
+    round_id: str
+    tensors: Dict[str, np.ndarray]
+    privacy_spent: float = 0.0
+    metrics: Dict[str, float] = field(default_factory=dict)
+
+    def to_frame(self) -> List[memoryview]:
+        return encode_frame(MESSAGE_MODEL_UPDATE,
+                            {"round_id": self.round_id,
+                             "privacy_spent": self.privacy_spent,
+                             "metrics": self.metrics},
+                            self.tensors)
+
+    @classmethod
+    def from_frame(cls, buffer: Buffer) -> "ModelUpdate":
+        message_type, meta, tensors = decode_frame(buffer)
+        if message_type != MESSAGE_MODEL_UPDATE:
+            raise ValueError("Frame does not contain a ModelUpdate")
+        return cls(meta["round_id"], tensors, meta["privacy_spent"], meta["metrics"])
+
+
+@dataclass
+class AggregatedModel:
+    """Server → client model (mirrors the ``AggregatedModel`` protobuf message)."""
+
+    round_id: str
+    tensors: Dict[str, np.ndarray]
+    total_privacy_spent: float = 0.0
+    fairness: Dict[str, float] = field(default_factory=dict)
+
+    def to_frame(self) -> List[memoryview]:
+        return encode_frame(MESSAGE_AGGREGATED_MODEL,
+                            {"round_id": self.round_id,
+                             "total_privacy_spent": self.total_privacy_spent,
+                             "fairness": self.fairness},
+                            self.tensors)
+
+    @classmethod
+    def from_frame(cls, buffer: Buffer) -> "AggregatedModel":
+        message_type, meta, tensors = decode_frame(buffer)
+        if message_type != MESSAGE_AGGREGATED_MODEL:
+            raise ValueError("Frame does not contain an AggregatedModel")
+        return cls(meta["round_id"], tensors, meta["total_privacy_spent"],
+                   meta["fairness"])
@@ -0,0 +1,9 @@
+"""
+FedHR5.0 - HR analytics modules
+"""
+
+from ..utils.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__, {},
+    submodules=["benchmarking", "learning", "recruitment", "skills", "wellbeing"])
@@ -0,0 +1,11 @@
+"""
+FedHR5.0 - Blockchain-enhanced benchmarking module
+"""
+
+from ...utils.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "blockchain_integration": ["BatchedCommitter", "Block", "LocalLedger", "Receipt",
+                               "merkle_proof", "merkle_root", "record_hash", "verify_proof"],
+    "metrics_aggregation": ["MetricsAggregator", "encode_metrics", "encrypt_metrics"],
+})
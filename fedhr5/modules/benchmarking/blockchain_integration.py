@@ -0,0 +1,402 @@
+"""
+FedHR5.0 - Ledger integration for round and benchmarking metadata
+
+The round lifecycle records metadata (round results, privacy spend,
+benchmark submissions) on a ledger. Waiting for consensus on every record
+would put the ledger on the critical path of each round, so commits are
+split in two:
+
+1. :meth:`BatchedCommitter.submit` appends the record to a local journal and
+   ``fsync``s it. That is the only step a round waits for; once it returns
+   the record survives a crash.
+2. A background thread packs pending records from all rounds and modules
+   into blocks whose Merkle root covers every record. Each block is
+   appended to the ledger, and the receipt's future resolves to the block.
+
+:class:`LocalLedger` is the file-backed stand-in for the consortium ledger.
+It is a hash-chained, append-only JSON-lines file, and ``commit_latency_s``
+emulates the ordering/consensus delay of a real network such as Hyperledger
+Fabric. Inclusion proofs from :meth:`LocalLedger.proof` let an organization
+check that its record is in a block without reading the others.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+GENESIS_HASH = "0" * 64
+
+
+def canonical_json(payload) -> bytes:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+
+
+def record_hash(record: Dict) -> str:
+    """Merkle leaf hash of a record (domain-separated from inner nodes)."""
+    return hashlib.sha256(b"\x00" + canonical_json(record)).hexdigest()
+
+
+def _node_hash(left: str, right: str) -> str:
+    return hashlib.sha256(b"\x01" + bytes.fromhex(left) + bytes.fromhex(right)).hexdigest()
+
+
+def merkle_root(leaves: Sequence[str]) -> str:
+    """Root over leaf hashes; an unpaired node is promoted to the next level."""
+    if not leaves:
+        return GENESIS_HASH
+    level = list(leaves)
+    while len(level) > 1:
+        paired = [_node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
+
+def merkle_proof(leaves: Sequence[str], index: int) -> List[Tuple[str, str]]:
+    """Sibling path of ``leaves[index]`` as ``(side, hash)`` pairs, leaf upwards."""
+    proof = []
+    level = list(leaves)
+    while len(level) > 1:
+        sibling = index ^ 1
+        if sibling < len(level):
+            proof.append(("left" if sibling < index else "right", level[sibling]))
+        paired = [_node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+        index //= 2
+    return proof
+
+
+def verify_proof(leaf: str, proof: Sequence[Tuple[str, str]], root: str) -> bool:
+    """Check a :func:`merkle_proof` against a block's Merkle root."""
+    node = leaf
+    for side, sibling in proof:
+        node = _node_hash(sibling, node) if side == "left" else _node_hash(node, sibling)
+    return node == root
+
+
+def _block_hash(header: Dict) -> str:
+    return hashlib.sha256(canonical_json(header)).hexdigest()
+
+
+@dataclass
+class Block:
+    """A ledger block: a header chained to its parent plus the records it covers."""
+
+    height: int
+    prev_hash: str
+    merkle_root: str
+    timestamp: float
+    records: List[Dict] = field(default_factory=list)
+    hash: str = ""
+
+    def header(self) -> Dict:
+        return {"height": self.height, "prev_hash": self.prev_hash,
+                "merkle_root": self.merkle_root, "timestamp": self.timestamp,
+                "num_records": len(self.records)}
+
+    def leaves(self) -> List[str]:
+        return [record_hash(record) for record in self.records]
+
+
+class LocalLedger:
+    """
+    Append-only, hash-chained ledger in a JSON-lines file.
+
+    Args:
+        path: Ledger file (created if missing).
+        commit_latency_s: Delay added to every block append, emulating the
+            consensus round-trip of a distributed ledger.
+        fsync: Flush every block to stable storage.
+    """
+
+    def __init__(self, path: Union[str, Path], commit_latency_s: float = 0.0,
+                 fsync: bool = True):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.commit_latency_s = commit_latency_s
+        self.fsync = fsync
+        self.height = -1
+        self.head = GENESIS_HASH
+        self.last_sequence = -1
+        self._index: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        for block in self.blocks():
+            self._track(block)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def _track(self, block: Block):
+        self.height, self.head = block.height, block.hash
+        for record in block.records:
+            self._index[record_hash(record)] = block.height
+            self.last_sequence = max(self.last_sequence, record.get("sequence", -1))
+
+    def blocks(self) -> Iterator[Block]:
+        """Iterate over all blocks from the genesis block on."""
+        if not self.path.exists():
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield Block(**json.loads(line))
+
+    def append_block(self, records: Sequence[Dict]) -> Block:
+        """Commit ``records`` as one block and return it once durable."""
+        with self._lock:
+            if self.commit_latency_s:
+                time.sleep(self.commit_latency_s)
+            block = Block(height=self.height + 1, prev_hash=self.head,
+                          merkle_root=merkle_root([record_hash(r) for r in records]),
+                          timestamp=time.time(), records=list(records))
+            block.hash = _block_hash(block.header())
+            self._file.write(json.dumps(vars(block), separators=(",", ":")) + "\n")
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self._track(block)
+            return block
+
+    def block(self, height: int) -> Block:
+        for block in self.blocks():
+            if block.height == height:
+                return block
+        raise KeyError(f"No block at height {height}")
+
+    def proof(self, record: Dict) -> Tuple[int, List[Tuple[str, str]]]:
+        """
+        Inclusion proof of a committed record.
+
+        Returns:
+            ``(block height, Merkle path)`` for :func:`verify_proof`.
+
+        Raises:
+            KeyError: If the record is not on the ledger.
+        """
+        leaf = record_hash(record)
+        block = self.block(self._index[leaf])
+        return block.height, merkle_proof(block.leaves(), block.leaves().index(leaf))
+
+    def verify(self) -> bool:
+        """Re-check every hash link and Merkle root of the chain."""
+        prev = GENESIS_HASH
+        for height, block in enumerate(self.blocks()):
+            if (block.height != height or block.prev_hash != prev
+                    or block.merkle_root != merkle_root(block.leaves())
+                    or block.hash != _block_hash(block.header())):
+                return False
+            prev = block.hash
+        return True
+
+    def close(self):
+        self._file.close()
+
+
+@dataclass
+class Receipt:
+    """Handle for a submitted record; ``committed`` resolves to its block."""
+
+    sequence: int
+    record: Dict
+    committed: Future = field(default_factory=Future)
+
+    @property
+    def hash(self) -> str:
+        return record_hash(self.record)
+
+
+class BatchedCommitter:
+    """
+    Journal records durably, commit them to the ledger in Merkle-rooted batches.
+
+    A batch the ledger rejects goes back to the front of the queue and is
+    retried with exponential backoff, so records are committed in sequence
+    order and the journal only drops records that are on the ledger. If the
+    ledger still fails when the committer is closed, the outstanding
+    receipts fail but their records stay journalled for the next start.
+
+    Args:
+        ledger: Ledger receiving the blocks.
+        journal_path: Local write-ahead journal. On start-up, records in the
+            journal but not on the ledger are committed again.
+        max_batch: Records per block at most.
+        max_delay_s: Longest a record waits before its block is cut.
+        retry_delay_s: Backoff after the first failed commit.
+        max_retry_delay_s: Cap of the doubling backoff.
+    """
+
+    def __init__(self, ledger: LocalLedger, journal_path: Union[str, Path],
+                 max_batch: int = 512, max_delay_s: float = 1.0,
+                 retry_delay_s: float = 0.1, max_retry_delay_s: float = 30.0):
+        self.ledger = ledger
+        self.max_batch = max_batch
+        self.max_delay_s = max_delay_s
+        self.retry_delay_s = retry_delay_s
+        self.max_retry_delay_s = max_retry_delay_s
+        self.journal_path = Path(journal_path)
+        self.last_error: Optional[BaseException] = None
+        self._pending: List[Receipt] = []
+        self._in_flight: List[Receipt] = []
+        self._condition = threading.Condition()
+        self._closed = False
+        self._flush_requested = False
+        self._sequence = ledger.last_sequence + 1
+        self._journal_records = 0
+
+        recovered = self._recover()
+        self._journal = open(self.journal_path, "a", encoding="utf-8")
+        self._pending.extend(recovered)
+        self._worker = threading.Thread(target=self._run, daemon=True,
+                                        name="fedhr5-ledger-committer")
+        self._worker.start()
+
+    def _recover(self) -> List[Receipt]:
+        if not self.journal_path.exists():
+            return []
+        records, valid_bytes = [], 0
+        with open(self.journal_path, "rb") as f:
+            lines = f.read().split(b"\n")
+        for number, line in enumerate(lines):
+            if not line.strip():
+                valid_bytes += len(line) + 1
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                # A torn final write is what a crash mid-submit leaves behind;
+                # its submit never returned, so the record was never promised
+                if number == len(lines) - 1:
+                    break
+                raise
+            valid_bytes += len(line) + 1
+        if valid_bytes < self.journal_path.stat().st_size:
+            os.truncate(self.journal_path, valid_bytes)
+        pending = [Receipt(r["sequence"], r) for r in records
+                   if r["sequence"] > self.ledger.last_sequence]
+        if pending:
+            self._sequence = max(self._sequence, pending[-1].sequence + 1)
+            self._journal_records = len(records)
+        else:
+            # Everything journalled is on the ledger: start a fresh journal
+            self.journal_path.unlink()
+        return pending
+
+    def submit(self, module: str, payload: Dict) -> Receipt:
+        """
+        Durably journal one record and queue it for the ledger.
+
+        Returns after the journal ``fsync``; the ledger commit happens in the
+        background (see :attr:`Receipt.committed`).
+        """
+        return self.submit_many([(module, payload)])[0]
+
+    def submit_many(self, items: Sequence[Tuple[str, Dict]]) -> List[Receipt]:
+        """Journal several ``(module, payload)`` records with a single ``fsync``."""
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Committer is closed")
+            receipts = []
+            for module, payload in items:
+                receipts.append(Receipt(self._sequence, {"sequence": self._sequence,
+                                                         "module": module,
+                                                         "payload": payload}))
+                self._sequence += 1
+            self._journal.write("".join(canonical_json(r.record).decode() + "\n"
+                                        for r in receipts))
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+            self._journal_records += len(receipts)
+            self._pending.extend(receipts)
+            if len(self._pending) >= self.max_batch:
+                self._condition.notify()
+        return receipts
+
+    def _run(self):
+        delay = 0.0
+        while True:
+            with self._condition:
+                deadline = time.monotonic() + self.max_delay_s
+                while (len(self._pending) < self.max_batch and not self._closed
+                       and not self._flush_requested and time.monotonic() < deadline):
+                    self._condition.wait(deadline - time.monotonic())
+                batch = self._pending[:self.max_batch]
+                del self._pending[:self.max_batch]
+                self._in_flight = batch
+                if not self._pending:
+                    self._flush_requested = False
+                if not batch and self._closed:
+                    return
+            if not batch:
+                continue
+            try:
+                block = self.ledger.append_block([r.record for r in batch])
+            except Exception as exc:
+                with self._condition:
+                    self._in_flight = []
+                    self.last_error = exc
+                    if not self._closed:
+                        # Retry in order; the records stay journalled meanwhile
+                        self._pending[:0] = batch
+                        delay = min(max(2 * delay, self.retry_delay_s),
+                                    self.max_retry_delay_s)
+                        self._condition.wait(delay)
+                        continue
+                    failed, self._pending = batch + self._pending, []
+                for receipt in failed:
+                    receipt.committed.set_exception(exc)
+                return
+            delay = 0.0
+            with self._condition:
+                self._in_flight = []
+                self._compact_journal()
+            for receipt in batch:
+                receipt.committed.set_result(block.height)
+
+    def _compact_journal(self):
+        """
+        Drop committed records from the journal (condition held).
+
+        Commits happen in sequence order, so the journal holds exactly the
+        pending records after the committed ones. It is truncated when
+        nothing is pending, and otherwise rewritten with the pending records
+        once committed ones make up most of it.
+        """
+        if not self._pending:
+            os.ftruncate(self._journal.fileno(), 0)
+            self._journal_records = 0
+            return
+        if self._journal_records < 2 * len(self._pending):
+            return
+        tmp_path = self.journal_path.with_name(self.journal_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("".join(canonical_json(r.record).decode() + "\n" for r in self._pending))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.journal_path)
+        self._journal.close()
+        self._journal = open(self.journal_path, "a", encoding="utf-8")
+        self._journal_records = len(self._pending)
+
+    def flush(self, timeout: Optional[float] = None):
+        """Commit everything submitted so far, including a batch in flight, and wait."""
+        with self._condition:
+            receipts = self._in_flight + self._pending
+            self._flush_requested = True
+            self._condition.notify()
+        for receipt in receipts:
+            receipt.committed.result(timeout)
+
+    def close(self):
+        """Commit pending records, stop the worker and close the journal."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._worker.join()
+        self._journal.close()
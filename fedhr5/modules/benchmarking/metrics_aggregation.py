@@ -0,0 +1,112 @@
+"""
+FedHR5.0 - Encrypted cross-organizational KPI benchmarking
+
+Organizations submit their KPIs (retention rate, turnover, training hours,
+...) as packed Paillier ciphertexts (:mod:`fedhr5.privacy.homomorphic_ops`).
+The aggregator folds each submission into a running encrypted total as it
+arrives, so it keeps one vector no matter how many organizations take part,
+and it never sees an individual organization's values. Only the key holder
+can decrypt the total, and only into consortium-wide means once enough
+organizations have contributed.
+"""
+
+from typing import Dict, List, Mapping, Optional, Sequence, Set
+
+import numpy as np
+
+from ...privacy.homomorphic_ops import (
+    EncryptedVector,
+    FixedPointEncoder,
+    PackedEncryptor,
+    PaillierPrivateKey,
+    PaillierPublicKey,
+    decrypt_vector,
+)
+
+
+def encode_metrics(metric_names: Sequence[str], metrics: Mapping[str, float]) -> np.ndarray:
+    """Order an organization's KPIs by ``metric_names``."""
+    missing = [name for name in metric_names if name not in metrics]
+    if missing:
+        raise ValueError(f"Missing metrics: {missing[:5]}")
+    return np.array([metrics[name] for name in metric_names], dtype=np.float64)
+
+
+def encrypt_metrics(encryptor: PackedEncryptor, metric_names: Sequence[str],
+                    metrics: Mapping[str, float]) -> EncryptedVector:
+    """Client side: encrypt one organization's KPI submission."""
+    return encryptor.encrypt(encode_metrics(metric_names, metrics))
+
+
+class MetricsAggregator:
+    """
+    Running homomorphic sum of KPI submissions for one benchmarking period.
+
+    Args:
+        metric_names: KPIs in submission order.
+        public_key: Consortium Paillier public key.
+        min_participants: Organizations required before results are released.
+        encoder: Fixed-point encoding every submission must use.
+    """
+
+    def __init__(self, metric_names: Sequence[str], public_key: PaillierPublicKey,
+                 min_participants: int = 3,
+                 encoder: Optional[FixedPointEncoder] = None):
+        self.metric_names = list(metric_names)
+        self.public_key = public_key
+        self.encoder = encoder or FixedPointEncoder()
+        self.min_participants = min_participants
+        self.participants: Set[str] = set()
+        self._total: Optional[EncryptedVector] = None
+
+    def submit(self, org_id: str, encrypted: EncryptedVector):
+        """
+        Add one organization's encrypted KPIs to the total.
+
+        ``summands`` and the encoder travel in the clear next to the
+        ciphertexts and steer decoding, so a submission must be a single
+        vector in the aggregator's own encoding.
+
+        Raises:
+            ValueError: On a repeated submission, a different key or
+                encoding, a pre-summed vector or a vector of the wrong
+                length.
+        """
+        if org_id in self.participants:
+            raise ValueError(f"{org_id} has already submitted for this period")
+        if encrypted.public_key != self.public_key:
+            raise ValueError("Submission is encrypted under a different key")
+        if encrypted.encoder != self.encoder:
+            raise ValueError("Submission uses a different fixed-point encoding")
+        if encrypted.summands != 1:
+            raise ValueError("A submission must hold exactly one organization's KPIs")
+        if (encrypted.length != len(self.metric_names)
+                or len(encrypted.ciphertexts) != -(-encrypted.length // self.public_key.slots)):
+            raise ValueError(f"Expected {len(self.metric_names)} metrics, "
+                             f"got {encrypted.length}")
+        self._total = encrypted if self._total is None else self._total + encrypted
+        self.participants.add(org_id)
+
+    def submit_many(self, submissions: Mapping[str, EncryptedVector]):
+        for org_id, encrypted in submissions.items():
+            self.submit(org_id, encrypted)
+
+    def encrypted_total(self) -> EncryptedVector:
+        if self._total is None:
+            raise ValueError("No submissions yet")
+        return self._total
+
+    def results(self, private_key: PaillierPrivateKey) -> Dict[str, float]:
+        """
+        Decrypt the consortium-wide mean of every KPI.
+
+        Raises:
+            ValueError: If fewer than ``min_participants`` organizations
+                submitted.
+        """
+        if len(self.participants) < self.min_participants:
+            raise ValueError(f"Results need at least {self.min_participants} participants, "
+                             f"have {len(self.participants)}")
+        totals = decrypt_vector(private_key, self.encrypted_total())
+        means: List[float] = (totals / len(self.participants)).tolist()
+        return dict(zip(self.metric_names, means))
@@ -0,0 +1,12 @@
+"""
+FedHR5.0 - Immersive learning module
+"""
+
+from .path_optimization import CacheStats, Course, LearningPath, PathOptimizer
+
+__all__ = [
+    "CacheStats",
+    "Course",
+    "LearningPath",
+    "PathOptimizer",
+]
@@ -0,0 +1,339 @@
+"""
+FedHR5.0 - Learning path optimization
+
+Finds low-effort course sequences that take an employee from their current
+skills to a set of target skills. The catalogue is an AND-OR DAG: a course
+requires *all* of its prerequisite skills, and a skill can be obtained from
+*any* course that provides it. The effort of a course is its expected hours
+including retakes (``duration_h / success_rate``), plus an optional price
+term.
+
+The DP over the DAG is shared across employees. The best way to obtain a
+skill depends only on which skills the employee already has *inside that
+skill's prerequisite cone*, so results are cached under
+``(skill, state & cone)`` bitmasks. Employees whose states overlap on a cone
+reuse each other's subproblems, even when their overall profiles differ. The
+cache is an LRU with a fixed capacity. When a course changes (for example,
+its federated success rate moves after new outcomes), only entries whose
+cone contains that course are invalidated.
+
+Sibling prerequisites are resolved in turn, smallest cone (most basic) first,
+and each one sees the skills gained by the ones before it. A course that covers several
+branches is therefore paid for once. This is a greedy approximation of the
+exact (NP-hard) minimum-cost closure.
+"""
+
+import math
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+INFEASIBLE = math.inf
+# Pseudo-observations behind a course's initial success rate
+PRIOR_WEIGHT = 10.0
+
+
+@dataclass(frozen=True)
+class Course:
+    """A catalogue course: prerequisite skills in, provided skills out."""
+
+    course_id: str
+    duration_h: float
+    provides: FrozenSet[str]
+    requires: FrozenSet[str] = frozenset()
+    cost: float = 0.0
+    success_rate: float = 1.0
+
+
+@dataclass
+class LearningPath:
+    """Recommended courses in a valid order with their expected totals."""
+
+    courses: List[str] = field(default_factory=list)
+    expected_hours: float = 0.0
+    cost: float = 0.0
+    success_rate: float = 1.0
+    missing: List[str] = field(default_factory=list)
+
+    @property
+    def feasible(self) -> bool:
+        """False if some target skill cannot be reached from the catalogue."""
+        return not self.missing
+
+    def to_dict(self) -> Dict:
+        return {"courses": self.courses, "expected_hours": self.expected_hours,
+                "cost": self.cost, "success_rate": self.success_rate,
+                "feasible": self.feasible, "missing": self.missing}
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class PathOptimizer:
+    """
+    Memoized learning-path engine over a course catalogue.
+
+    Args:
+        courses: The catalogue; its prerequisite graph must be acyclic.
+        cache_size: Maximum number of cached subproblems (LRU eviction).
+        cost_weight: Hours-equivalent of one unit of course price.
+
+    Raises:
+        ValueError: On duplicate course ids or a prerequisite cycle.
+    """
+
+    def __init__(self, courses: Sequence[Course], cache_size: int = 200_000,
+                 cost_weight: float = 0.0):
+        self.cache_size = cache_size
+        self.cost_weight = cost_weight
+        self.stats = CacheStats()
+        self.courses: List[Course] = list(courses)
+        self._course_index = {c.course_id: i for i, c in enumerate(self.courses)}
+        if len(self._course_index) != len(self.courses):
+            raise ValueError("Duplicate course ids")
+        skills = sorted({s for c in self.courses for s in c.provides | c.requires})
+        self.skills = skills
+        self._skill_index = {s: i for i, s in enumerate(skills)}
+        self._providers: List[List[int]] = [[] for _ in skills]
+        for index, course in enumerate(self.courses):
+            for skill in course.provides:
+                self._providers[self._skill_index[skill]].append(index)
+        self._requires = [[self._skill_index[s] for s in sorted(c.requires)]
+                          for c in self.courses]
+        self._provides = [sum(1 << self._skill_index[s] for s in c.provides)
+                          for c in self.courses]
+        # Outcome counts behind each course's success-rate estimate
+        self._outcomes = [[c.success_rate * PRIOR_WEIGHT, PRIOR_WEIGHT] for c in self.courses]
+        self._weights = [self._weight(c) for c in self.courses]
+        self._build_index()
+        self._cache: "OrderedDict[Tuple[int, int], Tuple[float, int, int]]" = OrderedDict()
+        self._cached_masks: List[Set[int]] = [set() for _ in skills]
+
+    def _weight(self, course: Course) -> float:
+        if course.success_rate <= 0:
+            return INFEASIBLE
+        return course.duration_h / course.success_rate + self.cost_weight * course.cost
+
+    def _build_index(self):
+        """Topological ranks, prerequisite cones and invalidation lists."""
+        num_skills = len(self.skills)
+        cones = [0] * num_skills
+        skill_rank = [0] * num_skills
+        state = [0] * num_skills  # 0 new, 1 on stack, 2 done
+
+        def visit(root: int):
+            # Iterative DFS: skill -> providers -> required skills
+            stack = [(root, iter(self._providers[root]), iter(()))]
+            state[root] = 1
+            while stack:
+                skill, providers, requirements = stack[-1]
+                advanced = False
+                for required in requirements:
+                    if state[required] == 1:
+                        raise ValueError(f"Prerequisite cycle through '{self.skills[required]}'")
+                    if state[required] == 0:
+                        state[required] = 1
+                        stack.append((required, iter(self._providers[required]), iter(())))
+                        advanced = True
+                        break
+                if advanced:
+                    continue
+                provider = next(providers, None)
+                if provider is not None:
+                    stack[-1] = (skill, providers, iter(self._requires[provider]))
+                    continue
+                cone, rank = 1 << skill, 0
+                for p in self._providers[skill]:
+                    for r in self._requires[p]:
+                        cone |= cones[r]
+                        rank = max(rank, skill_rank[r] + 1)
+                cones[skill], skill_rank[skill] = cone, rank
+                state[skill] = 2
+                stack.pop()
+
+        for skill in range(num_skills):
+            if state[skill] == 0:
+                visit(skill)
+        self._cones = cones
+        # Resolve basic prerequisites first so advanced ones can build on them
+        self._requires = [sorted(req, key=lambda r: bin(cones[r]).count("1"))
+                          for req in self._requires]
+        # Cached values of skill s depend on every course providing a skill in cone(s)
+        self._dependents: List[List[int]] = [[] for _ in self.courses]
+        for skill, cone in enumerate(cones):
+            for other in range(num_skills):
+                if cone >> other & 1:
+                    for p in self._providers[other]:
+                        self._dependents[p].append(skill)
+        self._dependents = [sorted(set(d)) for d in self._dependents]
+
+    def _mask(self, skills: Iterable[str]) -> int:
+        mask = 0
+        for skill in skills:
+            index = self._skill_index.get(skill)
+            if index is not None:
+                mask |= 1 << index
+        return mask
+
+    def _best(self, skill: int, state: int) -> Tuple[float, int, int]:
+        """
+        Cheapest way to obtain ``skill`` given the skills in ``state``.
+
+        Returns:
+            ``(effort, provider course, skills provided by the chosen courses)``.
+        """
+        if state >> skill & 1:
+            return 0.0, -1, 0
+        key = (skill, state & self._cones[skill])
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+            self.stats.hits += 1
+            return entry
+        self.stats.misses += 1
+        best, choice, gained = INFEASIBLE, -1, 0
+        for provider in self._providers[skill]:
+            # Skills provided by the courses picked so far; unlike the full
+            # state they depend only on the cache key, so entries stay exact
+            effort, acquired = self._weights[provider], 0
+            for required in self._requires[provider]:
+                if effort >= best:
+                    break
+                sub_effort, _, sub_gained = self._best(required, state | acquired)
+                effort += sub_effort
+                acquired |= sub_gained
+            if effort < best:
+                best, choice = effort, provider
+                gained = acquired | self._provides[provider]
+        entry = (best, choice, gained)
+        self._cache[key] = entry
+        self._cached_masks[skill].add(key[1])
+        if len(self._cache) > self.cache_size:
+            (old_skill, old_mask), _ = self._cache.popitem(last=False)
+            self._cached_masks[old_skill].discard(old_mask)
+            self.stats.evictions += 1
+        return entry
+
+    def _collect(self, skill: int, state: int, chosen: List[int], missing: Set[int]) -> int:
+        """Append the chosen courses for ``skill`` in post-order; returns the new state."""
+        if state >> skill & 1:
+            return state
+        effort, provider, _ = self._best(skill, state)
+        if effort == INFEASIBLE:
+            missing.add(skill)
+            return state
+        for required in self._requires[provider]:
+            state = self._collect(required, state, chosen, missing)
+        chosen.append(provider)
+        return state | self._provides[provider]
+
+    def _path(self, state: int, targets: int) -> LearningPath:
+        chosen: List[int] = []
+        missing: Set[int] = set()
+        for skill in range(len(self.skills)):
+            if targets >> skill & 1:
+                state = self._collect(skill, state, chosen, missing)
+        # Post-order already lists prerequisites before the courses needing them
+        courses = [self.courses[c] for c in chosen]
+        return LearningPath(
+            courses=[c.course_id for c in courses],
+            expected_hours=sum(c.duration_h / c.success_rate for c in courses),
+            cost=sum(c.cost for c in courses),
+            success_rate=math.prod(c.success_rate for c in courses),
+            missing=sorted(self.skills[s] for s in missing),
+        )
+
+    def recommend(self, current_skills: Iterable[str], targets: Iterable[str]) -> LearningPath:
+        """Learning path for one employee."""
+        return self.recommend_batch([current_skills], [targets])[0]
+
+    def recommend_batch(self, current_skills: Sequence[Iterable[str]],
+                        targets: Sequence[Iterable[str]]) -> List[LearningPath]:
+        """
+        Learning paths for many employees in one call.
+
+        Identical ``(skills, targets)`` requests are solved once, and all
+        requests share the subproblem cache.
+
+        Args:
+            current_skills: Skills each employee already has (skills unknown
+                to the catalogue are ignored).
+            targets: Target skills per employee.
+
+        Raises:
+            ValueError: If the lengths differ or a target skill is unknown.
+        """
+        if len(current_skills) != len(targets):
+            raise ValueError("Expected one target set per employee")
+        solved: Dict[Tuple[int, int], LearningPath] = {}
+        paths = []
+        for skills, wanted in zip(current_skills, targets):
+            wanted = list(wanted)
+            unknown = [s for s in wanted if s not in self._skill_index]
+            if unknown:
+                raise ValueError(f"Unknown target skills: {unknown}")
+            key = (self._mask(skills), self._mask(wanted))
+            path = solved.get(key)
+            if path is None:
+                path = solved[key] = self._path(*key)
+            paths.append(path)
+        return paths
+
+    def update_course(self, course_id: str, duration_h: Optional[float] = None,
+                      cost: Optional[float] = None,
+                      success_rate: Optional[float] = None) -> int:
+        """
+        Change a course's attributes and invalidate the affected subproblems.
+
+        Returns:
+            Number of cache entries invalidated.
+        """
+        index = self._course_index[course_id]
+        course = self.courses[index]
+        course = Course(course.course_id,
+                        course.duration_h if duration_h is None else duration_h,
+                        course.provides, course.requires,
+                        course.cost if cost is None else cost,
+                        course.success_rate if success_rate is None else success_rate)
+        self.courses[index] = course
+        self._weights[index] = self._weight(course)
+        invalidated = 0
+        for skill in self._dependents[index]:
+            masks = self._cached_masks[skill]
+            for mask in masks:
+                del self._cache[(skill, mask)]
+            invalidated += len(masks)
+            masks.clear()
+        self.stats.invalidations += invalidated
+        return invalidated
+
+    def record_outcome(self, course_id: str, completed: bool) -> int:
+        """
+        Fold one learner's outcome into a course's success rate.
+
+        Outcomes update a running estimate that starts from the catalogue
+        rate, so outcomes reported by every organization refine the same
+        recommendations.
+
+        Returns:
+            Number of cache entries invalidated.
+        """
+        counts = self._outcomes[self._course_index[course_id]]
+        counts[0] += bool(completed)
+        counts[1] += 1
+        return self.update_course(course_id, success_rate=counts[0] / counts[1])
+
+    def clear_cache(self):
+        self._cache.clear()
+        for masks in self._cached_masks:
+            masks.clear()
@@ -0,0 +1,11 @@
+"""
+FedHR5.0 - Ethical recruitment module
+"""
+
+from .fairness_metrics import FairnessReport, FairnessSchema, fairness_report
+
+__all__ = [
+    "FairnessReport",
+    "FairnessSchema",
+    "fairness_report",
+]
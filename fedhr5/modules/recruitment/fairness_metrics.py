@@ -0,0 +1,241 @@
+"""
+FedHR5.0 - Group fairness metrics for recruitment decisions
+
+Computes demographic parity, disparate impact, equal opportunity and
+equalized odds for many protected attributes and their intersections from
+columnar decision data. Every attribute set is reduced in one grouped pass:
+each row is mapped to ``group * 4 + decision * 2 + label`` and a single
+``np.bincount`` yields the per-group confusion counts, from which every
+metric follows.
+
+Those counts are also the federated payload. With a shared
+:class:`FairnessSchema` every organization produces a fixed-length integer
+vector of per-group counts (:meth:`FairnessSchema.statistics`) that can be
+summed with secure aggregation; the server evaluates the metrics on the sum
+without seeing any individual decision.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+# Per-group statistics, in the order they are stored
+STATISTICS = ("count", "selected", "positives", "true_positives", "false_positives",
+              "labelled")
+
+AttributeSet = Tuple[str, ...]
+
+
+@dataclass
+class FairnessReport:
+    """Per-group rates and group fairness metrics for one attribute set."""
+
+    attributes: AttributeSet
+    groups: List[Tuple]
+    counts: np.ndarray
+    selection_rate: np.ndarray
+    true_positive_rate: np.ndarray
+    false_positive_rate: np.ndarray
+    metrics: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        return {
+            "attributes": list(self.attributes),
+            "groups": [
+                {"group": list(group), "count": int(n), "selection_rate": float(sr),
+                 "true_positive_rate": float(tpr), "false_positive_rate": float(fpr)}
+                for group, n, sr, tpr, fpr in zip(
+                    self.groups, self.counts, self.selection_rate,
+                    self.true_positive_rate, self.false_positive_rate)
+            ],
+            "metrics": self.metrics,
+        }
+
+
+def _rate_spread(rates: np.ndarray) -> Tuple[float, float]:
+    """(max - min, min / max) over the groups with a defined rate."""
+    rates = rates[~np.isnan(rates)]
+    if len(rates) == 0:
+        return float("nan"), float("nan")
+    high, low = rates.max(), rates.min()
+    return float(high - low), float(low / high) if high > 0 else float("nan")
+
+
+class FairnessSchema:
+    """
+    Protected attributes, their categories, and the attribute sets audited.
+
+    All parties of a federated audit must use the same schema so that their
+    statistic vectors line up element by element.
+
+    Args:
+        categories: Attribute name to its category labels.
+        intersections: Extra attribute sets to audit jointly, e.g.
+            ``[("gender", "age_group")]``. Every single attribute is always
+            audited on its own.
+    """
+
+    def __init__(self,
+                 categories: Mapping[str, Sequence],
+                 intersections: Sequence[Sequence[str]] = ()):
+        self.categories = {name: np.asarray(values) for name, values in categories.items()}
+        self._sorted = {name: (np.argsort(values, kind="stable"), np.sort(values))
+                        for name, values in self.categories.items()}
+        self.attribute_sets: List[AttributeSet] = [(name,) for name in self.categories]
+        for attributes in intersections:
+            attributes = tuple(attributes)
+            unknown = set(attributes) - set(self.categories)
+            if unknown:
+                raise ValueError(f"Unknown protected attributes: {sorted(unknown)}")
+            if attributes not in self.attribute_sets:
+                self.attribute_sets.append(attributes)
+        self._shapes = [tuple(len(self.categories[name]) for name in attributes)
+                        for attributes in self.attribute_sets]
+        self._offsets = np.cumsum([0] + [int(np.prod(shape)) for shape in self._shapes])
+
+    @classmethod
+    def from_data(cls,
+                  attributes: Mapping[str, Sequence],
+                  intersections: Sequence[Sequence[str]] = ()) -> "FairnessSchema":
+        """Schema with the categories observed in ``attributes``."""
+        return cls({name: np.unique(np.asarray(values)) for name, values in attributes.items()},
+                   intersections)
+
+    @property
+    def num_groups(self) -> int:
+        return int(self._offsets[-1])
+
+    @property
+    def size(self) -> int:
+        """Length of a statistics vector."""
+        return self.num_groups * len(STATISTICS)
+
+    def _codes(self, name: str, values) -> np.ndarray:
+        order, sorted_categories = self._sorted[name]
+        values = np.asarray(values)
+        positions = np.searchsorted(sorted_categories, values)
+        positions = np.minimum(positions, len(sorted_categories) - 1)
+        if not np.array_equal(sorted_categories[positions], values):
+            raise ValueError(f"Attribute '{name}' has values outside the schema")
+        return order[positions]
+
+    def statistics(self,
+                   decisions,
+                   attributes: Mapping[str, Sequence],
+                   labels=None) -> np.ndarray:
+        """
+        Per-group sufficient statistics of a batch of decisions.
+
+        Args:
+            decisions: Binary decisions (1 = selected), one per candidate.
+            attributes: Protected attribute columns, aligned with ``decisions``.
+            labels: Optional binary ground truth (1 = qualified); required
+                for equal opportunity and equalized odds.
+
+        Returns:
+            int64 vector of length :attr:`size`: for every audited group, in
+            schema order, the counts named in ``STATISTICS``. Without labels
+            the label-dependent counts and ``labelled`` are 0. Vectors from
+            different batches or organizations can simply be added;
+            :meth:`evaluate` only reports label metrics when every candidate
+            of the sum was labelled.
+        """
+        decisions = np.asarray(decisions).astype(bool, copy=False)
+        has_labels = labels is not None
+        labels = (np.asarray(labels).astype(bool, copy=False) if has_labels
+                  else np.zeros(len(decisions), dtype=bool))
+        if labels.shape != decisions.shape:
+            raise ValueError("labels and decisions must have the same length")
+        codes = {name: self._codes(name, attributes[name]) for name in self.categories}
+        outcome = decisions.astype(np.int64) * 2 + labels
+
+        stats = np.zeros((self.num_groups, len(STATISTICS)), dtype=np.int64)
+        for attributes_set, shape, offset in zip(self.attribute_sets, self._shapes,
+                                                 self._offsets):
+            groups = np.ravel_multi_index([codes[name] for name in attributes_set], shape)
+            size = int(np.prod(shape))
+            # cells[g] = [no/unqualified, no/qualified, yes/unqualified, yes/qualified]
+            cells = np.bincount(groups * 4 + outcome, minlength=size * 4).reshape(size, 4)
+            block = stats[offset:offset + size]
+            block[:, 0] = cells.sum(axis=1)
+            block[:, 1] = cells[:, 2] + cells[:, 3]
+            block[:, 2] = cells[:, 1] + cells[:, 3]
+            block[:, 3] = cells[:, 3]
+            block[:, 4] = cells[:, 2]
+        if has_labels:
+            stats[:, 5] = stats[:, 0]
+        else:
+            stats[:, 2:] = 0
+        return stats.reshape(-1)
+
+    def evaluate(self, statistics: np.ndarray, min_group_size: int = 1) -> List[FairnessReport]:
+        """
+        Fairness metrics from (possibly aggregated) statistics.
+
+        Args:
+            statistics: Output of :meth:`statistics`, or the sum of several.
+            min_group_size: Groups with fewer candidates are reported but
+                excluded from the metrics.
+
+        Returns:
+            One report per attribute set. Metrics: ``demographic_parity_difference``,
+            ``disparate_impact`` (lowest / highest selection rate) and, when
+            every candidate was labelled, ``equal_opportunity_difference`` and
+            ``equalized_odds_difference``. If any contributor had no labels,
+            the label counts cover only part of each group, so label-based
+            rates are left undefined rather than skewed.
+        """
+        stats = np.asarray(statistics, dtype=np.int64).reshape(self.num_groups, len(STATISTICS))
+        has_labels = bool(np.array_equal(stats[:, 5], stats[:, 0]) and stats[:, 0].any())
+        reports = []
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for attributes_set, shape, offset in zip(self.attribute_sets, self._shapes,
+                                                     self._offsets):
+                block = stats[offset:offset + int(np.prod(shape))]
+                count, selected = block[:, 0], block[:, 1]
+                valid = count >= max(min_group_size, 1)
+                selection_rate = np.where(valid, selected / count, np.nan)
+                if has_labels:
+                    positives, tp, fp = block[:, 2], block[:, 3], block[:, 4]
+                    negatives = count - positives
+                    tpr = np.where(valid & (positives > 0), tp / positives, np.nan)
+                    fpr = np.where(valid & (negatives > 0), fp / negatives, np.nan)
+                else:
+                    tpr = fpr = np.full(len(block), np.nan)
+
+                dp_difference, disparate_impact = _rate_spread(selection_rate)
+                metrics = {"demographic_parity_difference": dp_difference,
+                           "disparate_impact": disparate_impact}
+                if has_labels:
+                    tpr_difference, _ = _rate_spread(tpr)
+                    fpr_difference, _ = _rate_spread(fpr)
+                    metrics["equal_opportunity_difference"] = tpr_difference
+                    metrics["equalized_odds_difference"] = max(tpr_difference, fpr_difference)
+
+                labels = [self.categories[name] for name in attributes_set]
+                groups = [tuple(values[i].item() for values, i in zip(labels, index))
+                          for index in np.ndindex(*shape)]
+                reports.append(FairnessReport(
+                    attributes=attributes_set, groups=groups, counts=count,
+                    selection_rate=selection_rate, true_positive_rate=tpr,
+                    false_positive_rate=fpr, metrics=metrics))
+        return reports
+
+
+def fairness_report(decisions,
+                    attributes: Mapping[str, Sequence],
+                    labels=None,
+                    intersections: Sequence[Sequence[str]] = (),
+                    min_group_size: int = 1) -> List[FairnessReport]:
+    """
+    Audit one organization's decisions locally.
+
+    Example:
+        >>> reports = fairness_report(hired, {"gender": gender, "age_group": age},
+        ...                           labels=qualified,
+        ...                           intersections=[("gender", "age_group")])
+        >>> reports[0].metrics["disparate_impact"]
+    """
+    schema = FairnessSchema.from_data(attributes, intersections)
+    return schema.evaluate(schema.statistics(decisions, attributes, labels), min_group_size)
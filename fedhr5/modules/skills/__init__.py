@@ -0,0 +1,10 @@
+"""
+FedHR5.0 - Skills intelligence module
+"""
+
+from .embeddings import IVFIndex, exact_search
+
+__all__ = [
+    "IVFIndex",
+    "exact_search",
+]
@@ -0,0 +1,321 @@
+"""
+FedHR5.0 - Approximate nearest-neighbour search over skills embeddings
+
+An inverted-file (IVF) index: k-means centroids partition the embedding
+space into lists, and a query scans only the ``nprobe`` lists whose
+centroids are closest. Batched queries are answered list by list, so each
+probed list is scored against every query that probes it with one matrix
+product. Inserts append to growable per-list buffers; a saved index is a set
+of ``.npy`` files laid out list by list and is memory-mapped on load, so
+lists are paged in only when probed.
+"""
+
+import json
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+METRICS = ("cosine", "l2")
+FORMAT_VERSION = 2
+# Rows of the query-to-centroid and k-means distance matrices per block
+_BLOCK_ROWS = 4096
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Column indices of the ``k`` highest scores per row, best first."""
+    k = min(k, scores.shape[1])
+    part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(scores, part, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(part, order, axis=1)
+
+
+def _scores(queries: np.ndarray, vectors: np.ndarray, metric: str,
+            sq_norms: Optional[np.ndarray] = None) -> np.ndarray:
+    """Similarity (higher is better): cosine, or negative squared L2 up to a per-query constant."""
+    scores = queries @ vectors.T
+    if metric == "l2":
+        if sq_norms is None:
+            sq_norms = np.einsum("ij,ij->i", vectors, vectors)
+        scores *= 2
+        scores -= sq_norms
+    return scores
+
+
+def exact_search(database: np.ndarray,
+                 queries: np.ndarray,
+                 k: int = 10,
+                 metric: str = "cosine") -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Brute-force top-``k`` search (the recall reference).
+
+    Returns:
+        ``(scores, indices)`` of shape ``(len(queries), k)``; for ``"l2"``
+        scores are negative squared distances.
+    """
+    database = np.asarray(database, dtype=np.float32)
+    queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+    if metric == "cosine":
+        database, queries = _normalize(database), _normalize(queries)
+    sq_norms = np.einsum("ij,ij->i", database, database) if metric == "l2" else None
+    all_scores, all_indices = [], []
+    for start in range(0, len(queries), _BLOCK_ROWS):
+        block = queries[start:start + _BLOCK_ROWS]
+        scores = _scores(block, database, metric, sq_norms)
+        indices = _top_k(scores, k)
+        scores = np.take_along_axis(scores, indices, axis=1)
+        if metric == "l2":
+            scores -= np.einsum("ij,ij->i", block, block)[:, None]
+        all_scores.append(scores)
+        all_indices.append(indices)
+    return np.concatenate(all_scores), np.concatenate(all_indices)
+
+
+def kmeans(data: np.ndarray, num_clusters: int, iterations: int = 10,
+           seed: int = 0) -> np.ndarray:
+    """Lloyd's k-means with blocked assignment; returns float32 centroids."""
+    rng = np.random.default_rng(seed)
+    data = np.asarray(data, dtype=np.float32)
+    if len(data) < num_clusters:
+        raise ValueError(f"Need at least {num_clusters} training vectors, got {len(data)}")
+    centroids = data[rng.choice(len(data), num_clusters, replace=False)].copy()
+    assignment = np.empty(len(data), dtype=np.int64)
+    for _ in range(iterations):
+        sq_norms = np.einsum("ij,ij->i", centroids, centroids)
+        for start in range(0, len(data), _BLOCK_ROWS):
+            block = data[start:start + _BLOCK_ROWS]
+            assignment[start:start + len(block)] = np.argmax(
+                _scores(block, centroids, "l2", sq_norms), axis=1)
+        counts = np.bincount(assignment, minlength=num_clusters)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, data)
+        empty = counts == 0
+        centroids[~empty] = sums[~empty] / counts[~empty, None]
+        # Re-seed empty clusters with random training points
+        centroids[empty] = data[rng.choice(len(data), int(empty.sum()), replace=False)]
+    return centroids
+
+
+class IVFIndex:
+    """
+    Inverted-file ANN index for embeddings.
+
+    Args:
+        dim: Embedding dimension.
+        num_lists: Number of k-means partitions (about ``sqrt(N)`` works well).
+        metric: ``"cosine"`` (vectors are normalized on insert and query) or
+            ``"l2"``.
+        seed: Seed for k-means.
+
+    Example:
+        >>> index = IVFIndex(dim=128, num_lists=512)
+        >>> index.train(employee_embeddings[:50_000])
+        >>> index.add(employee_embeddings, ids=employee_ids)
+        >>> scores, ids = index.search(role_embeddings, k=10, nprobe=16)
+        >>> index.save("skills_index")
+        >>> index = IVFIndex.load("skills_index")  # memory-mapped
+    """
+
+    def __init__(self, dim: int, num_lists: int = 256, metric: str = "cosine", seed: int = 0):
+        if metric not in METRICS:
+            raise ValueError(f"metric must be one of {METRICS}")
+        self.dim = dim
+        self.num_lists = num_lists
+        self.metric = metric
+        self.seed = seed
+        self.centroids: Optional[np.ndarray] = None
+        self._vectors = [np.empty((0, dim), dtype=np.float32) for _ in range(num_lists)]
+        self._ids = [np.empty(0, dtype=np.int64) for _ in range(num_lists)]
+        self._sq_norms = [np.empty(0, dtype=np.float32) for _ in range(num_lists)]
+        self._sizes = np.zeros(num_lists, dtype=np.int64)
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        return int(self._sizes.sum())
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    def _prepare(self, vectors) -> np.ndarray:
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+        if vectors.shape[1] != self.dim:
+            raise ValueError(f"Expected {self.dim}-dimensional vectors, got {vectors.shape[1]}")
+        return _normalize(vectors) if self.metric == "cosine" else vectors
+
+    def train(self, sample, iterations: int = 10):
+        """Fit the list centroids on a representative sample."""
+        self.centroids = kmeans(self._prepare(sample), self.num_lists, iterations, self.seed)
+        if self.metric == "cosine":
+            self.centroids = _normalize(self.centroids)
+
+    def _nearest_lists(self, vectors: np.ndarray, nprobe: int) -> np.ndarray:
+        sq_norms = np.einsum("ij,ij->i", self.centroids, self.centroids)
+        lists = np.empty((len(vectors), nprobe), dtype=np.int64)
+        for start in range(0, len(vectors), _BLOCK_ROWS):
+            block = vectors[start:start + _BLOCK_ROWS]
+            lists[start:start + len(block)] = _top_k(
+                _scores(block, self.centroids, "l2", sq_norms), nprobe)
+        return lists
+
+    def add(self, vectors, ids=None) -> np.ndarray:
+        """
+        Insert vectors; can be called at any time after :meth:`train`.
+
+        Args:
+            vectors: ``(n, dim)`` embeddings.
+            ids: Optional int64 identifiers (default: consecutive integers).
+
+        Returns:
+            The identifiers of the inserted vectors.
+
+        Raises:
+            RuntimeError: If the index has not been trained.
+        """
+        if not self.is_trained:
+            raise RuntimeError("Train the index before adding vectors")
+        vectors = self._prepare(vectors)
+        if ids is None:
+            ids = np.arange(self._next_id, self._next_id + len(vectors), dtype=np.int64)
+        ids = np.asarray(ids, dtype=np.int64)
+        if ids.shape != (len(vectors),):
+            raise ValueError("Expected one id per vector")
+        if len(ids):
+            self._next_id = max(self._next_id, int(ids.max()) + 1)
+
+        assignment = self._nearest_lists(vectors, 1)[:, 0]
+        order = np.argsort(assignment, kind="stable")
+        lists, starts = np.unique(assignment[order], return_index=True)
+        bounds = np.append(starts, len(order))
+        for list_id, lo, hi in zip(lists, bounds[:-1], bounds[1:]):
+            self._append(int(list_id), vectors[order[lo:hi]], ids[order[lo:hi]])
+        return ids
+
+    def _append(self, list_id: int, vectors: np.ndarray, ids: np.ndarray):
+        size = self._sizes[list_id]
+        needed = size + len(vectors)
+        stored = self._vectors[list_id]
+        # Grow geometrically; loaded (memory-mapped) lists are copied on first write
+        if needed > len(stored) or not stored.flags.writeable:
+            capacity = max(needed, 2 * len(stored), 16)
+            grown = np.empty((capacity, self.dim), dtype=np.float32)
+            grown[:size] = stored[:size]
+            grown_ids = np.empty(capacity, dtype=np.int64)
+            grown_ids[:size] = self._ids[list_id][:size]
+            grown_norms = np.empty(capacity, dtype=np.float32)
+            grown_norms[:size] = self._sq_norms[list_id][:size]
+            self._vectors[list_id], self._ids[list_id] = grown, grown_ids
+            self._sq_norms[list_id] = grown_norms
+        self._vectors[list_id][size:needed] = vectors
+        self._ids[list_id][size:needed] = ids
+        self._sq_norms[list_id][size:needed] = np.einsum("ij,ij->i", vectors, vectors)
+        self._sizes[list_id] = needed
+
+    def search(self, queries, k: int = 10, nprobe: int = 8) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Batched approximate top-``k`` search.
+
+        Args:
+            queries: ``(q, dim)`` query embeddings (or one vector).
+            k: Neighbours per query.
+            nprobe: Lists scanned per query; higher is slower and more exact.
+
+        Returns:
+            ``(scores, ids)`` of shape ``(q, k)``, best first. Slots without
+            a neighbour have score ``-inf`` and id ``-1``. For ``"l2"``
+            scores are negative squared distances.
+        """
+        if not self.is_trained:
+            raise RuntimeError("Train the index before searching")
+        queries = self._prepare(queries)
+        nprobe = min(nprobe, self.num_lists)
+        probes = self._nearest_lists(queries, nprobe)
+
+        # Candidate slots: probe p of query q owns columns [p * k, (p + 1) * k)
+        candidates = np.full((len(queries), nprobe * k), -np.inf, dtype=np.float32)
+        candidate_ids = np.full((len(queries), nprobe * k), -1, dtype=np.int64)
+        flat = probes.ravel()
+        order = np.argsort(flat, kind="stable")
+        lists, starts = np.unique(flat[order], return_index=True)
+        bounds = np.append(starts, len(order))
+        for list_id, lo, hi in zip(lists, bounds[:-1], bounds[1:]):
+            size = self._sizes[list_id]
+            if size == 0:
+                continue
+            query_index, probe_index = np.divmod(order[lo:hi], nprobe)
+            scores = _scores(queries[query_index], self._vectors[list_id][:size], self.metric,
+                             self._sq_norms[list_id][:size])
+            best = _top_k(scores, k)
+            columns = probe_index[:, None] * k + np.arange(best.shape[1])
+            candidates[query_index[:, None], columns] = np.take_along_axis(scores, best, axis=1)
+            candidate_ids[query_index[:, None], columns] = self._ids[list_id][best]
+
+        best = _top_k(candidates, k)
+        scores = np.take_along_axis(candidates, best, axis=1)
+        if self.metric == "l2":
+            scores -= np.einsum("ij,ij->i", queries, queries)[:, None]
+        return scores, np.take_along_axis(candidate_ids, best, axis=1)
+
+    def save(self, directory: Union[str, Path]):
+        """Write the index as ``.npy`` files laid out list by list."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        offsets = np.concatenate([[0], np.cumsum(self._sizes)])
+        vectors = np.lib.format.open_memmap(directory / "vectors.npy", mode="w+",
+                                            dtype=np.float32, shape=(len(self), self.dim))
+        ids = np.empty(len(self), dtype=np.int64)
+        sq_norms = np.empty(len(self), dtype=np.float32)
+        for list_id in range(self.num_lists):
+            lo, hi = offsets[list_id], offsets[list_id + 1]
+            vectors[lo:hi] = self._vectors[list_id][:hi - lo]
+            ids[lo:hi] = self._ids[list_id][:hi - lo]
+            sq_norms[lo:hi] = self._sq_norms[list_id][:hi - lo]
+        vectors.flush()
+        del vectors
+        np.save(directory / "ids.npy", ids)
+        if self.metric == "l2":
+            np.save(directory / "sq_norms.npy", sq_norms)
+        np.save(directory / "offsets.npy", offsets)
+        np.save(directory / "centroids.npy", self.centroids)
+        with open(directory / "index.json", "w") as f:
+            json.dump({"version": FORMAT_VERSION, "dim": self.dim, "num_lists": self.num_lists,
+                       "metric": self.metric, "seed": self.seed, "next_id": self._next_id}, f)
+
+    @classmethod
+    def load(cls, directory: Union[str, Path], mmap: bool = True) -> "IVFIndex":
+        """
+        Open a saved index.
+
+        With ``mmap`` the lists (and, for ``"l2"``, their saved squared
+        norms) are read-only views into the memory-mapped files; a list is
+        copied into memory only when vectors are added to it.
+        """
+        directory = Path(directory)
+        with open(directory / "index.json") as f:
+            meta = json.load(f)
+        if meta["version"] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported index format version {meta['version']}")
+        index = cls(meta["dim"], meta["num_lists"], meta["metric"], meta["seed"])
+        index._next_id = meta["next_id"]
+        mode = "r" if mmap else None
+        index.centroids = np.load(directory / "centroids.npy")
+        vectors = np.load(directory / "vectors.npy", mmap_mode=mode)
+        ids = np.load(directory / "ids.npy", mmap_mode=mode)
+        offsets = np.load(directory / "offsets.npy")
+        if index.metric == "l2":
+            sq_norms = np.load(directory / "sq_norms.npy", mmap_mode=mode)
+        else:
+            # Norms are unused for cosine: a zero-stride view, not N stored zeros
+            sq_norms = np.broadcast_to(np.float32(0), (len(ids),))
+        for list_id in range(index.num_lists):
+            lo, hi = offsets[list_id], offsets[list_id + 1]
+            index._vectors[list_id] = vectors[lo:hi]
+            index._ids[list_id] = ids[lo:hi]
+            index._sq_norms[list_id] = sq_norms[lo:hi]
+            index._sizes[list_id] = hi - lo
+        return index
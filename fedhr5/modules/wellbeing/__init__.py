@@ -0,0 +1,27 @@
+"""
+FedHR5.0 - Well-being monitoring module
+"""
+
+from .data_collectors import (
+    WINDOW_STATS,
+    FeatureBuffer,
+    RingBuffer,
+    SlidingWindowFeatures,
+    TumblingAggregate,
+    TumblingWindowFeatures,
+    collect,
+    feature_names,
+    simulate_sensor_stream,
+)
+
+__all__ = [
+    "WINDOW_STATS",
+    "FeatureBuffer",
+    "RingBuffer",
+    "SlidingWindowFeatures",
+    "TumblingAggregate",
+    "TumblingWindowFeatures",
+    "collect",
+    "feature_names",
+    "simulate_sensor_stream",
+]
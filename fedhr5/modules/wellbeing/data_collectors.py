@@ -0,0 +1,361 @@
+"""
+FedHR5.0 - Streaming well-being data collection
+
+Edge-side feature extraction for IoT and environmental sensor streams. A
+reading is a ``(timestamp, channel, value)`` tuple; pipeline stages are
+generators, so a device can consume an unbounded stream while holding only
+the current windows in memory:
+
+    readings -> sliding / tumbling window aggregates -> feature vectors
+    -> FeatureBuffer -> local training
+
+Sliding windows keep their raw readings in fixed-capacity ring buffers
+(``array``-backed, read through NumPy views); tumbling windows keep only
+running accumulators. Feature vectors hold ``count, mean, std, min, max`` per
+channel, with NaN for channels that saw no readings in the window.
+
+Example:
+    >>> pipeline = SlidingWindowFeatures(["heart_rate", "eda", "noise_db"],
+    ...                                  window=30.0, hop=5.0)
+    >>> buffer = FeatureBuffer(capacity=720, width=pipeline.width)
+    >>> for window_end, features in pipeline.process(sensor_readings):
+    ...     buffer.push(features)
+    >>> local_train(buffer.latest())
+"""
+
+import math
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+Reading = Tuple[float, str, float]
+
+WINDOW_STATS = ("count", "mean", "std", "min", "max")
+
+# Synthetic sensor channels: name -> (baseline, spread, stress response)
+SENSOR_CHANNELS = {
+    "heart_rate": (72.0, 6.0, 18.0),
+    "eda": (2.0, 0.4, 1.5),
+    "skin_temp": (33.5, 0.3, -0.6),
+    "noise_db": (55.0, 8.0, 6.0),
+    "co2_ppm": (650.0, 60.0, 150.0),
+}
+
+
+def feature_names(channels: Sequence[str]) -> List[str]:
+    """Column names of the feature vectors produced for ``channels``."""
+    return [f"{channel}_{stat}" for channel in channels for stat in WINDOW_STATS]
+
+
+def _fill_stats(out: np.ndarray, count: int, total: float, sumsq: float,
+                minimum: float, maximum: float, shift: float = 0.0):
+    """Write ``WINDOW_STATS`` from (shifted) running sums into ``out``."""
+    out[0] = count
+    if count == 0:
+        out[1:] = np.nan
+        return
+    mean = total / count
+    out[1] = mean + shift
+    out[2] = math.sqrt(max(sumsq / count - mean * mean, 0.0))
+    out[3] = minimum
+    out[4] = maximum
+
+
+class RingBuffer:
+    """
+    Fixed-capacity buffer of ``(timestamp, value)`` pairs in time order.
+
+    When full, pushing overwrites the oldest reading and increments
+    ``dropped``. Storage is two preallocated ``array('d')`` blocks exposed to
+    NumPy without copying.
+    """
+
+    __slots__ = ("capacity", "dropped", "_times", "_values", "_times_np", "_values_np",
+                 "_head", "_size")
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.dropped = 0
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._times_np = np.frombuffer(self._times, dtype=np.float64)
+        self._values_np = np.frombuffer(self._values, dtype=np.float64)
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, timestamp: float, value: float):
+        size = self._size
+        if size == self.capacity:
+            index = self._head
+            self._head = (index + 1) % size
+            self.dropped += 1
+        else:
+            index = self._head + size
+            if index >= self.capacity:
+                index -= self.capacity
+            self._size = size + 1
+        self._times[index] = timestamp
+        self._values[index] = value
+
+    def evict_before(self, timestamp: float):
+        """Drop readings older than ``timestamp``."""
+        while self._size and self._times[self._head] < timestamp:
+            self._head = (self._head + 1) % self.capacity
+            self._size -= 1
+
+    def _segments(self, data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        end = self._head + self._size
+        if end <= self.capacity:
+            return data[self._head:end], data[:0]
+        return data[self._head:], data[:end - self.capacity]
+
+    def values(self) -> np.ndarray:
+        """Buffered values, oldest first (a copy when the buffer wraps)."""
+        first, second = self._segments(self._values_np)
+        return first if not len(second) else np.concatenate([first, second])
+
+    def timestamps(self) -> np.ndarray:
+        first, second = self._segments(self._times_np)
+        return first if not len(second) else np.concatenate([first, second])
+
+    def stats(self, out: np.ndarray):
+        """Write ``WINDOW_STATS`` of the buffered values into ``out``."""
+        if self._size == 0:
+            _fill_stats(out, 0, 0.0, 0.0, 0.0, 0.0)
+            return
+        parts = [part for part in self._segments(self._values_np) if len(part)]
+        shift = parts[0][0]
+        total = sumsq = 0.0
+        for part in parts:
+            centered = part - shift
+            total += float(centered.sum())
+            sumsq += float(centered @ centered)
+        _fill_stats(out, self._size, total, sumsq,
+                    min(float(part.min()) for part in parts),
+                    max(float(part.max()) for part in parts), shift)
+
+
+class TumblingAggregate:
+    """Running ``WINDOW_STATS`` of one channel over one tumbling window."""
+
+    __slots__ = ("count", "shift", "total", "sumsq", "minimum", "maximum")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.shift = self.total = self.sumsq = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def add(self, value: float):
+        if self.count == 0:
+            # Sums are kept relative to the first value to avoid cancellation
+            self.shift = value
+        self.count += 1
+        centered = value - self.shift
+        self.total += centered
+        self.sumsq += centered * centered
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    def stats(self, out: np.ndarray):
+        _fill_stats(out, self.count, self.total, self.sumsq,
+                    self.minimum, self.maximum, self.shift)
+
+
+class SlidingWindowFeatures:
+    """
+    Features over the last ``window`` seconds, emitted every ``hop`` seconds.
+
+    Emission times are multiples of ``hop``; the vector emitted at time ``T``
+    summarizes readings with ``T - window <= timestamp < T``. Timestamps are
+    expected in non-decreasing order; readings older than the last emission
+    are counted in ``late`` and ignored.
+
+    Args:
+        channels: Channel names to track (others are ignored).
+        window: Window length in seconds.
+        hop: Emission interval in seconds.
+        max_rate: Upper bound on readings per second per channel, used to size
+            the ring buffers; beyond it the oldest readings are overwritten.
+    """
+
+    __slots__ = ("channels", "window", "hop", "late", "_buffers")
+
+    def __init__(self, channels: Sequence[str], window: float = 30.0, hop: float = 5.0,
+                 max_rate: float = 2_000.0):
+        if hop <= 0 or window <= 0:
+            raise ValueError("window and hop must be positive")
+        self.channels = list(channels)
+        self.window = window
+        self.hop = hop
+        self.late = 0
+        # Between emissions a buffer holds up to window + hop seconds of data
+        capacity = int(math.ceil((window + hop) * max_rate))
+        self._buffers: Dict[str, RingBuffer] = {c: RingBuffer(capacity) for c in self.channels}
+
+    @property
+    def width(self) -> int:
+        return len(self.channels) * len(WINDOW_STATS)
+
+    @property
+    def dropped(self) -> int:
+        return sum(buffer.dropped for buffer in self._buffers.values())
+
+    def _emit(self, window_end: float) -> np.ndarray:
+        features = np.empty(self.width)
+        stride = len(WINDOW_STATS)
+        for i, channel in enumerate(self.channels):
+            buffer = self._buffers[channel]
+            buffer.evict_before(window_end - self.window)
+            buffer.stats(features[i * stride:(i + 1) * stride])
+        return features
+
+    def process(self, readings: Iterable[Reading]) -> Iterator[Tuple[float, np.ndarray]]:
+        """Consume ``readings`` lazily, yielding ``(window_end, features)``."""
+        buffers, hop = self._buffers, self.hop
+        next_emit = None
+        for timestamp, channel, value in readings:
+            if next_emit is None:
+                next_emit = (timestamp // hop + 1) * hop
+            elif timestamp >= next_emit:
+                while timestamp >= next_emit:
+                    yield next_emit, self._emit(next_emit)
+                    next_emit += hop
+            elif timestamp < next_emit - hop:
+                self.late += 1
+                continue
+            buffer = buffers.get(channel)
+            if buffer is not None:
+                buffer.push(timestamp, value)
+
+
+class TumblingWindowFeatures:
+    """
+    Features over consecutive, non-overlapping windows of ``duration`` seconds.
+
+    Only running accumulators are kept, so memory is constant regardless of
+    the event rate. Readings that belong to an already emitted window are
+    counted in ``late`` and ignored.
+    """
+
+    __slots__ = ("channels", "duration", "late", "_aggregates")
+
+    def __init__(self, channels: Sequence[str], duration: float = 60.0):
+        if duration <= 0:
+            raise ValueError("duration must be positive")
+        self.channels = list(channels)
+        self.duration = duration
+        self.late = 0
+        self._aggregates = {channel: TumblingAggregate() for channel in self.channels}
+
+    @property
+    def width(self) -> int:
+        return len(self.channels) * len(WINDOW_STATS)
+
+    def _emit(self) -> np.ndarray:
+        features = np.empty(self.width)
+        stride = len(WINDOW_STATS)
+        for i, channel in enumerate(self.channels):
+            aggregate = self._aggregates[channel]
+            aggregate.stats(features[i * stride:(i + 1) * stride])
+            aggregate.reset()
+        return features
+
+    def process(self, readings: Iterable[Reading]) -> Iterator[Tuple[float, np.ndarray]]:
+        """Consume ``readings`` lazily, yielding ``(window_end, features)``."""
+        aggregates, duration = self._aggregates, self.duration
+        window_end = None
+        for timestamp, channel, value in readings:
+            if window_end is None:
+                window_end = (timestamp // duration + 1) * duration
+            elif timestamp >= window_end:
+                yield window_end, self._emit()
+                # Skip empty windows after a gap in the stream
+                window_end = (timestamp // duration + 1) * duration
+            elif timestamp < window_end - duration:
+                self.late += 1
+                continue
+            aggregate = aggregates.get(channel)
+            if aggregate is not None:
+                aggregate.add(value)
+
+
+class FeatureBuffer:
+    """
+    Ring of the most recent feature vectors, the local training set.
+
+    Args:
+        capacity: Number of vectors kept (older ones are overwritten).
+        width: Feature vector length.
+    """
+
+    __slots__ = ("capacity", "width", "_data", "_next", "_size")
+
+    def __init__(self, capacity: int, width: int):
+        self.capacity = capacity
+        self.width = width
+        self._data = np.empty((capacity, width), dtype=np.float32)
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, features: np.ndarray):
+        self._data[self._next] = features
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def latest(self, n: Optional[int] = None) -> np.ndarray:
+        """The last ``n`` vectors (default: all), oldest first, as a new array."""
+        n = self._size if n is None else min(n, self._size)
+        indices = (np.arange(self._next - n, self._next)) % self.capacity
+        return self._data[indices]
+
+
+def collect(features: Iterable[Tuple[float, np.ndarray]],
+            buffer: FeatureBuffer) -> Iterator[float]:
+    """Push each feature vector into ``buffer``, yielding its window end."""
+    for window_end, vector in features:
+        buffer.push(vector)
+        yield window_end
+
+
+def simulate_sensor_stream(rate: float,
+                           duration: float,
+                           channels: Optional[Sequence[str]] = None,
+                           start: float = 0.0,
+                           seed: int = 0,
+                           chunk_size: int = 8192) -> Iterator[Reading]:
+    """
+    Synthetic wearable/environmental readings at ``rate`` events per second.
+
+    Channels are sampled round-robin with Gaussian noise; a slow stress
+    signal (a few episodes per hour) shifts every channel by its stress
+    response. Generated in NumPy chunks, yielded one reading at a time.
+    """
+    channels = list(channels or SENSOR_CHANNELS)
+    params = np.array([SENSOR_CHANNELS[c] for c in channels])
+    rng = np.random.default_rng(seed)
+    total = int(rate * duration)
+    for offset in range(0, total, chunk_size):
+        n = min(chunk_size, total - offset)
+        index = np.arange(offset, offset + n)
+        timestamps = start + index / rate
+        channel_index = index % len(channels)
+        stress = np.clip(np.sin(2 * np.pi * timestamps / 1200.0) * 2 - 1, 0, 1)
+        base, spread, response = params[channel_index].T
+        values = base + spread * rng.standard_normal(n) + response * stress
+        names = [channels[i] for i in channel_index.tolist()]
+        yield from zip(timestamps.tolist(), names, values.tolist())
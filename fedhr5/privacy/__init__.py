@@ -0,0 +1,18 @@
+"""
+FedHR5.0 - Privacy mechanisms
+"""
+
+from ..utils.lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "accounting": ["PrivacyAccountant"],
+    "budget": ["PrivacyBudgetManager"],
+    "secure_aggregation": ["DiffieHellmanKeyPair", "SecureAggregator", "key_agreement",
+                           "mask_update", "reconstruct_secret", "recovery_response",
+                           "secure_aggregate", "share_secret"],
+    "homomorphic_ops": ["EncryptedVector", "FixedPointEncoder", "PackedEncryptor",
+                        "PaillierPrivateKey", "PaillierPublicKey", "decrypt_vector",
+                        "generate_keypair"],
+    "differential_privacy": ["adaptive_clip", "add_differential_privacy", "clip_and_noise_",
+                             "client_streams", "gaussian_sigma"],
+})
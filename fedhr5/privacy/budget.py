@@ -0,0 +1,269 @@
+"""
+FedHR5.0 - Privacy budget management
+
+Tracks cumulative privacy spend for many concurrent budgets (per client,
+per module, ...) with constant work per recorded round. Each budget keeps
+only the running sums Σε and Σε², from which every composition bound in
+:mod:`fedhr5.privacy.accounting` can be evaluated, and the whole state can
+be checkpointed to a single compact file.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Hashable, Iterable, Optional, Sequence, Union
+
+import numpy as np
+
+from ..utils.metrics import EPSILON_SPENT
+from .accounting import COMPOSITION_METHODS, compose_sums
+
+DEFAULT_KEY = "global"
+STATE_VERSION = 1
+
+BudgetKey = Union[str, Sequence[str]]
+
+
+def _normalise_key(key: BudgetKey) -> Hashable:
+    """Budget keys are strings or (client, module, ...) tuples of strings."""
+    return key if isinstance(key, str) else tuple(key)
+
+
+class PrivacyBudgetManager:
+    """
+    Incremental privacy budget manager.
+
+    Budgets are stored in flat arrays indexed through a key table, so
+    recording a round is O(1) per budget and ``can_proceed`` never rescans
+    history. Unknown keys are registered on first :meth:`record` with the
+    default ``total_budget``; queries treat them as unspent without
+    registering them.
+
+    Args:
+        total_budget: Default total ε for each budget.
+        num_rounds: Planned number of training rounds.
+        delta: Target failure probability δ for composition.
+        method: Composition bound, ``"basic"``, ``"advanced"`` or ``"rdp"``.
+
+    Example:
+        >>> manager = PrivacyBudgetManager(total_budget=1.0)
+        >>> eps = manager.allocate_round_budget(round_num=3)
+        >>> if manager.can_proceed(eps, key=("org_17", "wellbeing")):
+        ...     manager.record(eps, key=("org_17", "wellbeing"))
+        >>> manager.save("privacy_state.npz")
+    """
+
+    def __init__(self,
+                 total_budget: float = 1.0,
+                 num_rounds: int = 100,
+                 delta: float = 1e-5,
+                 method: str = "rdp"):
+        if method not in COMPOSITION_METHODS:
+            raise ValueError(
+                f"Unknown composition method {method!r}, "
+                f"expected one of {COMPOSITION_METHODS}"
+            )
+        self.total_budget = total_budget
+        self.num_rounds = num_rounds
+        self.delta = delta
+        self.method = method
+
+        self._index = {}
+        self._keys = []
+        self._size = 0
+        self._sum_eps = np.zeros(0, dtype=np.float64)
+        self._sum_sq = np.zeros(0, dtype=np.float64)
+        self._limit = np.zeros(0, dtype=np.float64)
+        self._rounds = np.zeros(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: BudgetKey) -> bool:
+        return _normalise_key(key) in self._index
+
+    def _grow(self, minimum: int):
+        """Grow backing arrays geometrically so registration is amortised O(1)."""
+        capacity = max(minimum, 2 * len(self._sum_eps), 16)
+        for name in ("_sum_eps", "_sum_sq", "_limit", "_rounds"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def register(self, key: BudgetKey, total_budget: Optional[float] = None) -> int:
+        """
+        Register a budget (no-op if it already exists).
+
+        Args:
+            key: Budget identifier, e.g. ``"org_17"`` or ``("org_17", "skills")``.
+            total_budget: Total ε for this budget; defaults to the manager's.
+
+        Returns:
+            Internal index of the budget.
+        """
+        key = _normalise_key(key)
+        index = self._index.get(key)
+        if index is not None:
+            if total_budget is not None:
+                self._limit[index] = total_budget
+            return index
+        if self._size == len(self._sum_eps):
+            self._grow(self._size + 1)
+        index = self._size
+        self._index[key] = index
+        self._keys.append(key)
+        self._limit[index] = self.total_budget if total_budget is None else total_budget
+        self._size += 1
+        return index
+
+    def _indices(self, keys: Iterable[BudgetKey]) -> np.ndarray:
+        return np.fromiter((self.register(k) for k in keys), dtype=np.int64)
+
+    def _state(self, keys: Iterable[BudgetKey]):
+        """``(Σε, Σε², limit)`` per key without registering unknown keys."""
+        index = np.fromiter((self._index.get(_normalise_key(k), -1) for k in keys),
+                            dtype=np.int64)
+        known = index >= 0
+        sum_eps, sum_sq = np.zeros(len(index)), np.zeros(len(index))
+        limit = np.full(len(index), self.total_budget, dtype=np.float64)
+        sum_eps[known] = self._sum_eps[index[known]]
+        sum_sq[known] = self._sum_sq[index[known]]
+        limit[known] = self._limit[index[known]]
+        return sum_eps, sum_sq, limit
+
+    def allocate_round_budget(self, round_num: int) -> float:
+        """Adaptive allocation based on round importance"""
+        if round_num < 10:  # Early rounds more important
+            return 0.02
+        elif round_num < 50:
+            return 0.01
+        else:
+            return 0.005
+
+    def _composed(self, sum_eps, sum_sq, extra=0.0) -> np.ndarray:
+        extra = np.asarray(extra, dtype=np.float64)
+        return compose_sums(sum_eps + extra, sum_sq + extra ** 2, self.delta, self.method)
+
+    def spent(self, key: BudgetKey = DEFAULT_KEY) -> float:
+        """Cumulative ε spent by ``key`` under the configured composition."""
+        sum_eps, sum_sq, _ = self._state([key])
+        return float(self._composed(sum_eps, sum_sq)[0])
+
+    def remaining(self, key: BudgetKey = DEFAULT_KEY) -> float:
+        """Budget left for ``key``."""
+        sum_eps, sum_sq, limit = self._state([key])
+        return float((limit - self._composed(sum_eps, sum_sq))[0])
+
+    @property
+    def spent_budget(self) -> float:
+        """Cumulative ε of the default budget."""
+        return self.spent(DEFAULT_KEY)
+
+    def can_proceed(self, requested_budget: float, key: BudgetKey = DEFAULT_KEY) -> bool:
+        """Check if budget allows operation"""
+        return bool(self.can_proceed_many([key], requested_budget)[0])
+
+    def can_proceed_many(self,
+                         keys: Iterable[BudgetKey],
+                         requested_budget: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Vectorized :meth:`can_proceed` for many budgets at once.
+
+        Args:
+            keys: Budget identifiers.
+            requested_budget: Scalar or per-key ε requested for the next round.
+
+        Returns:
+            Boolean array, one entry per key.
+        """
+        sum_eps, sum_sq, limit = self._state(keys)
+        return self._composed(sum_eps, sum_sq, requested_budget) <= limit
+
+    def record(self, epsilon: float, key: BudgetKey = DEFAULT_KEY):
+        """Record ε spent by one budget for one round."""
+        index = self.register(key)
+        self._sum_eps[index] += epsilon
+        self._sum_sq[index] += epsilon * epsilon
+        self._rounds[index] += 1
+        EPSILON_SPENT.inc(epsilon)
+
+    def record_many(self,
+                    keys: Iterable[BudgetKey],
+                    epsilon: Union[float, np.ndarray]):
+        """
+        Record one round of spend for many budgets.
+
+        Args:
+            keys: Budget identifiers; a key listed twice is charged twice.
+            epsilon: Scalar or per-key ε spent this round.
+        """
+        index = self._indices(keys)
+        epsilon = np.broadcast_to(np.asarray(epsilon, dtype=np.float64), index.shape)
+        # Unbuffered adds: ``a[index] += x`` keeps only the last of repeated indices
+        np.add.at(self._sum_eps, index, epsilon)
+        np.add.at(self._sum_sq, index, epsilon ** 2)
+        np.add.at(self._rounds, index, 1)
+        EPSILON_SPENT.inc(float(epsilon.sum()))
+
+    def save(self, path: Union[str, Path]):
+        """
+        Checkpoint the manager state.
+
+        The state is written to a temporary file and atomically renamed, so a
+        crash mid-write never leaves a truncated checkpoint behind.
+
+        Args:
+            path: Destination ``.npz`` file.
+        """
+        path = Path(path)
+        config = {
+            "version": STATE_VERSION,
+            "total_budget": self.total_budget,
+            "num_rounds": self.num_rounds,
+            "delta": self.delta,
+            "method": self.method,
+            "keys": [k if isinstance(k, str) else list(k) for k in self._keys],
+        }
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(
+                f,
+                config=np.frombuffer(json.dumps(config).encode(), dtype=np.uint8),
+                sum_eps=self._sum_eps[:self._size],
+                sum_sq=self._sum_sq[:self._size],
+                limit=self._limit[:self._size],
+                rounds=self._rounds[:self._size],
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "PrivacyBudgetManager":
+        """
+        Restore a manager from a checkpoint written by :meth:`save`.
+
+        Raises:
+            ValueError: If the checkpoint version is not supported.
+        """
+        with np.load(path) as state:
+            config = json.loads(state["config"].tobytes().decode())
+            if config.get("version") != STATE_VERSION:
+                raise ValueError(
+                    f"Unsupported privacy state version {config.get('version')!r}"
+                )
+            manager = cls(total_budget=config["total_budget"],
+                          num_rounds=config["num_rounds"],
+                          delta=config["delta"],
+                          method=config["method"])
+            size = len(config["keys"])
+            manager._grow(size)
+            manager._sum_eps[:size] = state["sum_eps"]
+            manager._sum_sq[:size] = state["sum_sq"]
+            manager._limit[:size] = state["limit"]
+            manager._rounds[:size] = state["rounds"]
+        manager._keys = [_normalise_key(k) for k in config["keys"]]
+        manager._index = {k: i for i, k in enumerate(manager._keys)}
+        manager._size = size
+        return manager
@@ -0,0 +1,169 @@
+"""
+FedHR5.0 - Differential privacy mechanisms
+
+Gaussian mechanism and adaptive clipping for client model updates. The fused
+:func:`clip_and_noise_` kernel operates in place on one contiguous float32
+buffer holding every client update of a round (one row per client).
+"""
+
+import math
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# Bytes of float32 noise generated per block when a single RNG stream is shared
+_NOISE_BLOCK_BYTES = 8 * 2**20
+
+
+def gaussian_sigma(sensitivity: float, epsilon: float, delta: float) -> float:
+    """Noise scale of the (ε, δ) Gaussian mechanism for an L2 sensitivity."""
+    if epsilon <= 0:
+        raise ValueError("epsilon must be positive")
+    if not 0 < delta < 1:
+        raise ValueError("delta must lie in (0, 1)")
+    return sensitivity * math.sqrt(2 * math.log(1.25 / delta)) / epsilon
+
+
+def client_streams(seed: int,
+                   client_ids: Sequence[int],
+                   round_num: int = 0) -> list:
+    """
+    Reproducible, independent RNG streams for each client in a round.
+
+    The stream of a client depends only on ``(seed, client_id, round_num)``,
+    not on which other clients participate or their order in the buffer.
+
+    Args:
+        seed: Deployment-wide base seed.
+        client_ids: Integer identifiers of the clients, in buffer row order.
+        round_num: Training round.
+
+    Returns:
+        List of ``numpy.random.Generator``, one per client.
+    """
+    return [
+        np.random.Generator(np.random.PCG64(
+            np.random.SeedSequence(seed, spawn_key=(int(cid), round_num))))
+        for cid in client_ids
+    ]
+
+
+def add_differential_privacy(gradient: np.ndarray,
+                             sensitivity: float,
+                             epsilon: float,
+                             delta: float,
+                             rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Add calibrated Gaussian noise to a single gradient.
+
+    Args:
+        gradient: Model gradients
+        sensitivity: L2 sensitivity bound
+        epsilon: Privacy budget
+        delta: Failure probability
+        rng: Random generator; a fresh unseeded one if omitted.
+
+    Returns:
+        Noisy gradient satisfying (ε, δ)-DP
+    """
+    rng = rng or np.random.default_rng()
+    sigma = gaussian_sigma(sensitivity, epsilon, delta)
+    noise = rng.standard_normal(gradient.shape, dtype=np.float32)
+    return gradient + sigma * noise
+
+
+def row_norms(updates: np.ndarray) -> np.ndarray:
+    """L2 norm of every row of a 2-D buffer without an (n, d) temporary."""
+    return np.sqrt(np.einsum("ij,ij->i", updates, updates))
+
+
+def adaptive_clip(updates: np.ndarray, percentile: float = 75) -> float:
+    """
+    Adaptively clip a batch of updates in place.
+
+    Every row is scaled down to at most the given percentile of the row norms.
+
+    Args:
+        updates: Contiguous ``(num_clients, num_params)`` float32 buffer.
+        percentile: Percentile of row norms used as the clip value.
+
+    Returns:
+        The clip value that was applied.
+    """
+    norms = row_norms(updates)
+    clip_value = float(np.percentile(norms, percentile))
+    _scale_rows(updates, norms, clip_value)
+    return clip_value
+
+
+def _scale_rows(updates: np.ndarray, norms: np.ndarray, clip_value: float):
+    scale = np.ones(len(norms), dtype=np.float32)
+    over = norms > clip_value
+    scale[over] = clip_value / norms[over]
+    updates *= scale[:, None]
+
+
+def clip_and_noise_(updates: np.ndarray,
+                    epsilon: float,
+                    delta: float,
+                    clip_norm: Optional[float] = None,
+                    percentile: float = 75,
+                    rng: Union[np.random.Generator, Sequence[np.random.Generator], None] = None,
+                    ) -> Tuple[float, float]:
+    """
+    Fused per-row clipping and Gaussian noise, applied in place.
+
+    Norms are computed in one pass, rows are rescaled with a single broadcast
+    multiply, and noise is drawn directly into a reusable scratch buffer, so
+    the only allocation proportional to the model is one row (or block) of
+    noise.
+
+    Args:
+        updates: C-contiguous ``(num_clients, num_params)`` float32 buffer;
+            overwritten with the privatized updates.
+        epsilon: Per-round privacy budget.
+        delta: Failure probability.
+        clip_norm: Fixed L2 clip norm. If omitted, the ``percentile`` of the
+            current row norms is used (adaptive clipping).
+        percentile: Percentile for adaptive clipping.
+        rng: Either one generator per row (see :func:`client_streams`) for
+            reproducible per-client noise, or a single shared generator.
+
+    Returns:
+        ``(clip_value, sigma)`` actually applied.
+
+    Raises:
+        ValueError: If ``updates`` is not a C-contiguous 2-D float32 array or
+            the number of generators does not match the number of rows.
+    """
+    if (updates.ndim != 2 or updates.dtype != np.float32
+            or not updates.flags.c_contiguous):
+        raise ValueError("updates must be a C-contiguous 2-D float32 buffer")
+    num_rows, num_params = updates.shape
+
+    norms = row_norms(updates)
+    if clip_norm is None:
+        clip_norm = float(np.percentile(norms, percentile))
+    _scale_rows(updates, norms, clip_norm)
+
+    sigma = gaussian_sigma(clip_norm, epsilon, delta)
+    sigma32 = np.float32(sigma)
+    if rng is None or isinstance(rng, np.random.Generator):
+        rng = rng or np.random.default_rng()
+        block = max(1, min(num_rows, _NOISE_BLOCK_BYTES // max(1, 4 * num_params)))
+        scratch = np.empty((block, num_params), dtype=np.float32)
+        for start in range(0, num_rows, block):
+            rows = updates[start:start + block]
+            noise = scratch[:len(rows)]
+            rng.standard_normal(dtype=np.float32, out=noise)
+            noise *= sigma32
+            rows += noise
+    else:
+        if len(rng) != num_rows:
+            raise ValueError("Expected one generator per update row")
+        scratch = np.empty(num_params, dtype=np.float32)
+        for row, stream in zip(updates, rng):
+            stream.standard_normal(dtype=np.float32, out=scratch)
+            scratch *= sigma32
+            row += scratch
+    return clip_norm, sigma
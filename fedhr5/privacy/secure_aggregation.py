@@ -0,0 +1,434 @@
+"""
+FedHR5.0 - Secure aggregation
+
+Double-masked secure aggregation (Bonawitz et al., 2017) over the ring of
+integers modulo 2^16, 2^32 or 2^64. Client updates are fixed-point encoded and
+masked with pseudorandom vectors expanded from pairwise seeds, which cancel in
+the sum, plus a self-mask from a fresh per-round seed that each client
+Shamir-shares with its peers. When clients drop, the survivors reveal the
+pair seeds shared with dropped clients and the self-mask shares of surviving
+clients, never both for the same peer, so a server that falsely reports a
+client as dropped still cannot remove that client's self-mask.
+
+The :class:`SecureAggregator` consumes masked updates as they arrive into a
+single running-sum buffer, so server memory is O(model size) regardless of
+the number of clients. Masks are never stored: they are re-expanded from
+their seed when needed, and only the masks shared with dropped clients are
+reconstructed during recovery.
+"""
+
+import hashlib
+import secrets
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+# RFC 3526 2048-bit MODP group (group 14), generator 2
+MODP_2048_PRIME = int(
+    "FFFFFFFFFFFFFFFFC90FDAA22168C234C4C6628B80DC1CD1"
+    "29024E088A67CC74020BBEA63B139B22514A08798E3404DD"
+    "EF9519B3CD3A431B302B0A6DF25F14374FE1356D6D51C245"
+    "E485B576625E7EC6F44C42E9A637ED6B0BFF5CB6F406B7ED"
+    "EE386BFB5A899FA5AE9F24117C4B1FE649286651ECE45B3D"
+    "C2007CB8A163BF0598DA48361C55D39A69163FA8FD24CF5F"
+    "83655D23DCA3AD961C62F356208552BB9ED529077096966D"
+    "670C354E4ABC9804F1746C08CA18217C32905E462E36CE3B"
+    "E39E772C180E86039B2783A2EC07A28FB5C55DF06F4C52C9"
+    "DE2BCBF6955817183995497CEA956AE515D2261898FA0510"
+    "15728E5A8AACAA68FFFFFFFFFFFFFFFF", 16)
+MODP_2048_GENERATOR = 2
+
+# Shamir shares live in GF(2^130 - 5), a prime field above every 128-bit seed
+SHARE_PRIME = 2 ** 130 - 5
+
+FIELD_DTYPES = {16: np.uint16, 32: np.uint32, 64: np.uint64}
+SIGNED_DTYPES = {16: np.int16, 32: np.int32, 64: np.int64}
+
+
+class DiffieHellmanKeyPair:
+    """Ephemeral Diffie-Hellman key pair for pairwise seed agreement."""
+
+    def __init__(self, private_key: Optional[int] = None):
+        if private_key is None:
+            private_key = secrets.randbits(256)
+        if not 1 <= private_key <= MODP_2048_PRIME - 2:
+            raise ValueError("Private key must be in [1, p - 2]")
+        self._private = private_key
+        self.public_key = pow(MODP_2048_GENERATOR, self._private, MODP_2048_PRIME)
+
+    def shared_seed(self, peer_public_key: int) -> int:
+        """
+        128-bit seed derived from the shared secret with a peer.
+
+        Raises:
+            ValueError: If the peer's key is outside ``[2, p - 2]`` (0, 1 and
+                ``p - 1`` force the shared secret into a tiny subgroup).
+        """
+        if not 2 <= peer_public_key <= MODP_2048_PRIME - 2:
+            raise ValueError("Peer public key must be in [2, p - 2]")
+        shared = pow(peer_public_key, self._private, MODP_2048_PRIME)
+        digest = hashlib.blake2b(shared.to_bytes(256, "big"), digest_size=16).digest()
+        return int.from_bytes(digest, "big")
+
+
+def key_agreement(public_keys: Mapping[int, int],
+                  key_pair: DiffieHellmanKeyPair,
+                  client_id: int) -> Dict[int, int]:
+    """
+    Establish pairwise seeds between one client and all its peers.
+
+    Args:
+        public_keys: Public keys of every participating client.
+        key_pair: This client's key pair.
+        client_id: This client's identifier.
+
+    Returns:
+        Mapping of peer id to shared 128-bit seed.
+    """
+    return {
+        peer: key_pair.shared_seed(public)
+        for peer, public in public_keys.items() if peer != client_id
+    }
+
+
+def _share_point(holder: int) -> int:
+    if holder < 0:
+        raise ValueError("Share holders must have non-negative ids")
+    return holder + 1
+
+
+def share_secret(secret: int, holders: Iterable[int], threshold: int) -> Dict[int, int]:
+    """
+    Shamir-share a seed so that any ``threshold`` holders can rebuild it.
+
+    Args:
+        secret: Seed in ``[0, SHARE_PRIME)``, e.g. a self-mask seed.
+        holders: Ids of the clients receiving a share.
+        threshold: Shares needed for reconstruction; fewer reveal nothing.
+
+    Returns:
+        Mapping of holder id to its share.
+    """
+    holders = list(holders)
+    if not 1 <= threshold <= len(holders):
+        raise ValueError(f"threshold must be in [1, {len(holders)}]")
+    if not 0 <= secret < SHARE_PRIME:
+        raise ValueError("Secret does not fit the share field")
+    coefficients = [secret] + [secrets.randbelow(SHARE_PRIME) for _ in range(threshold - 1)]
+    shares = {}
+    for holder in holders:
+        x, y = _share_point(holder), 0
+        for coefficient in reversed(coefficients):
+            y = (y * x + coefficient) % SHARE_PRIME
+        shares[holder] = y
+    return shares
+
+
+def reconstruct_secret(shares: Mapping[int, int]) -> int:
+    """Lagrange-interpolate a shared seed from ``holder -> share`` at zero."""
+    points = [(_share_point(holder), share) for holder, share in shares.items()]
+    secret = 0
+    for i, (x_i, y_i) in enumerate(points):
+        numerator = denominator = 1
+        for j, (x_j, _) in enumerate(points):
+            if i != j:
+                numerator = numerator * -x_j % SHARE_PRIME
+                denominator = denominator * (x_i - x_j) % SHARE_PRIME
+        secret = (secret + y_i * numerator * pow(denominator, -1, SHARE_PRIME)) % SHARE_PRIME
+    return secret
+
+
+def expand_mask(seed: int, round_num: int, num_params: int,
+                field_bits: int = 32) -> np.ndarray:
+    """
+    Expand a pairwise seed into a pseudorandom mask vector.
+
+    Philox is counter-based, so the mask is a pure function of
+    ``(seed, round_num)`` and can be regenerated at any time instead of
+    being stored.
+
+    Args:
+        seed: Pairwise seed shared by the two clients.
+        round_num: Training round; masks are never reused across rounds.
+        num_params: Length of the mask.
+        field_bits: 16, 32 or 64.
+
+    Returns:
+        Mask of dtype ``uint16``, ``uint32`` or ``uint64``.
+    """
+    key = hashlib.blake2b(
+        seed.to_bytes(16, "big") + round_num.to_bytes(8, "big"), digest_size=16
+    ).digest()
+    bit_generator = np.random.Philox(key=int.from_bytes(key, "big"))
+    words = (num_params * field_bits + 63) // 64
+    raw = bit_generator.random_raw(words)
+    return raw.view(FIELD_DTYPES[field_bits])[:num_params]
+
+
+def encode_fixed_point(update: np.ndarray, scale: float,
+                       field_bits: int = 32,
+                       levels: Optional[int] = None) -> np.ndarray:
+    """
+    Fixed-point encode a float update into the ring Z_2^k.
+
+    Values saturate at ``±levels`` grid steps instead of wrapping around.
+    With the ``levels`` that sized the ring (see
+    :func:`fedhr5.core.compression.secure_aggregation_params`), an outlier
+    cannot push the sum over the cohort past the ring bound either; without
+    it values saturate only at the ring bound itself.
+    """
+    signed = np.rint(np.asarray(update, dtype=np.float64) * scale)
+    limit = np.nextafter(float(2 ** (field_bits - 1)), 0)
+    if levels is not None:
+        limit = min(limit, levels)
+    np.clip(signed, -limit, limit, out=signed)
+    return signed.astype(SIGNED_DTYPES[field_bits]).view(FIELD_DTYPES[field_bits])
+
+
+def decode_fixed_point(values: np.ndarray, scale: float,
+                       field_bits: int = 32) -> np.ndarray:
+    """Decode ring elements back to floats (two's-complement interpretation)."""
+    signed = values.view(SIGNED_DTYPES[field_bits])
+    return (signed / scale).astype(np.float32)
+
+
+def _pair_sign(client_id: int, peer_id: int) -> bool:
+    """The lower id adds the pairwise mask, the higher id subtracts it."""
+    return client_id < peer_id
+
+
+def mask_update(update: np.ndarray,
+                client_id: int,
+                pair_seeds: Mapping[int, int],
+                round_num: int,
+                scale: float = 2.0 ** 16,
+                field_bits: int = 32,
+                self_seed: Optional[int] = None,
+                levels: Optional[int] = None) -> np.ndarray:
+    """
+    Add random masks that cancel in aggregation.
+
+    Masks are expanded one peer at a time and folded into the output, so
+    client memory stays O(model size) for any number of peers.
+
+    Args:
+        update: Float update to protect.
+        client_id: This client's identifier.
+        pair_seeds: Seeds shared with each peer (see :func:`key_agreement`).
+        round_num: Training round.
+        scale: Fixed-point scale; ``|sum of updates| * scale`` must stay
+            below ``2^(field_bits - 1)``.
+        field_bits: 16, 32 or 64.
+        self_seed: Fresh per-round seed of the self-mask, Shamir-shared
+            with the peers (see :func:`share_secret`). Without it the update
+            carries pairwise masks only, which the survivors' recovery seeds
+            strip if the server falsely reports this client as dropped.
+        levels: Saturation bound in grid steps (see
+            :func:`encode_fixed_point`).
+
+    Returns:
+        Masked update in Z_2^k.
+    """
+    masked = encode_fixed_point(update, scale, field_bits, levels)
+    if self_seed is not None:
+        masked += expand_mask(self_seed, round_num, masked.size, field_bits)
+    for peer_id, seed in pair_seeds.items():
+        mask = expand_mask(seed, round_num, masked.size, field_bits)
+        if _pair_sign(client_id, peer_id):
+            masked += mask
+        else:
+            masked -= mask
+    return masked
+
+
+def recovery_response(client_id: int,
+                      survivors: Iterable[int],
+                      pair_seeds: Mapping[int, int],
+                      held_shares: Mapping[int, int],
+                      ) -> Tuple[Dict[Tuple[int, int], int], Dict[int, int]]:
+    """
+    A surviving client's answer to the server's recovery request.
+
+    For each peer the client reveals either the pair seed (the peer dropped)
+    or its share of the peer's self-mask seed (the peer survived), never
+    both, so no update can be fully unmasked.
+
+    Args:
+        client_id: This client's identifier.
+        survivors: Clients whose masked update the server reports received.
+        pair_seeds: Seeds shared with each peer.
+        held_shares: Shares of peers' self-mask seeds held by this client,
+            keyed by the seed's owner.
+
+    Returns:
+        ``({(client_id, dropped_id): seed}, {surviving_owner: share})``.
+    """
+    survivors = set(survivors)
+    seeds = {(client_id, peer): seed for peer, seed in pair_seeds.items()
+             if peer not in survivors}
+    shares = {owner: share for owner, share in held_shares.items() if owner in survivors}
+    return seeds, shares
+
+
+class SecureAggregator:
+    """
+    Streaming server-side secure aggregator.
+
+    Args:
+        num_params: Length of every update.
+        round_num: Training round being aggregated.
+        clients: Every client that took part in key agreement this round.
+        threshold: Shares needed to rebuild a self-mask seed, when clients
+            double-mask (``mask_update(self_seed=...)``); ``None`` when they
+            apply pairwise masks only.
+        scale: Fixed-point scale used by the clients.
+        field_bits: 16, 32 or 64, must match the clients.
+
+    Example:
+        >>> aggregator = SecureAggregator(num_params, round_num=7, clients=cohort,
+        ...                               threshold=len(cohort) // 2 + 1)
+        >>> for client_id, masked in incoming_updates():
+        ...     aggregator.add(client_id, masked)
+        >>> dropped = aggregator.dropped()
+        >>> # survivors answer with recovery_response(...)
+        >>> total = aggregator.finalize(revealed_seeds, self_mask_shares)
+    """
+
+    def __init__(self,
+                 num_params: int,
+                 round_num: int,
+                 clients: Iterable[int],
+                 threshold: Optional[int] = None,
+                 scale: float = 2.0 ** 16,
+                 field_bits: int = 32):
+        if field_bits not in FIELD_DTYPES:
+            raise ValueError("field_bits must be 16, 32 or 64")
+        self.num_params = num_params
+        self.round_num = round_num
+        self.clients = frozenset(clients)
+        if threshold is not None and not 1 <= threshold <= len(self.clients):
+            raise ValueError(f"threshold must be in [1, {len(self.clients)}]")
+        self.threshold = threshold
+        self.scale = scale
+        self.field_bits = field_bits
+        self._sum = np.zeros(num_params, dtype=FIELD_DTYPES[field_bits])
+        self.received = set()
+
+    def add(self, client_id: int, masked_update: np.ndarray):
+        """
+        Fold one masked update into the running sum.
+
+        Raises:
+            ValueError: On an unknown or duplicate client or a malformed
+                update.
+        """
+        if client_id not in self.clients:
+            raise ValueError(f"Client {client_id} is not part of this round")
+        if client_id in self.received:
+            raise ValueError(f"Duplicate update from client {client_id}")
+        if masked_update.shape != self._sum.shape or masked_update.dtype != self._sum.dtype:
+            raise ValueError("Masked update does not match the aggregation field")
+        self._sum += masked_update
+        self.received.add(client_id)
+
+    def dropped(self) -> set:
+        """Clients of the round that never delivered an update."""
+        return set(self.clients - self.received)
+
+    def finalize(self,
+                 revealed_seeds: Optional[Mapping[Tuple[int, int], int]] = None,
+                 self_mask_shares: Optional[Mapping[int, Mapping[int, int]]] = None,
+                 ) -> np.ndarray:
+        """
+        Remove the masks that do not cancel and decode the aggregate.
+
+        Masks between two surviving clients already cancel. For each pair of
+        a survivor and a dropped client, the survivor's half of the mask is
+        still in the sum; its seed (recovered by the survivors) is expanded
+        and the mask removed. Each survivor's self-mask seed is rebuilt from
+        ``threshold`` of its shares and removed likewise.
+
+        Args:
+            revealed_seeds: Mapping ``(survivor_id, dropped_id) -> seed`` for
+                every survivor/dropped pair. Empty when nobody dropped.
+            self_mask_shares: Mapping ``survivor_id -> {holder_id: share}``
+                with at least ``threshold`` shares per survivor, revealed by
+                surviving holders. Only for double-masked rounds.
+
+        Returns:
+            Sum of the surviving clients' updates (float32).
+
+        Raises:
+            ValueError: If no update was received, a survivor/dropped seed is
+                missing or refers to the wrong clients, or self-mask shares
+                are missing, too few, or reveal a client that dropped.
+        """
+        if not self.received:
+            raise ValueError("Cannot aggregate without any client updates")
+        dropped = self.dropped()
+        revealed_seeds = revealed_seeds or {}
+        for survivor, dropped_id in revealed_seeds:
+            if survivor not in self.received or dropped_id not in dropped:
+                raise ValueError(
+                    f"Invalid recovery pair ({survivor}, {dropped_id}) for this round"
+                )
+        missing = [(survivor, dropped_id) for survivor in sorted(self.received)
+                   for dropped_id in sorted(dropped)
+                   if (survivor, dropped_id) not in revealed_seeds]
+        if missing:
+            raise ValueError(f"{len(missing)} survivor/dropped seeds were not revealed, "
+                             f"e.g. {missing[0]}")
+        total = self._sum.copy()
+        for (survivor, dropped_id), seed in revealed_seeds.items():
+            mask = expand_mask(seed, self.round_num, self.num_params, self.field_bits)
+            if _pair_sign(survivor, dropped_id):
+                total -= mask
+            else:
+                total += mask
+        for seed in self._self_mask_seeds(self_mask_shares or {}):
+            total -= expand_mask(seed, self.round_num, self.num_params, self.field_bits)
+        return decode_fixed_point(total, self.scale, self.field_bits)
+
+    def _self_mask_seeds(self, shares: Mapping[int, Mapping[int, int]]) -> List[int]:
+        """Rebuild every survivor's self-mask seed from its revealed shares."""
+        if self.threshold is None:
+            if shares:
+                raise ValueError("Self-mask shares given for a pairwise-only round")
+            return []
+        for owner, held in shares.items():
+            if owner not in self.received:
+                raise ValueError(f"Refusing self-mask shares of client {owner}, "
+                                 f"whose update was not received")
+            if not set(held) <= self.received:
+                raise ValueError(f"Shares of client {owner} come from non-survivors")
+        seeds = []
+        for owner in sorted(self.received):
+            held = shares.get(owner, {})
+            if len(held) < self.threshold:
+                raise ValueError(f"Client {owner}: {len(held)} self-mask shares, "
+                                 f"{self.threshold} needed")
+            holders = sorted(held)[:self.threshold]
+            seeds.append(reconstruct_secret({holder: held[holder] for holder in holders}))
+        return seeds
+
+
+def secure_aggregate(masked_updates: Iterable[Tuple[int, np.ndarray]],
+                     num_params: int,
+                     round_num: int,
+                     clients: Iterable[int],
+                     revealed_seeds: Optional[Mapping[Tuple[int, int], int]] = None,
+                     self_mask_shares: Optional[Mapping[int, Mapping[int, int]]] = None,
+                     threshold: Optional[int] = None,
+                     scale: float = 2.0 ** 16,
+                     field_bits: int = 32) -> np.ndarray:
+    """
+    Server computes sum, masks cancel out.
+
+    Accepts any iterable (e.g. a generator over network messages) of
+    ``(client_id, masked_update)`` pairs and streams it through a
+    :class:`SecureAggregator`.
+    """
+    aggregator = SecureAggregator(num_params, round_num, clients, threshold, scale, field_bits)
+    for client_id, masked in masked_updates:
+        aggregator.add(client_id, masked)
+    return aggregator.finalize(revealed_seeds, self_mask_shares)
@@ -0,0 +1,12 @@
+"""
+FedHR5.0 - Utilities
+"""
+
+from .lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "data_loader": ["SharedDataLoader", "SharedTable", "TableHandle", "read_table"],
+    "metrics": ["REGISTRY", "Counter", "Gauge", "Histogram", "MetricsRegistry",
+                "start_http_server", "timed"],
+    "results_store": ["Aggregate", "ResultsStore"],
+})
@@ -0,0 +1,524 @@
+"""
+FedHR5.0 - Shared-memory columnar data loader
+
+The Well-being, Skills, Recruitment, Benchmarking and Learning modules train
+in separate processes on overlapping employee feature tables. Instead of
+every process decoding its own copy, the organization's loader decodes each
+local table once into a ``multiprocessing.shared_memory`` segment:
+
+    +---------+---------+-----+-----------------------------------+
+    | col 0   | col 1   | ... | categories (offsets + UTF-8 blob) |
+    +---------+---------+-----+-----------------------------------+
+
+Every column is one contiguous, 64-byte aligned array; string columns are
+dictionary encoded (int32 codes, -1 for missing values) with their categories
+stored in the same segment. Training processes receive a small picklable :class:`TableHandle`
+and map the segment read-only, so selecting columns or row ranges yields
+NumPy views over the shared pages and the table is resident once per node,
+however many modules read it.
+
+Example:
+    >>> with SharedDataLoader() as loader:
+    ...     handle = loader.load("employees", "data/employees.csv")
+    ...     pool.map(train_module, [(module, handle) for module in MODULES])
+    >>> # in each training process
+    >>> with handle.attach() as table:
+    ...     for batch in table.batches(["tenure", "workload"], batch_size=4096):
+    ...         ...
+"""
+
+import csv
+import mmap
+import os
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+try:
+    import _posixshmem
+except ImportError:  # Windows: named file mappings
+    _posixshmem = None
+
+ALIGNMENT = 64
+CATEGORY_DTYPE = np.dtype(np.int32)
+MISSING_CODE = -1  # code of a null string (Parquet only; CSV has no nulls)
+CATEGORICAL = "category"
+
+# A decoded column: values, or dictionary codes plus their categories
+Column = Tuple[np.ndarray, Optional[List[str]]]
+Rows = Union[None, slice, Sequence[int], np.ndarray]
+
+
+def _pyarrow():
+    """Import pyarrow on first use; ``(None, None)`` if it is not installed."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        return None, None
+    return pyarrow, pyarrow.parquet
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+class _Categories:
+    """Incremental dictionary encoding of one string column."""
+
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+
+    def encode(self, values: np.ndarray) -> np.ndarray:
+        uniques, inverse = np.unique(values, return_inverse=True)
+        index = self.index
+        codes = np.fromiter((index.setdefault(u, len(index)) for u in uniques.tolist()),
+                            dtype=CATEGORY_DTYPE, count=len(uniques))
+        return codes[inverse.reshape(-1)]
+
+    @property
+    def values(self) -> List[str]:
+        return list(self.index)
+
+
+def _to_numeric(name: str, values: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    if dtype.kind == "f":
+        values = np.where(values == "", "nan", values)
+    try:
+        return values.astype(dtype)
+    except (ValueError, OverflowError):
+        raise ValueError(f"Column '{name}' does not parse as {dtype}") from None
+
+
+def _infer(values: np.ndarray) -> str:
+    """Narrowest of int64, float64 and categorical that parses every value."""
+    for dtype in ("int64", "float64"):
+        try:
+            _to_numeric("", values, np.dtype(dtype))
+            return dtype
+        except ValueError:
+            continue
+    return CATEGORICAL
+
+
+def _csv_chunks(path: Path, chunk_rows: int) -> Iterator[List[Tuple[str, ...]]]:
+    """
+    Yield the header of a CSV file, then its rows column-major in chunks.
+
+    Blank lines are skipped; a row whose field count differs from the
+    header's raises instead of being truncated.
+    """
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = next((row for row in reader if row), None)
+        if header is None:
+            raise ValueError(f"{path} is empty")
+        yield header
+        while True:
+            rows = []
+            for row in reader:
+                if not row:
+                    continue
+                if len(row) != len(header):
+                    raise ValueError(f"{path}, line {reader.line_num}: expected "
+                                     f"{len(header)} fields, got {len(row)}")
+                rows.append(row)
+                if len(rows) == chunk_rows:
+                    break
+            if not rows:
+                return
+            yield list(zip(*rows))
+
+
+def _read_csv(path: Path, dtypes: Mapping[str, str], chunk_rows: int) -> Dict[str, Column]:
+    """
+    Decode a CSV file chunk by chunk.
+
+    Column types come from ``dtypes`` or are inferred on the first chunk. An
+    inferred int64 column that later meets a non-integer is widened to
+    float64; an inferred numeric column that meets a non-number is widened to
+    categorical and re-read from the start in a second pass, so its
+    categories keep the text exactly as written. Columns listed in ``dtypes``
+    are never widened.
+    """
+    chunks_in = _csv_chunks(path, chunk_rows)
+    header = next(chunks_in)
+    kinds: Dict[str, str] = {}
+    chunks: Dict[str, List[np.ndarray]] = {name: [] for name in header}
+    categories = {}
+    widened = set()
+    for chunk in chunks_in:
+        for name, values in zip(header, chunk):
+            if name in widened:
+                continue
+            values = np.asarray(values)
+            kind = kinds.get(name)
+            if kind is None:
+                kind = kinds[name] = dtypes.get(name) or _infer(values)
+                if kind == CATEGORICAL:
+                    categories[name] = _Categories()
+            if kind == CATEGORICAL:
+                chunks[name].append(categories[name].encode(values))
+                continue
+            try:
+                chunks[name].append(_to_numeric(name, values, np.dtype(kind)))
+                continue
+            except ValueError:
+                if name in dtypes:
+                    raise
+            if kind == "int64" and _infer(values) == "float64":
+                kinds[name] = "float64"
+                chunks[name] = [c.astype(np.float64) for c in chunks[name]]
+                chunks[name].append(_to_numeric(name, values, np.dtype(np.float64)))
+            else:
+                kinds[name] = CATEGORICAL
+                categories[name] = _Categories()
+                chunks[name] = []
+                widened.add(name)
+    if widened:
+        chunks_in = _csv_chunks(path, chunk_rows)
+        next(chunks_in)
+        for chunk in chunks_in:
+            for name, values in zip(header, chunk):
+                if name in widened:
+                    chunks[name].append(categories[name].encode(np.asarray(values)))
+    columns = {}
+    for name in header:
+        kind = kinds.get(name) or dtypes.get(name) or "float64"
+        dtype = CATEGORY_DTYPE if kind == CATEGORICAL else np.dtype(kind)
+        values = np.concatenate(chunks.pop(name)) if chunks[name] else np.empty(0, dtype)
+        columns[name] = (values, categories[name].values if name in categories else None)
+    return columns
+
+
+def _read_parquet(path: Path) -> Dict[str, Column]:
+    pa, pq = _pyarrow()
+    if pq is None:
+        raise ImportError("Reading Parquet tables requires pyarrow")
+    table = pq.read_table(path)
+    columns = {}
+    for name, column in zip(table.column_names, table.columns):
+        if pa.types.is_dictionary(column.type):
+            column = column.cast(column.type.value_type)
+        if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+            encoded = column.dictionary_encode().combine_chunks()
+            codes = encoded.indices.fill_null(MISSING_CODE).cast(pa.int32())
+            columns[name] = (codes.to_numpy(), encoded.dictionary.to_pylist())
+        else:
+            columns[name] = (column.to_numpy(), None)
+    return columns
+
+
+def _from_arrays(arrays: Mapping[str, Sequence]) -> Dict[str, Column]:
+    columns = {}
+    for name, values in arrays.items():
+        values = np.asarray(values)
+        if values.dtype.kind in "OUS":
+            encoder = _Categories()
+            columns[name] = (encoder.encode(values.astype(str)), encoder.values)
+        else:
+            columns[name] = (np.ascontiguousarray(values), None)
+    return columns
+
+
+def read_table(source: Union[str, Path, Mapping[str, Sequence]],
+               dtypes: Optional[Mapping[str, str]] = None,
+               chunk_rows: int = 65_536) -> Dict[str, Column]:
+    """
+    Decode a table into private columnar arrays.
+
+    Args:
+        source: A ``.csv`` or ``.parquet`` file, or a mapping of column name
+            to values (e.g. the result of a database query).
+        dtypes: Column types for CSV files (``"int64"``, ``"float32"``,
+            ``"category"``, ...); unlisted columns are inferred and widened
+            (int64 to float64 to categorical) as later rows require.
+        chunk_rows: CSV rows decoded per chunk.
+
+    Returns:
+        ``{name: (values, categories)}``; categories is ``None`` for
+        numeric columns, else the strings behind the int32 codes
+        (``MISSING_CODE`` marks a Parquet null).
+
+    Raises:
+        ValueError: On an unknown file type, a CSV row with the wrong number
+            of fields, or a value that does not parse as its listed dtype.
+        ImportError: For Parquet files when pyarrow is not installed.
+    """
+    if isinstance(source, Mapping):
+        columns = _from_arrays(source)
+    else:
+        path = Path(source)
+        suffix = path.suffix.lower()
+        if suffix == ".csv":
+            columns = _read_csv(path, dtypes or {}, chunk_rows)
+        elif suffix == ".parquet":
+            columns = _read_parquet(path)
+        else:
+            raise ValueError(f"Unsupported table format '{suffix}'")
+    lengths = {len(values) for values, _ in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError("Columns have unequal lengths")
+    return columns
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """Where one column lives in the segment."""
+
+    name: str
+    dtype: str
+    offset: int
+    num_categories: int = -1    # -1 for numeric columns
+    categories_offset: int = 0  # int64 byte offsets into the blob (num_categories + 1)
+    blob_offset: int = 0        # UTF-8 encoded categories
+
+    @property
+    def categorical(self) -> bool:
+        return self.num_categories >= 0
+
+
+@dataclass(frozen=True)
+class TableHandle:
+    """Picklable description of a shared table; pass it to training processes."""
+
+    name: str
+    segment: str
+    num_rows: int
+    columns: Tuple[ColumnSpec, ...]
+
+    def attach(self) -> "SharedTable":
+        """Map the table read-only in the calling process."""
+        return SharedTable(self)
+
+
+def _map_readonly(segment: str):
+    """
+    Map a segment read-only; returns ``(buffer, close)``.
+
+    On POSIX the segment is opened with ``O_RDONLY`` directly rather than
+    through ``SharedMemory``, which maps it writable and, before Python
+    3.13, registers it with the attaching process's resource tracker.
+    """
+    if _posixshmem is None:
+        memory = shared_memory.SharedMemory(name=segment)
+        return memory.buf, memory.close
+    fd = _posixshmem.shm_open("/" + segment, os.O_RDONLY, mode=0o600)
+    try:
+        mapping = mmap.mmap(fd, os.fstat(fd).st_size, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+    return mapping, mapping.close
+
+
+class SharedTable:
+    """
+    Read-only view of a shared table in one process.
+
+    Columns and row slices are zero-copy views; index arrays, masks and
+    :meth:`matrix`/:meth:`batches` gather into private copies.
+    """
+
+    def __init__(self, handle: TableHandle):
+        self.handle = handle
+        self._buffer, self._close = _map_readonly(handle.segment)
+        self._specs = {spec.name: spec for spec in handle.columns}
+        self._views: Dict[str, np.ndarray] = {}
+        self._categories: Dict[str, List[str]] = {}
+
+    def __enter__(self) -> "SharedTable":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def num_rows(self) -> int:
+        return self.handle.num_rows
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self._specs)
+
+    def _spec(self, name: str) -> ColumnSpec:
+        spec = self._specs.get(name)
+        if spec is None:
+            raise KeyError(f"Table '{self.handle.name}' has no column '{name}'")
+        return spec
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """The whole column (codes for string columns) as a read-only view."""
+        view = self._views.get(name)
+        if view is None:
+            spec = self._spec(name)
+            view = np.frombuffer(self._buffer, dtype=spec.dtype, count=self.num_rows,
+                                 offset=spec.offset)
+            view.flags.writeable = False
+            self._views[name] = view
+        return view
+
+    def select(self, names: Optional[Sequence[str]] = None,
+               rows: Rows = None) -> Dict[str, np.ndarray]:
+        """
+        Columns restricted to ``rows``.
+
+        Args:
+            names: Columns to select (all if omitted).
+            rows: A slice (zero-copy), or indices / a boolean mask (copied).
+        """
+        names = self.column_names if names is None else names
+        if rows is None:
+            return {name: self[name] for name in names}
+        return {name: self[name][rows] for name in names}
+
+    def categories(self, name: str) -> List[str]:
+        """Strings behind a categorical column's codes."""
+        categories = self._categories.get(name)
+        if categories is None:
+            spec = self._spec(name)
+            if not spec.categorical:
+                raise ValueError(f"Column '{name}' is not categorical")
+            offsets = np.frombuffer(self._buffer, dtype=np.int64,
+                                    count=spec.num_categories + 1,
+                                    offset=spec.categories_offset).tolist()
+            blob = bytes(self._buffer[spec.blob_offset:spec.blob_offset + offsets[-1]])
+            categories = [blob[start:end].decode()
+                          for start, end in zip(offsets[:-1], offsets[1:])]
+            self._categories[name] = categories
+        return categories
+
+    def decode(self, name: str, rows: Rows = None) -> np.ndarray:
+        """String values of a categorical column."""
+        codes = self[name] if rows is None else self[name][rows]
+        # MISSING_CODE (-1) indexes the trailing None
+        return np.asarray(self.categories(name) + [None], dtype=object)[codes]
+
+    def matrix(self, names: Sequence[str], rows: Rows = None,
+               dtype=np.float32) -> np.ndarray:
+        """Stack columns into a private ``(rows, len(names))`` feature matrix."""
+        columns = self.select(names, rows)
+        length = len(next(iter(columns.values()))) if columns else 0
+        out = np.empty((length, len(names)), dtype=dtype)
+        for j, name in enumerate(names):
+            out[:, j] = columns[name]
+        return out
+
+    def batches(self, names: Sequence[str], batch_size: int = 4096,
+                dtype=np.float32) -> Iterator[np.ndarray]:
+        """Feature matrices of consecutive row ranges; memory bounded by one batch."""
+        for start in range(0, self.num_rows, batch_size):
+            yield self.matrix(names, slice(start, start + batch_size), dtype)
+
+    def close(self):
+        """Release the mapping; views handed out keep it alive until they go."""
+        self._views.clear()
+        try:
+            self._close()
+        except BufferError:
+            # Views are still referenced; the mapping is released with them
+            pass
+
+
+class SharedDataLoader:
+    """
+    Decodes each local table once into shared memory.
+
+    The loader owns the segments: they are unlinked by :meth:`unload`,
+    :meth:`close` or when the loader's process exits (resource tracker).
+
+    Args:
+        chunk_rows: CSV rows decoded per chunk.
+    """
+
+    def __init__(self, chunk_rows: int = 65_536):
+        self.chunk_rows = chunk_rows
+        self._segments: Dict[str, shared_memory.SharedMemory] = {}
+        self._handles: Dict[str, TableHandle] = {}
+
+    def __enter__(self) -> "SharedDataLoader":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def handles(self) -> Dict[str, TableHandle]:
+        return dict(self._handles)
+
+    def load(self, name: str, source: Union[str, Path, Mapping[str, Sequence]],
+             dtypes: Optional[Mapping[str, str]] = None) -> TableHandle:
+        """
+        Decode ``source`` into a shared segment, once per table name.
+
+        Arguments are those of :func:`read_table`. Loading a name that is
+        already shared returns its existing handle.
+        """
+        handle = self._handles.get(name)
+        if handle is None:
+            handle = self._share(name, read_table(source, dtypes, self.chunk_rows))
+        return handle
+
+    def _share(self, name: str, columns: Dict[str, Column]) -> TableHandle:
+        num_rows = len(next(iter(columns.values()))[0]) if columns else 0
+        # Lay out values first, then the categories of string columns
+        layout, offset = [], 0
+        for column_name, (values, categories) in columns.items():
+            offset = _align(offset)
+            layout.append([column_name, values, categories, offset, None, None])
+            offset += values.nbytes
+        for entry in layout:
+            categories = entry[2]
+            if categories is None:
+                continue
+            encoded = [c.encode() for c in categories]
+            offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+            np.cumsum([len(e) for e in encoded], out=offsets[1:])
+            entry[2] = (encoded, offsets)
+            entry[4] = offset = _align(offset)
+            offset += offsets.nbytes
+            entry[5] = offset
+            offset += int(offsets[-1])
+
+        segment = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        try:
+            specs = []
+            for entry in layout:
+                column_name, values, categories, start, categories_start, blob_start = entry
+                target = np.ndarray(values.shape, dtype=values.dtype, buffer=segment.buf,
+                                    offset=start)
+                target[:] = values
+                del target
+                # Drop the private copy as soon as it is shared
+                entry[1] = columns[column_name] = None
+                if categories is None:
+                    specs.append(ColumnSpec(column_name, values.dtype.str, start))
+                    continue
+                encoded, offsets = categories
+                segment.buf[categories_start:categories_start + offsets.nbytes] = \
+                    offsets.tobytes()
+                segment.buf[blob_start:blob_start + int(offsets[-1])] = b"".join(encoded)
+                specs.append(ColumnSpec(column_name, values.dtype.str, start,
+                                        len(encoded), categories_start, blob_start))
+        except BaseException:
+            segment.close()
+            segment.unlink()
+            raise
+        handle = TableHandle(name, segment.name, num_rows, tuple(specs))
+        self._segments[name] = segment
+        self._handles[name] = handle
+        return handle
+
+    def unload(self, name: str):
+        """Unlink a table's segment; processes still attached keep their mapping."""
+        self._handles.pop(name, None)
+        segment = self._segments.pop(name, None)
+        if segment is not None:
+            segment.close()
+            segment.unlink()
+
+    def close(self):
+        for name in list(self._segments):
+            self.unload(name)
@@ -0,0 +1,57 @@
+"""
+FedHR5.0 - Lazy package namespaces
+
+Package ``__init__`` files list their public names per submodule instead of
+importing them. A module-level ``__getattr__`` (PEP 562) imports the
+submodule the first time one of its names is looked up and caches the
+result in the package namespace, so ``import fedhr5`` and
+``import fedhr5.core`` cost next to nothing. An edge agent that only needs
+the wire format never loads asyncio, the HTTP exporter or the Paillier
+code.
+
+Example:
+    >>> __getattr__, __dir__, __all__ = attach(__name__, {
+    ...     "wire": ["ModelUpdate", "encode_frame"],
+    ... })
+"""
+
+import importlib
+import sys
+
+# Builtin annotations only: importing typing would cost more than the rest
+# of ``import fedhr5`` together
+
+
+def attach(package: str, names: dict, submodules=()) -> tuple:
+    """
+    Build the lazy namespace of a package.
+
+    Args:
+        package: The package's ``__name__``.
+        names: Public names re-exported from each submodule, keyed by the
+            submodule's relative name.
+        submodules: Submodules exposed as attributes themselves.
+
+    Returns:
+        ``(__getattr__, __dir__, __all__)`` to assign in the package.
+    """
+    origins = {name: module for module, exported in names.items() for name in exported}
+    submodules = set(submodules)
+    public = list(origins)
+
+    def __getattr__(name: str):
+        if name in origins:
+            module = importlib.import_module(f"{package}.{origins[name]}")
+            value = getattr(module, name)
+        elif name in submodules:
+            value = importlib.import_module(f"{package}.{name}")
+        else:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+        # Later lookups find the attribute without calling __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list:
+        return sorted(set(vars(sys.modules[package])) | set(public) | submodules)
+
+    return __getattr__, __dir__, public
@@ -0,0 +1,410 @@
+"""
+FedHR5.0 - Runtime metrics
+
+Counters, gauges and HDR-style histograms cheap enough for the aggregation
+hot path, and a Prometheus text-format exposition endpoint for them.
+
+Writers never take a lock: every thread updates its own accumulator cell,
+registered once on first use, and a scrape sums the cells. When a thread
+exits, its cell is folded into a shared base cell, so thread churn does not
+grow the metric. Histograms use
+log-linear buckets (a power-of-two range split into ``2**precision``
+sub-buckets), so any value from nanoseconds to terabytes is recorded with a
+bounded relative error and quantiles are exported as a Prometheus summary.
+
+Example:
+    >>> from fedhr5.utils.metrics import ROUND_DURATION, start_http_server
+    >>> with ROUND_DURATION.time():
+    ...     run_round()
+    >>> server = start_http_server(9108)   # GET http://127.0.0.1:9108/metrics
+"""
+
+import functools
+import math
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99)
+
+_frexp = math.frexp
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class _ThreadToken:
+    """Lives in a thread's ``local`` and dies with the thread."""
+
+    __slots__ = ("__weakref__",)
+
+
+class _Cells:
+    """
+    Per-thread accumulators: each writer owns one, readers sum them all.
+
+    Writers read ``local.cell`` directly and call :meth:`register` only the
+    first time a thread touches the metric. A finalizer on a token stored
+    next to the cell folds it into ``base`` once the thread has exited.
+    """
+
+    def __init__(self, factory: Callable, merge: Callable):
+        self._factory = factory
+        self._merge = merge
+        self._lock = threading.Lock()
+        self.local = threading.local()
+        self.base = factory()
+        self._live: List = []
+
+    def register(self):
+        cell = self._factory()
+        token = _ThreadToken()
+        with self._lock:
+            self._live.append(cell)
+        weakref.finalize(token, self._retire, cell).atexit = False
+        self.local.token = token
+        self.local.cell = cell
+        return cell
+
+    def _retire(self, cell):
+        with self._lock:
+            self._live.remove(cell)
+            self._merge(self.base, cell)
+
+    def read(self, reduce: Callable):
+        """
+        Apply ``reduce`` to the base cell plus every live cell.
+
+        Runs under the lock, so a cell retired meanwhile is counted once.
+        """
+        with self._lock:
+            return reduce([self.base] + self._live)
+
+
+def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    items = list(labels) + ([extra] if extra else [])
+    if not items:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+               for _, value in items)
+    return "{" + ",".join(f'{key}="{value}"'
+                          for (key, _), value in zip(items, escaped)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class Counter:
+    """Monotonically increasing total (events, bytes, ε)."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str = "", labels: Labels = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._cells = _Cells(lambda: [0.0], _add_counter)
+        self._local = self._cells.local
+
+    def inc(self, amount: float = 1.0):
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        try:
+            cell = self._local.cell
+        except AttributeError:
+            cell = self._cells.register()
+        cell[0] += amount
+
+    @property
+    def value(self) -> float:
+        return self._cells.read(lambda cells: sum(cell[0] for cell in cells))
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        return [(self.name, _format_labels(self.labels), self.value)]
+
+
+class Gauge:
+    """Value that is set (last write wins)."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str = "", labels: Labels = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.value = 0.0
+
+    def set(self, value: float):
+        self.value = value
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        return [(self.name, _format_labels(self.labels), self.value)]
+
+
+def _add_counter(base: List[float], cell: List[float]):
+    base[0] += cell[0]
+
+
+class _HistogramCell:
+    __slots__ = ("counts", "total")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.total = 0.0
+
+    def merge(self, other: "_HistogramCell"):
+        self.counts = list(map(sum, zip(self.counts, other.counts)))
+        self.total += other.total
+
+
+class Timer:
+    """Times a block (``with``) or a function (decorator) into a histogram."""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: "Histogram"):
+        self._histogram = histogram
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._histogram.observe(time.perf_counter() - self._start)
+        return False
+
+    def __call__(self, func: Callable) -> Callable:
+        return timed(self._histogram)(func)
+
+
+class Histogram:
+    """
+    HDR-style log-linear histogram exported as a Prometheus summary.
+
+    Args:
+        name: Metric name.
+        help: Help text.
+        labels: Constant labels.
+        precision: Sub-bucket bits; the relative error of a recorded value is
+            at most ``2**-precision``.
+        min_exponent: Values below ``2**min_exponent`` share the lowest bucket.
+        max_exponent: Values above ``2**max_exponent`` share the highest.
+        quantiles: Quantiles included in the exposition.
+    """
+
+    kind = "summary"
+
+    def __init__(self,
+                 name: str,
+                 help: str = "",
+                 labels: Labels = (),
+                 precision: int = 5,
+                 min_exponent: int = -40,
+                 max_exponent: int = 64,
+                 quantiles: Sequence[float] = DEFAULT_QUANTILES):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.quantiles = tuple(quantiles)
+        self._sub_buckets = 1 << precision
+        self._min_exponent = min_exponent
+        # Index 0 holds zero and negative values
+        self._size = (max_exponent - min_exponent) * self._sub_buckets + 1
+        self._cells = _Cells(lambda: _HistogramCell(self._size), _HistogramCell.merge)
+        self._local = self._cells.local
+        # Bucket of m * 2**e (0.5 <= m < 1), i.e. of a value in [2**(e-1), 2**e), is
+        # (e - 1 - min_exponent) * sub_buckets + int(m * 2 * sub_buckets) - sub_buckets + 1
+        self._exponent_base = -(min_exponent + 2) * self._sub_buckets + 1
+        self._mantissa_scale = 2 * self._sub_buckets
+
+    def _bucket_bounds(self, index: int) -> Tuple[float, float]:
+        exponent, sub = divmod(index - 1, self._sub_buckets)
+        base = 2.0 ** (exponent + self._min_exponent)
+        width = base / self._sub_buckets
+        return base + sub * width, base + (sub + 1) * width
+
+    def observe(self, value: float):
+        try:
+            cell = self._local.cell
+        except AttributeError:
+            cell = self._cells.register()
+        if value > 0:
+            mantissa, exponent = _frexp(value)
+            index = (exponent * self._sub_buckets + self._exponent_base
+                     + int(mantissa * self._mantissa_scale))
+            if not 0 < index < self._size:
+                index = 1 if index < 1 else self._size - 1
+        else:
+            index = 0
+        cell.counts[index] += 1
+        cell.total += value
+
+    def time(self) -> Timer:
+        """Context manager / decorator recording elapsed seconds."""
+        return Timer(self)
+
+    def _merged(self) -> Tuple[List[int], float]:
+        # One C-level pass over all cells instead of a list per cell
+        return self._cells.read(lambda cells: (
+            list(map(sum, zip(*(cell.counts for cell in cells)))),
+            sum(cell.total for cell in cells)))
+
+    @property
+    def count(self) -> int:
+        return sum(self._merged()[0])
+
+    def quantile(self, q: float) -> float:
+        """Approximate ``q``-quantile (bucket midpoint); NaN when empty."""
+        return self._quantiles(self._merged()[0], [q])[0]
+
+    def _quantiles(self, counts: List[int], qs: Sequence[float]) -> List[float]:
+        n = sum(counts)
+        if n == 0:
+            return [math.nan] * len(qs)
+        results = []
+        for q in qs:
+            rank = max(1, math.ceil(q * n))
+            seen = 0
+            for index, c in enumerate(counts):
+                seen += c
+                if seen >= rank:
+                    if index == 0:
+                        results.append(0.0)
+                    else:
+                        lo, hi = self._bucket_bounds(index)
+                        results.append((lo + hi) / 2)
+                    break
+        return results
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        counts, total = self._merged()
+        samples = [(self.name, _format_labels(self.labels, ("quantile", repr(q))), v)
+                   for q, v in zip(self.quantiles, self._quantiles(counts, self.quantiles))]
+        samples.append((f"{self.name}_sum", _format_labels(self.labels), total))
+        samples.append((f"{self.name}_count", _format_labels(self.labels), sum(counts)))
+        return samples
+
+
+def timed(histogram: Histogram) -> Callable:
+    """Decorator recording each call's duration; the plain function is ``__wrapped__``."""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+class MetricsRegistry:
+    """Named metrics and their Prometheus text exposition."""
+
+    def __init__(self):
+        self._metrics: Dict[Tuple[str, Labels], object] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name: str, help: str, labels: Optional[Dict[str, str]], **kwargs):
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self._lock:
+            metric = self._metrics.get(key)
+            if metric is None:
+                metric = cls(name, help, key[1], **kwargs)
+                self._metrics[key] = metric
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric '{name}' is already registered as a {metric.kind}")
+        return metric
+
+    def counter(self, name: str, help: str = "",
+                labels: Optional[Dict[str, str]] = None) -> Counter:
+        return self._get(Counter, name, help, labels)
+
+    def gauge(self, name: str, help: str = "",
+              labels: Optional[Dict[str, str]] = None) -> Gauge:
+        return self._get(Gauge, name, help, labels)
+
+    def histogram(self, name: str, help: str = "",
+                  labels: Optional[Dict[str, str]] = None, **kwargs) -> Histogram:
+        return self._get(Histogram, name, help, labels, **kwargs)
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: (m.name, m.labels))
+        lines = []
+        described = set()
+        for metric in metrics:
+            if metric.name not in described:
+                described.add(metric.name)
+                lines.append(f"# HELP {metric.name} {metric.help}")
+                lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{labels} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def start_http_server(port: int = 9108,
+                      addr: str = "127.0.0.1",
+                      registry: Optional[MetricsRegistry] = None) -> "ThreadingHTTPServer":
+    """
+    Serve ``/metrics`` from a daemon thread.
+
+    Args:
+        port: TCP port (0 picks a free one, see ``server.server_address``).
+        addr: Bind address; local-only by default.
+        registry: Registry to expose (the default registry if omitted).
+
+    Returns:
+        The running server; call ``shutdown()`` to stop it.
+    """
+    # http.server pulls in email/html/socketserver; only exporters pay for it
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    registry = registry or REGISTRY
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((addr, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True,
+                     name="fedhr5-metrics").start()
+    return server
+
+
+# Default registry and the metrics recorded by fedhr5 itself
+REGISTRY = MetricsRegistry()
+
+ROUND_DURATION = REGISTRY.histogram(
+    "fedhr5_round_duration_seconds", "Wall time of a federated training round")
+AGGREGATION_DURATION = REGISTRY.histogram(
+    "fedhr5_aggregation_duration_seconds", "Time spent averaging client updates")
+WIRE_BYTES_UPDATE = REGISTRY.counter(
+    "fedhr5_wire_bytes_total", "Bytes of model messages put on the wire",
+    labels={"message": "model_update"})
+WIRE_BYTES_AGGREGATED = REGISTRY.counter(
+    "fedhr5_wire_bytes_total", "Bytes of model messages put on the wire",
+    labels={"message": "aggregated_model"})
+EPSILON_SPENT = REGISTRY.counter(
+    "fedhr5_privacy_epsilon_spent_total", "Privacy budget ε recorded as spent")
@@ -0,0 +1,311 @@
+"""
+FedHR5.0 - Columnar experiment results store
+
+Training runs write their results as one columnar table per run: Parquet
+when ``pyarrow`` is installed, otherwise a directory of ``.npy`` columns.
+Readers load only the columns they need (memory-mapped where the format
+allows) and string columns stay dictionary-encoded, so aggregating over
+thousands of runs and seeds is a pass of NumPy ``bincount`` calls rather than
+a load of every run into memory.
+
+The report in ``scripts/create_placeholder_images.py`` uses the long layout
+``figure, group, series, value``; any other columns (seed, round, ...) are
+carried along and can be filtered on.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+META_FILE = "_meta.json"
+PARQUET_SUFFIX = ".parquet"
+METADATA_KEY = b"fedhr5"
+
+# A loaded column: values, or dictionary codes plus their categories
+Column = Tuple[np.ndarray, Optional[List[str]]]
+
+
+def _pyarrow():
+    """Import pyarrow on first use; ``(None, None)`` if it is not installed."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        return None, None
+    return pyarrow, pyarrow.parquet
+
+
+@dataclass
+class Aggregate:
+    """Per-key statistics of a value column across runs."""
+
+    keys: List[Tuple]
+    mean: np.ndarray
+    std: np.ndarray
+    count: np.ndarray
+
+    def pivot(self, rows: Sequence, cols: Sequence) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Arrange two-level keys as ``(len(rows), len(cols))`` matrices.
+
+        Returns:
+            Mean, standard deviation and count matrices; cells without
+            observations are NaN (count 0).
+        """
+        index = {key: i for i, key in enumerate(self.keys)}
+        shape = (len(rows), len(cols))
+        mean, std = np.full(shape, np.nan), np.full(shape, np.nan)
+        count = np.zeros(shape, dtype=np.int64)
+        for r, row in enumerate(rows):
+            for c, col in enumerate(cols):
+                i = index.get((row, col))
+                if i is not None:
+                    mean[r, c], std[r, c], count[r, c] = self.mean[i], self.std[i], self.count[i]
+        return mean, std, count
+
+
+def _is_string(values: np.ndarray) -> bool:
+    return values.dtype.kind in "OUS"
+
+
+class ResultsStore:
+    """
+    Directory of per-run columnar result tables.
+
+    Args:
+        root: Store directory, e.g. ``experiments/results/runs``.
+
+    Example:
+        >>> store = ResultsStore("experiments/results/runs")
+        >>> store.write_run("seed-3", {"figure": [...], "group": [...],
+        ...                            "series": [...], "value": [...]},
+        ...                 metadata={"seed": 3})
+        >>> stats = store.aggregate("value", by=("group", "series"),
+        ...                         where={"figure": "performance"})
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+
+    def runs(self) -> List[str]:
+        """Identifiers of the stored runs, sorted."""
+        if not self.root.is_dir():
+            return []
+        runs = []
+        for entry in os.scandir(self.root):
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir() and os.path.exists(os.path.join(entry.path, META_FILE)):
+                runs.append(entry.name)
+            elif entry.name.endswith(PARQUET_SUFFIX):
+                runs.append(entry.name[: -len(PARQUET_SUFFIX)])
+        return sorted(runs)
+
+    def _parquet_path(self, run_id: str) -> Path:
+        return self.root / f"{run_id}{PARQUET_SUFFIX}"
+
+    def write_run(
+        self,
+        run_id: str,
+        columns: Mapping[str, Sequence],
+        metadata: Optional[Dict] = None,
+        format: Optional[str] = None,
+    ) -> Path:
+        """
+        Write one run's results table.
+
+        Args:
+            run_id: Run identifier (file or directory name).
+            columns: Equal-length columns; string columns are dictionary
+                encoded.
+            metadata: JSON-serializable run metadata (seed, config, ...).
+            format: ``"parquet"`` or ``"npy"``; Parquet if ``pyarrow`` is
+                installed, ``.npy`` columns otherwise.
+
+        Returns:
+            Path of the written run.
+
+        Raises:
+            ValueError: On unequal column lengths or an unknown format.
+        """
+        pa, pq = _pyarrow()
+        format = format or ("parquet" if pq is not None else "npy")
+        arrays = {name: np.asarray(values) for name, values in columns.items()}
+        lengths = {len(values) for values in arrays.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+        self.root.mkdir(parents=True, exist_ok=True)
+        metadata = metadata or {}
+
+        if format == "parquet":
+            if pq is None:
+                raise ValueError("Writing Parquet requires pyarrow")
+            table = pa.table({
+                name: pa.array(values.astype(str).tolist()).dictionary_encode()
+                if _is_string(values) else pa.array(values)
+                for name, values in arrays.items()
+            })
+            table = table.replace_schema_metadata({METADATA_KEY: json.dumps(metadata)})
+            path = self._parquet_path(run_id)
+            tmp_path = path.with_name(path.name + ".tmp")
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, path)
+            return path
+
+        if format != "npy":
+            raise ValueError(f"Unknown format '{format}'")
+        path = self.root / run_id
+        tmp_path = self.root / f".{run_id}.tmp"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        tmp_path.mkdir()
+        meta = {"num_rows": lengths.pop() if lengths else 0, "metadata": metadata,
+                "columns": {}}
+        for name, values in arrays.items():
+            if _is_string(values):
+                categories, codes = np.unique(values.astype(str), return_inverse=True)
+                np.save(tmp_path / f"{name}.npy", codes.astype(np.int32))
+                meta["columns"][name] = {"categories": categories.tolist()}
+            else:
+                np.save(tmp_path / f"{name}.npy", values)
+                meta["columns"][name] = {}
+        with open(tmp_path / META_FILE, "w") as f:
+            json.dump(meta, f)
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp_path, path)
+        return path
+
+    def metadata(self, run_id: str) -> Dict:
+        """Metadata stored with a run."""
+        path = self._parquet_path(run_id)
+        if path.exists():
+            _, pq = _pyarrow()
+            schema_metadata = pq.read_schema(path).metadata or {}
+            return json.loads(schema_metadata.get(METADATA_KEY, b"{}"))
+        with open(self.root / run_id / META_FILE) as f:
+            return json.load(f)["metadata"]
+
+    def read_columns(self, run_id: str, names: Sequence[str]) -> Dict[str, Column]:
+        """
+        Load selected columns of a run.
+
+        Returns:
+            Column name to ``(values, None)`` for numeric columns or
+            ``(codes, categories)`` for string columns. ``.npy`` columns are
+            memory-mapped.
+        """
+        path = self._parquet_path(run_id)
+        if path.exists():
+            pa, pq = _pyarrow()
+            # ParquetFile.read skips the dataset layer, which dominates for small runs
+            table = pq.ParquetFile(path, memory_map=True).read(columns=list(names))
+            columns = {}
+            for name in names:
+                column = table.column(name)
+                if pa.types.is_dictionary(column.type) or pa.types.is_string(column.type):
+                    encoded = column.unify_dictionaries().combine_chunks() \
+                        if pa.types.is_dictionary(column.type) \
+                        else column.combine_chunks().dictionary_encode()
+                    columns[name] = (encoded.indices.to_numpy(zero_copy_only=False),
+                                     encoded.dictionary.to_pylist())
+                else:
+                    columns[name] = (column.to_numpy(), None)
+            return columns
+
+        run_dir = self.root / run_id
+        with open(run_dir / META_FILE) as f:
+            meta = json.load(f)["columns"]
+        return {name: (np.load(run_dir / f"{name}.npy", mmap_mode="r"),
+                       meta[name].get("categories"))
+                for name in names}
+
+    def aggregate(
+        self,
+        value: str,
+        by: Sequence[str],
+        where: Optional[Mapping[str, object]] = None,
+        runs: Optional[Sequence[str]] = None,
+    ) -> Aggregate:
+        """
+        Mean and standard deviation of ``value`` per key over many runs.
+
+        Args:
+            value: Numeric column to aggregate.
+            by: Key columns.
+            where: Equality filters on columns (e.g. ``{"figure": "comparison"}``).
+            runs: Runs to include (default: all).
+
+        Returns:
+            Per-key statistics, keys in order of first appearance.
+        """
+        where = dict(where or {})
+        names = list(dict.fromkeys([value, *by, *where]))
+        key_index: Dict[Tuple, int] = {}
+        sums: List[float] = []
+        squares: List[float] = []
+        counts: List[int] = []
+
+        for run_id in self.runs() if runs is None else runs:
+            columns = self.read_columns(run_id, names)
+            values = np.asarray(columns[value][0], dtype=np.float64)
+            mask = np.ones(len(values), dtype=bool)
+            for name, wanted in where.items():
+                data, categories = columns[name]
+                if categories is not None:
+                    if wanted not in categories:
+                        mask[:] = False
+                        break
+                    wanted = categories.index(wanted)
+                mask &= np.asarray(data) == wanted
+            if not mask.any():
+                continue
+
+            key_codes, key_labels = [], []
+            for name in by:
+                data, categories = columns[name]
+                labels, codes = np.unique(np.asarray(data)[mask], return_inverse=True)
+                key_codes.append(codes)
+                key_labels.append([categories[int(c)] for c in labels]
+                                  if categories is not None else labels.tolist())
+            dims = tuple(len(labels) for labels in key_labels)
+            local, inverse = np.unique(np.ravel_multi_index(key_codes, dims),
+                                       return_inverse=True)
+            masked = values[mask]
+            run_sums = np.bincount(inverse, weights=masked, minlength=len(local))
+            run_squares = np.bincount(inverse, weights=masked * masked, minlength=len(local))
+            run_counts = np.bincount(inverse, minlength=len(local))
+
+            positions = np.unravel_index(local, dims)
+            run_keys = zip(*[[labels[p] for p in position.tolist()]
+                             for labels, position in zip(key_labels, positions)])
+            for i, key in enumerate(run_keys):
+                k = key_index.setdefault(key, len(key_index))
+                if k == len(sums):
+                    sums.append(0.0)
+                    squares.append(0.0)
+                    counts.append(0)
+                sums[k] += run_sums[i]
+                squares[k] += run_squares[i]
+                counts[k] += int(run_counts[i])
+
+        count = np.array(counts, dtype=np.int64)
+        mean = np.array(sums) / np.maximum(count, 1)
+        variance = np.array(squares) / np.maximum(count, 1) - mean ** 2
+        return Aggregate(keys=list(key_index), mean=mean,
+                         std=np.sqrt(np.maximum(variance, 0.0)), count=count)
+
+    def fingerprint(self) -> str:
+        """Cheap hash of the store's contents (names, sizes, mtimes)."""
+        digest = hashlib.sha256()
+        for run_id in self.runs():
+            path = self._parquet_path(run_id)
+            if not path.exists():
+                path = self.root / run_id / META_FILE
+            stat = path.stat()
+            digest.update(f"{run_id}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+        return digest.hexdigest()
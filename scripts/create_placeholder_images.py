@@ -4,22 +4,66 @@ Create ALL images for FedHR5.0 README
 This script generates both placeholder images and performance charts
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import FancyBboxPatch, Circle
+import argparse
+import hashlib
+import inspect
 import numpy as np
-import seaborn as sns
+import json
 import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
-# Set style
-plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette("husl")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fedhr5.core.topology import load_topology
+from fedhr5.privacy import PrivacyAccountant
+from fedhr5.utils import ResultsStore
+
+# Plotting libraries are imported by setup_plotting() in the process that
+# renders, so the parent process and cache checks never pay for them
+plt = sns = FancyBboxPatch = Circle = None
+
+PLOT_STYLE = ('seaborn-v0_8-darkgrid', 'husl')
+
+def setup_plotting():
+    """Import matplotlib with the Agg backend and seaborn, and set the style"""
+    global plt, sns, FancyBboxPatch, Circle
+    if plt is not None:
+        return
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as _plt
+    import seaborn as _sns
+    from matplotlib.patches import FancyBboxPatch as _FancyBboxPatch, Circle as _Circle
+    plt, sns, FancyBboxPatch, Circle = _plt, _sns, _FancyBboxPatch, _Circle
+    plt.style.use(PLOT_STYLE[0])
+    sns.set_palette(PLOT_STYLE[1])
 
 # Create directories
 os.makedirs('docs/images', exist_ok=True)
 os.makedirs('experiments/results', exist_ok=True)
 
+# Columnar results written by training runs (see fedhr5.utils.ResultsStore)
+RESULTS_STORE = 'experiments/results/runs'
+
+def report_table(figure, groups, series, defaults, store=None):
+    """
+    Mean and std of a figure's values across all runs in the results store.
+
+    Returns two ``(len(series), len(groups))`` arrays; cells that no run
+    reported fall back to ``defaults`` with zero std.
+    """
+    store = store or ResultsStore(RESULTS_STORE)
+    labels = [group.replace('\n', ' ') for group in groups]
+    stats = store.aggregate('value', by=('series', 'group'), where={'figure': figure})
+    mean, std, count = stats.pivot(series, labels)
+    missing = count == 0
+    mean[missing] = np.asarray(defaults, dtype=float)[missing]
+    std[missing] = 0.0
+    return mean, std
+
 def create_logo():
     """Create a simple but professional logo for FedHR5.0"""
     fig, ax = plt.subplots(1, 1, figsize=(8, 4))
@@ -67,26 +111,28 @@ def create_logo():
     plt.close()
     print("✅ Created logo: docs/images/fedhr5_logo.png")
 
-def create_module_performance_plot():
+def create_module_performance_plot(store=None):
     """Create Figure 2: Model Performance Across Modules - Referenced in README"""
     modules = ['Well-being\nAnalytics', 'Skills\nMapping', 'Recruitment\nFairness', 
                'Learning\nPaths', 'Cross-org\nBenchmarking']
     
-    # Metrics from the paper
-    accuracy = [0.94, 0.89, 0.85, 0.78, 0.91]
-    precision = [0.93, 0.89, 0.88, 0.81, 0.90]
-    recall = [0.92, 0.87, 0.83, 0.76, 0.89]
-    f1_scores = [0.92, 0.88, 0.85, 0.78, 0.89]
+    # Metrics from the paper, used where no training run reported a value
+    paper = [[0.94, 0.89, 0.85, 0.78, 0.91],
+             [0.93, 0.89, 0.88, 0.81, 0.90],
+             [0.92, 0.87, 0.83, 0.76, 0.89],
+             [0.92, 0.88, 0.85, 0.78, 0.89]]
+    (accuracy, precision, recall, f1_scores), errors = report_table(
+        'performance', modules, ['accuracy', 'precision', 'recall', 'f1'], paper, store)
     
     x = np.arange(len(modules))
     width = 0.2
     
     fig, ax = plt.subplots(figsize=(12, 8))
     
-    rects1 = ax.bar(x - 1.5*width, accuracy, width, label='Accuracy', alpha=0.8)
-    rects2 = ax.bar(x - 0.5*width, precision, width, label='Precision', alpha=0.8)
-    rects3 = ax.bar(x + 0.5*width, recall, width, label='Recall', alpha=0.8)
-    rects4 = ax.bar(x + 1.5*width, f1_scores, width, label='F1-Score', alpha=0.8)
+    rects1 = ax.bar(x - 1.5*width, accuracy, width, yerr=errors[0], label='Accuracy', alpha=0.8)
+    rects2 = ax.bar(x - 0.5*width, precision, width, yerr=errors[1], label='Precision', alpha=0.8)
+    rects3 = ax.bar(x + 0.5*width, recall, width, yerr=errors[2], label='Recall', alpha=0.8)
+    rects4 = ax.bar(x + 1.5*width, f1_scores, width, yerr=errors[3], label='F1-Score', alpha=0.8)
     
     ax.set_ylabel('Score', fontsize=12)
     ax.set_xlabel('FedHR5.0 Modules', fontsize=12)
@@ -112,18 +158,22 @@ def create_module_performance_plot():
     
     plt.tight_layout()
     plt.savefig('experiments/results/performance.png', dpi=300, bbox_inches='tight')
+    plt.close(fig)
     print("✅ Created performance.png")
 
-def create_baseline_comparison_plot():
+def create_baseline_comparison_plot(store=None):
     """Create Figure 3: Performance Comparison with Baselines - Referenced in README"""
     metrics = ['Privacy\nGuarantee', 'Model\nAccuracy', 'Training\nEfficiency', 
                'Fairness\nScore', 'Scalability']
     
-    # Normalized scores (0-1 scale)
-    fedhr5_scores = [0.95, 0.94, 0.85, 0.93, 0.88]
-    centralized_scores = [0.0, 0.96, 0.95, 0.75, 0.60]
-    local_only_scores = [1.0, 0.72, 0.90, 0.65, 0.30]
-    basic_fl_scores = [0.70, 0.88, 0.80, 0.70, 0.75]
+    # Normalized scores (0-1 scale) from the paper, used where no run reported one
+    paper = [[0.95, 0.94, 0.85, 0.93, 0.88],
+             [0.0, 0.96, 0.95, 0.75, 0.60],
+             [1.0, 0.72, 0.90, 0.65, 0.30],
+             [0.70, 0.88, 0.80, 0.70, 0.75]]
+    scores, _ = report_table('comparison', metrics,
+                             ['fedhr5', 'centralized', 'local_only', 'basic_fl'], paper, store)
+    fedhr5_scores, centralized_scores, local_only_scores, basic_fl_scores = scores.tolist()
     
     angles = np.linspace(0, 2 * np.pi, len(metrics), endpoint=False).tolist()
     
@@ -162,54 +212,78 @@ def create_baseline_comparison_plot():
     
     plt.tight_layout()
     plt.savefig('experiments/results/comparison.png', dpi=300, bbox_inches='tight')
+    plt.close(fig)
     print("✅ Created comparison.png")
 
+def load_scalability_results(path='experiments/results/scalability.json'):
+    """Load measured scalability results written by experiments/scalability_benchmark.py"""
+    with open(path) as f:
+        results = json.load(f)['results']
+    return sorted(results, key=lambda r: r['num_orgs'])
+
 def create_scalability_plot():
     """Create Figure 4: Scalability Analysis - Referenced in README"""
-    num_orgs = [1, 5, 10, 20, 30, 40, 50]
+    try:
+        results = load_scalability_results()
+    except FileNotFoundError:
+        print("⚠️  Skipped scalability.png: run experiments/scalability_benchmark.py first")
+        return
+
+    num_orgs = np.array([r['num_orgs'] for r in results])
     
-    # Training time in minutes (showing near-linear scaling)
-    training_time = [12, 15, 22, 38, 54, 72, 95]
+    # Measured round wall time in seconds
+    round_time = np.array([r['round_time_s'] for r in results])
+    exchanged_mb = np.array([r['bytes_exchanged'] for r in results]) / 2**20
     
-    # Theoretical linear scaling
-    linear_baseline = [12 * n for n in num_orgs]
+    # Linear scaling extrapolated from the smallest measured consortium
+    linear_baseline = round_time[0] * num_orgs / num_orgs[0]
     
     fig, ax = plt.subplots(figsize=(10, 6))
     
-    ax.plot(num_orgs, training_time, 'o-', linewidth=3, markersize=10, 
-            label='FedHR5.0 (Actual)', color='#2E86AB')
+    ax.plot(num_orgs, round_time, 'o-', linewidth=3, markersize=10, 
+            label='FedHR5.0 (Measured)', color='#2E86AB')
     ax.plot(num_orgs, linear_baseline, '--', linewidth=2, 
             label='Linear Scaling (Theoretical)', color='#A23B72', alpha=0.7)
     
     # Add shaded region showing acceptable performance
-    ax.fill_between(num_orgs, training_time, linear_baseline, 
-                    where=[t < l for t, l in zip(training_time, linear_baseline)],
+    ax.fill_between(num_orgs, round_time, linear_baseline, 
+                    where=round_time < linear_baseline,
                     alpha=0.3, color='green', label='Better than Linear')
+    ax.fill_between(num_orgs, round_time, linear_baseline, 
+                    where=round_time > linear_baseline,
+                    alpha=0.3, color='red', label='Superlinear')
     
     ax.set_xlabel('Number of Organizations', fontsize=12)
-    ax.set_ylabel('Training Time (minutes)', fontsize=12)
-    ax.set_title('Scalability: Training Time vs. Number of Organizations', 
+    ax.set_ylabel('Round Time (seconds)', fontsize=12)
+    ax.set_title('Scalability: Round Time vs. Number of Organizations', 
                  fontsize=16, fontweight='bold')
-    ax.legend()
     ax.grid(True, alpha=0.3)
     
-    # Add annotations
-    ax.annotate('Near-linear scaling\nup to 50 organizations', 
-                xy=(40, 72), xytext=(35, 100),
-                arrowprops=dict(arrowstyle='->', color='black', alpha=0.7),
-                fontsize=10, ha='center')
+    # Communication volume on a secondary axis
+    ax2 = ax.twinx()
+    ax2.plot(num_orgs, exchanged_mb, 's:', color='#06A77D', alpha=0.7,
+             label='Bytes Exchanged per Round')
+    ax2.set_ylabel('Exchanged per Round (MiB)', fontsize=12)
+    
+    lines, labels = ax.get_legend_handles_labels()
+    lines2, labels2 = ax2.get_legend_handles_labels()
+    ax.legend(lines + lines2, labels + labels2, loc='upper left')
     
     plt.tight_layout()
     plt.savefig('experiments/results/scalability.png', dpi=300, bbox_inches='tight')
+    plt.close(fig)
     print("✅ Created scalability.png")
 
-def create_business_metrics_plot():
+def create_business_metrics_plot(store=None):
     """Create additional plot showing business impact"""
     metrics = ['Employee\nRetention', 'Training\nEffectiveness', 'Time to\nHire', 
                'Well-being\nScore']
-    baseline = [72, 54, 45, 6.2]
-    fedhr5 = [88, 76, 28, 7.8]
-    improvement = [23, 41, -38, 26]  # Percentage improvement
+    # Paper values, used where no run reported one; improvement is in percent
+    paper = [[72, 54, 45, 6.2],
+             [88, 76, 28, 7.8],
+             [23, 41, -38, 26]]
+    (baseline, fedhr5, improvement), _ = report_table(
+        'business_impact', metrics, ['baseline', 'fedhr5', 'improvement'], paper, store)
     
     x = np.arange(len(metrics))
     width = 0.35
@@ -246,7 +320,7 @@ def create_business_metrics_plot():
     
     # Add improvement labels
     for i, (xi, yi) in enumerate(zip(x, improvement)):
-        ax2.annotate(f'{yi:+d}%',
+        ax2.annotate(f'{yi:+.0f}%',
                     xy=(xi, yi),
                     xytext=(0, 10),
                     textcoords="offset points",
@@ -257,22 +331,21 @@ def create_business_metrics_plot():
     
     plt.tight_layout()
     plt.savefig('experiments/results/business_impact.png', dpi=300, bbox_inches='tight')
+    plt.close(fig)
     print("✅ Created business_impact.png")
 
 def create_privacy_budget_analysis():
     """Create privacy budget consumption over rounds"""
-    rounds = np.arange(1, 101)
-    epsilon_0 = 0.1
-    alpha = 0.02
+    num_rounds = 100
+    rounds = np.arange(1, num_rounds + 1)
+    accountant = PrivacyAccountant(epsilon_0=0.1, alpha=0.02, delta=1e-5)
     
     # Adaptive privacy budget from Equation (7)
-    epsilon_t = epsilon_0 * np.exp(-alpha * rounds)
+    epsilon_t = accountant.round_budgets(num_rounds)
     
-    # Cumulative privacy spent from Equation (8)
-    cumulative_epsilon = np.minimum(
-        np.sqrt(2 * rounds * np.log(1/1e-5)) * epsilon_0 + rounds * epsilon_0**2,
-        rounds * epsilon_0
-    )
+    # Cumulative privacy spent from Equation (8) and the RDP accountant
+    cumulative_epsilon = accountant.cumulative_epsilon(num_rounds, method='advanced')
+    cumulative_rdp = accountant.cumulative_epsilon(num_rounds, method='rdp')
     
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 10))
     
@@ -285,7 +358,10 @@ def create_privacy_budget_analysis():
     ax1.set_ylim(0, 0.12)
     
     # Cumulative spending
-    ax2.plot(rounds, cumulative_epsilon, linewidth=3, color='#A23B72')
+    ax2.plot(rounds, cumulative_epsilon, linewidth=3, color='#A23B72',
+             label='Advanced Composition (Eq. 8)')
+    ax2.plot(rounds, cumulative_rdp, linewidth=3, color='#06A77D',
+             label='RDP Accountant')
     ax2.axhline(y=1.0, color='red', linestyle='--', label='Privacy Budget Limit')
     ax2.fill_between(rounds, 0, cumulative_epsilon, alpha=0.3, color='#A23B72')
     ax2.set_xlabel('Training Rounds', fontsize=12)
@@ -296,62 +372,72 @@ def create_privacy_budget_analysis():
     
     plt.tight_layout()
     plt.savefig('experiments/results/privacy_analysis.png', dpi=300, bbox_inches='tight')
+    plt.close(fig)
     print("✅ Created privacy_analysis.png")
 
-def create_architecture_diagram():
-    """Create a simple architecture diagram"""
+# Box styles per tier: (facecolor, edgecolor)
+TIER_STYLES = {
+    'cloud': ('#E8F4FD', '#2196F3'),
+    'fog': ('#FFF3E0', '#FF9800'),
+    'edge': ('#E8F5E9', '#4CAF50'),
+}
+
+def create_architecture_diagram(topology_path='experiments/configs/topology.json'):
+    """Create the architecture diagram from the simulator's topology config"""
+    topology = load_topology(topology_path)
+    tiers = topology.tiers()
+    leaves = topology.leaves()
+    
     fig, ax = plt.subplots(1, 1, figsize=(10, 8))
     ax.set_xlim(0, 10)
     ax.set_ylim(0, 10)
     ax.axis('off')
     
-    # Cloud Layer
-    cloud = FancyBboxPatch((2, 7), 6, 2, 
-                           boxstyle="round,pad=0.1",
-                           facecolor='#E8F4FD', 
-                           edgecolor='#2196F3',
-                           linewidth=2)
-    ax.add_patch(cloud)
-    ax.text(5, 8, 'Cloud Layer', fontsize=14, fontweight='bold', ha='center')
-    ax.text(5, 7.5, 'Global Model • Blockchain', fontsize=10, ha='center')
-    
-    # Fog Layer
-    fog1 = FancyBboxPatch((1, 4), 3, 1.5, 
-                         boxstyle="round,pad=0.05",
-                         facecolor='#FFF3E0',
-                         edgecolor='#FF9800',
-                         linewidth=2)
-    fog2 = FancyBboxPatch((6, 4), 3, 1.5,
-                         boxstyle="round,pad=0.05",
-                         facecolor='#FFF3E0',
-                         edgecolor='#FF9800',
-                         linewidth=2)
-    ax.add_patch(fog1)
-    ax.add_patch(fog2)
-    ax.text(2.5, 4.75, 'Fog Node 1', fontsize=11, ha='center')
-    ax.text(7.5, 4.75, 'Fog Node 2', fontsize=11, ha='center')
-    
-    # Edge Devices
-    edge_y = 1.5
-    for i, x in enumerate([0.5, 1.5, 2.5, 3.5, 5.5, 6.5, 7.5, 8.5]):
-        edge = FancyBboxPatch((x, edge_y), 0.8, 0.8,
-                             boxstyle="round,pad=0.02",
-                             facecolor='#E8F5E9',
-                             edgecolor='#4CAF50',
-                             linewidth=1.5)
-        ax.add_patch(edge)
-        ax.text(x+0.4, edge_y+0.4, 'E', fontsize=9, ha='center', va='center')
-    
-    # Connections
-    # Cloud to Fog
-    ax.plot([5, 2.5], [7, 5.5], 'k--', alpha=0.5, linewidth=1.5)
-    ax.plot([5, 7.5], [7, 5.5], 'k--', alpha=0.5, linewidth=1.5)
-    
-    # Fog to Edge
-    for x in [0.9, 1.9, 2.9, 3.9]:
-        ax.plot([2.5, x], [4, 2.3], 'k--', alpha=0.3, linewidth=1)
-    for x in [5.9, 6.9, 7.9, 8.9]:
-        ax.plot([7.5, x], [4, 2.3], 'k--', alpha=0.3, linewidth=1)
+    # Leaves are spread evenly; parents sit above the middle of their leaves
+    spacing = 9.0 / len(leaves)
+    leaf_x = {leaf.name: 0.5 + spacing * (i + 0.5) for i, leaf in enumerate(leaves)}
+    tier_y = dict(zip(tiers, np.linspace(8, 1.9, len(tiers))))
+    box_height = {tier: h for tier, h in zip(tiers, np.linspace(2, 0.8, len(tiers)))}
+    
+    def layout(node):
+        if node.is_leaf:
+            x = leaf_x[node.name]
+            return x, x, x
+        spans = [layout(child) for child in node.children]
+        lo, hi = spans[0][0], spans[-1][1]
+        x = (lo + hi) / 2
+        for child, (_, _, cx) in zip(node.children, spans):
+            ax.plot([x, cx], [tier_y[node.tier] - box_height[node.tier] / 2,
+                              tier_y[child.tier] + box_height[child.tier] / 2],
+                    'k--', alpha=0.5 if child.children else 0.3, linewidth=1.5)
+        draw(node, x, max(hi - lo + spacing * 0.8, 0.8))
+        return lo, hi, x
+    
+    fog_index = {}
+    def draw(node, x, width):
+        face, edge = TIER_STYLES.get(node.tier, ('#F5F5F5', '#9E9E9E'))
+        y, height = tier_y[node.tier], box_height[node.tier]
+        if node.is_leaf:
+            width = min(0.8, spacing * 0.8)
+        box = FancyBboxPatch((x - width / 2, y - height / 2), width, height,
+                             boxstyle="round,pad=0.05",
+                             facecolor=face, edgecolor=edge,
+                             linewidth=2 if node.children else 1.5)
+        ax.add_patch(box)
+        if node is topology:
+            ax.text(x, y + 0.2, f'{node.tier.title()} Layer', fontsize=14,
+                    fontweight='bold', ha='center')
+            ax.text(x, y - 0.4, 'Global Model • Blockchain', fontsize=10, ha='center')
+        elif node.children:
+            fog_index[node.tier] = fog_index.get(node.tier, 0) + 1
+            ax.text(x, y, f'{node.tier.title()} Node {fog_index[node.tier]}',
+                    fontsize=11, ha='center', va='center')
+        elif width >= 0.3:
+            ax.text(x, y, node.tier[0].upper(), fontsize=9, ha='center', va='center')
+    
+    for leaf in leaves:
+        draw(leaf, leaf_x[leaf.name], spacing)
+    layout(topology)
     
     # Labels
     ax.text(5, 0.5, 'Hierarchical Federated Architecture', 
@@ -363,8 +449,109 @@ def create_architecture_diagram():
     plt.close()
     print("✅ Created architecture diagram: docs/images/architecture.png")
 
+# Figure name -> (function, output path, inputs). Inputs are data files and
+# functions/modules whose contents feed the figure; together with the
+# figure function's own source they form the cache key.
+FIGURES = {
+    'logo': (create_logo, 'docs/images/fedhr5_logo.png', []),
+    'architecture': (create_architecture_diagram, 'docs/images/architecture.png',
+                     ['experiments/configs/topology.json', 'fedhr5/core/topology.py']),
+    'performance': (create_module_performance_plot, 'experiments/results/performance.png',
+                    [RESULTS_STORE, report_table, 'fedhr5/utils/results_store.py']),
+    'comparison': (create_baseline_comparison_plot, 'experiments/results/comparison.png',
+                   [RESULTS_STORE, report_table, 'fedhr5/utils/results_store.py']),
+    'scalability': (create_scalability_plot, 'experiments/results/scalability.png',
+                    ['experiments/results/scalability.json', load_scalability_results]),
+    'business_impact': (create_business_metrics_plot,
+                        'experiments/results/business_impact.png',
+                        [RESULTS_STORE, report_table, 'fedhr5/utils/results_store.py']),
+    'privacy_analysis': (create_privacy_budget_analysis,
+                         'experiments/results/privacy_analysis.png',
+                         ['fedhr5/privacy/accounting.py']),
+}
+
+CACHE_PATH = 'experiments/results/.figure_cache.json'
+
+def figure_hash(name):
+    """Hash of a figure's code, plot style and input data"""
+    function, _, inputs = FIGURES[name]
+    digest = hashlib.sha256(repr(PLOT_STYLE).encode())
+    for item in [function] + inputs:
+        if callable(item):
+            digest.update(inspect.getsource(item).encode())
+        elif os.path.isdir(item):
+            digest.update(ResultsStore(item).fingerprint().encode())
+        elif os.path.exists(item):
+            with open(item, 'rb') as f:
+                digest.update(f.read())
+        else:
+            digest.update(f'missing:{item}'.encode())
+    if function is create_architecture_diagram:
+        digest.update(repr(TIER_STYLES).encode())
+    return digest.hexdigest()
+
+def load_cache(path=CACHE_PATH):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def render_figure(name):
+    """Render one figure (runs in a worker process); returns (name, seconds)"""
+    setup_plotting()
+    start = time.perf_counter()
+    FIGURES[name][0]()
+    plt.close('all')
+    return name, time.perf_counter() - start
+
+def build_figures(names=None, jobs=None, force=False, cache_path=CACHE_PATH):
+    """
+    Render the figures whose code or input data changed since the last build.
+
+    Figures are rendered in a process pool of ``jobs`` workers (all CPUs by
+    default; ``jobs=1`` renders in-process). Returns the rendered names.
+    """
+    names = list(FIGURES) if names is None else names
+    cache = {} if force else load_cache(cache_path)
+    hashes = {name: figure_hash(name) for name in names}
+    stale = [name for name in names
+             if cache.get(name) != hashes[name] or not os.path.exists(FIGURES[name][1])]
+    for name in names:
+        if name not in stale:
+            print(f"⏭️  Skipped {name}: unchanged")
+
+    rendered = []
+    if stale and (jobs == 1 or len(stale) == 1):
+        rendered = [render_figure(name) for name in stale]
+    elif stale:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(render_figure, name) for name in stale]
+            rendered = [future.result() for future in as_completed(futures)]
+
+    for name, seconds in rendered:
+        # Figures that produced no output (e.g. missing data) stay stale
+        if os.path.exists(FIGURES[name][1]):
+            cache[name] = hashes[name]
+        print(f"⏱️  {name} rendered in {seconds:.2f}s")
+    with open(cache_path, 'w') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    return [name for name, _ in rendered]
+
 def main():
     """Generate all images for FedHR5.0"""
+    parser = argparse.ArgumentParser(description='Create ALL images for FedHR5.0 README')
+    parser.add_argument('figures', nargs='*', metavar='FIGURE',
+                        help=f"Figures to build (default: all): {', '.join(FIGURES)}")
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help='Worker processes (default: number of CPUs)')
+    parser.add_argument('--force', action='store_true',
+                        help='Rebuild figures even if unchanged')
+    args = parser.parse_args()
+    unknown = set(args.figures) - set(FIGURES)
+    if unknown:
+        parser.error(f"unknown figure(s): {', '.join(sorted(unknown))}")
+    
     print("🎨 Creating ALL images for FedHR5.0...")
     print("=" * 50)
     
@@ -372,36 +559,13 @@ def main():
     Path('docs/images').mkdir(parents=True, exist_ok=True)
     Path('experiments/results').mkdir(parents=True, exist_ok=True)
     
-    # Create placeholder images
-    print("\n📸 Creating general images...")
-    create_logo()
-    create_architecture_diagram()
-    
-    # Create performance charts (referenced in README)
-    print("\n📊 Creating performance charts...")
-    create_module_performance_plot()     # experiments/results/performance.png
-    create_baseline_comparison_plot()    # experiments/results/comparison.png
-    create_scalability_plot()           # experiments/results/scalability.png
-    
-    # Create additional charts
-    print("\n📈 Creating additional charts...")
-    create_business_metrics_plot()
-    create_privacy_budget_analysis()
+    start = time.perf_counter()
+    rendered = build_figures(args.figures or None, jobs=args.jobs, force=args.force)
+    print(f"\n✨ Built {len(rendered)} image(s) in {time.perf_counter() - start:.2f}s")
     
-    print("\n✨ All images created successfully!")
     print("\n📁 Images saved in:")
-    print("   - docs/images/")
-    print("   - experiments/results/")
-    
-    # Summary
-    print("\n📋 Created files:")
-    print("   ✓ docs/images/fedhr5_logo.png")
-    print("   ✓ docs/images/architecture.png")
-    print("   ✓ experiments/results/performance.png (Referenced in README)")
-    print("   ✓ experiments/results/comparison.png (Referenced in README)")
-    print("   ✓ experiments/results/scalability.png (Referenced in README)")
-    print("   ✓ experiments/results/business_impact.png")
-    print("   ✓ experiments/results/privacy_analysis.png")
+    for name in args.figures or FIGURES:
+        print(f"   ✓ {FIGURES[name][1]}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1 @@
+"""FedHR5.0 test suite."""
@@ -0,0 +1,81 @@
+"""Tests for the vectorized privacy accountant."""
+
+import math
+
+import numpy as np
+import pytest
+
+from fedhr5.privacy.accounting import PrivacyAccountant, compose_sums
+
+
+def _rdp_numeric(epsilons, delta):
+    """Minimise the RDP-to-DP conversion over a dense grid of orders."""
+    rho = sum(e * e for e in epsilons) / (4 * math.log(1.25 / delta))
+    orders = 1 + np.logspace(-4, 5, 200_000)
+    return float(np.min(rho * orders + math.log(1 / delta) / (orders - 1)))
+
+
+@pytest.mark.parametrize("epsilons", [[0.1] * 100, [1.0, 0.5, 0.25], [0.01] * 5000])
+def test_rdp_closed_form_matches_numeric_minimum(epsilons):
+    delta = 1e-5
+    closed = compose_sums(sum(epsilons), sum(e * e for e in epsilons), delta, "rdp")
+    assert closed == pytest.approx(min(_rdp_numeric(epsilons, delta), sum(epsilons)),
+                                   rel=1e-6)
+
+
+def test_advanced_composition_is_equation_8():
+    epsilon, rounds, delta = 0.1, 200, 1e-5
+    expected = (math.sqrt(2 * rounds * math.log(1 / delta)) * epsilon
+                + rounds * epsilon ** 2)
+    got = compose_sums(epsilon * rounds, epsilon ** 2 * rounds, delta, "advanced")
+    assert got == pytest.approx(expected)
+    # Never worse than basic composition
+    assert compose_sums(0.5, 0.25, delta, "advanced") == 0.5
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError, match="Unknown composition method"):
+        compose_sums(1.0, 1.0, 1e-5, "moments")
+
+
+def test_round_budgets_follow_equation_7():
+    accountant = PrivacyAccountant(epsilon_0=0.1, alpha=0.02)
+    budgets = accountant.round_budgets(3)
+    np.testing.assert_allclose(budgets, 0.1 * np.exp(-0.02 * np.arange(1, 4)))
+
+
+@pytest.mark.parametrize("method", ["basic", "advanced", "rdp"])
+def test_cumulative_epsilon_matches_a_per_cell_loop(method):
+    epsilon_0 = np.array([[0.1], [0.5]])
+    alpha = np.array([0.0, 0.02, 0.1])
+    accountant = PrivacyAccountant(epsilon_0, alpha, delta=1e-6)
+    grid = accountant.cumulative_epsilon(50, method)
+    assert grid.shape == (2, 3, 50)
+    for i in range(2):
+        for j in range(3):
+            budgets = epsilon_0[i, 0] * np.exp(-alpha[j] * np.arange(1, 51))
+            single = PrivacyAccountant(delta=1e-6).compose(budgets, method)
+            np.testing.assert_allclose(grid[i, j], single, rtol=1e-12)
+
+
+def test_cumulative_epsilon_is_non_decreasing():
+    spent = PrivacyAccountant(epsilon_0=np.full(4, 0.1)).cumulative_epsilon(500)
+    assert np.all(np.diff(spent, axis=-1) >= 0)
+
+
+def test_compose_along_another_axis():
+    epsilons = np.full((5, 3), 0.2)
+    accountant = PrivacyAccountant()
+    np.testing.assert_allclose(accountant.compose(epsilons, "basic", axis=0)[-1], [1.0] * 3)
+
+
+def test_rounds_within_budget():
+    accountant = PrivacyAccountant(epsilon_0=np.array([0.1, 0.2]), alpha=0.0)
+    affordable = accountant.rounds_within_budget(1.0, 100, method="basic")
+    np.testing.assert_array_equal(affordable, [10, 5])
+
+
+@pytest.mark.parametrize("kwargs", [{"epsilon_0": 0.0}, {"delta": 1.0}, {"delta": 0.0}])
+def test_invalid_parameters(kwargs):
+    with pytest.raises(ValueError):
+        PrivacyAccountant(**kwargs)
@@ -0,0 +1,103 @@
+"""Tests for the FedAvg and Byzantine-robust aggregators."""
+
+import numpy as np
+import pytest
+
+from fedhr5.core import aggregation
+from fedhr5.core.aggregation import (aggregate, coordinate_median, krum, krum_scores,
+                                     pairwise_sq_distances, trimmed_mean)
+
+
+def _reference_krum_scores(updates, num_byzantine):
+    """Brute force: sum of squared distances to the n - f - 2 nearest others."""
+    n = len(updates)
+    scores = []
+    for i in range(n):
+        others = sorted(float(np.sum((updates[i] - updates[j]) ** 2))
+                        for j in range(n) if j != i)
+        scores.append(sum(others[:n - num_byzantine - 2]))
+    return np.array(scores)
+
+
+@pytest.fixture
+def updates():
+    rng = np.random.default_rng(0)
+    return rng.standard_normal((60, 50)).astype(np.float32)
+
+
+def test_pairwise_distances_match_brute_force(updates):
+    expected = ((updates[:, None].astype(np.float64) - updates[None]) ** 2).sum(axis=2)
+    np.testing.assert_allclose(pairwise_sq_distances(updates), expected, rtol=1e-4,
+                               atol=1e-3)
+
+
+@pytest.mark.parametrize("num_byzantine", [0, 5, 20])
+def test_krum_scores_match_brute_force(updates, num_byzantine):
+    scores = krum_scores(pairwise_sq_distances(updates), num_byzantine)
+    np.testing.assert_allclose(scores, _reference_krum_scores(updates, num_byzantine),
+                               rtol=1e-4)
+
+
+def test_krum_scores_at_a_few_hundred_clients():
+    rng = np.random.default_rng(1)
+    updates = rng.standard_normal((300, 8)).astype(np.float32)
+    scores = krum_scores(pairwise_sq_distances(updates), 30)
+    np.testing.assert_allclose(scores, _reference_krum_scores(updates, 30), rtol=1e-3)
+
+
+def test_krum_selects_the_reference_winner(updates):
+    best = int(np.argmin(_reference_krum_scores(updates, 5)))
+    np.testing.assert_allclose(krum(updates, num_byzantine=5), updates[best])
+
+
+def test_multi_krum_excludes_byzantine_updates(updates):
+    poisoned = updates.copy()
+    poisoned[:5] += 100.0
+    result = aggregate(poisoned, "multi_krum", num_byzantine=5)
+    np.testing.assert_allclose(result, updates[5:].mean(axis=0), atol=1e-5)
+
+
+def test_sketched_krum_still_rejects_outliers(updates):
+    poisoned = updates.copy()
+    poisoned[:5] += 100.0
+    scores = krum_scores(pairwise_sq_distances(poisoned, sketch_dim=16), 5)
+    assert set(np.argsort(scores)[-5:]) == set(range(5))
+
+
+def test_krum_needs_enough_clients(updates):
+    with pytest.raises(ValueError):
+        krum(updates[:4], num_byzantine=2)
+
+
+@pytest.mark.parametrize("method", ["krum", "multi_krum"])
+def test_aggregate_requires_num_byzantine_for_krum(updates, method):
+    with pytest.raises(ValueError, match="num_byzantine"):
+        aggregate(updates, method)
+
+
+def test_median_and_trimmed_mean_match_numpy(updates, monkeypatch):
+    # Small blocks exercise the column-block iteration
+    monkeypatch.setattr(aggregation, "_BLOCK_ELEMENTS", 600)
+    np.testing.assert_allclose(coordinate_median(updates), np.median(updates, axis=0),
+                               rtol=1e-6)
+    ordered = np.sort(updates, axis=0)[6:-6]
+    np.testing.assert_allclose(trimmed_mean(updates, 0.1), ordered.mean(axis=0), rtol=1e-5,
+                               atol=1e-6)
+    list_input = [row for row in updates]
+    np.testing.assert_allclose(coordinate_median(list_input), coordinate_median(updates))
+
+
+def test_trimmed_mean_rejects_ratio_that_discards_everything(updates):
+    with pytest.raises(ValueError):
+        trimmed_mean(updates, 0.5)
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError, match="Unknown aggregation_method"):
+        aggregate([np.zeros(2)], "mean")
+
+
+def test_fedavg_weights_only_apply_to_fedavg(updates):
+    weights = np.arange(1, 61)
+    np.testing.assert_allclose(aggregate(updates, "median", weights),
+                               coordinate_median(updates))
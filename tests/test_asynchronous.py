@@ -0,0 +1,77 @@
+"""Tests for asynchronous bounded-staleness aggregation."""
+
+import numpy as np
+import pytest
+
+from fedhr5.core.asynchronous import (
+    AsyncAggregator,
+    AsyncSimulation,
+    SimulationTrace,
+    staleness_weight,
+)
+
+
+def test_staleness_weight_is_polynomial_discount():
+    assert staleness_weight(0) == 1.0
+    assert staleness_weight(3, exponent=0.5) == pytest.approx(0.5)
+    assert staleness_weight(3, exponent=0.0) == 1.0
+
+
+def test_fresh_update_is_mixed_with_base_rate():
+    aggregator = AsyncAggregator(np.zeros(4), mixing=0.25)
+    assert aggregator.submit(np.full(4, 8.0), base_version=0)
+    np.testing.assert_allclose(aggregator.weights, np.full(4, 2.0))
+    assert aggregator.version == 1
+
+
+def test_stale_update_is_discounted():
+    aggregator = AsyncAggregator(np.zeros(2), mixing=1.0, staleness_exponent=1.0)
+    for _ in range(3):
+        aggregator.submit(np.zeros(2), aggregator.version)
+    # Staleness 3 → weight 1 / (1 + 3)
+    aggregator.submit(np.full(2, 4.0), base_version=0)
+    np.testing.assert_allclose(aggregator.weights, np.full(2, 1.0))
+
+
+def test_updates_past_max_staleness_are_rejected():
+    aggregator = AsyncAggregator(np.zeros(2), max_staleness=1)
+    aggregator.submit(np.ones(2), 0)
+    aggregator.submit(np.ones(2), 1)
+    before = aggregator.weights.copy()
+    assert not aggregator.submit(np.full(2, 100.0), base_version=0)
+    np.testing.assert_array_equal(aggregator.weights, before)
+    assert (aggregator.accepted, aggregator.rejected, aggregator.version) == (2, 1, 2)
+
+
+def test_snapshot_is_a_copy():
+    aggregator = AsyncAggregator(np.zeros(3))
+    weights, version = aggregator.snapshot()
+    weights += 1
+    assert version == 0 and not aggregator.weights.any()
+
+
+@pytest.mark.parametrize("kwargs", [{"mixing": 0.0}, {"mixing": 1.5},
+                                    {"max_staleness": -1}])
+def test_invalid_parameters_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        AsyncAggregator(np.zeros(1), **kwargs)
+
+
+def test_time_to_error():
+    trace = SimulationTrace("async", times_s=[1.0, 2.0, 3.0], errors=[0.9, 0.4, 0.2])
+    assert trace.time_to_error(0.5) == 2.0
+    assert trace.time_to_error(0.1) is None
+
+
+def test_async_mode_is_not_held_back_by_a_slow_client():
+    simulation = AsyncSimulation([0.005, 0.005, 0.1], model_size=50, jitter=0.0)
+    async_trace = simulation.run_async(duration_s=0.3)
+    sync_trace = simulation.run_sync(duration_s=0.3)
+
+    # The fast clients keep contributing while the slow one trains
+    assert async_trace.updates_applied > sync_trace.updates_applied
+    assert len(async_trace.errors) == async_trace.updates_applied
+    assert async_trace.errors[-1] < async_trace.errors[0]
+    # Synchronous rounds are paced by the slowest client
+    assert len(sync_trace.times_s) <= 3
+    assert np.all(np.diff(async_trace.times_s) >= 0)
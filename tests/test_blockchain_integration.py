@@ -0,0 +1,165 @@
+"""Tests for the ledger, its Merkle proofs and the batched committer."""
+
+import json
+
+import pytest
+
+from fedhr5.modules.benchmarking.blockchain_integration import (
+    BatchedCommitter,
+    LocalLedger,
+    canonical_json,
+    merkle_proof,
+    merkle_root,
+    record_hash,
+    verify_proof,
+)
+
+
+class FlakyLedger(LocalLedger):
+    """Ledger whose first ``failures`` appends raise."""
+
+    def __init__(self, path, failures):
+        super().__init__(path, fsync=False)
+        self.failures = failures
+        self.attempts = 0
+
+    def append_block(self, records):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise ConnectionError("ordering service unavailable")
+        return super().append_block(records)
+
+
+def _committer(ledger, journal, **kwargs):
+    options = dict(max_delay_s=0.01, retry_delay_s=0.001)
+    options.update(kwargs)
+    return BatchedCommitter(ledger, journal, **options)
+
+
+def _ledger_sequences(ledger):
+    return [r["sequence"] for block in ledger.blocks() for r in block.records]
+
+
+@pytest.mark.parametrize("n", range(1, 10))
+def test_merkle_proofs_verify_every_leaf(n):
+    leaves = [record_hash({"i": i}) for i in range(n)]
+    root = merkle_root(leaves)
+    for index, leaf in enumerate(leaves):
+        proof = merkle_proof(leaves, index)
+        assert verify_proof(leaf, proof, root)
+        assert not verify_proof(record_hash({"i": -1}), proof, root)
+
+
+def test_ledger_chain_survives_reopen_and_detects_tampering(tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    ledger = LocalLedger(path, fsync=False)
+    ledger.append_block([{"sequence": 0, "payload": {"round": 1}}])
+    ledger.close()
+
+    ledger = LocalLedger(path, fsync=False)
+    assert (ledger.height, ledger.last_sequence) == (0, 0)
+    record = {"sequence": 1, "payload": {"round": 2}}
+    block = ledger.append_block([{"sequence": 2}, record])
+    assert block.height == 1 and ledger.verify()
+    height, proof = ledger.proof(record)
+    assert height == 1 and verify_proof(record_hash(record), proof, block.merkle_root)
+    with pytest.raises(KeyError):
+        ledger.proof({"sequence": 99})
+    ledger.close()
+
+    lines = path.read_text().splitlines()
+    tampered = json.loads(lines[0])
+    tampered["records"][0]["payload"]["round"] = 7
+    path.write_text("\n".join([json.dumps(tampered)] + lines[1:]) + "\n")
+    assert not LocalLedger(path).verify()
+
+
+def test_committer_batches_records_in_sequence_order(tmp_path):
+    ledger = LocalLedger(tmp_path / "ledger.jsonl", fsync=False)
+    journal = tmp_path / "journal.jsonl"
+    committer = _committer(ledger, journal, max_batch=4)
+    receipts = committer.submit_many([("privacy", {"eps": i}) for i in range(10)])
+    receipts.append(committer.submit("benchmark", {"score": 1}))
+    committer.flush(timeout=10)
+
+    assert _ledger_sequences(ledger) == list(range(11))
+    assert all(len(block.records) <= 4 for block in ledger.blocks())
+    assert [r.committed.result() for r in receipts[:4]] == [0] * 4
+    assert journal.stat().st_size == 0
+    committer.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        committer.submit("privacy", {})
+
+
+def test_failed_commits_are_retried_in_order(tmp_path):
+    ledger = FlakyLedger(tmp_path / "ledger.jsonl", failures=3)
+    committer = _committer(ledger, tmp_path / "journal.jsonl")
+    receipts = [committer.submit("round", {"round": i}) for i in range(5)]
+    committer.flush(timeout=10)
+    committer.close()
+    assert ledger.attempts >= 4
+    assert isinstance(committer.last_error, ConnectionError)
+    assert _ledger_sequences(ledger) == list(range(5))
+    assert all(r.committed.done() and r.committed.exception() is None for r in receipts)
+
+
+def test_journal_recovers_uncommitted_records_after_crash(tmp_path):
+    ledger_path, journal = tmp_path / "ledger.jsonl", tmp_path / "journal.jsonl"
+    ledger = FlakyLedger(ledger_path, failures=10**9)
+    committer = _committer(ledger, journal, retry_delay_s=10.0)
+    receipts = committer.submit_many([("round", {"round": i}) for i in range(3)])
+    committer.close()
+    # The ledger never accepted a block: receipts fail, records stay journalled
+    assert all(isinstance(r.committed.exception(), ConnectionError) for r in receipts)
+    ledger.close()
+
+    # A crash mid-submit leaves a torn final line behind
+    with open(journal, "a") as f:
+        f.write('{"sequence": 3, "mod')
+
+    ledger = LocalLedger(ledger_path, fsync=False)
+    committer = _committer(ledger, journal)
+    committer.submit("round", {"round": 3})
+    committer.flush(timeout=10)
+    committer.close()
+    records = [r for block in ledger.blocks() for r in block.records]
+    assert [r["sequence"] for r in records] == [0, 1, 2, 3]
+    assert records[3]["payload"] == {"round": 3}
+    assert ledger.verify()
+
+
+def test_recovery_skips_records_already_on_the_ledger(tmp_path):
+    ledger_path, journal = tmp_path / "ledger.jsonl", tmp_path / "journal.jsonl"
+    ledger = LocalLedger(ledger_path, fsync=False)
+    records = [{"sequence": i, "module": "round", "payload": {"round": i}}
+               for i in range(4)]
+    ledger.append_block(records[:2])
+    # Crash after the block was appended but before the journal was compacted
+    journal.write_bytes(b"".join(canonical_json(r) + b"\n" for r in records))
+
+    committer = _committer(ledger, journal)
+    committer.flush(timeout=10)
+    assert committer.submit("round", {"round": 4}).sequence == 4
+    committer.flush(timeout=10)
+    committer.close()
+    assert _ledger_sequences(ledger) == [0, 1, 2, 3, 4]
+
+
+def test_recovery_removes_fully_committed_journal(tmp_path):
+    ledger = LocalLedger(tmp_path / "ledger.jsonl", fsync=False)
+    record = {"sequence": 0, "module": "round", "payload": {}}
+    ledger.append_block([record])
+    journal = tmp_path / "journal.jsonl"
+    journal.write_bytes(canonical_json(record) + b"\n")
+    committer = _committer(ledger, journal)
+    committer.close()
+    assert journal.read_bytes() == b""
+    assert _ledger_sequences(ledger) == [0]
+
+
+def test_corrupt_journal_line_before_the_end_is_an_error(tmp_path):
+    ledger = LocalLedger(tmp_path / "ledger.jsonl", fsync=False)
+    journal = tmp_path / "journal.jsonl"
+    journal.write_bytes(b'{"sequence": 0, "mod\n' + canonical_json({"sequence": 1}) + b"\n")
+    with pytest.raises(json.JSONDecodeError):
+        _committer(ledger, journal)
@@ -0,0 +1,110 @@
+"""Tests for the incremental privacy budget manager."""
+
+import numpy as np
+import pytest
+
+from fedhr5.privacy.accounting import compose_sums
+from fedhr5.privacy.budget import PrivacyBudgetManager
+
+
+def test_spent_matches_composition_of_history():
+    manager = PrivacyBudgetManager(total_budget=5.0, method="advanced")
+    history = [0.02] * 10 + [0.01] * 40
+    for eps in history:
+        manager.record(eps, key="org_1")
+    expected = compose_sums(sum(history), sum(e * e for e in history),
+                            manager.delta, "advanced")
+    assert manager.spent("org_1") == pytest.approx(float(expected))
+    assert manager.remaining("org_1") == pytest.approx(5.0 - float(expected))
+
+
+def test_queries_do_not_register_unknown_keys():
+    manager = PrivacyBudgetManager(total_budget=1.0)
+    assert manager.spent(("org_9", "skills")) == 0.0
+    assert manager.can_proceed(0.5, key=("org_9", "skills"))
+    assert ("org_9", "skills") not in manager
+    assert len(manager) == 0
+
+
+def test_can_proceed_refuses_spend_past_the_limit():
+    manager = PrivacyBudgetManager(total_budget=0.1, method="basic")
+    manager.record(0.08)
+    assert manager.can_proceed(0.02)
+    assert not manager.can_proceed(0.03)
+
+
+def test_record_many_charges_repeated_keys_each_time():
+    manager = PrivacyBudgetManager(method="basic")
+    manager.record_many(["a", "b", "a", "a"], 0.1)
+    assert manager.spent("a") == pytest.approx(0.3)
+    assert manager.spent("b") == pytest.approx(0.1)
+
+
+def test_record_many_matches_individual_records():
+    keys = [f"org_{i % 7}" for i in range(50)]
+    epsilons = np.linspace(0.001, 0.05, len(keys))
+    batched, looped = PrivacyBudgetManager(), PrivacyBudgetManager()
+    batched.record_many(keys, epsilons)
+    for key, eps in zip(keys, epsilons):
+        looped.record(float(eps), key=key)
+    for key in set(keys):
+        assert batched.spent(key) == pytest.approx(looped.spent(key))
+
+
+def test_can_proceed_many_uses_per_key_limits():
+    manager = PrivacyBudgetManager(total_budget=1.0, method="basic")
+    manager.register("strict", total_budget=0.05)
+    allowed = manager.can_proceed_many(["strict", "default", "unknown"], 0.1)
+    assert allowed.tolist() == [False, True, True]
+
+
+def test_register_grows_past_initial_capacity():
+    manager = PrivacyBudgetManager(method="basic")
+    for i in range(100):
+        manager.record(0.01 * (i + 1), key=("org", str(i)))
+    assert len(manager) == 100
+    assert manager.spent(("org", "99")) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("method", ["basic", "advanced", "rdp"])
+def test_save_and_load_round_trip(tmp_path, method):
+    manager = PrivacyBudgetManager(total_budget=2.0, num_rounds=40, delta=1e-6,
+                                   method=method)
+    manager.register(("org_1", "wellbeing"), total_budget=0.5)
+    manager.record_many(["global", ("org_1", "wellbeing"), "org_2"], [0.1, 0.2, 0.3])
+    manager.record(0.05, key="org_2")
+
+    path = tmp_path / "privacy_state.npz"
+    manager.save(path)
+    restored = PrivacyBudgetManager.load(path)
+
+    assert not (tmp_path / "privacy_state.npz.tmp").exists()
+    assert (restored.total_budget, restored.num_rounds, restored.delta,
+            restored.method) == (2.0, 40, 1e-6, method)
+    assert len(restored) == len(manager)
+    for key in ["global", ("org_1", "wellbeing"), "org_2"]:
+        assert key in restored
+        assert restored.spent(key) == pytest.approx(manager.spent(key))
+        assert restored.remaining(key) == pytest.approx(manager.remaining(key))
+
+    # The restored manager keeps accepting new budgets and spend
+    restored.record(0.1, key="org_3")
+    assert restored.spent("org_3") > 0
+
+
+def test_load_rejects_unknown_version(tmp_path):
+    manager = PrivacyBudgetManager()
+    manager.record(0.1)
+    path = tmp_path / "state.npz"
+    manager.save(path)
+    with np.load(path) as state:
+        arrays = dict(state)
+    arrays["config"] = np.frombuffer(b'{"version": 99}', dtype=np.uint8)
+    np.savez(path, **arrays)
+    with pytest.raises(ValueError, match="version"):
+        PrivacyBudgetManager.load(path)
+
+
+def test_unknown_method_is_rejected():
+    with pytest.raises(ValueError, match="composition method"):
+        PrivacyBudgetManager(method="moments")
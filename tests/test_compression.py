@@ -0,0 +1,90 @@
+"""Tests for the update codec and the secure-aggregation grid."""
+
+import numpy as np
+import pytest
+
+from fedhr5.core.compression import UpdateCodec, compression_ratio, secure_aggregation_params
+from fedhr5.privacy.secure_aggregation import SecureAggregator, mask_update
+
+
+@pytest.fixture
+def update():
+    return np.random.default_rng(0).standard_normal(10_000).astype(np.float32)
+
+
+def test_float32_round_trip_is_exact(update):
+    codec = UpdateCodec(quantize=False)
+    np.testing.assert_array_equal(codec.decode(codec.encode(update)), update)
+
+
+def test_int8_error_is_within_half_a_step_per_block(update):
+    codec = UpdateCodec(quantize=True, block_size=250)
+    payload = codec.encode(update)
+    steps = np.repeat(np.abs(update.reshape(-1, 250)).max(axis=1) / 127, 250)
+    assert np.all(np.abs(codec.decode(payload) - update) <= 0.5 * steps + 1e-6)
+    assert compression_ratio(update, payload) > 3.5
+
+
+def test_topk_keeps_the_largest_coordinates(update):
+    codec = UpdateCodec(topk_ratio=0.01, quantize=False, error_feedback=False)
+    restored = codec.decode(codec.encode(update))
+    kept = np.flatnonzero(restored)
+    assert len(kept) == 100
+    assert set(kept) == set(np.argsort(np.abs(update))[-100:])
+    np.testing.assert_array_equal(restored[kept], update[kept])
+
+
+def test_delta_encoding_against_a_reference(update):
+    reference = np.ones_like(update)
+    codec = UpdateCodec(quantize=False)
+    payload = codec.encode(update + reference, reference=reference)
+    np.testing.assert_allclose(codec.decode(payload, reference=reference), update + reference)
+
+
+def test_error_feedback_carries_the_untransmitted_part(update):
+    codec = UpdateCodec(topk_ratio=0.1, quantize=True)
+    total = np.zeros(update.size)
+    for _ in range(30):
+        total += codec.decode(codec.encode(update, client_id="org"))
+    # Everything not yet transmitted is in the residual, which stays bounded
+    np.testing.assert_allclose(total + codec.residual("org"), 30 * update, atol=1e-3)
+    assert np.abs(codec.residual("org")).max() < 10 * np.abs(update).max()
+    codec.reset("org")
+    assert codec.residual("org") is None
+
+
+def test_invalid_configuration_and_payload():
+    with pytest.raises(ValueError):
+        UpdateCodec(topk_ratio=0)
+    with pytest.raises(ValueError):
+        UpdateCodec(block_size=0)
+    payload = UpdateCodec().encode(np.ones(4))
+    with pytest.raises(ValueError, match="codec payload"):
+        UpdateCodec().decode(b"XXXX" + payload[4:])
+
+
+def test_grid_covers_the_noise_tail():
+    scale, field_bits, levels = secure_aggregation_params(1.0, 20, noise_std=10.0)
+    assert levels == 127 and field_bits == 16
+    assert scale == pytest.approx(127 / 61)
+    assert secure_aggregation_params(1.0, 300)[1] == 32
+    with pytest.raises(ValueError):
+        secure_aggregation_params(0.0, 10)
+
+
+def test_outliers_saturate_instead_of_wrapping_the_sum():
+    num_clients, sigma = 20, 10.0
+    scale, field_bits, levels = secure_aggregation_params(1.0, num_clients, noise_std=sigma)
+    # Every client pushes the same coordinate 100σ out, far past the grid
+    updates = np.zeros((num_clients, 8), dtype=np.float32)
+    updates[:, 0] = 100 * sigma
+    updates[:, 1] = -100 * sigma
+    aggregator = SecureAggregator(8, 1, range(num_clients), scale=scale, field_bits=field_bits)
+    for cid in range(num_clients):
+        peers = {peer: 7 * min(cid, peer) + max(cid, peer)
+                 for peer in range(num_clients) if peer != cid}
+        aggregator.add(cid, mask_update(updates[cid], cid, peers, 1, scale=scale,
+                                        field_bits=field_bits, levels=levels))
+    total = aggregator.finalize()
+    bound = num_clients * levels / scale
+    np.testing.assert_allclose(total[:2], [bound, -bound], rtol=1e-6)
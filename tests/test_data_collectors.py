@@ -0,0 +1,114 @@
+"""Tests for streaming well-being feature extraction."""
+
+import numpy as np
+import pytest
+
+from fedhr5.modules.wellbeing.data_collectors import (
+    FeatureBuffer,
+    RingBuffer,
+    SlidingWindowFeatures,
+    TumblingWindowFeatures,
+    collect,
+    feature_names,
+    simulate_sensor_stream,
+)
+
+CHANNELS = ["heart_rate", "eda", "noise_db"]
+
+
+def _window_stats(values):
+    if not values:
+        return [0] + [np.nan] * 4
+    values = np.asarray(values)
+    return [len(values), values.mean(), values.std(), values.min(), values.max()]
+
+
+def _reference(readings, channels, start, end):
+    features = []
+    for channel in channels:
+        features += _window_stats([v for t, c, v in readings
+                                   if c == channel and start <= t < end])
+    return np.array(features, dtype=float)
+
+
+def test_sliding_windows_match_brute_force():
+    readings = list(simulate_sensor_stream(rate=50, duration=120, channels=CHANNELS))
+    pipeline = SlidingWindowFeatures(CHANNELS, window=12.0, hop=5.0)
+    emitted = list(pipeline.process(readings))
+    assert [end for end, _ in emitted] == [5.0 * k for k in range(1, 24)]
+    for end, features in emitted:
+        np.testing.assert_allclose(features, _reference(readings, CHANNELS, end - 12.0, end),
+                                   rtol=1e-9, atol=1e-9)
+    assert pipeline.late == pipeline.dropped == 0
+
+
+def test_tumbling_windows_match_brute_force_and_skip_gaps():
+    readings = list(simulate_sensor_stream(rate=20, duration=100, channels=CHANNELS))
+    readings += list(simulate_sensor_stream(rate=20, duration=50, channels=CHANNELS,
+                                            start=400.0, seed=1))
+    pipeline = TumblingWindowFeatures(CHANNELS, duration=30.0)
+    emitted = list(pipeline.process(readings))
+    assert [end for end, _ in emitted] == [30.0, 60.0, 90.0, 120.0, 420.0]
+    for end, features in emitted:
+        np.testing.assert_allclose(features, _reference(readings, CHANNELS, end - 30.0, end),
+                                   rtol=1e-9, atol=1e-9)
+
+
+def test_std_is_stable_for_large_offsets():
+    readings = [(t / 10, "co2", 1e9 + (t % 2)) for t in range(100)]
+    end, features = next(TumblingWindowFeatures(["co2"], duration=5.0).process(readings))
+    assert features[1] == pytest.approx(1e9 + 0.5)
+    assert features[2] == pytest.approx(0.5)
+
+
+def test_late_readings_and_unknown_channels_are_ignored():
+    readings = [(1.0, "eda", 1.0), (6.0, "eda", 2.0), (0.5, "eda", 100.0),
+                (6.5, "other", 5.0), (11.0, "eda", 3.0)]
+    pipeline = SlidingWindowFeatures(["eda"], window=10.0, hop=5.0)
+    emitted = dict(pipeline.process(readings))
+    assert pipeline.late == 1
+    np.testing.assert_allclose(emitted[10.0], [2, 1.5, 0.5, 1.0, 2.0])
+
+
+def test_channel_without_readings_is_nan():
+    pipeline = SlidingWindowFeatures(["eda", "noise_db"], window=5.0, hop=5.0)
+    _, features = next(pipeline.process([(1.0, "eda", 1.0), (6.0, "eda", 1.0)]))
+    assert features[5] == 0 and np.isnan(features[6:]).all()
+    assert feature_names(["eda"]) == ["eda_count", "eda_mean", "eda_std", "eda_min",
+                                      "eda_max"]
+
+
+def test_ring_buffer_wraps_and_overwrites_oldest():
+    ring = RingBuffer(4)
+    for i in range(6):
+        ring.push(float(i), float(i * 10))
+    assert len(ring) == 4 and ring.dropped == 2
+    np.testing.assert_array_equal(ring.timestamps(), [2, 3, 4, 5])
+    np.testing.assert_array_equal(ring.values(), [20, 30, 40, 50])
+    ring.evict_before(4.0)
+    np.testing.assert_array_equal(ring.values(), [40, 50])
+    out = np.empty(5)
+    ring.stats(out)
+    np.testing.assert_allclose(out, [2, 45, 5, 40, 50])
+
+
+def test_sliding_window_counts_overflow():
+    pipeline = SlidingWindowFeatures(["eda"], window=1.0, hop=1.0, max_rate=10)
+    readings = [(i / 100, "eda", 1.0) for i in range(150)]
+    list(pipeline.process(readings))
+    assert pipeline.dropped > 0
+
+
+def test_feature_buffer_keeps_latest_vectors():
+    buffer = FeatureBuffer(capacity=3, width=2)
+    ends = list(collect(((float(i), np.full(2, i)) for i in range(5)), buffer))
+    assert ends == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert len(buffer) == 3
+    np.testing.assert_array_equal(buffer.latest()[:, 0], [2, 3, 4])
+    np.testing.assert_array_equal(buffer.latest(2)[:, 0], [3, 4])
+
+
+@pytest.mark.parametrize("kwargs", [{"window": 0.0}, {"hop": -1.0}])
+def test_invalid_windows_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        SlidingWindowFeatures(["eda"], **kwargs)
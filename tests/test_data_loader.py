@@ -0,0 +1,132 @@
+"""Tests for the shared-memory columnar data loader."""
+
+import multiprocessing as mp
+
+import numpy as np
+import pytest
+
+from fedhr5.utils.data_loader import MISSING_CODE, SharedDataLoader, read_table
+
+
+def _write(tmp_path, text, name="table.csv"):
+    path = tmp_path / name
+    path.write_text(text)
+    return path
+
+
+def test_csv_types_are_inferred(tmp_path):
+    path = _write(tmp_path, "id,score,team\n1,0.5,a\n2,,b\n3,1.5,a\n")
+    columns = read_table(path)
+    np.testing.assert_array_equal(columns["id"][0], [1, 2, 3])
+    assert columns["id"][0].dtype == np.int64
+    np.testing.assert_array_equal(columns["score"][0], [0.5, np.nan, 1.5])
+    codes, categories = columns["team"]
+    assert [categories[c] for c in codes] == ["a", "b", "a"]
+
+
+def test_blank_lines_are_skipped(tmp_path):
+    path = _write(tmp_path, "x,y\n1,a\n2,b\n\n3,c\n4,d\n\n")
+    for chunk_rows in (2, 65_536):
+        columns = read_table(path, chunk_rows=chunk_rows)
+        np.testing.assert_array_equal(columns["x"][0], [1, 2, 3, 4])
+
+
+def test_ragged_row_raises_with_its_line(tmp_path):
+    path = _write(tmp_path, "x,y\n1,a\n2\n")
+    with pytest.raises(ValueError, match="line 3"):
+        read_table(path)
+
+
+def test_late_non_integer_widens_to_float(tmp_path):
+    path = _write(tmp_path, "x\n10\n20\n2.5\n")
+    values, categories = read_table(path, chunk_rows=2)["x"]
+    np.testing.assert_array_equal(values, [10.0, 20.0, 2.5])
+    assert categories is None
+
+
+def test_late_non_number_widens_to_categorical_keeping_text(tmp_path):
+    path = _write(tmp_path, "x,y\n10,1\n20,2\n1.50,3\nX7,4\n")
+    columns = read_table(path, chunk_rows=2)
+    codes, categories = columns["x"]
+    assert [categories[c] for c in codes] == ["10", "20", "1.50", "X7"]
+    np.testing.assert_array_equal(columns["y"][0], [1, 2, 3, 4])
+
+
+def test_integer_beyond_int64_widens_to_float(tmp_path):
+    path = _write(tmp_path, "x\n1\n99999999999999999999\n")
+    values, _ = read_table(path)["x"]
+    assert values.dtype == np.float64 and values[1] == 1e20
+
+
+def test_listed_dtypes_are_not_widened(tmp_path):
+    path = _write(tmp_path, "x\n10\n20\nX7\n")
+    with pytest.raises(ValueError, match="does not parse as int64"):
+        read_table(path, dtypes={"x": "int64"}, chunk_rows=2)
+    values, _ = read_table(_write(tmp_path, "x\n1\n2\n", "f.csv"), dtypes={"x": "float32"})["x"]
+    assert values.dtype == np.float32
+
+
+def test_empty_and_unsupported_files(tmp_path):
+    with pytest.raises(ValueError, match="empty"):
+        read_table(_write(tmp_path, ""))
+    with pytest.raises(ValueError, match="Unsupported"):
+        read_table(_write(tmp_path, "x\n1\n", "table.txt"))
+    assert len(read_table(_write(tmp_path, "x,y\n", "header.csv"))["x"][0]) == 0
+
+
+def test_arrays_must_have_equal_lengths():
+    with pytest.raises(ValueError, match="unequal"):
+        read_table({"a": [1, 2], "b": [1]})
+
+
+def test_parquet_nulls_get_the_missing_code(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "table.parquet"
+    table = pa.table({"team": pa.chunked_array([["a", None], ["b", "a", None]]),
+                      "score": [1.0, None, 3.0, 4.0, 5.0]})
+    pq.write_table(table, path, row_group_size=2)
+    codes, categories = read_table(path)["team"]
+    np.testing.assert_array_equal(codes, [0, MISSING_CODE, 1, 0, MISSING_CODE])
+    assert categories == ["a", "b"]
+    with SharedDataLoader() as loader:
+        with loader.load("table", path).attach() as shared:
+            assert shared.decode("team").tolist() == ["a", None, "b", "a", None]
+
+
+@pytest.fixture
+def loader():
+    with SharedDataLoader() as loader:
+        yield loader
+
+
+def test_shared_table_round_trip(loader):
+    handle = loader.load("employees", {"tenure": np.arange(10), "workload": np.ones(10),
+                                       "team": ["a", "b"] * 5})
+    assert loader.load("employees", {"other": [1]}) is handle
+    with handle.attach() as table:
+        assert table.num_rows == 10
+        np.testing.assert_array_equal(table["tenure"], np.arange(10))
+        assert not table["tenure"].flags.writeable
+        view = table.select(["tenure"], slice(2, 5))["tenure"]
+        assert np.shares_memory(view, table["tenure"])
+        assert table.decode("team", [0, 1]).tolist() == ["a", "b"]
+        matrix = table.matrix(["tenure", "workload"], rows=[1, 3])
+        np.testing.assert_array_equal(matrix, [[1, 1], [3, 1]])
+        batches = list(table.batches(["tenure"], batch_size=4))
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        with pytest.raises(KeyError):
+            table["missing"]
+        with pytest.raises(ValueError, match="not categorical"):
+            table.categories("tenure")
+
+
+def _column_sum(handle):
+    with handle.attach() as table:
+        return int(table["tenure"].sum())
+
+
+def test_shared_table_is_readable_from_another_process(loader):
+    handle = loader.load("employees", {"tenure": np.arange(1000)})
+    with mp.get_context("spawn").Pool(1) as pool:
+        assert pool.apply(_column_sum, (handle,)) == sum(range(1000))
@@ -0,0 +1,117 @@
+"""Tests for the differential privacy mechanisms."""
+
+import math
+
+import numpy as np
+import pytest
+
+from fedhr5.privacy.differential_privacy import (
+    adaptive_clip,
+    client_streams,
+    clip_and_noise_,
+    gaussian_sigma,
+    row_norms,
+)
+
+
+def test_gaussian_sigma_formula():
+    assert gaussian_sigma(2.0, 0.5, 1e-5) == pytest.approx(
+        2.0 * math.sqrt(2 * math.log(1.25 / 1e-5)) / 0.5)
+
+
+@pytest.mark.parametrize("epsilon, delta", [(0.0, 1e-5), (1.0, 0.0), (1.0, 1.0)])
+def test_gaussian_sigma_rejects_invalid_params(epsilon, delta):
+    with pytest.raises(ValueError):
+        gaussian_sigma(1.0, epsilon, delta)
+
+
+def _draw(generator):
+    return generator.standard_normal(5)
+
+
+def test_client_streams_depend_only_on_client_and_round():
+    a = client_streams(7, [3, 1, 2], round_num=4)
+    b = client_streams(7, [2, 3], round_num=4)
+    np.testing.assert_array_equal(_draw(a[0]), _draw(b[1]))
+    np.testing.assert_array_equal(_draw(a[2]), _draw(b[0]))
+
+    other_round = client_streams(7, [3], round_num=5)[0]
+    assert not np.array_equal(_draw(client_streams(7, [3], round_num=4)[0]),
+                              _draw(other_round))
+
+
+def test_adaptive_clip_caps_rows_at_percentile():
+    updates = np.random.default_rng(0).standard_normal((20, 50)).astype(np.float32)
+    updates *= np.arange(1, 21, dtype=np.float32)[:, None]
+    before = row_norms(updates)
+    clip_value = adaptive_clip(updates, percentile=50)
+    after = row_norms(updates)
+    assert clip_value == pytest.approx(float(np.percentile(before, 50)))
+    assert np.all(after <= clip_value * (1 + 1e-5))
+    below = before <= clip_value
+    np.testing.assert_allclose(after[below], before[below], rtol=1e-6)
+
+
+def test_clip_and_noise_with_zero_noise_limit_only_clips():
+    updates = np.random.default_rng(1).standard_normal((8, 100)).astype(np.float32)
+    expected = updates.copy()
+    adaptive_clip(expected, percentile=100)
+    # A huge epsilon makes the noise negligible and leaves only clipping
+    clip_value, sigma = clip_and_noise_(updates, epsilon=1e12, delta=1e-5,
+                                        percentile=100,
+                                        rng=np.random.default_rng(0))
+    assert sigma < 1e-10
+    np.testing.assert_allclose(updates, expected, atol=1e-6)
+
+
+def test_clip_and_noise_noise_scale_matches_sigma():
+    updates = np.zeros((4, 200_000), dtype=np.float32)
+    updates[:, 0] = 1.0
+    clip_value, sigma = clip_and_noise_(updates, epsilon=4.0, delta=1e-5,
+                                        clip_norm=1.0,
+                                        rng=np.random.default_rng(0))
+    assert clip_value == 1.0
+    assert sigma == pytest.approx(gaussian_sigma(1.0, 4.0, 1e-5))
+    assert float(updates[:, 1:].std()) == pytest.approx(sigma, rel=0.01)
+
+
+def test_clip_and_noise_per_client_streams_are_order_independent():
+    rng = np.random.default_rng(2)
+    updates = rng.standard_normal((3, 64)).astype(np.float32)
+    ids = [10, 11, 12]
+    forward = updates.copy()
+    clip_and_noise_(forward, 1.0, 1e-5, clip_norm=1.0,
+                    rng=client_streams(5, ids, round_num=1))
+    reverse = updates[::-1].copy()
+    clip_and_noise_(reverse, 1.0, 1e-5, clip_norm=1.0,
+                    rng=client_streams(5, ids[::-1], round_num=1))
+    np.testing.assert_array_equal(forward, reverse[::-1])
+
+
+def test_clip_and_noise_shared_stream_spans_several_blocks(monkeypatch):
+    from fedhr5.privacy import differential_privacy
+
+    updates = np.zeros((10, 32), dtype=np.float32)
+    blocked = updates.copy()
+    clip_and_noise_(updates, 1.0, 1e-5, clip_norm=1.0, rng=np.random.default_rng(3))
+    # Three rows per block: the noise sequence must not depend on the blocking
+    monkeypatch.setattr(differential_privacy, "_NOISE_BLOCK_BYTES", 3 * 4 * 32)
+    clip_and_noise_(blocked, 1.0, 1e-5, clip_norm=1.0, rng=np.random.default_rng(3))
+    np.testing.assert_array_equal(updates, blocked)
+
+
+@pytest.mark.parametrize("updates", [
+    np.zeros((2, 3), dtype=np.float64),
+    np.zeros(6, dtype=np.float32),
+    np.zeros((3, 2), dtype=np.float32).T,
+])
+def test_clip_and_noise_rejects_bad_buffers(updates):
+    with pytest.raises(ValueError, match="C-contiguous"):
+        clip_and_noise_(updates, 1.0, 1e-5, clip_norm=1.0)
+
+
+def test_clip_and_noise_rejects_wrong_number_of_streams():
+    updates = np.zeros((3, 4), dtype=np.float32)
+    with pytest.raises(ValueError, match="one generator per"):
+        clip_and_noise_(updates, 1.0, 1e-5, clip_norm=1.0,
+                        rng=client_streams(0, [1, 2]))
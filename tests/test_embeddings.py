@@ -0,0 +1,108 @@
+"""Tests for the IVF approximate nearest-neighbour index."""
+
+import json
+
+import numpy as np
+import pytest
+
+from fedhr5.modules.skills.embeddings import IVFIndex, exact_search
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    centers = rng.standard_normal((20, 16)).astype(np.float32) * 4
+    database = (centers[rng.integers(0, 20, 3000)]
+                + rng.standard_normal((3000, 16)).astype(np.float32))
+    queries = centers[rng.integers(0, 20, 50)] + rng.standard_normal((50, 16)).astype(np.float32)
+    return database, queries
+
+
+def _recall(found, expected):
+    return np.mean([len(set(f) & set(e)) / len(e) for f, e in zip(found, expected)])
+
+
+@pytest.mark.parametrize("metric", ["cosine", "l2"])
+def test_full_probe_matches_exact_search(data, metric):
+    database, queries = data
+    index = IVFIndex(dim=16, num_lists=16, metric=metric)
+    index.train(database)
+    index.add(database)
+    scores, ids = index.search(queries, k=5, nprobe=16)
+    exact_scores, exact_ids = exact_search(database, queries, k=5, metric=metric)
+    assert _recall(ids, exact_ids) == 1.0
+    np.testing.assert_allclose(scores, exact_scores, rtol=1e-3, atol=1e-2)
+
+
+def test_few_probes_keep_high_recall(data):
+    database, queries = data
+    index = IVFIndex(dim=16, num_lists=32)
+    index.train(database)
+    index.add(database)
+    _, ids = index.search(queries, k=10, nprobe=4)
+    assert _recall(ids, exact_search(database, queries, k=10)[1]) > 0.9
+
+
+def test_custom_ids_and_incremental_inserts(data):
+    database, _ = data
+    index = IVFIndex(dim=16, num_lists=8)
+    index.train(database)
+    index.add(database[:100], ids=np.arange(1000, 1100))
+    assert index.add(database[100:110]).tolist() == list(range(1100, 1110))
+    assert len(index) == 110
+    _, ids = index.search(database[5], k=1, nprobe=8)
+    assert ids[0, 0] == 1005
+
+
+def test_missing_neighbours_are_padded():
+    index = IVFIndex(dim=2, num_lists=2, metric="l2")
+    index.train([[0, 0], [10, 10]])
+    index.add([[0, 0]])
+    scores, ids = index.search([[0, 0]], k=3, nprobe=2)
+    assert ids[0].tolist() == [0, -1, -1]
+    assert np.isneginf(scores[0, 1:]).all()
+
+
+def test_untrained_index_and_bad_dimension():
+    index = IVFIndex(dim=4, num_lists=2)
+    with pytest.raises(RuntimeError):
+        index.add(np.zeros((1, 4)))
+    with pytest.raises(RuntimeError):
+        index.search(np.zeros(4))
+    index.train(np.random.default_rng(0).standard_normal((10, 4)))
+    with pytest.raises(ValueError):
+        index.add(np.zeros((1, 3)))
+
+
+@pytest.mark.parametrize("metric", ["cosine", "l2"])
+def test_save_and_memory_mapped_load(tmp_path, data, metric):
+    database, queries = data
+    index = IVFIndex(dim=16, num_lists=16, metric=metric)
+    index.train(database)
+    index.add(database)
+    expected = index.search(queries, k=5, nprobe=4)
+    index.save(tmp_path)
+
+    loaded = IVFIndex.load(tmp_path)
+    assert len(loaded) == len(index)
+    if metric == "l2":
+        # Norms come from the saved file rather than a pass over every vector
+        assert isinstance(loaded._sq_norms[0].base, np.memmap)
+    for got, want in zip(loaded.search(queries, k=5, nprobe=4), expected):
+        np.testing.assert_allclose(got, want, rtol=1e-5)
+
+    # Inserting copies only the touched list out of the read-only mapping
+    new_ids = loaded.add(database[:3])
+    _, ids = loaded.search(database[:3], k=2, nprobe=16)
+    assert all(new_id in row for new_id, row in zip(new_ids, ids))
+
+
+def test_load_rejects_other_format_versions(tmp_path, data):
+    index = IVFIndex(dim=16, num_lists=4)
+    index.train(data[0])
+    index.save(tmp_path)
+    meta = json.loads((tmp_path / "index.json").read_text())
+    meta["version"] = 1
+    (tmp_path / "index.json").write_text(json.dumps(meta))
+    with pytest.raises(ValueError, match="version"):
+        IVFIndex.load(tmp_path)
@@ -0,0 +1,98 @@
+"""Tests for the recruitment group fairness metrics."""
+
+import numpy as np
+import pytest
+
+from fedhr5.modules.recruitment.fairness_metrics import FairnessSchema, fairness_report
+
+
+def _candidates(n=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    attributes = {"gender": rng.choice(["f", "m", "x"], n),
+                  "age_group": rng.choice(["<30", "30-50", ">50"], n)}
+    labels = rng.random(n) < 0.4
+    decisions = rng.random(n) < np.where(attributes["gender"] == "f", 0.3, 0.5)
+    return decisions, attributes, labels
+
+
+def _reference(decisions, attributes, labels, names):
+    """Per-group rates with a plain Python loop over candidates."""
+    keys = list(zip(*(attributes[name] for name in names)))
+    rates = {}
+    for group in sorted(set(keys)):
+        rows = [i for i, key in enumerate(keys) if key == group]
+        selected = [decisions[i] for i in rows]
+        qualified = [decisions[i] for i in rows if labels[i]]
+        unqualified = [decisions[i] for i in rows if not labels[i]]
+        rates[group] = (np.mean(selected), np.mean(qualified), np.mean(unqualified))
+    return rates
+
+
+def test_rates_and_metrics_match_reference():
+    decisions, attributes, labels = _candidates()
+    reports = fairness_report(decisions, attributes, labels,
+                              intersections=[("gender", "age_group")])
+    assert [r.attributes for r in reports] == [("gender",), ("age_group",),
+                                               ("gender", "age_group")]
+    for report in reports:
+        expected = _reference(decisions, attributes, labels, report.attributes)
+        assert sorted(report.groups) == sorted(expected)
+        for i, group in enumerate(report.groups):
+            sr, tpr, fpr = expected[group]
+            assert report.selection_rate[i] == pytest.approx(sr)
+            assert report.true_positive_rate[i] == pytest.approx(tpr)
+            assert report.false_positive_rate[i] == pytest.approx(fpr)
+
+        srs = [v[0] for v in expected.values()]
+        tprs = [v[1] for v in expected.values()]
+        fprs = [v[2] for v in expected.values()]
+        metrics = report.metrics
+        assert metrics["demographic_parity_difference"] == pytest.approx(max(srs) - min(srs))
+        assert metrics["disparate_impact"] == pytest.approx(min(srs) / max(srs))
+        assert metrics["equal_opportunity_difference"] == pytest.approx(max(tprs) - min(tprs))
+        assert metrics["equalized_odds_difference"] == pytest.approx(
+            max(max(tprs) - min(tprs), max(fprs) - min(fprs)))
+
+
+def test_summed_statistics_equal_pooled_data():
+    decisions, attributes, labels = _candidates()
+    schema = FairnessSchema.from_data(attributes, [("gender", "age_group")])
+    halves = [slice(0, 700), slice(700, None)]
+    summed = sum(schema.statistics(decisions[s], {k: v[s] for k, v in attributes.items()},
+                                   labels[s]) for s in halves)
+    assert summed.shape == (schema.size,)
+    np.testing.assert_array_equal(summed, schema.statistics(decisions, attributes, labels))
+
+
+def test_unlabelled_contributor_disables_label_metrics():
+    decisions, attributes, labels = _candidates()
+    schema = FairnessSchema.from_data(attributes)
+    summed = (schema.statistics(decisions, attributes, labels)
+              + schema.statistics(decisions, attributes))
+    report = schema.evaluate(summed)[0]
+    assert "equal_opportunity_difference" not in report.metrics
+    assert np.isnan(report.true_positive_rate).all()
+    assert report.metrics["demographic_parity_difference"] > 0
+
+
+def test_small_and_empty_groups_are_excluded():
+    schema = FairnessSchema({"gender": ["f", "m", "x"]})
+    stats = schema.statistics([1, 0, 1, 1, 0], {"gender": ["f", "f", "m", "m", "x"]})
+    report = schema.evaluate(stats, min_group_size=2)[0]
+    np.testing.assert_array_equal(report.counts, [2, 2, 1])
+    assert np.isnan(report.selection_rate[2])
+    assert report.metrics["disparate_impact"] == pytest.approx(0.5)
+    assert report.to_dict()["groups"][1] == {
+        "group": ["m"], "count": 2, "selection_rate": 1.0,
+        "true_positive_rate": pytest.approx(float("nan"), nan_ok=True),
+        "false_positive_rate": pytest.approx(float("nan"), nan_ok=True)}
+
+
+def test_values_outside_schema_are_rejected():
+    schema = FairnessSchema({"gender": ["f", "m"]})
+    with pytest.raises(ValueError, match="outside the schema"):
+        schema.statistics([1], {"gender": ["x"]})
+    with pytest.raises(ValueError, match="Unknown protected"):
+        FairnessSchema({"gender": ["f"]}, intersections=[("gender", "age")])
+    with pytest.raises(ValueError, match="same length"):
+        schema.statistics([1, 0], {"gender": ["f", "m"]}, labels=[1])
@@ -0,0 +1,52 @@
+"""Tests for the cached figure build in scripts/create_placeholder_images.py."""
+
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+SCRIPT = Path(__file__).parents[1] / "scripts" / "create_placeholder_images.py"
+
+
+@pytest.fixture
+def images(monkeypatch, tmp_path):
+    spec = importlib.util.spec_from_file_location("create_placeholder_images", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    data = tmp_path / "data.json"
+    data.write_text("[1, 2, 3]")
+    output = tmp_path / "figure.png"
+    calls = []
+
+    def render():
+        calls.append(1)
+        output.write_bytes(b"png")
+
+    monkeypatch.setattr(module, "FIGURES", {"fake": (render, str(output), [str(data)])})
+    return SimpleNamespace(build=module.build_figures, hash=module.figure_hash,
+                           module=module, calls=calls, data=data, output=output,
+                           cache=tmp_path / "cache.json")
+
+
+def test_unchanged_figures_are_skipped(images):
+    assert images.build(jobs=1, cache_path=images.cache) == ["fake"]
+    assert images.build(jobs=1, cache_path=images.cache) == []
+    assert len(images.calls) == 1
+
+
+def test_changed_input_or_missing_output_rebuilds(images):
+    images.build(jobs=1, cache_path=images.cache)
+    images.data.write_text("[1, 2, 4]")
+    assert images.build(jobs=1, cache_path=images.cache) == ["fake"]
+    images.output.unlink()
+    assert images.build(jobs=1, cache_path=images.cache) == ["fake"]
+    assert images.build(jobs=1, cache_path=images.cache, force=True) == ["fake"]
+    assert len(images.calls) == 4
+
+
+def test_hash_covers_plot_style(images, monkeypatch):
+    before = images.hash("fake")
+    monkeypatch.setattr(images.module, "PLOT_STYLE", ("ggplot", "husl"))
+    assert images.hash("fake") != before
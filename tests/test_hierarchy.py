@@ -0,0 +1,93 @@
+"""Tests for the topology configuration and the hierarchical simulator."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from fedhr5.core.aggregation import federated_average
+from fedhr5.core.hierarchy import HierarchicalSimulator
+from fedhr5.core.simulation import local_update
+from fedhr5.core.topology import balanced_topology, build_topology, load_topology
+
+CONFIG = Path(__file__).parents[1] / "experiments" / "configs" / "topology.json"
+
+UNEVEN = {
+    "name": "cloud", "tier": "cloud",
+    "children": [
+        {"name": "fog", "tier": "fog", "count": 2,
+         "children": [{"name": "edge", "tier": "edge", "count": 3, "num_samples": 16}]},
+        {"name": "hospital", "tier": "fog",
+         "children": [{"name": "ward", "tier": "edge", "count": 2, "num_samples": 100}]},
+    ],
+}
+
+
+def test_count_replicates_nodes_with_qualified_names():
+    root = build_topology(UNEVEN)
+    assert root.depth() == 3
+    assert root.tiers() == ["cloud", "fog", "edge"]
+    names = [leaf.name for leaf in root.leaves()]
+    assert len(names) == len(set(names)) == 8
+    assert "cloud/fog-2/edge-3" in names and "cloud/hospital/ward-1" in names
+
+
+def test_tier_defaults_and_overrides():
+    root = build_topology(UNEVEN)
+    fog = root.children[0]
+    assert (fog.bandwidth_mbps, fog.latency_ms) == (100.0, 5.0)
+    custom = balanced_topology(1, 2, edge_bandwidth_mbps=1.0)
+    assert all(leaf.bandwidth_mbps == 1.0 for leaf in custom.leaves())
+
+
+def test_root_must_be_single_node():
+    with pytest.raises(ValueError, match="single node"):
+        build_topology({"name": "cloud", "tier": "cloud", "count": 2})
+
+
+def test_load_topology_reads_shipped_config():
+    root = load_topology(CONFIG)
+    assert len(root.children) == 2
+    assert len(root.leaves()) == 8
+
+
+def test_transfer_time_includes_latency_and_bandwidth():
+    edge = balanced_topology(1, 1, edge_bandwidth_mbps=8.0).leaves()[0]
+    assert edge.transfer_time_s(1_000_000) == pytest.approx(0.02 + 1.0)
+
+
+def test_hierarchical_round_equals_flat_fedavg_over_leaves():
+    root = build_topology(UNEVEN)
+    simulator = HierarchicalSimulator(root, model_size=64, local_steps=2, seed=3)
+    start = simulator.global_weights.copy()
+    simulator.run_round()
+
+    leaves = root.leaves()
+    flat = federated_average(
+        [local_update(start, simulator._true_weights, (3, i), leaf.num_samples,
+                      2, simulator.learning_rate)
+         for i, leaf in enumerate(leaves)],
+        [leaf.num_samples for leaf in leaves])
+    np.testing.assert_allclose(simulator.global_weights, flat, rtol=1e-5, atol=1e-6)
+
+
+def test_round_stats_count_nodes_and_bytes_per_tier():
+    simulator = HierarchicalSimulator(balanced_topology(2, 4), model_size=100)
+    stats = simulator.run_round()
+    payload = 100 * 4
+    assert stats.tiers["edge"].nodes == 8
+    assert stats.tiers["fog"].nodes == 2
+    assert stats.tiers["edge"].bytes_up == stats.tiers["edge"].bytes_down == 8 * payload
+    assert stats.tiers["fog"].bytes_moved == 2 * 2 * payload
+    assert stats.tiers["cloud"].bytes_moved == 0
+    assert stats.round_time_s >= stats.tiers["edge"].latency_s
+    assert set(stats.to_dict()["tiers"]) == {"cloud", "fog", "edge"}
+
+
+def test_fog_interface_bounds_fan_out():
+    narrow = balanced_topology(1, 50)
+    narrow.children[0].nic_mbps = 1.0
+    stats = HierarchicalSimulator(narrow, model_size=10_000).run_round()
+    # 50 broadcasts and 50 uploads of 40 kB through a 1 Mbit/s interface
+    assert stats.tiers["fog"].nic_s == pytest.approx(100 * 40_000 * 8 / 1e6)
+    assert stats.round_time_s >= stats.tiers["fog"].nic_s
@@ -0,0 +1,143 @@
+"""Tests for packed Paillier encryption and encrypted KPI benchmarking."""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from fedhr5.modules.benchmarking.metrics_aggregation import MetricsAggregator, encrypt_metrics
+from fedhr5.privacy.homomorphic_ops import (
+    EncryptedVector,
+    FixedPointEncoder,
+    PackedEncryptor,
+    aggregate,
+    decrypt_vector,
+    generate_keypair,
+)
+
+# Small keys keep key generation fast; packing is the same at any size
+KEY_BITS = 512
+METRICS = ["retention_rate", "turnover", "training_hours"]
+
+
+@pytest.fixture(scope="module")
+def keypair():
+    return generate_keypair(KEY_BITS)
+
+
+def test_encrypt_decrypt_and_homomorphic_addition(keypair):
+    public_key, private_key = keypair
+    assert public_key.n.bit_length() == KEY_BITS
+    assert public_key.slots == (KEY_BITS - 1) // 64
+    a, b = 123456789, public_key.n - 10
+    ca, cb = public_key.encrypt(a), public_key.encrypt(b)
+    assert ca != public_key.encrypt(a)  # randomized
+    assert private_key.decrypt(ca) == a
+    assert private_key.decrypt(public_key.add(ca, cb)) == (a + b) % public_key.n
+    with pytest.raises(ValueError):
+        public_key.encrypt(public_key.n)
+
+
+def test_encoder_round_trip_and_range():
+    encoder = FixedPointEncoder(frac_bits=20, value_bits=44)
+    values = np.array([-1000.5, -1e-6, 0.0, 3.25, 8_000_000.0])
+    decoded = encoder.decode(encoder.encode(values))
+    np.testing.assert_allclose(decoded, values, atol=2.0 ** -21)
+    with pytest.raises(ValueError, match="within"):
+        encoder.encode([encoder.max_abs])
+
+
+def test_encoder_decodes_sums_up_to_max_summands():
+    encoder = FixedPointEncoder()
+    values = np.array([-1000.5, 0.0, 1000.25])
+    n = encoder.max_summands
+    slots = encoder.encode(values) * np.uint64(n)
+    np.testing.assert_allclose(encoder.decode(slots, summands=n), values * n)
+    with pytest.raises(ValueError, match="At most"):
+        encoder.decode(slots, summands=n + 1)
+
+
+def test_pack_unpack_round_trip():
+    encoder = FixedPointEncoder()
+    values = np.linspace(-50, 50, 23)
+    packed = encoder.pack(values, slots=7)
+    assert len(packed) == 4
+    np.testing.assert_allclose(encoder.unpack(packed, 7, len(values)), values,
+                               atol=2.0 ** -20)
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_packed_aggregate_decrypts_to_plain_sum(keypair, workers):
+    public_key, private_key = keypair
+    rng = np.random.default_rng(0)
+    vectors = [rng.uniform(-100, 100, 20) for _ in range(5)]
+    with PackedEncryptor(public_key, workers=workers) as encryptor:
+        encrypted = encryptor.encrypt_many(vectors)
+    assert all(len(e.ciphertexts) == -(-20 // public_key.slots) for e in encrypted)
+    total = aggregate(encrypted)
+    assert total.summands == 5
+    np.testing.assert_allclose(decrypt_vector(private_key, total), np.sum(vectors, axis=0),
+                               atol=5 * 2.0 ** -20)
+
+
+def test_encrypted_vector_serialization(keypair):
+    public_key, private_key = keypair
+    encrypted = PackedEncryptor(public_key).encrypt(np.array([1.5, -2.0]))
+    restored = EncryptedVector.from_dict(public_key, encrypted.to_dict())
+    assert restored == encrypted
+    np.testing.assert_allclose(decrypt_vector(private_key, restored), [1.5, -2.0])
+
+    public_key.noise()
+    clone = pickle.loads(pickle.dumps(public_key))
+    assert clone == public_key and clone._table is None
+
+
+def test_aggregate_rejects_mismatched_vectors(keypair):
+    public_key, _ = keypair
+    encryptor = PackedEncryptor(public_key)
+    with pytest.raises(ValueError, match="empty"):
+        aggregate([])
+    with pytest.raises(ValueError, match="different"):
+        encryptor.encrypt(np.zeros(3)) + encryptor.encrypt(np.zeros(4))
+
+
+def test_metrics_aggregator_releases_means_after_quorum(keypair):
+    public_key, private_key = keypair
+    encryptor = PackedEncryptor(public_key)
+    aggregator = MetricsAggregator(METRICS, public_key, min_participants=3)
+    orgs = {f"org_{i}": {"retention_rate": 0.8 + i / 100, "turnover": 0.1 * i,
+                         "training_hours": 20.0 + i} for i in range(4)}
+    for org_id, metrics in list(orgs.items())[:2]:
+        aggregator.submit(org_id, encrypt_metrics(encryptor, METRICS, metrics))
+    with pytest.raises(ValueError, match="at least 3"):
+        aggregator.results(private_key)
+    aggregator.submit_many({org_id: encrypt_metrics(encryptor, METRICS, metrics)
+                            for org_id, metrics in list(orgs.items())[2:]})
+    results = aggregator.results(private_key)
+    for name in METRICS:
+        assert results[name] == pytest.approx(np.mean([m[name] for m in orgs.values()]),
+                                              abs=1e-5)
+
+
+def test_metrics_aggregator_validates_submissions(keypair):
+    public_key, _ = keypair
+    other_key, _ = generate_keypair(KEY_BITS)
+    encryptor = PackedEncryptor(public_key)
+    aggregator = MetricsAggregator(METRICS, public_key)
+    valid = encryptor.encrypt(np.zeros(3))
+    aggregator.submit("org_1", valid)
+
+    with pytest.raises(ValueError, match="already submitted"):
+        aggregator.submit("org_1", valid)
+    with pytest.raises(ValueError, match="different key"):
+        aggregator.submit("org_2", PackedEncryptor(other_key).encrypt(np.zeros(3)))
+    with pytest.raises(ValueError, match="encoding"):
+        aggregator.submit("org_2", PackedEncryptor(
+            public_key, FixedPointEncoder(frac_bits=10)).encrypt(np.zeros(3)))
+    with pytest.raises(ValueError, match="exactly one"):
+        aggregator.submit("org_2", valid + valid)
+    with pytest.raises(ValueError, match="Expected 3 metrics"):
+        aggregator.submit("org_2", encryptor.encrypt(np.zeros(4)))
+    with pytest.raises(ValueError, match="Missing metrics"):
+        encrypt_metrics(encryptor, METRICS, {"turnover": 0.1})
+    assert aggregator.participants == {"org_1"}
@@ -0,0 +1,54 @@
+"""Tests for the lazy package namespaces."""
+
+import importlib
+import pkgutil
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+import fedhr5
+from fedhr5.utils.lazy import attach
+
+PACKAGES = ["fedhr5"] + [
+    info.name for info in pkgutil.walk_packages(fedhr5.__path__, "fedhr5.") if info.ispkg
+]
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+def test_every_exported_name_resolves(package):
+    module = importlib.import_module(package)
+    for name in module.__all__:
+        assert getattr(module, name) is not None, f"{package}.{name}"
+        # Resolved names are cached in the package namespace
+        assert name in vars(module)
+    assert set(module.__all__) <= set(dir(module))
+
+
+def test_import_fedhr5_loads_no_submodule_or_numpy():
+    code = ("import sys, fedhr5, fedhr5.core, fedhr5.privacy, fedhr5.utils, fedhr5.modules; "
+            "print(sorted(m for m in sys.modules if m == 'numpy' or m == 'asyncio' "
+            "or m.startswith('fedhr5.') and m.count('.') > 1 and not m.endswith('.lazy')))")
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            check=True, cwd=Path(fedhr5.__file__).parents[1]).stdout
+    assert output.strip() == "[]"
+
+
+def test_attach_resolves_names_and_submodules(monkeypatch):
+    package = types.ModuleType("fakepkg")
+    package.__path__ = []
+    monkeypatch.setitem(sys.modules, "fakepkg", package)
+    submodule = types.ModuleType("fakepkg.tools")
+    submodule.helper = object()
+    monkeypatch.setitem(sys.modules, "fakepkg.tools", submodule)
+
+    getattr_, dir_, all_ = attach("fakepkg", {"tools": ["helper"]}, submodules=["tools"])
+    package.__getattr__ = getattr_
+    assert all_ == ["helper"]
+    assert package.helper is submodule.helper
+    assert package.tools is submodule
+    assert {"helper", "tools"} <= set(dir_())
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        package.missing
@@ -0,0 +1,140 @@
+"""Tests for the lock-free runtime metrics."""
+
+import gc
+import threading
+import urllib.request
+
+import numpy as np
+import pytest
+
+from fedhr5.utils.metrics import (
+    CONTENT_TYPE,
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    start_http_server,
+    timed,
+)
+
+
+def test_counter_sums_cells_of_all_threads():
+    counter = Counter("events_total")
+
+    def work():
+        for _ in range(1000):
+            counter.inc()
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    counter.inc(0.5)
+    assert counter.value == 8000.5
+
+
+def test_exited_threads_are_folded_into_the_base_cell():
+    counter = Counter("events_total")
+    for _ in range(20):
+        thread = threading.Thread(target=counter.inc, args=(2.0,))
+        thread.start()
+        thread.join()
+    del thread
+    gc.collect()
+    assert counter.value == 40.0
+    assert len(counter._cells._live) <= 1
+
+
+def test_counter_rejects_negative_increments():
+    with pytest.raises(ValueError):
+        Counter("events_total").inc(-1)
+
+
+@pytest.mark.parametrize("precision", [3, 5, 7])
+def test_histogram_quantiles_within_relative_error(precision):
+    histogram = Histogram("latency_seconds", precision=precision)
+    values = np.random.default_rng(0).lognormal(-4, 2, 20_000)
+    for value in values:
+        histogram.observe(float(value))
+    assert histogram.count == len(values)
+    for q in (0.01, 0.5, 0.9, 0.999):
+        exact = np.quantile(values, q, method="inverted_cdf")
+        assert histogram.quantile(q) == pytest.approx(exact, rel=2.0 ** -precision)
+
+
+def test_histogram_edge_values():
+    histogram = Histogram("sizes", min_exponent=-2, max_exponent=4)
+    assert np.isnan(histogram.quantile(0.5))
+    for value in (0.0, -1.0, 1e-9, 1e9):
+        histogram.observe(value)
+    assert histogram.quantile(0.5) == 0.0
+    # Out-of-range values are clamped into the buckets at 2**min and 2**max
+    assert histogram.quantile(0.75) == pytest.approx(2.0 ** -2, rel=2.0 ** -5)
+    assert histogram.quantile(1.0) == pytest.approx(2.0 ** 4, rel=2.0 ** -5)
+
+
+def test_histogram_covers_the_documented_range():
+    for value in (2.0 ** -2, 3.0, 2.0 ** 4 * 0.99):
+        histogram = Histogram("sizes", min_exponent=-2, max_exponent=4)
+        histogram.observe(value)
+        assert histogram.quantile(0.5) == pytest.approx(value, rel=2.0 ** -5)
+
+
+def test_timer_context_and_decorators():
+    histogram = Histogram("duration_seconds")
+    with histogram.time():
+        pass
+
+    @histogram.time()
+    def decorated():
+        return 1
+
+    @timed(histogram)
+    def wrapped(x):
+        return x * 2
+
+    assert decorated() == 1 and wrapped(3) == 6
+    assert wrapped.__wrapped__(3) == 6
+    assert histogram.count == 3
+
+
+def test_registry_reuses_metrics_and_rejects_kind_clashes():
+    registry = MetricsRegistry()
+    first = registry.counter("bytes_total", labels={"message": "update"})
+    assert registry.counter("bytes_total", labels={"message": "update"}) is first
+    assert registry.counter("bytes_total", labels={"message": "model"}) is not first
+    with pytest.raises(ValueError, match="already registered"):
+        registry.gauge("bytes_total", labels={"message": "update"})
+
+
+def test_render_prometheus_text_format():
+    registry = MetricsRegistry()
+    registry.counter("bytes_total", "Bytes sent", {"message": 'a "quoted"\nvalue'}).inc(3)
+    registry.counter("bytes_total", "Bytes sent", {"message": "b"}).inc(1)
+    registry.gauge("clients", "Connected clients").set(7)
+    registry.histogram("round_seconds", "Round time", quantiles=(0.5,)).observe(2.0)
+    text = registry.render()
+    assert text.count("# TYPE bytes_total counter") == 1
+    assert 'bytes_total{message="a \\"quoted\\"\\nvalue"} 3.0' in text
+    assert 'bytes_total{message="b"} 1.0' in text
+    assert "clients 7.0" in text
+    assert "# TYPE round_seconds summary" in text
+    assert 'round_seconds{quantile="0.5"}' in text
+    assert "round_seconds_count 1.0" in text and "round_seconds_sum 2.0" in text
+    assert text.endswith("\n")
+
+
+def test_http_server_exposes_metrics():
+    registry = MetricsRegistry()
+    registry.counter("requests_total").inc()
+    server = start_http_server(0, registry=registry)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            assert "requests_total 1.0" in response.read().decode()
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/other")
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,118 @@
+"""Tests for the chunk-deduplicated model store."""
+
+import numpy as np
+import pytest
+
+from fedhr5.core.model_store import ModelStore
+
+CHUNK = 256
+
+
+def _weights(size=1000, seed=0):
+    return np.random.default_rng(seed).standard_normal(size).astype(np.float32)
+
+
+def test_round_trip_of_named_tensors(tmp_path):
+    store = ModelStore(tmp_path, chunk_size=CHUNK)
+    tensors = {"weights": _weights(), "bias": np.arange(7, dtype=np.int64),
+               "matrix": _weights(60).reshape(6, 10), "empty": np.zeros(0, np.float32)}
+    store.commit(1, tensors)
+    snapshot = store.open()
+    assert snapshot.round_num == 1
+    assert sorted(snapshot.names) == sorted(tensors)
+    for name, array in tensors.items():
+        restored = snapshot[name]
+        assert restored.dtype == array.dtype and restored.shape == array.shape
+        np.testing.assert_array_equal(restored, array)
+
+
+def test_unchanged_round_writes_nothing(tmp_path):
+    store = ModelStore(tmp_path, chunk_size=CHUNK)
+    weights = _weights()
+    first = store.commit(1, weights)
+    second = store.commit(2, weights)
+    assert first.chunks_written == first.chunks_total == 16
+    assert second.chunks_written == second.bytes_written == 0
+    assert second.chunks_reused == 16
+    assert not (tmp_path / "segments" / "round-00000002.seg").exists()
+    np.testing.assert_array_equal(store.open(2).tensor(), weights)
+
+
+def test_sparse_change_rewrites_only_touched_chunks(tmp_path):
+    store = ModelStore(tmp_path, chunk_size=CHUNK)
+    weights = _weights()
+    store.commit(1, weights)
+    changed = weights.copy()
+    changed[0] += 1
+    changed[-1] += 1
+    stats = store.commit(2, changed)
+    assert stats.chunks_written == 2
+    # 4000 bytes leave a 160-byte final chunk, padded to the 64-byte alignment
+    assert stats.bytes_written == CHUNK + 192
+    np.testing.assert_array_equal(store.open(1).tensor(), weights)
+    np.testing.assert_array_equal(store.open(2).tensor(), changed)
+
+
+def test_reverted_chunks_are_found_by_hash(tmp_path):
+    store = ModelStore(tmp_path, chunk_size=CHUNK)
+    weights = _weights()
+    changed = weights.copy()
+    changed[:64] = 0
+    store.commit(1, weights)
+    store.commit(2, changed)
+    # Round 3 returns to round 1; the original chunk is still stored
+    stats = store.commit(3, weights)
+    assert stats.chunks_written == 0
+    np.testing.assert_array_equal(store.open(3).tensor(), weights)
+
+
+def test_duplicate_chunks_within_a_round_are_stored_once(tmp_path):
+    store = ModelStore(tmp_path, chunk_size=CHUNK)
+    stats = store.commit(1, {"a": np.zeros(640, np.float32),
+                             "b": np.zeros(64, np.float32)})
+    assert stats.chunks_total == 11
+    assert stats.chunks_written == 1
+    assert store.disk_usage() == CHUNK
+
+
+def test_snapshots_are_read_only_memmap_views(tmp_path):
+    store = ModelStore(tmp_path, chunk_size=CHUNK)
+    store.commit(1, _weights())
+    tensor = store.open().tensor()
+    with pytest.raises(ValueError):
+        tensor[0] = 1.0
+    for chunk in store.open().chunks():
+        assert not chunk.flags.writeable
+
+
+def test_reopened_store_keeps_deduplicating(tmp_path):
+    weights = _weights()
+    ModelStore(tmp_path, chunk_size=CHUNK).commit(5, weights)
+    store = ModelStore(tmp_path, chunk_size=CHUNK)
+    assert store.rounds() == [5] and store.latest_round() == 5
+    changed = weights.copy()
+    changed[:64] = 0
+    store.commit(6, changed)
+    # A chunk identical to one from round 5 is matched through the hash index
+    assert store.commit(7, weights).chunks_written == 0
+
+
+def test_rounds_must_increase(tmp_path):
+    store = ModelStore(tmp_path, chunk_size=CHUNK)
+    store.commit(3, _weights())
+    with pytest.raises(ValueError, match="not newer"):
+        store.commit(3, _weights())
+
+
+def test_missing_rounds_and_empty_store(tmp_path):
+    store = ModelStore(tmp_path, chunk_size=CHUNK)
+    with pytest.raises(KeyError):
+        store.open()
+    store.commit(1, _weights())
+    with pytest.raises(KeyError):
+        store.open(2)
+
+
+def test_chunk_size_must_be_aligned(tmp_path):
+    with pytest.raises(ValueError, match="multiple"):
+        ModelStore(tmp_path, chunk_size=100)
@@ -0,0 +1,143 @@
+"""Tests for the memoized learning-path optimizer."""
+
+import random
+
+import pytest
+
+from fedhr5.modules.learning.path_optimization import Course, PathOptimizer
+
+
+def _course(course_id, hours, provides, requires=(), **kwargs):
+    return Course(course_id, hours, frozenset(provides), frozenset(requires), **kwargs)
+
+
+CATALOGUE = [
+    _course("python", 10, ["python"]),
+    _course("stats", 8, ["stats"]),
+    _course("ml_intro", 20, ["ml"], ["python", "stats"]),
+    _course("ml_bootcamp", 45, ["ml", "python"]),
+    _course("deep_learning", 30, ["dl"], ["ml", "python"]),
+    _course("mlops", 15, ["mlops"], ["ml", "python"], success_rate=0.5),
+]
+
+
+def _random_catalogue(seed, num_skills=30, num_courses=60):
+    rng = random.Random(seed)
+    courses = []
+    for i in range(num_courses):
+        top = rng.randrange(1, num_skills)
+        provides = {f"s{top}"} | ({f"s{top - 1}"} if rng.random() < 0.2 else set())
+        requires = {f"s{rng.randrange(top - 1)}" for _ in range(rng.randrange(3))
+                    if top > 1}
+        courses.append(_course(f"c{i}", rng.uniform(1, 40), provides, requires,
+                               cost=rng.uniform(0, 500),
+                               success_rate=rng.uniform(0.5, 1.0)))
+    courses.append(_course("root", 5, ["s0"]))
+    return courses
+
+
+def _assert_valid(path, current, targets, catalogue):
+    by_id = {c.course_id: c for c in catalogue}
+    state = set(current)
+    for course_id in path.courses:
+        course = by_id[course_id]
+        assert course.requires <= state, course_id
+        state |= course.provides
+    assert set(targets) - set(path.missing) <= state
+
+
+def test_prefers_cheaper_prerequisite_route():
+    optimizer = PathOptimizer(CATALOGUE)
+    path = optimizer.recommend([], ["ml"])
+    assert path.courses == ["python", "stats", "ml_intro"]
+    assert path.expected_hours == 38 and path.feasible
+
+
+def test_existing_skills_and_shared_prerequisites_are_not_repaid():
+    optimizer = PathOptimizer(CATALOGUE)
+    path = optimizer.recommend(["python"], ["dl", "mlops"])
+    assert path.courses == ["stats", "ml_intro", "deep_learning", "mlops"]
+    assert path.expected_hours == pytest.approx(8 + 20 + 30 + 15 / 0.5)
+    assert path.success_rate == pytest.approx(0.5)
+
+
+def test_unreachable_targets_are_reported_missing():
+    catalogue = CATALOGUE + [_course("leadership", 10, ["lead"], ["mentoring"])]
+    path = PathOptimizer(catalogue).recommend([], ["lead", "python"])
+    assert path.courses == ["python"]
+    assert path.missing == ["lead"] and not path.feasible
+    assert path.to_dict()["feasible"] is False
+
+
+def test_cost_weight_trades_hours_for_price():
+    catalogue = [_course("cheap", 10, ["x"], cost=1000), _course("fast", 20, ["x"])]
+    assert PathOptimizer(catalogue).recommend([], ["x"]).courses == ["cheap"]
+    assert PathOptimizer(catalogue, cost_weight=0.1).recommend([], ["x"]).courses == ["fast"]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_paths_are_valid_on_random_catalogues(seed):
+    catalogue = _random_catalogue(seed)
+    optimizer = PathOptimizer(catalogue)
+    rng = random.Random(seed)
+    for _ in range(50):
+        current = {f"s{rng.randrange(30)}" for _ in range(rng.randrange(5))}
+        targets = {f"s{rng.randrange(30)}" for _ in range(rng.randrange(1, 4))}
+        targets &= set(optimizer.skills)
+        _assert_valid(optimizer.recommend(current, targets), current, targets, catalogue)
+
+
+@pytest.mark.parametrize("cache_size", [200_000, 16])
+def test_cached_results_match_fresh_optimizer_after_updates(cache_size):
+    catalogue = _random_catalogue(7)
+    optimizer = PathOptimizer(catalogue, cache_size=cache_size)
+    rng = random.Random(7)
+    requests = [({f"s{rng.randrange(30)}" for _ in range(3)},
+                 {f"s{rng.randrange(1, 30)}"} & set(optimizer.skills))
+                for _ in range(40)]
+    for step in range(10):
+        course = rng.choice(catalogue).course_id
+        optimizer.update_course(course, duration_h=rng.uniform(1, 40))
+        fresh = PathOptimizer(optimizer.courses)
+        cached = optimizer.recommend_batch(*zip(*requests))
+        assert cached == fresh.recommend_batch(*zip(*requests))
+    assert optimizer.stats.hits > 0
+    if cache_size == 16:
+        assert optimizer.stats.evictions > 0
+
+
+def test_update_invalidates_only_dependent_entries():
+    optimizer = PathOptimizer(CATALOGUE)
+    optimizer.recommend([], ["dl"])
+    optimizer.recommend([], ["stats"])
+    # Cached: dl, ml, python and stats. deep_learning only feeds dl
+    assert optimizer.update_course("deep_learning", duration_h=1) == 1
+    # python feeds the python and ml entries, but not stats
+    assert optimizer.update_course("python", duration_h=1) == 2
+    assert optimizer.update_course("stats", duration_h=1) == 1
+    assert optimizer.stats.invalidations == 4
+
+
+def test_record_outcome_refines_success_rate():
+    optimizer = PathOptimizer(CATALOGUE)
+    optimizer.record_outcome("python", completed=False)
+    python = optimizer.courses[0]
+    assert python.success_rate == pytest.approx(10 / 11)
+
+
+def test_batch_solves_identical_requests_once():
+    optimizer = PathOptimizer(CATALOGUE)
+    paths = optimizer.recommend_batch([["python"], ["python"]], [["ml"], ["ml"]])
+    assert paths[0] is paths[1]
+
+
+def test_invalid_catalogues_and_requests_are_rejected():
+    with pytest.raises(ValueError, match="cycle"):
+        PathOptimizer([_course("a", 1, ["x"], ["y"]), _course("b", 1, ["y"], ["x"])])
+    with pytest.raises(ValueError, match="Duplicate"):
+        PathOptimizer([_course("a", 1, ["x"]), _course("a", 2, ["y"])])
+    optimizer = PathOptimizer(CATALOGUE)
+    with pytest.raises(ValueError, match="Unknown target"):
+        optimizer.recommend([], ["cooking"])
+    with pytest.raises(ValueError, match="one target set"):
+        optimizer.recommend_batch([[]], [])
@@ -0,0 +1,170 @@
+"""Tests for the round progress broker."""
+
+import asyncio
+import json
+
+import pytest
+
+from fedhr5.core.progress import ProgressBroker
+
+
+class Connection:
+    """Records frames; ``blocked`` holds writes until it is set."""
+
+    def __init__(self, fail=False):
+        self.frames = []
+        self.fail = fail
+        self.blocked = asyncio.Event()
+        self.blocked.set()
+
+    async def send(self, payload):
+        await self.blocked.wait()
+        if self.fail:
+            raise ConnectionResetError("peer went away")
+        self.frames.append(payload)
+
+    @property
+    def messages(self):
+        return [json.loads(frame) for frame in self.frames]
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_ticks_are_coalesced_and_frames_shared():
+    async def scenario():
+        broker = ProgressBroker()
+        a, b = Connection(), Connection()
+        broker.subscribe(a.send, ["r1"])
+        broker.subscribe(b.send, ["r1"])
+        for step in range(100):
+            broker.publish("r1", "org_1", progress=step / 100)
+        broker.publish("r1", "org_2", progress=0.5)
+        broker.update_round("r1", status="training")
+        assert broker.flush() == 1
+        await _settle()
+        return broker, a, b
+
+    broker, a, b = asyncio.run(scenario())
+    assert len(a.frames) == len(b.frames) == 1
+    assert a.frames[0] is b.frames[0]
+    message = a.messages[0]
+    assert message["seq"] == 1 and not message["snapshot"]
+    assert message["round"] == {"status": "training"}
+    assert message["clients"] == {"org_1": {"progress": 0.99}, "org_2": {"progress": 0.5}}
+    assert message["progress"] == pytest.approx((0.99 + 0.5) / 2)
+    assert broker.stats.published == 101 and broker.stats.frames == 1
+    assert broker.stats.deliveries == 2
+
+
+def test_deltas_carry_only_changes_and_late_followers_get_a_snapshot():
+    async def scenario():
+        broker = ProgressBroker()
+        early, late = Connection(), Connection()
+        subscription = broker.subscribe(early.send, ["r1"])
+        broker.update_round("r1", status="training")
+        broker.publish("r1", "org_1", progress=0.2)
+        broker.flush()
+        broker.publish("r1", "org_2", progress=0.4)
+        broker.flush()
+        assert broker.flush() == 0  # nothing changed
+        broker.follow(subscription, "r1")  # already following: no-op
+        broker.subscribe(late.send, ["r1"])
+        await _settle()
+        return early, late
+
+    early, late = asyncio.run(scenario())
+    assert [m["seq"] for m in early.messages] == [1, 2]
+    assert early.messages[1]["round"] == {}
+    assert early.messages[1]["clients"] == {"org_2": {"progress": 0.4}}
+    snapshot = late.messages[0]
+    assert snapshot["snapshot"] and snapshot["round"] == {"status": "training"}
+    assert set(snapshot["clients"]) == {"org_1", "org_2"}
+
+
+def test_slow_subscriber_holds_one_frame_per_round():
+    async def scenario():
+        broker = ProgressBroker()
+        slow, fast = Connection(), Connection()
+        slow.blocked.clear()
+        subscription = broker.subscribe(slow.send, ["r1", "r2"])
+        broker.subscribe(fast.send, ["r1"])
+        for step in range(10):
+            broker.publish("r1", "org_1", progress=step / 10)
+            broker.publish("r2", "org_9", progress=step / 20)
+            broker.flush()
+            await _settle()
+        assert subscription.pending == 2
+        slow.blocked.set()
+        await _settle()
+        return broker, subscription, slow, fast
+
+    broker, subscription, slow, fast = asyncio.run(scenario())
+    assert len(fast.frames) == 10
+    # The first blocked write, then one snapshot per round
+    assert len(slow.frames) == 3
+    assert subscription.pending == 0
+    # r1's first frame is in flight: its later frames queue from flush 2 and
+    # are superseded from flush 3, r2's are queued at 1 and superseded from 2
+    assert subscription.superseded == broker.stats.superseded == 8 + 9
+    r1 = [m for m in slow.messages if m["round_id"] == "r1"][-1]
+    assert r1["snapshot"] and r1["clients"]["org_1"]["progress"] == 0.9
+
+
+def test_failed_send_disconnects_only_that_subscriber():
+    async def scenario():
+        broker = ProgressBroker()
+        broken, healthy = Connection(fail=True), Connection()
+        subscription = broker.subscribe(broken.send, ["r1"])
+        broker.subscribe(healthy.send, ["r1"])
+        broker.publish("r1", "org_1", progress=0.1)
+        broker.flush()
+        await _settle()
+        broker.publish("r1", "org_1", progress=0.2)
+        broker.flush()
+        await _settle()
+        return broker, subscription, healthy
+
+    broker, subscription, healthy = asyncio.run(scenario())
+    assert broker.stats.disconnects == 1
+    assert not subscription.round_ids
+    assert len(healthy.frames) == 2
+
+
+def test_discarded_round_keeps_its_subscribers():
+    async def scenario():
+        broker = ProgressBroker()
+        connection = Connection()
+        broker.subscribe(connection.send, ["r1"])
+        broker.publish("r1", "org_1", progress=1.0)
+        broker.discard_round("r1")
+        broker.publish("r1", "org_2", progress=0.5)
+        broker.flush()
+        broker.discard_round("gone")
+        await _settle()
+        return connection
+
+    message = asyncio.run(scenario()).messages[0]
+    assert message["participants"] == 1 and message["progress"] == 0.5
+
+
+def test_periodic_flush_and_close():
+    async def scenario():
+        connection = Connection()
+        async with ProgressBroker(rate_hz=200) as broker:
+            broker.subscribe(connection.send, ["r1"])
+            broker.publish("r1", "org_1", progress=0.3)
+            await asyncio.sleep(0.05)
+        broker.publish("r1", "org_1", progress=0.6)
+        await asyncio.sleep(0.02)
+        return connection
+
+    connection = asyncio.run(scenario())
+    assert [m["clients"]["org_1"]["progress"] for m in connection.messages] == [0.3]
+
+
+def test_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        ProgressBroker(rate_hz=0)
@@ -0,0 +1,114 @@
+"""Tests for the columnar experiment results store."""
+
+from collections import defaultdict
+
+import numpy as np
+import pytest
+
+from fedhr5.utils.results_store import ResultsStore, _pyarrow
+
+needs_pyarrow = pytest.mark.skipif(_pyarrow()[0] is None, reason="pyarrow not installed")
+FORMATS = [pytest.param("parquet", marks=needs_pyarrow), "npy"]
+
+
+def _run(seed, rows=200):
+    rng = np.random.default_rng(seed)
+    return {
+        "figure": rng.choice(["performance", "comparison"], rows),
+        "group": rng.choice(["recruitment", "skills", "wellbeing"], rows),
+        "series": rng.choice(["accuracy", "f1"], rows),
+        "round": rng.integers(0, 5, rows),
+        "value": rng.normal(80, 5, rows),
+    }
+
+
+def _reference(runs, by, where):
+    groups = defaultdict(list)
+    for columns in runs:
+        for i in range(len(columns["value"])):
+            if all(columns[k][i] == v for k, v in where.items()):
+                groups[tuple(columns[k][i].item() for k in by)].append(columns["value"][i])
+    return {key: (np.mean(v), np.std(v), len(v)) for key, v in groups.items()}
+
+
+@pytest.mark.parametrize("formats", [
+    pytest.param(["parquet"] * 3, marks=needs_pyarrow),
+    ["npy"] * 3,
+    pytest.param(["parquet", "npy", "parquet"], marks=needs_pyarrow),
+])
+def test_aggregate_matches_naive_groupby(tmp_path, formats):
+    store = ResultsStore(tmp_path)
+    runs = [_run(seed) for seed in range(len(formats))]
+    for seed, (columns, format) in enumerate(zip(runs, formats)):
+        store.write_run(f"seed-{seed}", columns, format=format)
+
+    where = {"figure": "performance"}
+    stats = store.aggregate("value", by=("group", "series"), where=where)
+    expected = _reference(runs, ("group", "series"), where)
+    assert set(stats.keys) == set(expected)
+    for i, key in enumerate(stats.keys):
+        mean, std, count = expected[key]
+        assert stats.count[i] == count
+        assert stats.mean[i] == pytest.approx(mean)
+        assert stats.std[i] == pytest.approx(std, abs=1e-6)
+
+
+@pytest.mark.parametrize("format", FORMATS)
+def test_numeric_filters_and_keys(tmp_path, format):
+    store = ResultsStore(tmp_path)
+    columns = _run(0)
+    store.write_run("run", columns, format=format)
+    stats = store.aggregate("value", by=("round",), where={"series": "f1", "round": 2})
+    expected = _reference([columns], ("round",), {"series": "f1", "round": 2})
+    assert stats.keys == [(2,)]
+    assert stats.count[0] == expected[(2,)][2]
+
+
+@pytest.mark.parametrize("format", FORMATS)
+def test_unmatched_filter_yields_empty_aggregate(tmp_path, format):
+    store = ResultsStore(tmp_path)
+    store.write_run("run", _run(0), format=format)
+    stats = store.aggregate("value", by=("group",), where={"figure": "nonexistent"})
+    assert stats.keys == [] and len(stats.mean) == 0
+
+
+@pytest.mark.parametrize("format", FORMATS)
+def test_read_columns_and_metadata(tmp_path, format):
+    store = ResultsStore(tmp_path)
+    store.write_run("run", {"label": ["b", "a", "b"], "value": [1.0, 2.0, 3.0]},
+                    metadata={"seed": 3}, format=format)
+    assert store.runs() == ["run"]
+    assert store.metadata("run") == {"seed": 3}
+    columns = store.read_columns("run", ["label", "value"])
+    codes, categories = columns["label"]
+    assert [categories[c] for c in codes] == ["b", "a", "b"]
+    np.testing.assert_array_equal(columns["value"][0], [1.0, 2.0, 3.0])
+    assert columns["value"][1] is None
+
+
+def test_pivot_fills_missing_cells_with_nan(tmp_path):
+    store = ResultsStore(tmp_path)
+    store.write_run("run", {"group": ["a", "a", "b"], "series": ["x", "y", "x"],
+                            "value": [1.0, 3.0, 5.0]})
+    mean, std, count = store.aggregate("value", by=("group", "series")).pivot(
+        ["a", "b"], ["x", "y"])
+    np.testing.assert_array_equal(count, [[1, 1], [1, 0]])
+    assert mean[0, 1] == 3.0 and np.isnan(mean[1, 1])
+
+
+def test_rewrite_replaces_run_and_changes_fingerprint(tmp_path):
+    store = ResultsStore(tmp_path)
+    store.write_run("run", {"value": [1.0]}, format="npy")
+    before = store.fingerprint()
+    store.write_run("run", {"value": [1.0, 2.0]}, format="npy")
+    assert store.runs() == ["run"]
+    assert store.fingerprint() != before
+    assert len(store.read_columns("run", ["value"])["value"][0]) == 2
+
+
+def test_write_run_validates_input(tmp_path):
+    store = ResultsStore(tmp_path)
+    with pytest.raises(ValueError, match="different lengths"):
+        store.write_run("run", {"a": [1, 2], "b": [1]})
+    with pytest.raises(ValueError, match="Unknown format"):
+        store.write_run("run", {"a": [1]}, format="csv")
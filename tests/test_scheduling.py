@@ -0,0 +1,97 @@
+"""Tests for deadline-aware client selection."""
+
+import pytest
+
+from fedhr5.core.scheduling import ClientScheduler
+
+MODEL_BYTES = 1_000_000
+
+
+def _scheduler(**kwargs):
+    options = dict(deadline_s=10.0, model_bytes=MODEL_BYTES, cohort_size=4,
+                   explore_after=None)
+    options.update(kwargs)
+    return ClientScheduler(**options)
+
+
+def test_expected_time_formula():
+    scheduler = _scheduler(risk=2.0)
+    scheduler.register("a", "org", compute_s=3.0, bandwidth_mbps=8.0, latency_ms=50)
+    scheduler.clients["a"].compute_var = 0.25
+    assert scheduler.expected_time("a") == pytest.approx(3.0 + 2 * 0.5 + 0.1 + 2.0)
+
+
+def test_first_observation_replaces_prior_then_ewma():
+    scheduler = _scheduler(decay=0.5)
+    scheduler.register("a", "org", compute_s=100.0)
+    scheduler.observe("a", compute_s=2.0, transfer_bytes=1_000_000, transfer_s=0.8)
+    profile = scheduler.clients["a"]
+    assert profile.compute_s == 2.0 and profile.compute_var == 0.0
+    assert profile.bandwidth_mbps == pytest.approx(10.0)
+    scheduler.observe("a", compute_s=4.0)
+    assert profile.compute_s == pytest.approx(3.0)
+    assert profile.compute_var == pytest.approx(1.0)
+
+
+def test_cohort_round_robins_over_organizations_and_rotates_clients():
+    scheduler = _scheduler(cohort_size=3)
+    for org in ("a", "b", "c"):
+        for i in range(4):
+            scheduler.register(f"{org}{i}", org, compute_s=1.0)
+    seen = set()
+    for _ in range(4):
+        selection = scheduler.select()
+        assert sorted(cid[0] for cid in selection.clients) == ["a", "b", "c"]
+        assert selection.meets_deadline and not selection.late
+        seen.update(selection.clients)
+    assert len(seen) == 12
+
+
+def test_late_clients_are_left_out_until_org_is_overdue():
+    scheduler = _scheduler(cohort_size=2, max_org_gap=2)
+    scheduler.register("fast1", "fast", compute_s=1.0)
+    scheduler.register("fast2", "fast", compute_s=1.0)
+    scheduler.register("slow1", "slow", compute_s=50.0)
+    picks = [scheduler.select() for _ in range(3)]
+    assert all("slow1" not in s.clients for s in picks[:2])
+    # Round 3: the slow organization has sat out more than max_org_gap rounds
+    assert "slow1" in picks[2].clients and picks[2].late == ["slow1"]
+    assert not picks[2].meets_deadline
+
+
+def test_min_clients_filled_with_fastest_late_clients():
+    scheduler = _scheduler(cohort_size=3, min_clients=2)
+    scheduler.register("slow", "org", compute_s=30.0)
+    scheduler.register("slower", "org", compute_s=60.0)
+    scheduler.register("slowest", "org", compute_s=90.0)
+    selection = scheduler.select()
+    assert selection.clients == ["slow", "slower"]
+    assert selection.late == ["slow", "slower"]
+
+
+def test_exploration_reprobes_written_off_clients_with_backoff():
+    scheduler = _scheduler(cohort_size=2, max_org_gap=100, explore_after=3)
+    scheduler.register("fast", "org", compute_s=1.0)
+    scheduler.register("slow", "org", compute_s=50.0)
+    probes = []
+    for _ in range(20):
+        selection = scheduler.select()
+        if selection.explored:
+            assert selection.explored == ["slow"] and "slow" not in selection.late
+            probes.append(selection.round_num)
+            scheduler.observe("slow", compute_s=50.0)
+    # Waits of more than 3, then 6, then 12 rounds since the last probe
+    assert probes == [4, 11]
+    assert scheduler.clients["slow"].explore_backoff == 4
+
+    # A probe that finds the client fast again makes it a regular member
+    scheduler.clients["slow"].stale = True
+    scheduler.observe("slow", compute_s=1.0)
+    assert scheduler.clients["slow"].explore_backoff == 1
+    assert "slow" in scheduler.select().clients
+
+
+@pytest.mark.parametrize("kwargs", [{"decay": 0.0}, {"min_clients": 5}])
+def test_invalid_parameters_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        _scheduler(**kwargs)
@@ -0,0 +1,185 @@
+"""Tests for double-masked secure aggregation with dropout recovery."""
+
+import secrets
+
+import numpy as np
+import pytest
+
+from fedhr5.privacy.secure_aggregation import (
+    MODP_2048_PRIME, DiffieHellmanKeyPair, SecureAggregator, decode_fixed_point,
+    encode_fixed_point, expand_mask, key_agreement, mask_update, reconstruct_secret,
+    recovery_response, secure_aggregate, share_secret,
+)
+
+NUM_CLIENTS = 6
+NUM_PARAMS = 257
+ROUND = 3
+THRESHOLD = 4
+
+
+@pytest.fixture(scope="module")
+def session():
+    """Key agreement, updates, self-mask seeds and their shares for one round."""
+    key_pairs = [DiffieHellmanKeyPair() for _ in range(NUM_CLIENTS)]
+    public_keys = {cid: kp.public_key for cid, kp in enumerate(key_pairs)}
+    pair_seeds = [key_agreement(public_keys, kp, cid) for cid, kp in enumerate(key_pairs)]
+    rng = np.random.default_rng(0)
+    updates = rng.uniform(-1, 1, (NUM_CLIENTS, NUM_PARAMS)).astype(np.float32)
+    self_seeds = [secrets.randbits(128) for _ in range(NUM_CLIENTS)]
+    held = [{} for _ in range(NUM_CLIENTS)]
+    for owner, seed in enumerate(self_seeds):
+        for holder, share in share_secret(seed, range(NUM_CLIENTS), THRESHOLD).items():
+            held[holder][owner] = share
+    masked = [mask_update(updates[cid], cid, pair_seeds[cid], ROUND, self_seed=self_seeds[cid])
+              for cid in range(NUM_CLIENTS)]
+    return pair_seeds, updates, held, masked
+
+
+def _recover(pair_seeds, held, survivors):
+    revealed, shares = {}, {}
+    for cid in survivors:
+        seeds, self_shares = recovery_response(cid, survivors, pair_seeds[cid], held[cid])
+        revealed.update(seeds)
+        for owner, share in self_shares.items():
+            shares.setdefault(owner, {})[cid] = share
+    return revealed, shares
+
+
+def test_pair_seeds_are_symmetric(session):
+    pair_seeds = session[0]
+    for i in range(NUM_CLIENTS):
+        for j in range(NUM_CLIENTS):
+            if i != j:
+                assert pair_seeds[i][j] == pair_seeds[j][i]
+
+
+@pytest.mark.parametrize("dropped", [set(), {1}, {0, 4}])
+def test_round_trip_with_dropouts(session, dropped):
+    pair_seeds, updates, held, masked = session
+    survivors = [cid for cid in range(NUM_CLIENTS) if cid not in dropped]
+    revealed, shares = _recover(pair_seeds, held, survivors)
+    aggregator = SecureAggregator(NUM_PARAMS, ROUND, range(NUM_CLIENTS), THRESHOLD)
+    for cid in survivors:
+        aggregator.add(cid, masked[cid])
+    assert aggregator.dropped() == dropped
+    total = aggregator.finalize(revealed, shares)
+    np.testing.assert_allclose(total, updates[survivors].sum(axis=0), atol=1e-4)
+
+
+def test_secure_aggregate_streams_a_generator(session):
+    pair_seeds, updates, held, masked = session
+    survivors = [0, 1, 2, 3, 5]
+    revealed, shares = _recover(pair_seeds, held, survivors)
+    total = secure_aggregate(((cid, masked[cid]) for cid in survivors), NUM_PARAMS, ROUND,
+                             range(NUM_CLIENTS), revealed, shares, THRESHOLD)
+    np.testing.assert_allclose(total, updates[survivors].sum(axis=0), atol=1e-4)
+
+
+def test_missing_recovery_seed_raises(session):
+    pair_seeds, _, held, masked = session
+    survivors = [0, 1, 2, 3, 4]
+    revealed, shares = _recover(pair_seeds, held, survivors)
+    del revealed[2, 5]
+    aggregator = SecureAggregator(NUM_PARAMS, ROUND, range(NUM_CLIENTS), THRESHOLD)
+    for cid in survivors:
+        aggregator.add(cid, masked[cid])
+    with pytest.raises(ValueError, match="not revealed"):
+        aggregator.finalize(revealed, shares)
+
+
+def test_seed_for_a_received_client_raises(session):
+    pair_seeds, _, held, masked = session
+    aggregator = SecureAggregator(NUM_PARAMS, ROUND, range(NUM_CLIENTS), THRESHOLD)
+    for cid in range(NUM_CLIENTS):
+        aggregator.add(cid, masked[cid])
+    _, shares = _recover(pair_seeds, held, range(NUM_CLIENTS))
+    with pytest.raises(ValueError, match="Invalid recovery pair"):
+        aggregator.finalize({(0, 1): pair_seeds[0][1]}, shares)
+
+
+def test_too_few_self_mask_shares_raise(session):
+    pair_seeds, _, held, masked = session
+    revealed, shares = _recover(pair_seeds, held, range(NUM_CLIENTS))
+    shares[3] = dict(list(shares[3].items())[:THRESHOLD - 1])
+    aggregator = SecureAggregator(NUM_PARAMS, ROUND, range(NUM_CLIENTS), THRESHOLD)
+    for cid in range(NUM_CLIENTS):
+        aggregator.add(cid, masked[cid])
+    with pytest.raises(ValueError, match="needed"):
+        aggregator.finalize(revealed, shares)
+
+
+def test_falsely_dropped_client_stays_masked(session):
+    """A server that hides a received update cannot strip its self-mask."""
+    pair_seeds, updates, held, masked = session
+    victim = 2
+    claimed_survivors = [cid for cid in range(NUM_CLIENTS) if cid != victim]
+    revealed, shares = _recover(pair_seeds, held, claimed_survivors)
+    assert victim not in shares
+    # Strip every pairwise mask from the victim's update with the revealed seeds
+    stripped = masked[victim].copy()
+    for (survivor, dropped), seed in revealed.items():
+        if dropped == victim:
+            mask = expand_mask(seed, ROUND, NUM_PARAMS)
+            if survivor < victim:
+                stripped += mask
+            else:
+                stripped -= mask
+    recovered = decode_fixed_point(stripped, 2.0 ** 16)
+    assert not np.allclose(recovered, updates[victim], atol=1e-3)
+    aggregator = SecureAggregator(NUM_PARAMS, ROUND, range(NUM_CLIENTS), THRESHOLD)
+    for cid in claimed_survivors:
+        aggregator.add(cid, masked[cid])
+    shares[victim] = {cid: held[cid][victim] for cid in claimed_survivors}
+    with pytest.raises(ValueError, match="not received"):
+        aggregator.finalize(revealed, shares)
+
+
+def test_pairwise_only_round(session):
+    pair_seeds, updates, _, _ = session
+    masked = [mask_update(updates[cid], cid, pair_seeds[cid], ROUND)
+              for cid in range(NUM_CLIENTS)]
+    aggregator = SecureAggregator(NUM_PARAMS, ROUND, range(NUM_CLIENTS))
+    for cid in range(NUM_CLIENTS):
+        aggregator.add(cid, masked[cid])
+    np.testing.assert_allclose(aggregator.finalize(), updates.sum(axis=0), atol=1e-4)
+    with pytest.raises(ValueError, match="pairwise-only"):
+        aggregator.finalize(None, {0: {1: 5}})
+
+
+def test_add_rejects_unknown_duplicate_and_malformed_updates(session):
+    masked = session[3]
+    aggregator = SecureAggregator(NUM_PARAMS, ROUND, range(NUM_CLIENTS), THRESHOLD)
+    aggregator.add(0, masked[0])
+    with pytest.raises(ValueError, match="Duplicate"):
+        aggregator.add(0, masked[0])
+    with pytest.raises(ValueError, match="not part"):
+        aggregator.add(NUM_CLIENTS, masked[1])
+    with pytest.raises(ValueError, match="field"):
+        aggregator.add(1, masked[1].astype(np.uint64))
+
+
+def test_shamir_reconstructs_from_any_threshold_subset():
+    secret = secrets.randbits(128)
+    shares = share_secret(secret, range(10), 4)
+    assert reconstruct_secret({h: shares[h] for h in (0, 3, 7, 9)}) == secret
+    assert reconstruct_secret({h: shares[h] for h in (1, 2, 5, 6, 8)}) == secret
+    assert reconstruct_secret({h: shares[h] for h in (0, 3, 7)}) != secret
+    with pytest.raises(ValueError):
+        share_secret(secret, range(3), 4)
+
+
+def test_fixed_point_saturates_instead_of_wrapping():
+    encoded = encode_fixed_point(np.array([1e9, -1e9, 0.5]), 2.0 ** 16)
+    decoded = decode_fixed_point(encoded, 2.0 ** 16)
+    assert decoded[0] > 0 > decoded[1]
+    assert decoded[2] == 0.5
+
+
+def test_diffie_hellman_validates_keys():
+    assert DiffieHellmanKeyPair(private_key=1).public_key == 2
+    with pytest.raises(ValueError):
+        DiffieHellmanKeyPair(private_key=0)
+    key_pair = DiffieHellmanKeyPair()
+    for bad in (0, 1, MODP_2048_PRIME - 1, MODP_2048_PRIME):
+        with pytest.raises(ValueError):
+            key_pair.shared_seed(bad)
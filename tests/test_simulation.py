@@ -0,0 +1,70 @@
+"""Tests for the in-process FedAvg simulator."""
+
+import numpy as np
+import pytest
+
+from fedhr5.core.aggregation import federated_average
+from fedhr5.core.simulation import FedAvgSimulator, local_update
+
+
+def test_federated_average_weights_by_sample_count():
+    updates = [np.full(4, 1.0, np.float32), np.full(4, 4.0, np.float32)]
+    np.testing.assert_allclose(federated_average(updates, [3, 1]), np.full(4, 1.75))
+    np.testing.assert_allclose(federated_average(updates), np.full(4, 2.5))
+
+
+@pytest.mark.parametrize("weights", [[1.0], [0.0, 0.0]])
+def test_federated_average_rejects_bad_weights(weights):
+    with pytest.raises(ValueError):
+        federated_average([np.zeros(2), np.zeros(2)], weights)
+
+
+def test_federated_average_rejects_empty():
+    with pytest.raises(ValueError):
+        federated_average([])
+
+
+def test_local_update_is_deterministic_and_leaves_input_untouched():
+    weights = np.zeros(8, np.float32)
+    true_weights = np.ones(8, np.float32)
+    first = local_update(weights, true_weights, (0, 1), 32)
+    second = local_update(weights, true_weights, (0, 1), 32)
+    np.testing.assert_array_equal(first, second)
+    assert not weights.any()
+
+
+def test_round_accounts_bytes_in_both_directions():
+    simulator = FedAvgSimulator(num_orgs=3, model_size=100, seed=1)
+    stats = simulator.run_round()
+    assert stats.round_num == 1 and stats.num_orgs == 3
+    assert stats.bytes_up == stats.bytes_down == 3 * 100 * 4
+    assert stats.bytes_exchanged == 2 * 3 * 100 * 4
+    assert stats.to_dict()["bytes_exchanged"] == stats.bytes_exchanged
+
+
+def test_round_with_a_subset_of_participants():
+    simulator = FedAvgSimulator(num_orgs=5, model_size=10)
+    stats = simulator.run_round(participants=iter([0, 3]))
+    assert stats.num_orgs == 2
+    assert stats.bytes_up == 2 * 10 * 4
+
+
+def test_training_moves_towards_the_true_weights():
+    simulator = FedAvgSimulator(num_orgs=4, model_size=20, samples_per_org=128,
+                                local_steps=5, learning_rate=0.1, seed=2)
+    start = np.linalg.norm(simulator.global_weights - simulator._true_weights)
+    simulator.run(num_rounds=10)
+    end = np.linalg.norm(simulator.global_weights - simulator._true_weights)
+    assert end < 0.5 * start
+    assert simulator.round == 10
+
+
+def test_robust_aggregation_method_is_used():
+    simulator = FedAvgSimulator(num_orgs=6, model_size=10, aggregation_method="median")
+    simulator.run_round()
+    assert simulator.global_weights.shape == (10,)
+
+
+def test_rejects_empty_consortium():
+    with pytest.raises(ValueError):
+        FedAvgSimulator(num_orgs=0)
@@ -0,0 +1,134 @@
+"""Tests for the zero-copy wire format."""
+
+import io
+import json
+
+import numpy as np
+import pytest
+
+from fedhr5.core.wire import (
+    ALIGNMENT, MAGIC, MESSAGE_AGGREGATED_MODEL, MESSAGE_MODEL_UPDATE, PREFIX_SIZE, VERSION,
+    AggregatedModel, ModelUpdate, _PREFIX, decode_frame, frame_size, pack_frame, read_frame,
+    write_frame,
+)
+
+TENSORS = {"weights": np.arange(10, dtype=np.float32),
+           "bias": np.array([[1, 2, 3]], dtype=np.int64),
+           "empty": np.zeros(0, dtype=np.float16)}
+
+
+def _rebuild(frame, header):
+    """Replace a frame's header, keeping its payload."""
+    _, _, message_type, header_len, payload_len = _PREFIX.unpack_from(frame)
+    payload = bytes(frame[PREFIX_SIZE + header_len:])
+    encoded = json.dumps(header).encode()
+    encoded += b" " * (-(PREFIX_SIZE + len(encoded)) % ALIGNMENT)
+    return (_PREFIX.pack(MAGIC, VERSION, message_type, len(encoded), payload_len)
+            + encoded + payload)
+
+
+def _read_raw(stream):
+    """One raw frame from a stream."""
+    prefix = stream.read(PREFIX_SIZE)
+    return prefix + stream.read(frame_size(prefix) - PREFIX_SIZE)
+
+
+def _header(frame):
+    _, _, _, header_len, _ = _PREFIX.unpack_from(frame)
+    return json.loads(bytes(frame[PREFIX_SIZE:PREFIX_SIZE + header_len]))
+
+
+def test_round_trip_is_zero_copy_and_aligned():
+    frame = pack_frame(MESSAGE_MODEL_UPDATE, {"round_id": "r1"}, TENSORS)
+    assert frame.ctypes.data % ALIGNMENT == 0
+    assert frame_size(frame[:PREFIX_SIZE]) == frame.nbytes
+    message_type, meta, tensors = decode_frame(frame)
+    assert message_type == MESSAGE_MODEL_UPDATE and meta == {"round_id": "r1"}
+    for name, array in TENSORS.items():
+        np.testing.assert_array_equal(tensors[name], array)
+        assert tensors[name].dtype == array.dtype
+        assert tensors[name].ctypes.data % ALIGNMENT == 0 or array.size == 0
+    assert np.shares_memory(tensors["weights"], frame)
+
+
+def test_non_contiguous_tensors_are_encoded():
+    matrix = np.arange(12, dtype=np.float32).reshape(3, 4)
+    _, _, tensors = decode_frame(pack_frame(MESSAGE_MODEL_UPDATE, {}, {"t": matrix.T}))
+    np.testing.assert_array_equal(tensors["t"], matrix.T)
+
+
+def test_object_tensors_are_rejected():
+    with pytest.raises(ValueError, match="object"):
+        pack_frame(MESSAGE_MODEL_UPDATE, {}, {"t": np.array([None])})
+
+
+def test_messages_round_trip_through_a_stream():
+    update = ModelUpdate("r2", {"update": np.ones(5, np.float32)}, 0.1, {"loss": 0.5})
+    model = AggregatedModel("r2", {"weights": np.zeros(3)}, 0.2, {"dp": 0.9})
+    stream = io.BytesIO()
+    for message in (update, model):
+        for part in message.to_frame():
+            stream.write(part)
+    write_frame(stream, MESSAGE_MODEL_UPDATE, {"round_id": "r3", "privacy_spent": 0.0,
+                                               "metrics": {}}, {})
+    stream.seek(0)
+    decoded = ModelUpdate.from_frame(_read_raw(stream))
+    assert decoded.round_id == "r2" and decoded.metrics == {"loss": 0.5}
+    np.testing.assert_array_equal(decoded.tensors["update"], np.ones(5))
+    message_type, meta, tensors = read_frame(stream)
+    assert message_type == MESSAGE_AGGREGATED_MODEL and meta["fairness"] == {"dp": 0.9}
+    np.testing.assert_array_equal(tensors["weights"], np.zeros(3))
+    assert read_frame(stream)[1]["round_id"] == "r3"
+
+
+def test_message_type_mismatch():
+    frame = b"".join(ModelUpdate("r", {}).to_frame())
+    with pytest.raises(ValueError, match="AggregatedModel"):
+        AggregatedModel.from_frame(frame)
+
+
+@pytest.mark.parametrize("cut", [PREFIX_SIZE - 1, PREFIX_SIZE + 8, -1])
+def test_truncated_frames_raise(cut):
+    frame = bytes(pack_frame(MESSAGE_MODEL_UPDATE, {}, TENSORS))
+    with pytest.raises(ValueError, match="Truncated"):
+        decode_frame(frame[:cut])
+    with pytest.raises(ValueError, match="Truncated"):
+        read_frame(io.BytesIO(frame[:cut]))
+
+
+def test_bad_magic_and_version():
+    frame = bytearray(pack_frame(MESSAGE_MODEL_UPDATE, {}, TENSORS))
+    with pytest.raises(ValueError, match="Not a FedHR5.0"):
+        decode_frame(b"XXXX" + frame[4:])
+    frame[4] = VERSION + 1
+    with pytest.raises(ValueError, match="version"):
+        decode_frame(frame)
+
+
+@pytest.mark.parametrize("offset", [-64, 128, 10**9, "0"])
+def test_tensor_outside_the_payload_raises(offset):
+    frame = pack_frame(MESSAGE_MODEL_UPDATE, {}, {"weights": TENSORS["weights"]})
+    header = _header(frame)
+    header["tensors"][0]["offset"] = offset
+    with pytest.raises(ValueError, match="outside the frame payload"):
+        decode_frame(_rebuild(frame, header))
+
+
+def test_tensor_larger_than_the_payload_raises():
+    frame = pack_frame(MESSAGE_MODEL_UPDATE, {}, {"weights": TENSORS["weights"]})
+    header = _header(frame)
+    header["tensors"][0]["shape"] = [1000]
+    with pytest.raises(ValueError, match="outside the frame payload"):
+        decode_frame(_rebuild(frame, header))
+    header["tensors"][0]["shape"] = [-2, -5]
+    with pytest.raises(ValueError, match="negative"):
+        decode_frame(_rebuild(frame, header))
+
+
+def test_following_frame_is_not_read():
+    first = bytes(pack_frame(MESSAGE_MODEL_UPDATE, {}, {"weights": TENSORS["weights"]}))
+    header = _header(first)
+    header["tensors"][0]["shape"] = [20]
+    second = bytes(pack_frame(MESSAGE_MODEL_UPDATE, {}, {"weights": TENSORS["weights"]}))
+    with pytest.raises(ValueError, match="outside the frame payload"):
+        decode_frame(_rebuild(first, header) + second)